@@ -4,9 +4,12 @@ import sys
 from PySide6.QtWidgets import QApplication
 from PySide6.QtGui import QIcon
 
+from core.cache import get_cache
 from core.config import Config
 from core.logger import Logger
 from core.plugin_manager import PluginManager
+from core.session import SessionStore
+from core.tasks import get_scheduler
 from ui.main_window import MainWindow
 
 
@@ -22,10 +25,16 @@ class FugoApp:
         # 初始化核心组件
         self._config = Config()
         self._logger = Logger()
+        json_log_file = self._config.get("logger.json_file")
+        if json_log_file:
+            self._logger.enable_json_sink(json_log_file)
+        # 共享磁盘缓存，供各插件复用计算结果
+        self._cache = get_cache(self._config.get("cache.dir"), self._config.get("cache.max_bytes"))
         self._plugin_manager = PluginManager()
         
         # 初始化主窗口
         self._main_window = MainWindow()
+        self._main_window.set_max_live_tabs(self._config.get("app.max_live_tabs", 8))
         
     def run(self):
         """运行应用程序"""
@@ -45,11 +54,20 @@ class FugoApp:
         self._main_window.set_app_instance(self)
         self._main_window.set_plugin_manager(self._plugin_manager)
         
+        # 恢复上次会话的标签页（延迟创建插件组件）
+        if self._config.get("app.restore_session", True):
+            self._main_window.set_session_store(SessionStore())
+            self._main_window.restore_session()
+        
         # 应用样式
         self._apply_stylesheet()
         
         # 运行事件循环
-        return self._app.exec()
+        exit_code = self._app.exec()
+        
+        # 取消未完成的后台任务并关闭进程池
+        get_scheduler().shutdown()
+        return exit_code
     
     def _apply_stylesheet(self):
         """应用全局样式表"""
@@ -0,0 +1,380 @@
+"""内容寻址磁盘缓存模块"""
+
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from core.logger import Logger
+from core.utils import calculate_file_hash, get_resource_path
+
+
+class CacheStats:
+    """单个命名空间的缓存统计"""
+
+    def __init__(self):
+        """初始化统计计数"""
+        self.hits = 0
+        self.misses = 0
+        self.bytes_read = 0
+        self.bytes_written = 0
+        self.evictions = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """缓存命中率"""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def to_dict(self) -> dict:
+        """转换为字典格式
+
+        Returns:
+            dict: 统计数据
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hit_rate,
+            "bytes_read": self.bytes_read,
+            "bytes_written": self.bytes_written,
+            "evictions": self.evictions
+        }
+
+
+class DiskCache:
+    """内容寻址磁盘缓存
+
+    缓存键由输入文件内容哈希和参数摘要组成，条目以 pickle 形式存储在
+    <cache_dir>/<namespace>/<key[:2]>/<key>.bin 中。总大小超过上限时按最近访问时间
+    （文件修改时间）淘汰最久未使用的条目。
+
+    多个应用实例可共享同一缓存目录：写入使用临时文件加原子替换，
+    淘汰过程由锁文件互斥，读到被其他实例删除或未写完的条目时按未命中处理。
+    """
+
+    ENTRY_SUFFIX = ".bin"
+    LOCK_STALE_SECONDS = 30
+
+    def __init__(self, cache_dir: str = "cache", max_bytes: int = 512 * 1024 * 1024):
+        """初始化磁盘缓存
+
+        Args:
+            cache_dir: 缓存目录，相对路径相对于程序根目录（而不是当前工作目录）
+            max_bytes: 缓存总大小上限（字节）
+        """
+        self._logger = Logger()
+        self._cache_dir = Path(cache_dir)
+        if not self._cache_dir.is_absolute():
+            self._cache_dir = Path(get_resource_path(cache_dir))
+        self._cache_dir.mkdir(parents=True, exist_ok=True)
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._stats = {}
+        self._total_bytes = self._scan_total_bytes()
+
+    @property
+    def cache_dir(self) -> Path:
+        """缓存目录"""
+        return self._cache_dir
+
+    @staticmethod
+    def make_key(file_path: str = None, **params) -> str:
+        """生成内容寻址缓存键
+
+        Args:
+            file_path: 输入文件路径，使用文件内容哈希参与计算
+            **params: 影响结果的参数，需可JSON序列化
+
+        Returns:
+            str: 缓存键（sha256十六进制字符串）
+        """
+        h = hashlib.sha256()
+        if file_path is not None:
+            h.update(calculate_file_hash(file_path, "sha256").encode("ascii"))
+        h.update(b"\0")
+        h.update(json.dumps(params, sort_keys=True, ensure_ascii=False, default=str).encode("utf-8"))
+        return h.hexdigest()
+
+    def get(self, namespace: str, key: str, default=None):
+        """读取缓存条目
+
+        Args:
+            namespace: 命名空间（如 "yjk_sheets"、"section_diagrams"）
+            key: 缓存键
+            default: 未命中时的返回值
+
+        Returns:
+            缓存的值，未命中时返回 default
+        """
+        path = self._entry_path(namespace, key)
+        stats = self._get_stats(namespace)
+
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+            value = pickle.loads(data)
+        except FileNotFoundError:
+            with self._lock:
+                stats.misses += 1
+            return default
+        except Exception as e:
+            # 损坏的条目直接删除
+            self._logger.warning(f"缓存条目无效，已删除: {path.name} ({e})")
+            self._remove_entry(path)
+            with self._lock:
+                stats.misses += 1
+            return default
+
+        # 更新访问时间，用于LRU淘汰
+        try:
+            os.utime(path, None)
+        except OSError:
+            pass
+
+        with self._lock:
+            stats.hits += 1
+            stats.bytes_read += len(data)
+        return value
+
+    def set(self, namespace: str, key: str, value) -> bool:
+        """写入缓存条目
+
+        Args:
+            namespace: 命名空间
+            key: 缓存键
+            value: 要缓存的值，需可pickle序列化
+
+        Returns:
+            bool: 是否写入成功
+        """
+        path = self._entry_path(namespace, key)
+        try:
+            data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            self._logger.warning(f"缓存值无法序列化: {e}")
+            return False
+
+        if len(data) > self._max_bytes:
+            return False
+
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            old_size = path.stat().st_size if path.exists() else 0
+
+            # 写入同目录临时文件后原子替换，其他实例不会读到半个条目
+            fd, temp_path = tempfile.mkstemp(dir=str(path.parent), suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(data)
+                os.replace(temp_path, path)
+            except Exception:
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
+                raise
+        except OSError as e:
+            self._logger.warning(f"写入缓存失败: {e}")
+            return False
+
+        stats = self._get_stats(namespace)
+        with self._lock:
+            stats.bytes_written += len(data)
+            self._total_bytes += len(data) - old_size
+
+        if self._total_bytes > self._max_bytes:
+            self.evict()
+        return True
+
+    def get_or_compute(self, namespace: str, key: str, compute):
+        """读取缓存条目，未命中时计算并写入
+
+        Args:
+            namespace: 命名空间
+            key: 缓存键
+            compute: 无参数的计算函数
+
+        Returns:
+            缓存或新计算的值
+        """
+        missing = object()
+        value = self.get(namespace, key, missing)
+        if value is not missing:
+            return value
+
+        value = compute()
+        self.set(namespace, key, value)
+        return value
+
+    def delete(self, namespace: str, key: str):
+        """删除缓存条目
+
+        Args:
+            namespace: 命名空间
+            key: 缓存键
+        """
+        self._remove_entry(self._entry_path(namespace, key))
+
+    def clear(self, namespace: str = None):
+        """清空缓存
+
+        Args:
+            namespace: 命名空间，为None时清空所有命名空间
+        """
+        root = self._cache_dir / namespace if namespace else self._cache_dir
+        for path in list(root.rglob(f"*{self.ENTRY_SUFFIX}")):
+            self._remove_entry(path)
+
+    def evict(self):
+        """按LRU淘汰条目，直到总大小不超过上限的90%"""
+        if not self._acquire_file_lock():
+            # 其他实例正在淘汰
+            return
+
+        try:
+            entries = []
+            total = 0
+            for path in self._cache_dir.rglob(f"*{self.ENTRY_SUFFIX}"):
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+                total += stat.st_size
+
+            target = int(self._max_bytes * 0.9)
+            entries.sort(key=lambda entry: entry[0])
+            for _, size, path in entries:
+                if total <= target:
+                    break
+                if self._remove_entry(path, update_total=False):
+                    total -= size
+                    namespace = path.parent.parent.name
+                    with self._lock:
+                        self._get_stats(namespace).evictions += 1
+
+            with self._lock:
+                self._total_bytes = total
+        finally:
+            self._release_file_lock()
+
+    def get_stats(self, namespace: str = None) -> dict:
+        """获取缓存统计
+
+        Args:
+            namespace: 命名空间，为None时返回所有命名空间的统计
+
+        Returns:
+            dict: 单个命名空间的统计字典，或 {命名空间: 统计字典}
+        """
+        with self._lock:
+            if namespace is not None:
+                return self._get_stats(namespace).to_dict()
+            return {name: stats.to_dict() for name, stats in self._stats.items()}
+
+    def get_total_bytes(self) -> int:
+        """获取缓存占用的总字节数"""
+        return self._total_bytes
+
+    def _get_stats(self, namespace: str) -> CacheStats:
+        """获取（必要时创建）命名空间统计对象"""
+        stats = self._stats.get(namespace)
+        if stats is None:
+            stats = self._stats.setdefault(namespace, CacheStats())
+        return stats
+
+    def _entry_path(self, namespace: str, key: str) -> Path:
+        """计算缓存条目的文件路径"""
+        return self._cache_dir / namespace / key[:2] / f"{key}{self.ENTRY_SUFFIX}"
+
+    def _remove_entry(self, path: Path, update_total: bool = True) -> bool:
+        """删除缓存条目文件（容忍已被其他实例删除）
+
+        Returns:
+            bool: 是否删除了文件
+        """
+        try:
+            size = path.stat().st_size
+            path.unlink()
+        except (FileNotFoundError, PermissionError):
+            return False
+
+        if update_total:
+            with self._lock:
+                self._total_bytes = max(self._total_bytes - size, 0)
+        return True
+
+    def _scan_total_bytes(self) -> int:
+        """扫描缓存目录计算总大小"""
+        total = 0
+        for path in self._cache_dir.rglob(f"*{self.ENTRY_SUFFIX}"):
+            try:
+                total += path.stat().st_size
+            except FileNotFoundError:
+                continue
+        return total
+
+    def _lock_path(self) -> Path:
+        """淘汰锁文件路径"""
+        return self._cache_dir / ".evict.lock"
+
+    def _acquire_file_lock(self) -> bool:
+        """获取跨进程淘汰锁
+
+        Returns:
+            bool: 是否获取成功
+        """
+        lock_path = self._lock_path()
+        try:
+            fd = os.open(str(lock_path), os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            os.write(fd, str(os.getpid()).encode("ascii"))
+            os.close(fd)
+            return True
+        except FileExistsError:
+            # 清理异常退出实例遗留的过期锁
+            try:
+                if time.time() - lock_path.stat().st_mtime > self.LOCK_STALE_SECONDS:
+                    lock_path.unlink()
+                    return self._acquire_file_lock()
+            except OSError:
+                pass
+            return False
+
+    def _release_file_lock(self):
+        """释放跨进程淘汰锁"""
+        try:
+            self._lock_path().unlink()
+        except FileNotFoundError:
+            pass
+
+
+_default_cache = None
+_default_cache_lock = threading.Lock()
+
+
+def get_cache(cache_dir: str = None, max_bytes: int = None) -> DiskCache:
+    """获取进程共享的磁盘缓存实例
+
+    首次调用时创建实例，参数仅在首次调用时生效
+
+    Args:
+        cache_dir: 缓存目录，默认为程序根目录下的 "cache"
+        max_bytes: 缓存总大小上限（字节），默认为512MB
+
+    Returns:
+        DiskCache: 共享缓存实例
+    """
+    global _default_cache
+    if _default_cache is None:
+        with _default_cache_lock:
+            if _default_cache is None:
+                kwargs = {}
+                if cache_dir is not None:
+                    kwargs["cache_dir"] = cache_dir
+                if max_bytes is not None:
+                    kwargs["max_bytes"] = max_bytes
+                _default_cache = DiskCache(**kwargs)
+    return _default_cache
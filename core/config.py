@@ -27,13 +27,20 @@ class Config:
             "app": {
                 "language": "zh_CN",
                 "window_size": [1024, 768],
-                "window_position": [100, 100]
+                "window_position": [100, 100],
+                "max_live_tabs": 8,
+                "restore_session": True
             },
             "logger": {
                 "level": "INFO",
                 "file": "logs/fugo_toolbox.log",
                 "max_bytes": 10485760,
-                "backup_count": 5
+                "backup_count": 5,
+                "json_file": None
+            },
+            "cache": {
+                "dir": "cache",
+                "max_bytes": 536870912
             },
             "plugins": {
                 "enabled": [],
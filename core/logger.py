@@ -1,93 +1,235 @@
 """日志系统模块"""
 
+import atexit
+import json
 import logging
-from logging.handlers import RotatingFileHandler
-import os
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 
 
+class JsonLinesFormatter(logging.Formatter):
+    """JSON Lines格式化器
+
+    每条日志输出为一行JSON，附带计时字段，便于批处理任务的日志分析
+    """
+
+    def format(self, record):
+        """格式化日志记录
+
+        Args:
+            record: 日志记录
+
+        Returns:
+            str: 单行JSON字符串
+        """
+        data = {
+            "time": self.formatTime(record, "%Y-%m-%d %H:%M:%S"),
+            "created": record.created,
+            "level": record.levelname,
+            "name": record.name,
+            "file": record.filename,
+            "line": record.lineno,
+            "thread": record.threadName,
+            "message": record.getMessage(),
+            # 自进程启动以来的毫秒数
+            "elapsed_ms": round(record.relativeCreated, 3),
+            # 日志产生到监听线程写出之间的排队延迟
+            "queue_delay_ms": round((time.time() - record.created) * 1000, 3),
+        }
+        duration_ms = getattr(record, "duration_ms", None)
+        if duration_ms is not None:
+            data["duration_ms"] = duration_ms
+        return json.dumps(data, ensure_ascii=False)
+
+
 class Logger:
-    """日志管理类"""
-    
+    """日志管理类
+
+    进程级单例：所有 Logger() 调用返回同一实例。日志记录只写入内存队列，
+    由后台监听线程完成控制台和文件I/O，避免在GUI线程上阻塞。
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __new__(cls):
+        """返回全局唯一的日志实例"""
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    instance = super().__new__(cls)
+                    instance._initialized = False
+                    cls._instance = instance
+        return cls._instance
+
     def __init__(self):
-        """初始化日志系统"""
+        """初始化日志系统（仅首次构造时生效）"""
+        if self._initialized:
+            return
+        self._initialized = True
+
         self._logger = logging.getLogger("FugoToolbox")
         self._logger.setLevel(logging.DEBUG)
-        
+        self._logger.propagate = False
+
         # 清除已存在的处理器
         for handler in self._logger.handlers[:]:
             self._logger.removeHandler(handler)
-        
+
         # 创建日志目录
-        log_dir = Path("logs")
-        log_dir.mkdir(exist_ok=True)
-        
+        self._log_dir = Path("logs")
+        self._log_dir.mkdir(exist_ok=True)
+
         # 配置控制台处理器
         console_handler = logging.StreamHandler()
         console_handler.setLevel(logging.INFO)
         console_formatter = logging.Formatter("%(levelname)s: %(message)s")
         console_handler.setFormatter(console_formatter)
-        
+
         # 配置文件处理器
         file_handler = RotatingFileHandler(
-            str(log_dir / "fugo_toolbox.log"),
+            str(self._log_dir / "fugo_toolbox.log"),
             maxBytes=10 * 1024 * 1024,  # 10MB
-            backupCount=5
+            backupCount=5,
+            encoding="utf-8"
         )
         file_handler.setLevel(logging.DEBUG)
         file_formatter = logging.Formatter(
             "%(asctime)s - %(name)s - %(levelname)s - %(filename)s:%(lineno)d - %(message)s"
         )
         file_handler.setFormatter(file_formatter)
-        
-        # 添加处理器
-        self._logger.addHandler(console_handler)
-        self._logger.addHandler(file_handler)
-    
+
+        self._handlers = [console_handler, file_handler]
+        self._json_handler = None
+
+        # 调用方只向队列写入，I/O由监听线程完成
+        self._queue = queue.SimpleQueue()
+        self._logger.addHandler(QueueHandler(self._queue))
+        self._listener = None
+        self._start_listener()
+
+        atexit.register(self.shutdown)
+
+    def _start_listener(self):
+        """启动（或重启）后台监听线程"""
+        self._listener = QueueListener(self._queue, *self._handlers, respect_handler_level=True)
+        self._listener.start()
+
+    def _restart_listener(self):
+        """在处理器列表变化后重启监听线程"""
+        if self._listener is not None:
+            self._listener.stop()
+        self._start_listener()
+
+    def enable_json_sink(self, file_path: str = None):
+        """启用结构化JSON Lines日志输出
+
+        Args:
+            file_path: JSON日志文件路径，默认为 logs/fugo_toolbox.jsonl
+        """
+        if self._json_handler is not None:
+            return
+
+        if file_path is None:
+            file_path = str(self._log_dir / "fugo_toolbox.jsonl")
+        Path(file_path).parent.mkdir(parents=True, exist_ok=True)
+
+        json_handler = RotatingFileHandler(
+            file_path,
+            maxBytes=10 * 1024 * 1024,  # 10MB
+            backupCount=5,
+            encoding="utf-8"
+        )
+        json_handler.setLevel(logging.DEBUG)
+        json_handler.setFormatter(JsonLinesFormatter())
+
+        self._json_handler = json_handler
+        self._handlers.append(json_handler)
+        self._restart_listener()
+
+    def disable_json_sink(self):
+        """关闭结构化JSON Lines日志输出"""
+        if self._json_handler is None:
+            return
+
+        self._handlers.remove(self._json_handler)
+        self._restart_listener()
+        self._json_handler.close()
+        self._json_handler = None
+
+    def shutdown(self):
+        """停止监听线程并刷新所有待写日志"""
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
+        for handler in self._handlers:
+            handler.flush()
+
+    @contextmanager
+    def timed(self, message: str):
+        """记录代码块耗时
+
+        在代码块结束时记录一条INFO日志，并在JSON日志中附带 duration_ms 字段
+
+        Args:
+            message: 日志信息
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            duration_ms = round((time.perf_counter() - start) * 1000, 3)
+            self._logger.info(f"{message} ({duration_ms:.1f} ms)",
+                              extra={"duration_ms": duration_ms}, stacklevel=3)
+
     def debug(self, message: str):
         """记录调试信息
-        
+
         Args:
             message: 日志信息
         """
-        self._logger.debug(message)
-    
+        self._logger.debug(message, stacklevel=2)
+
     def info(self, message: str):
         """记录普通信息
-        
+
         Args:
             message: 日志信息
         """
-        self._logger.info(message)
-    
+        self._logger.info(message, stacklevel=2)
+
     def warning(self, message: str):
         """记录警告信息
-        
+
         Args:
             message: 日志信息
         """
-        self._logger.warning(message)
-    
+        self._logger.warning(message, stacklevel=2)
+
     def error(self, message: str):
         """记录错误信息
-        
+
         Args:
             message: 日志信息
         """
-        self._logger.error(message)
-    
+        self._logger.error(message, stacklevel=2)
+
     def critical(self, message: str):
         """记录严重错误信息
-        
+
         Args:
             message: 日志信息
         """
-        self._logger.critical(message)
-    
+        self._logger.critical(message, stacklevel=2)
+
     def exception(self, message: str):
         """记录异常信息
-        
+
         Args:
             message: 日志信息
         """
-        self._logger.exception(message)
+        self._logger.exception(message, stacklevel=2)
@@ -0,0 +1,92 @@
+"""会话持久化模块"""
+
+import base64
+import json
+from pathlib import Path
+
+from core.logger import Logger
+
+
+class SessionStore:
+    """会话存储类
+
+    记录退出时打开的标签页（插件名称、标题和 save() 生成的状态），
+    供下次启动时恢复工作区
+    """
+
+    VERSION = 1
+
+    def __init__(self, session_file: str = "config/session.json"):
+        """初始化会话存储
+
+        Args:
+            session_file: 会话文件路径
+        """
+        self._logger = Logger()
+        self._session_file = Path(session_file)
+
+    def save(self, tabs: list, current_index: int = 0):
+        """保存会话
+
+        Args:
+            tabs: 标签页列表，每个元素为字典，包含 plugin、title、state（bytes或None）
+            current_index: 当前标签页在 tabs 中的索引
+        """
+        data = {
+            "version": self.VERSION,
+            "current_index": current_index,
+            "tabs": [
+                {
+                    "plugin": tab["plugin"],
+                    "title": tab["title"],
+                    "state": base64.b64encode(tab["state"]).decode("ascii") if tab.get("state") else None
+                }
+                for tab in tabs
+            ]
+        }
+
+        try:
+            self._session_file.parent.mkdir(parents=True, exist_ok=True)
+            # 先写临时文件再替换，避免异常退出时留下损坏的会话文件
+            temp_file = self._session_file.with_suffix(".tmp")
+            with open(temp_file, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+            temp_file.replace(self._session_file)
+            self._logger.info(f"Saved session with {len(tabs)} tabs")
+        except Exception as e:
+            self._logger.error(f"保存会话失败: {e}")
+
+    def load(self):
+        """加载会话
+
+        Returns:
+            tuple: (标签页列表, 当前标签页索引)，标签页的 state 已解码为bytes；
+                   会话文件不存在或无效时返回 ([], 0)
+        """
+        if not self._session_file.exists():
+            return [], 0
+
+        try:
+            with open(self._session_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+
+            if data.get("version") != self.VERSION:
+                return [], 0
+
+            tabs = []
+            for tab in data.get("tabs", []):
+                state = tab.get("state")
+                tabs.append({
+                    "plugin": tab["plugin"],
+                    "title": tab.get("title") or tab["plugin"],
+                    "state": base64.b64decode(state) if state else None
+                })
+            return tabs, data.get("current_index", 0)
+        except Exception as e:
+            self._logger.error(f"加载会话失败: {e}")
+            return [], 0
+
+    def clear(self):
+        """删除会话文件"""
+        if self._session_file.exists():
+            self._session_file.unlink()
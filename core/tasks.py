@@ -0,0 +1,376 @@
+"""后台任务调度模块"""
+
+import enum
+import itertools
+import threading
+import traceback
+from concurrent.futures import CancelledError, ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+
+from core.logger import Logger
+
+
+class TaskPriority(enum.IntEnum):
+    """任务优先级，数值越大越先执行"""
+
+    LOW = 0
+    NORMAL = 5
+    HIGH = 10
+
+
+class TaskState(enum.Enum):
+    """任务状态"""
+
+    PENDING = "pending"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
+class TaskCancelledError(Exception):
+    """任务已被取消"""
+
+
+class CancellationToken:
+    """协作式取消令牌
+
+    任务函数应在循环或阶段之间检查令牌，发现取消后尽快返回
+    """
+
+    def __init__(self):
+        """初始化取消令牌"""
+        self._event = threading.Event()
+
+    def cancel(self):
+        """请求取消"""
+        self._event.set()
+
+    @property
+    def is_cancelled(self) -> bool:
+        """是否已请求取消"""
+        return self._event.is_set()
+
+    def raise_if_cancelled(self):
+        """若已请求取消则抛出 TaskCancelledError"""
+        if self._event.is_set():
+            raise TaskCancelledError()
+
+
+class TaskContext:
+    """任务上下文，传递给以 with_context=True 提交的任务函数"""
+
+    def __init__(self, token: CancellationToken, signals):
+        """初始化任务上下文
+
+        Args:
+            token: 取消令牌
+            signals: 内部信号对象
+        """
+        self.token = token
+        self._signals = signals
+
+    @property
+    def is_cancelled(self) -> bool:
+        """是否已请求取消"""
+        return self.token.is_cancelled
+
+    def check_cancelled(self):
+        """若已请求取消则抛出 TaskCancelledError"""
+        self.token.raise_if_cancelled()
+
+    def report_progress(self, percent: int, message: str = ""):
+        """报告任务进度（可在工作线程中调用）
+
+        Args:
+            percent: 进度百分比（0-100）
+            message: 进度说明
+        """
+        self._signals.progress.emit(int(percent), message)
+
+
+class _TaskSignals(QObject):
+    """工作线程到GUI线程的内部信号"""
+
+    # 进度：百分比、说明
+    progress = Signal(int, str)
+    # 结束：状态、结果或错误信息
+    done = Signal(object, object)
+
+
+class TaskHandle(QObject):
+    """任务句柄
+
+    公共信号总是在GUI线程中发出，可以直接连接到任意可调用对象
+    """
+
+    # 进度信号：百分比、说明
+    progress = Signal(int, str)
+    # 成功信号：任务结果
+    succeeded = Signal(object)
+    # 失败信号：错误信息
+    failed = Signal(str)
+    # 取消信号
+    cancelled = Signal()
+    # 结束信号：无论成功、失败或取消都会发出
+    finished = Signal()
+
+    _ids = itertools.count(1)
+
+    def __init__(self, name: str, priority: TaskPriority, parent=None):
+        """初始化任务句柄
+
+        Args:
+            name: 任务名称（显示在状态栏）
+            priority: 任务优先级
+            parent: 父对象
+        """
+        super().__init__(parent)
+        self.task_id = next(self._ids)
+        self.name = name
+        self.priority = priority
+        self.token = CancellationToken()
+        self.state = TaskState.PENDING
+        self.result = None
+        self.error = None
+        self.progress_value = 0
+        self.progress_message = ""
+        self._future = None
+
+        # 工作线程发出的内部信号经队列连接转到GUI线程
+        self._signals = _TaskSignals(self)
+        self._signals.progress.connect(self._on_progress)
+        self._signals.done.connect(self._on_done)
+
+    def cancel(self):
+        """请求取消任务
+
+        未开始的任务不会再执行；运行中的任务需在函数内部检查取消令牌
+        """
+        self.token.cancel()
+        future = self._future
+        if future is not None:
+            future.cancel()
+
+    def is_done(self) -> bool:
+        """任务是否已结束"""
+        return self.state in (TaskState.SUCCEEDED, TaskState.FAILED, TaskState.CANCELLED)
+
+    def _on_progress(self, percent: int, message: str):
+        """转发进度（GUI线程）"""
+        self.progress_value = percent
+        self.progress_message = message
+        self.progress.emit(percent, message)
+
+    def _on_done(self, state: TaskState, payload):
+        """转发结束状态（GUI线程）"""
+        self.state = state
+        if state == TaskState.SUCCEEDED:
+            self.result = payload
+            self.succeeded.emit(payload)
+        elif state == TaskState.FAILED:
+            self.error = payload
+            self.failed.emit(payload)
+        else:
+            self.cancelled.emit()
+        self.finished.emit()
+
+
+class _TaskRunnable(QRunnable):
+    """在线程池中执行任务的Runnable"""
+
+    def __init__(self, handle: TaskHandle, func, args, kwargs, with_context: bool, executor=None):
+        """初始化Runnable
+
+        Args:
+            handle: 任务句柄
+            func: 任务函数
+            args: 位置参数
+            kwargs: 关键字参数
+            with_context: 是否将 TaskContext 作为第一个参数传给任务函数
+            executor: 进程池，不为None时任务函数在子进程中执行
+        """
+        super().__init__()
+        self.setAutoDelete(True)
+        self._handle = handle
+        self._signals = handle._signals
+        self._token = handle.token
+        self._name = handle.name
+        self._func = func
+        self._args = args
+        self._kwargs = kwargs
+        self._with_context = with_context
+        self._executor = executor
+
+    def run(self):
+        """执行任务并通过信号报告结果"""
+        if self._token.is_cancelled:
+            self._signals.done.emit(TaskState.CANCELLED, None)
+            return
+
+        self._handle.state = TaskState.RUNNING
+        try:
+            if self._executor is not None:
+                result = self._run_in_process()
+            elif self._with_context:
+                result = self._func(TaskContext(self._token, self._signals), *self._args, **self._kwargs)
+            else:
+                result = self._func(*self._args, **self._kwargs)
+        except (TaskCancelledError, CancelledError):
+            self._signals.done.emit(TaskState.CANCELLED, None)
+        except Exception as e:
+            Logger().error(f"任务 {self._name} 失败: {e}\n{traceback.format_exc()}")
+            self._signals.done.emit(TaskState.FAILED, str(e))
+        else:
+            if self._token.is_cancelled:
+                self._signals.done.emit(TaskState.CANCELLED, None)
+            else:
+                self._signals.done.emit(TaskState.SUCCEEDED, result)
+
+    def _run_in_process(self):
+        """在进程池中执行任务，等待期间响应取消请求"""
+        future = self._executor.submit(self._func, *self._args, **self._kwargs)
+        self._handle._future = future
+        while True:
+            try:
+                return future.result(timeout=0.1)
+            except FutureTimeoutError:
+                if self._token.is_cancelled:
+                    future.cancel()
+                    raise TaskCancelledError()
+
+
+class TaskScheduler(QObject):
+    """后台任务调度器
+
+    - 线程任务在 QThreadPool 中按优先级执行，适合I/O和释放GIL的计算；
+    - 进程任务（use_process=True）在进程池中执行，适合纯Python的CPU密集计算，
+      任务函数和参数需可pickle；
+    - 每个任务返回 TaskHandle，提供进度、结果、错误和取消。
+    """
+
+    # 任务开始排队
+    task_submitted = Signal(object)
+    # 任务进度变化
+    task_progress = Signal(object)
+    # 任务结束（成功、失败或取消）
+    task_finished = Signal(object)
+    # 未结束任务数量变化
+    active_count_changed = Signal(int)
+
+    def __init__(self, max_threads: int = None, max_processes: int = None, parent=None):
+        """初始化任务调度器
+
+        Args:
+            max_threads: 线程池最大线程数，默认为CPU核数
+            max_processes: 进程池最大进程数，默认为CPU核数
+            parent: 父对象
+        """
+        super().__init__(parent)
+        self._logger = Logger()
+        self._thread_pool = QThreadPool(self)
+        if max_threads:
+            self._thread_pool.setMaxThreadCount(max_threads)
+        self._max_processes = max_processes
+        self._process_pool = None
+        self._active = []
+
+    def submit(self, func, args=(), kwargs=None, name: str = "", priority: TaskPriority = TaskPriority.NORMAL,
+               with_context: bool = False, use_process: bool = False) -> TaskHandle:
+        """提交后台任务
+
+        Args:
+            func: 任务函数
+            args: 位置参数
+            kwargs: 关键字参数
+            name: 任务名称（显示在状态栏）
+            priority: 任务优先级
+            with_context: 是否将 TaskContext 作为第一个参数传入（用于进度和取消）
+            use_process: 是否在子进程中执行（不支持 with_context）
+
+        Returns:
+            TaskHandle: 任务句柄
+        """
+        if use_process and with_context:
+            raise ValueError("进程任务不支持 with_context")
+
+        handle = TaskHandle(name or getattr(func, "__name__", "task"), priority, self)
+        handle.finished.connect(lambda h=handle: self._on_task_finished(h))
+        handle.progress.connect(lambda *_: self.task_progress.emit(handle))
+
+        executor = self._get_process_pool() if use_process else None
+        runnable = _TaskRunnable(handle, func, tuple(args), dict(kwargs or {}), with_context, executor)
+
+        self._active.append(handle)
+        self.task_submitted.emit(handle)
+        self.active_count_changed.emit(len(self._active))
+
+        self._thread_pool.start(runnable, int(priority))
+        return handle
+
+    def active_tasks(self) -> list:
+        """获取未结束的任务列表"""
+        return list(self._active)
+
+    def cancel_all(self):
+        """取消所有未结束的任务"""
+        for handle in list(self._active):
+            handle.cancel()
+
+    def wait_for_done(self, timeout_ms: int = -1) -> bool:
+        """等待线程池中的任务全部结束
+
+        Args:
+            timeout_ms: 超时时间（毫秒），-1表示一直等待
+
+        Returns:
+            bool: 是否在超时前全部结束
+        """
+        return self._thread_pool.waitForDone(timeout_ms)
+
+    def shutdown(self, wait: bool = False):
+        """取消任务并关闭线程池和进程池
+
+        Args:
+            wait: 是否等待运行中的任务结束
+        """
+        self.cancel_all()
+        self._thread_pool.clear()
+        if wait:
+            self._thread_pool.waitForDone()
+        if self._process_pool is not None:
+            self._process_pool.shutdown(wait=wait, cancel_futures=True)
+            self._process_pool = None
+
+    def _get_process_pool(self):
+        """获取（必要时创建）进程池"""
+        if self._process_pool is None:
+            self._process_pool = ProcessPoolExecutor(max_workers=self._max_processes)
+        return self._process_pool
+
+    def _on_task_finished(self, handle: TaskHandle):
+        """处理任务结束（GUI线程）"""
+        if handle in self._active:
+            self._active.remove(handle)
+        self.task_finished.emit(handle)
+        self.active_count_changed.emit(len(self._active))
+        handle.deleteLater()
+
+
+_scheduler = None
+
+
+def get_scheduler() -> TaskScheduler:
+    """获取进程共享的任务调度器
+
+    需在GUI线程中、QApplication创建之后调用
+
+    Returns:
+        TaskScheduler: 共享任务调度器
+    """
+    global _scheduler
+    if _scheduler is None:
+        _scheduler = TaskScheduler()
+    return _scheduler
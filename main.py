@@ -3,6 +3,7 @@
 
 import sys
 import os
+import multiprocessing
 
 # 添加项目根目录到Python路径
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -17,4 +18,6 @@ def main():
 
 
 if __name__ == "__main__":
+    # 打包为可执行文件后，后台任务进程池需要此调用
+    multiprocessing.freeze_support()
     sys.exit(main())
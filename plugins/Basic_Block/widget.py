@@ -16,6 +16,7 @@ from PySide6.QtWidgets import (
 from PySide6.QtGui import QPixmap
 from PySide6.QtCore import Signal, Slot, Qt
 
+from core.tasks import get_scheduler
 from plugins.Basic_Block.logic import BasicBlockLogic
 
 
@@ -29,6 +30,9 @@ class BasicBlockWidget(QWidget):
         # 初始化业务逻辑
         self._logic = BasicBlockLogic()
         
+        # 正在执行的导出任务
+        self._export_handles = []
+        
         # 初始化UI
         self._init_ui()
         
@@ -982,8 +986,75 @@ class BasicBlockWidget(QWidget):
         """
         import json
         
-        # 收集所有输入参数
-        data = {
+        # 将数据保存到文件
+        try:
+            with open(file_path, 'w', encoding='utf-8') as f:
+                json.dump(self._collect_params(), f, ensure_ascii=False, indent=4)
+            # 更新结果文本框
+            self._result_text.append(f"参数已保存到: {file_path}")
+        except Exception as e:
+            self._result_text.append(f"保存失败: {str(e)}")
+    
+    def open(self, file_path):
+        """从文件中加载参数并填充到输入框
+        
+        Args:
+            file_path: 加载文件的路径
+        """
+        import json
+        
+        try:
+            # 从文件中读取数据
+            with open(file_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            
+            # 填充输入框
+            self._apply_params(data)
+            
+            # 更新结果文本框
+            self._result_text.append(f"从文件加载参数: {file_path}")
+        except Exception as e:
+            self._result_text.append(f"加载失败: {str(e)}")
+    
+    def hibernate_state(self) -> bytes:
+        """生成标签页休眠时保存的状态（输入参数和计算结果）
+        
+        与 save() 的格式兼容，额外保存结果文本框的内容
+        
+        Returns:
+            bytes: 状态数据
+        """
+        import json
+        
+        data = self._collect_params()
+        data["计算结果"] = self._result_text.toHtml()
+        return json.dumps(data, ensure_ascii=False).encode('utf-8')
+    
+    def restore_state(self, state: bytes):
+        """恢复 hibernate_state() 或 save() 生成的状态，保留计算结果且不输出加载信息
+        
+        Args:
+            state: 状态数据
+        """
+        import json
+        
+        data = json.loads(state.decode('utf-8'))
+        self._apply_params(data)
+        if data.get("计算结果"):
+            self._result_text.setHtml(data["计算结果"])
+    
+    def has_active_tasks(self) -> bool:
+        """检查是否有正在执行的导出任务（此时不能销毁组件）"""
+        self._export_handles = [handle for handle in self._export_handles if not handle.is_done()]
+        return bool(self._export_handles)
+    
+    def _collect_params(self) -> dict:
+        """收集所有输入参数
+        
+        Returns:
+            dict: 参数名到输入内容的映射
+        """
+        return {
             "基础长度": self._length_input.text(),
             "基础宽度": self._width_input.text(),
             "基础高度": self._height_input.text(),
@@ -1007,108 +1078,87 @@ class BasicBlockWidget(QWidget):
             "桩根数": self._pile_count_input.text(),
             "基础个数": self._foundation_count_input.text()
         }
-        
-        # 将数据保存到文件
-        try:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=4)
-            # 更新结果文本框
-            self._result_text.append(f"参数已保存到: {file_path}")
-        except Exception as e:
-            self._result_text.append(f"保存失败: {str(e)}")
     
-    def open(self, file_path):
-        """从文件中加载参数并填充到输入框
+    def _apply_params(self, data: dict):
+        """将参数填充到输入框
         
         Args:
-            file_path: 加载文件的路径
+            data: 参数名到输入内容的映射
         """
-        import json
-        
-        try:
-            # 从文件中读取数据
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            # 填充输入框
-            if "基础长度" in data:
-                self._length_input.setText(data["基础长度"])
-            if "基础宽度" in data:
-                self._width_input.setText(data["基础宽度"])
-            if "基础高度" in data:
-                self._height_input.setText(data["基础高度"])
-            if "基础高出地面高度" in data:
-                self._height_above_ground_input.setText(data["基础高出地面高度"])
-            elif "基底埋深" in data:
-                # 兼容旧版数据
-                self._height_above_ground_input.setText(data["基底埋深"])
-            if "垫层厚度" in data:
-                self._cushion_input.setText(data["垫层厚度"])
-            if "二次灌浆厚度" in data:
-                self._grout_input.setText(data["二次灌浆厚度"])
-            if "地基承载力" in data:
-                self._bearing_input.setText(data["地基承载力"])
-            if "上部荷载" in data:
-                self._load_input.setText(data["上部荷载"])
-            if "预埋钢板长度" in data:
-                self._plate_length_input.setText(data["预埋钢板长度"])
-            if "预埋钢板宽度" in data:
-                self._plate_width_input.setText(data["预埋钢板宽度"])
-            if "预埋钢板厚度" in data:
-                self._plate_thickness_input.setText(data["预埋钢板厚度"])
-            if "地脚螺栓个数" in data:
-                self._anchor_count_input.setText(data["地脚螺栓个数"])
-            if "地脚螺栓直径" in data:
-                self._anchor_diam_input.setText(data["地脚螺栓直径"])
-            if "地脚螺栓长度" in data:
-                self._anchor_length_input.setText(data["地脚螺栓长度"])
-
-            if "基础混凝土材质" in data:
-                material = data["基础混凝土材质"]
-                index = self._concrete_material_combo.findText(material)
-                if index >= 0:
-                    self._concrete_material_combo.setCurrentIndex(index)
-            if "换填厚度" in data:
-                self._replacement_thickness_input.setText(data["换填厚度"])
-            if "换填宽度" in data:
-                self._replacement_width_input.setText(data["换填宽度"])
-            if "是否素砼" in data:
-                is_plain_concrete = data["是否素砼"]
-                if is_plain_concrete == "是":
-                    self._is_plain_concrete_yes_btn.setChecked(True)
-                    self._is_plain_concrete_no_btn.setChecked(False)
-                else:
-                    self._is_plain_concrete_no_btn.setChecked(True)
-                    self._is_plain_concrete_yes_btn.setChecked(False)
+        # 填充输入框
+        if "基础长度" in data:
+            self._length_input.setText(data["基础长度"])
+        if "基础宽度" in data:
+            self._width_input.setText(data["基础宽度"])
+        if "基础高度" in data:
+            self._height_input.setText(data["基础高度"])
+        if "基础高出地面高度" in data:
+            self._height_above_ground_input.setText(data["基础高出地面高度"])
+        elif "基底埋深" in data:
             # 兼容旧版数据
-            elif "是否泵基础" in data:
-                is_pump = data["是否泵基础"]
-                # 旧版泵基础的"是"对应现在的"否"，因为泵基础通常不是素砼
-                if is_pump == "是":
-                    self._is_plain_concrete_no_btn.setChecked(True)
-                    self._is_plain_concrete_yes_btn.setChecked(False)
-                else:
-                    self._is_plain_concrete_no_btn.setChecked(True)
-                    self._is_plain_concrete_yes_btn.setChecked(False)
-            if "是否打桩" in data:
-                is_pile = data["是否打桩"]
-                if is_pile == "是":
-                    self._is_pile_yes_btn.setChecked(True)
-                    self._is_pile_no_btn.setChecked(False)
-                    self._pile_count_input.setEnabled(True)
-                else:
-                    self._is_pile_no_btn.setChecked(True)
-                    self._is_pile_yes_btn.setChecked(False)
-                    self._pile_count_input.setEnabled(False)
-            if "桩根数" in data:
-                self._pile_count_input.setText(data["桩根数"])
-            if "基础个数" in data:
-                self._foundation_count_input.setText(data["基础个数"])
-            
-            # 更新结果文本框
-            self._result_text.append(f"从文件加载参数: {file_path}")
-        except Exception as e:
-            self._result_text.append(f"加载失败: {str(e)}")
+            self._height_above_ground_input.setText(data["基底埋深"])
+        if "垫层厚度" in data:
+            self._cushion_input.setText(data["垫层厚度"])
+        if "二次灌浆厚度" in data:
+            self._grout_input.setText(data["二次灌浆厚度"])
+        if "地基承载力" in data:
+            self._bearing_input.setText(data["地基承载力"])
+        if "上部荷载" in data:
+            self._load_input.setText(data["上部荷载"])
+        if "预埋钢板长度" in data:
+            self._plate_length_input.setText(data["预埋钢板长度"])
+        if "预埋钢板宽度" in data:
+            self._plate_width_input.setText(data["预埋钢板宽度"])
+        if "预埋钢板厚度" in data:
+            self._plate_thickness_input.setText(data["预埋钢板厚度"])
+        if "地脚螺栓个数" in data:
+            self._anchor_count_input.setText(data["地脚螺栓个数"])
+        if "地脚螺栓直径" in data:
+            self._anchor_diam_input.setText(data["地脚螺栓直径"])
+        if "地脚螺栓长度" in data:
+            self._anchor_length_input.setText(data["地脚螺栓长度"])
+
+        if "基础混凝土材质" in data:
+            material = data["基础混凝土材质"]
+            index = self._concrete_material_combo.findText(material)
+            if index >= 0:
+                self._concrete_material_combo.setCurrentIndex(index)
+        if "换填厚度" in data:
+            self._replacement_thickness_input.setText(data["换填厚度"])
+        if "换填宽度" in data:
+            self._replacement_width_input.setText(data["换填宽度"])
+        if "是否素砼" in data:
+            is_plain_concrete = data["是否素砼"]
+            if is_plain_concrete == "是":
+                self._is_plain_concrete_yes_btn.setChecked(True)
+                self._is_plain_concrete_no_btn.setChecked(False)
+            else:
+                self._is_plain_concrete_no_btn.setChecked(True)
+                self._is_plain_concrete_yes_btn.setChecked(False)
+        # 兼容旧版数据
+        elif "是否泵基础" in data:
+            is_pump = data["是否泵基础"]
+            # 旧版泵基础的"是"对应现在的"否"，因为泵基础通常不是素砼
+            if is_pump == "是":
+                self._is_plain_concrete_no_btn.setChecked(True)
+                self._is_plain_concrete_yes_btn.setChecked(False)
+            else:
+                self._is_plain_concrete_no_btn.setChecked(True)
+                self._is_plain_concrete_yes_btn.setChecked(False)
+        if "是否打桩" in data:
+            is_pile = data["是否打桩"]
+            if is_pile == "是":
+                self._is_pile_yes_btn.setChecked(True)
+                self._is_pile_no_btn.setChecked(False)
+                self._pile_count_input.setEnabled(True)
+            else:
+                self._is_pile_no_btn.setChecked(True)
+                self._is_pile_yes_btn.setChecked(False)
+                self._pile_count_input.setEnabled(False)
+        if "桩根数" in data:
+            self._pile_count_input.setText(data["桩根数"])
+        if "基础个数" in data:
+            self._foundation_count_input.setText(data["基础个数"])
     
     @Slot()
     def _on_export_triggered(self):
@@ -1502,23 +1552,12 @@ class BasicBlockWidget(QWidget):
                 for run in footer_paragraph.runs:
                     run.font.color.rgb = RGBColor(0, 0, 0)  # 黑色
                 
-                # 保存文档
-                doc.save(file_path)
-                
-                from PySide6.QtWidgets import QMessageBox
-                from PySide6.QtGui import QDesktopServices
-                from PySide6.QtCore import QUrl
-                
-                msg_box = QMessageBox()
-                msg_box.setWindowTitle("成功")
-                msg_box.setText(f"计算书已成功保存到：\n{file_path}")
-                msg_box.setIcon(QMessageBox.Information)
-                msg_box.addButton("确定", QMessageBox.AcceptRole)
-                msg_box.addButton("打开文件", QMessageBox.ActionRole)
-                
-                result = msg_box.exec_()
-                if result == 1:  # 打开文件按钮被点击
-                    QDesktopServices.openUrl(QUrl.fromLocalFile(file_path))
+                # 保存文档在后台任务中执行
+                handle = get_scheduler().submit(
+                    self._save_document, args=(doc, file_path), name="导出块式基础计算书")
+                self._export_handles.append(handle)
+                handle.succeeded.connect(self._on_report_exported)
+                handle.failed.connect(self._on_report_export_failed)
                 
             except ValueError as e:
                 from PySide6.QtWidgets import QMessageBox
@@ -1534,6 +1573,59 @@ class BasicBlockWidget(QWidget):
             import traceback
             traceback.print_exc()
 
+    @staticmethod
+    def _save_document(document, file_path):
+        """保存Word文档或Excel工作簿（在后台任务中执行）
+        
+        Args:
+            document: python-docx 文档或 openpyxl 工作簿
+            file_path: 保存路径
+            
+        Returns:
+            str: 保存路径
+        """
+        document.save(file_path)
+        return file_path
+    
+    def _show_saved_message(self, text, file_path):
+        """提示保存成功，并提供打开文件按钮"""
+        from PySide6.QtWidgets import QMessageBox
+        from PySide6.QtGui import QDesktopServices
+        from PySide6.QtCore import QUrl
+        
+        msg_box = QMessageBox()
+        msg_box.setWindowTitle("成功")
+        msg_box.setText(f"{text}\n{file_path}")
+        msg_box.setIcon(QMessageBox.Information)
+        msg_box.addButton("确定", QMessageBox.AcceptRole)
+        msg_box.addButton("打开文件", QMessageBox.ActionRole)
+        
+        result = msg_box.exec_()
+        if result == 1:  # 打开文件按钮被点击
+            QDesktopServices.openUrl(QUrl.fromLocalFile(file_path))
+    
+    @Slot(object)
+    def _on_report_exported(self, file_path):
+        """计算书保存完成"""
+        self._show_saved_message("计算书已成功保存到：", file_path)
+    
+    @Slot(str)
+    def _on_report_export_failed(self, error):
+        """计算书保存失败"""
+        from PySide6.QtWidgets import QMessageBox
+        QMessageBox.critical(self, "错误", f"导出计算书失败：\n{error}")
+    
+    @Slot(object)
+    def _on_material_exported(self, file_path):
+        """料表保存完成"""
+        self._show_saved_message("料表已成功保存到：", file_path)
+    
+    @Slot(str)
+    def _on_material_export_failed(self, error):
+        """料表保存失败"""
+        from PySide6.QtWidgets import QMessageBox
+        QMessageBox.critical(self, "错误", f"导出料表失败：\n{error}")
+
     @Slot()
     def _on_export_material_triggered(self):
         """处理导出料表按钮的点击事件"""
@@ -1662,21 +1754,12 @@ class BasicBlockWidget(QWidget):
                     # 设置第二列为数值格式，保留三位小数
                     ws[f'B{idx}'].number_format = '0.000'
 
-                wb.save(file_path)
-
-                from PySide6.QtGui import QDesktopServices
-                from PySide6.QtCore import QUrl
-                
-                msg_box = QMessageBox()
-                msg_box.setWindowTitle("成功")
-                msg_box.setText(f"料表已成功保存到：\n{file_path}")
-                msg_box.setIcon(QMessageBox.Information)
-                msg_box.addButton("确定", QMessageBox.AcceptRole)
-                msg_box.addButton("打开文件", QMessageBox.ActionRole)
-                
-                result = msg_box.exec_()
-                if result == 1:  # 打开文件按钮被点击
-                    QDesktopServices.openUrl(QUrl.fromLocalFile(file_path))
+                # 保存工作簿在后台任务中执行
+                handle = get_scheduler().submit(
+                    self._save_document, args=(wb, file_path), name="导出块式基础料表")
+                self._export_handles.append(handle)
+                handle.succeeded.connect(self._on_material_exported)
+                handle.failed.connect(self._on_material_export_failed)
 
         except ValueError as e:
             QMessageBox.critical(self, "错误", f"导出料表失败：\n输入参数错误：{str(e)}")
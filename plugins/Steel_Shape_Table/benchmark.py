@@ -0,0 +1,389 @@
+"""型钢特性表性能基准
+
+在 offscreen Qt 平台下驱动 SectionDatabase、SteelShapeLogic、SteelShapeTableWidget 和
+SectionDiagram，测量类型切换、关键词搜索、表格填充、选中到截面图、缩放重绘的耗时，
+统计各项的百分位数和缓存命中率，并与保存的基线比较。
+
+用法（在项目根目录执行）：
+    python -m plugins.Steel_Shape_Table.benchmark                  # 运行并与基线比较
+    python -m plugins.Steel_Shape_Table.benchmark --save-baseline  # 运行并保存为新基线
+
+存在回退（中位数超过基线的容差）时退出码为 1。
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+from typing import Callable, Dict, List
+
+import numpy as np
+
+
+# 默认基线文件（与机器相关，不纳入版本库）
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "benchmark_baseline.json")
+
+# 中位数超过基线的比例容差，以及低于该绝对差值（毫秒）的变化不视为回退
+DEFAULT_TOLERANCE = 0.25
+MIN_REGRESSION_MS = 0.05
+
+# 关键词搜索使用的关键词
+SEARCH_KEYWORDS = ("200", "HW", "HN400", "L100", "I20", "300x300", "H250X125", "CH10")
+
+# 表格填充测试的行数
+FILL_ROW_COUNTS = (10, 50, 100, 200, 400)
+
+# 缩放测试的缩放因子序列（放大后再缩小）
+ZOOM_STEPS = tuple(1.2 ** step for step in (*range(8), *range(8, -1, -1)))
+
+BASELINE_FORMAT = 1
+
+
+def summarize(samples: List[float]) -> dict:
+    """计算耗时样本的统计值
+
+    Args:
+        samples: 耗时样本（秒）
+
+    Returns:
+        dict: {count, mean, p50, p90, p99, max}，单位毫秒
+    """
+    values = np.asarray(samples, dtype=float) * 1000.0
+    if values.size == 0:
+        return {"count": 0}
+    p50, p90, p99 = np.percentile(values, (50, 90, 99))
+    return {
+        "count": int(values.size),
+        "mean": float(values.mean()),
+        "p50": float(p50),
+        "p90": float(p90),
+        "p99": float(p99),
+        "max": float(values.max()),
+    }
+
+
+def _time(func: Callable, repeat: int) -> List[float]:
+    """重复执行并记录每次的耗时（秒）"""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+class SteelShapeBenchmark:
+    """型钢特性表性能基准"""
+
+    def __init__(self, repeat: int = 20):
+        """初始化基准
+
+        Args:
+            repeat: 每项测量的重复次数
+        """
+        self._repeat = repeat
+        self._samples = {}
+        self._caches = {}
+
+    def run(self) -> dict:
+        """运行全部基准
+
+        Returns:
+            dict: {"metrics": {名称: 统计值}, "caches": {名称: 命中率等}, "environment": {...}}
+        """
+        os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+        from PySide6.QtWidgets import QApplication
+
+        app = QApplication.instance() or QApplication(sys.argv[:1])
+
+        from plugins.Steel_Shape_Table.widget import SteelShapeTableWidget
+
+        widget = SteelShapeTableWidget()
+        widget.resize(1400, 900)
+        widget.show()
+        self._wait_loaded(app, widget)
+
+        self._bench_database(widget._logic)
+        self._bench_logic(widget._logic)
+        self._bench_type_switch(app, widget)
+        self._bench_keyword_search(app, widget)
+        self._bench_table_fill(app, widget)
+        self._bench_selection(app, widget)
+        self._bench_zoom(app, widget)
+        self._collect_cache_stats(widget)
+        widget.close()
+
+        from PySide6 import __version__ as pyside_version
+
+        return {
+            "metrics": {name: summarize(samples) for name, samples in self._samples.items()},
+            "caches": self._caches,
+            "environment": {
+                "python": platform.python_version(),
+                "pyside": pyside_version,
+                "platform": platform.platform(),
+                "qpa": os.environ.get("QT_QPA_PLATFORM", ""),
+                "repeat": self._repeat,
+            },
+        }
+
+    @staticmethod
+    def _wait_loaded(app, widget, timeout: float = 10.0):
+        """处理事件直到后台查询完成并填充表格"""
+        from PySide6.QtCore import QEventLoop
+
+        deadline = time.perf_counter() + timeout
+        while widget._search_handle is not None and time.perf_counter() < deadline:
+            app.processEvents(QEventLoop.ProcessEventsFlag.AllEvents, 5)
+        app.processEvents()
+
+    def _bench_database(self, logic):
+        """SectionDatabase：全类型查询和关键词查询（含结果缓存）"""
+        from plugins.Steel_Shape_Table.database import SectionDatabase
+
+        database = SectionDatabase(logic._db_path)
+        database.clear_cache()
+        shape_types = logic.get_shape_types()
+
+        samples = []
+        for _ in range(self._repeat):
+            for shape_type in shape_types:
+                start = time.perf_counter()
+                database.get_sections(shape_type)
+                samples.append(time.perf_counter() - start)
+        self._samples["database.get_sections"] = samples
+
+        samples = []
+        for _ in range(self._repeat):
+            for keyword in SEARCH_KEYWORDS:
+                start = time.perf_counter()
+                database.get_sections(shape_types[0], keyword)
+                samples.append(time.perf_counter() - start)
+        self._samples["database.get_sections[keyword]"] = samples
+        self._caches["database"] = database.get_cache_stats()
+
+    def _bench_logic(self, logic):
+        """SteelShapeLogic：类型查询、全局搜索和类型内搜索"""
+        shape_types = logic.get_shape_types()
+        self._samples["logic.query_shapes"] = [
+            sample for shape_type in shape_types
+            for sample in _time(lambda: logic.query_shapes(shape_type), self._repeat)]
+        self._samples["logic.search_all_shapes"] = [
+            sample for keyword in SEARCH_KEYWORDS
+            for sample in _time(lambda: logic.search_all_shapes(keyword), self._repeat)]
+        self._samples["logic.search_shapes_in_type"] = [
+            sample for keyword in SEARCH_KEYWORDS
+            for sample in _time(lambda: logic.search_shapes_in_type(shape_types[0], keyword, True), self._repeat)]
+
+    def _bench_type_switch(self, app, widget):
+        """类型切换：选择类型 → 后台查询 → 填充表格 → 绘制表格"""
+        combo = widget._type_combo
+        samples = []
+        for _ in range(self._repeat):
+            for index in range(combo.count()):
+                start = time.perf_counter()
+                combo.setCurrentIndex(index)
+                self._wait_loaded(app, widget)
+                widget._table_view.viewport().grab()
+                samples.append(time.perf_counter() - start)
+        self._samples["widget.type_switch"] = samples
+        combo.setCurrentIndex(0)
+        self._wait_loaded(app, widget)
+
+    def _bench_keyword_search(self, app, widget):
+        """关键词搜索：输入关键词 → 后台查询 → 更新行掩码 → 绘制表格（不含防抖延迟）"""
+        samples = []
+        for _ in range(self._repeat):
+            for keyword in SEARCH_KEYWORDS:
+                start = time.perf_counter()
+                widget._search_edit.setText(keyword)
+                widget._load_shapes()
+                self._wait_loaded(app, widget)
+                widget._table_view.viewport().grab()
+                samples.append(time.perf_counter() - start)
+        self._samples["widget.keyword_search"] = samples
+        widget._search_edit.clear()
+        widget._load_shapes()
+        self._wait_loaded(app, widget)
+
+    def _bench_table_fill(self, app, widget):
+        """表格填充：按行数替换模型数据并绘制表格"""
+        from plugins.Steel_Shape_Table.catalog import CatalogResult
+
+        logic = widget._logic
+        shape_type = max(logic.get_shape_types(), key=lambda name: len(logic.query_shapes(name)))
+        result = logic.query_shapes(shape_type)
+        model = widget._table_model
+        viewport = widget._table_view.viewport()
+
+        for count in FILL_ROW_COUNTS:
+            subset = CatalogResult(result.table, result.indices[:count])
+
+            def fill():
+                model.set_result("", None)
+                model.set_result(shape_type, subset)
+                viewport.grab()
+
+            self._samples[f"widget.table_fill[{len(subset)}]"] = _time(fill, self._repeat)
+
+        # 恢复为控件当前类型的数据
+        model.set_result("", None)
+        widget._load_shapes()
+        self._wait_loaded(app, widget)
+
+    def _bench_selection(self, app, widget):
+        """选中到截面图：选中表格行 → 更新截面图 → 绘制截面图"""
+        view = widget._table_view
+        diagram = widget._section_diagram
+        rows = widget._proxy_model.rowCount()
+        samples = []
+        for _ in range(self._repeat):
+            for row in range(min(rows, 20)):
+                start = time.perf_counter()
+                view.selectRow(row)
+                app.processEvents()
+                diagram.grab()
+                samples.append(time.perf_counter() - start)
+        self._samples["widget.selection_to_diagram"] = samples
+
+    def _bench_zoom(self, app, widget):
+        """截面图缩放：每帧设置缩放因子并重绘（统计绘制时缓存图形的复用率）"""
+        diagram = widget._section_diagram
+        widget._table_view.selectRow(0)
+        app.processEvents()
+        diagram.grab()
+
+        before = diagram.get_cache_stats()
+        samples = []
+        for _ in range(self._repeat):
+            for scale in ZOOM_STEPS:
+                start = time.perf_counter()
+                diagram.set_scale_factor(scale)
+                diagram.grab()
+                samples.append(time.perf_counter() - start)
+        diagram.reset_view()
+        self._samples["diagram.zoom_frame"] = samples
+
+        # 只统计缩放阶段的绘制（paintEvent 中回放已有图形为命中，重新录制为未命中）
+        after = diagram.get_cache_stats()
+        hits, misses = after["hits"] - before["hits"], after["misses"] - before["misses"]
+        self._caches["diagram_picture"] = {"hits": hits, "misses": misses,
+                                           "hit_rate": hits / (hits + misses) if hits + misses else 0.0}
+
+    def _collect_cache_stats(self, widget):
+        """收集搜索索引、截面图和磁盘缓存（含缩略图图集）的累计命中统计"""
+        from core.cache import get_cache
+
+        self._caches["search_index"] = widget._logic._catalog.search_index.cache_info()
+        self._caches["diagram_picture[total]"] = widget._section_diagram.get_cache_stats()
+        for namespace, stats in sorted(get_cache().get_stats().items()):
+            self._caches[f"disk_cache[{namespace}]"] = stats
+
+
+def compare(report: dict, baseline: dict, tolerance: float = DEFAULT_TOLERANCE) -> List[dict]:
+    """将本次结果与基线比较
+
+    Args:
+        report: 本次结果
+        baseline: 基线结果
+        tolerance: 中位数允许超过基线的比例
+
+    Returns:
+        List[dict]: 回退项 [{name, baseline, current, change}]（中位数，毫秒）
+    """
+    regressions = []
+    for name, current in report["metrics"].items():
+        previous = baseline.get("metrics", {}).get(name)
+        if not previous or "p50" not in previous or "p50" not in current:
+            continue
+        limit = max(previous["p50"] * (1.0 + tolerance), previous["p50"] + MIN_REGRESSION_MS)
+        if current["p50"] > limit:
+            regressions.append({
+                "name": name,
+                "baseline": previous["p50"],
+                "current": current["p50"],
+                "change": current["p50"] / previous["p50"] - 1.0 if previous["p50"] else float("inf"),
+            })
+    return regressions
+
+
+def format_report(report: dict, baseline: Dict = None) -> str:
+    """格式化结果表格
+
+    Args:
+        report: 本次结果
+        baseline: 基线结果，提供时显示中位数的变化
+
+    Returns:
+        str: 文本表格
+    """
+    lines = [f"{'项目':<36}{'次数':>6}{'p50':>10}{'p90':>10}{'p99':>10}{'最大':>10}{'基线p50':>10}{'变化':>9}"]
+    for name, stats in report["metrics"].items():
+        line = (f"{name:<38}{stats['count']:>6}{stats['p50']:>10.3f}{stats['p90']:>10.3f}"
+                f"{stats['p99']:>10.3f}{stats['max']:>10.3f}")
+        previous = (baseline or {}).get("metrics", {}).get(name)
+        if previous and previous.get("p50"):
+            line += f"{previous['p50']:>12.3f}{stats['p50'] / previous['p50'] - 1.0:>+10.1%}"
+        lines.append(line)
+
+    lines.append("")
+    lines.append("缓存命中率：")
+    for name, stats in report["caches"].items():
+        lines.append(f"  {name}: {stats['hit_rate']:.1%}（命中 {stats['hits']}，未命中 {stats['misses']}）")
+    return "\n".join(lines)
+
+
+def main(argv=None) -> int:
+    """命令行入口
+
+    Returns:
+        int: 退出码（存在回退时为 1）
+    """
+    parser = argparse.ArgumentParser(description="型钢特性表性能基准")
+    parser.add_argument("--repeat", type=int, default=20, help="每项测量的重复次数")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="基线文件路径")
+    parser.add_argument("--save-baseline", action="store_true", help="将本次结果保存为基线")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE, help="中位数允许超过基线的比例")
+    parser.add_argument("--output", help="将本次结果保存为JSON文件")
+    args = parser.parse_args(argv)
+
+    report = SteelShapeBenchmark(args.repeat).run()
+    report["format"] = BASELINE_FORMAT
+
+    baseline = None
+    if os.path.exists(args.baseline) and not args.save_baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        if baseline.get("format") != BASELINE_FORMAT:
+            baseline = None
+
+    print(format_report(report, baseline))
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"\n已保存基线：{args.baseline}")
+        return 0
+
+    if baseline is None:
+        print("\n没有可比较的基线，使用 --save-baseline 保存本次结果")
+        return 0
+
+    regressions = compare(report, baseline, args.tolerance)
+    if regressions:
+        print(f"\n{len(regressions)} 项性能回退（p50 超过基线 {args.tolerance:.0%}）：")
+        for item in regressions:
+            print(f"  {item['name']}: {item['baseline']:.3f} ms → {item['current']:.3f} ms（{item['change']:+.1%}）")
+        return 1
+    print("\n未发现性能回退")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,74 @@
+"""内置型钢截面库构建脚本
+
+重新计算内置库各截面表的派生特性列（塑性截面模量、扭转常数、翘曲常数、剪切面积），
+并在结构版本过旧时重建统一视图和索引。内置库在运行时以只读（immutable）方式打开，
+派生特性只在发布前由本脚本写入；用户截面的派生特性在写入覆盖库时计算。
+
+用法（在项目根目录执行，不要在程序运行时执行）：
+    python -m plugins.Steel_Shape_Table.build_database
+    python -m plugins.Steel_Shape_Table.build_database --db path/to/sections.db --force
+
+写入失败时退出码为 1。
+"""
+
+import argparse
+import os
+import sqlite3
+import sys
+
+
+# 默认构建的内置截面库
+DEFAULT_DB = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "sections.db")
+
+
+def build_database(db_path: str, force: bool = False) -> int:
+    """计算内置库的派生特性并更新统一视图和索引
+
+    Args:
+        db_path: 内置截面库路径
+        force: 是否忽略结构版本强制重建视图和索引
+
+    Returns:
+        int: 写入派生特性的记录数
+
+    Raises:
+        sqlite3.Error: 写入失败
+    """
+    from plugins.Steel_Shape_Table.schema import ensure_schema, is_schema_current, materialize_derived_columns
+
+    conn = sqlite3.connect(db_path)
+    try:
+        count = materialize_derived_columns(conn)
+        conn.commit()
+        if force or not is_schema_current(conn):
+            ensure_schema(conn, force=force)
+    finally:
+        conn.close()
+    return count
+
+
+def main(argv=None) -> int:
+    """命令行入口
+
+    Returns:
+        int: 退出码（写入失败时为 1）
+    """
+    parser = argparse.ArgumentParser(description="内置型钢截面库构建")
+    parser.add_argument("--db", default=DEFAULT_DB, help="内置截面库路径")
+    parser.add_argument("--force", action="store_true", help="强制重建统一视图和索引")
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(args.db):
+        print(f"截面库不存在: {args.db}")
+        return 1
+    try:
+        count = build_database(args.db, args.force)
+    except sqlite3.Error as e:
+        print(f"构建截面库失败: {e}")
+        return 1
+    print(f"已计算 {count} 条记录的派生特性")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
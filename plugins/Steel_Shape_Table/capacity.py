@@ -0,0 +1,290 @@
+"""构件承载力向量化筛选
+
+按 GB 50017-2017 的实腹式压弯构件公式，对目录中全部截面一次计算长细比、稳定系数和应力比，
+再按理论重量选出满足要求的最轻截面。截面沿一个维度、荷载工况沿另一个维度按NumPy广播计算，
+一个工况只需一次数组运算，上万个工况分块计算。
+
+简化假定（用于初选，最终设计仍需完整验算）：
+    - 稳定系数统一按一种截面分类曲线（默认 b 类）计算；
+    - 等效弯矩系数 βmx = βmy = 1.0，截面塑性发展系数 γx = γy = 1.0，取毛截面；
+    - 整体稳定系数 φb 由调用方给定（默认 1.0，即侧向支承充分）；
+    - 轴力以受压为正，受拉时只验算强度；
+    - 绕弱轴的长细比取 iy 和最小惯性半径 iu 中的较小值（角钢绕最小轴失稳）。
+
+单位：轴力 kN，弯矩 kN·m，计算长度 m；截面特性单位与型钢特性表一致（cm、cm²、cm³）。
+"""
+
+from typing import Dict, List, Optional
+
+import numpy as np
+
+
+# 钢材弹性模量（N/mm²）
+ELASTIC_MODULUS = 206000.0
+
+# 钢材牌号：(屈服强度 fy, 抗拉、抗压和抗弯强度设计值 f)，N/mm²，厚度 ≤ 16mm
+STEEL_GRADES = {
+    "Q235": (235.0, 215.0),
+    "Q355": (355.0, 305.0),
+    "Q390": (390.0, 345.0),
+    "Q420": (420.0, 375.0),
+}
+
+# 稳定系数曲线参数：{截面分类: (α1, α2, α3)}，c、d 类按正则化长细比 1.05 分段
+BUCKLING_CURVES = {
+    "a": ((0.41, 0.986, 0.152), (0.41, 0.986, 0.152)),
+    "b": ((0.65, 0.965, 0.300), (0.65, 0.965, 0.300)),
+    "c": ((0.73, 0.906, 0.595), (0.73, 1.216, 0.302)),
+    "d": ((1.35, 0.868, 0.915), (1.35, 1.375, 0.432)),
+}
+
+# 受压构件的容许长细比
+SLENDERNESS_LIMIT = 150.0
+
+# 参与筛选的截面特性字段
+SCREEN_FIELDS = ("area", "ix", "iy", "Wx", "Wy", "weight")
+
+# 批量筛选时每块的工况数（控制中间数组大小）
+BATCH_CHUNK = 512
+
+
+def stability_coefficient(slenderness, fy: float, curve: str = "b") -> np.ndarray:
+    """轴心受压构件的稳定系数 φ（GB 50017-2017 附录 D）
+
+    Args:
+        slenderness: 长细比 λ（标量或数组）
+        fy: 屈服强度（N/mm²）
+        curve: 截面分类 "a"、"b"、"c" 或 "d"
+
+    Returns:
+        np.ndarray: 稳定系数
+    """
+    low, high = BUCKLING_CURVES[curve]
+    lam_n = np.asarray(slenderness, dtype=float) / np.pi * np.sqrt(fy / ELASTIC_MODULUS)
+    alpha1 = low[0]
+    alpha2 = np.where(lam_n > 1.05, high[1], low[1])
+    alpha3 = np.where(lam_n > 1.05, high[2], low[2])
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        lam2 = lam_n ** 2
+        term = alpha2 + alpha3 * lam_n + lam2
+        slender = (term - np.sqrt(term ** 2 - 4.0 * lam2)) / (2.0 * lam2)
+    return np.where(lam_n <= 0.215, 1.0 - alpha1 * lam_n ** 2, slender)
+
+
+class CapacityScreen:
+    """构件承载力筛选器
+
+    构建时从目录取出各截面的面积、惯性半径、截面模量和理论重量（按重量排序），
+    之后每次筛选只做数组运算
+    """
+
+    def __init__(self, catalog, shape_types: List[str] = None, grade: str = "Q235", curve: str = "b",
+                 phi_b: float = 1.0, slenderness_limit: float = SLENDERNESS_LIMIT):
+        """初始化筛选器
+
+        Args:
+            catalog: 型钢截面目录（SectionCatalog）
+            shape_types: 参与筛选的型钢类型，为None时使用全部类型
+            grade: 钢材牌号，见 STEEL_GRADES
+            curve: 稳定系数的截面分类
+            phi_b: 受弯构件整体稳定系数
+            slenderness_limit: 容许长细比
+        """
+        if grade not in STEEL_GRADES:
+            raise ValueError(f"不支持的钢材牌号: {grade}")
+        if curve not in BUCKLING_CURVES:
+            raise ValueError(f"不支持的截面分类: {curve}")
+        self.fy, self.f = STEEL_GRADES[grade]
+        self.grade = grade
+        self.curve = curve
+        self.phi_b = phi_b
+        self.slenderness_limit = slenderness_limit
+
+        shape_type_list, models, columns = [], [], {field: [] for field in SCREEN_FIELDS}
+        for shape_type in shape_types or catalog.get_shape_types():
+            result = catalog.query(shape_type)
+            if len(result) == 0:
+                continue
+            values = {field: result.column(field) for field in SCREEN_FIELDS}
+            if any(column is None for column in values.values()):
+                continue
+            # 不等边角钢绕弱轴失稳取最小惯性半径 iu
+            min_radius = result.column("iu")
+            if min_radius is not None:
+                values["iy"] = np.fmin(values["iy"], min_radius)
+            shape_type_list.extend([shape_type] * len(result))
+            models.extend(result.names.tolist())
+            for field, column in values.items():
+                columns[field].append(column)
+
+        arrays = {field: np.concatenate(parts) if parts else np.empty(0) for field, parts in columns.items()}
+        order = np.argsort(arrays["weight"], kind="stable")
+        self.shape_types = np.array(shape_type_list, dtype=object)[order]
+        self.models = np.array(models, dtype=object)[order]
+        self.weight = arrays["weight"][order]
+
+        # 换算为 N、mm 单位
+        self._area = arrays["area"][order] * 1e2
+        self._ix = arrays["ix"][order] * 10.0
+        self._iy = arrays["iy"][order] * 10.0
+        self._wx = arrays["Wx"][order] * 1e3
+        self._wy = arrays["Wy"][order] * 1e3
+
+    def __len__(self):
+        """参与筛选的截面数"""
+        return len(self.weight)
+
+    def evaluate(self, axial, moment_x=0.0, moment_y=0.0, length_x=0.0, length_y=0.0) -> Dict[str, np.ndarray]:
+        """计算各截面在给定工况下的长细比、稳定系数和应力比
+
+        参数可以是标量（单个工况）或形状为 (工况数, 1) 的数组（多个工况），
+        结果按广播规则为 (截面数,) 或 (工况数, 截面数)
+
+        Args:
+            axial: 轴力 N（kN，受压为正）
+            moment_x: 绕强轴弯矩 Mx（kN·m）
+            moment_y: 绕弱轴弯矩 My（kN·m）
+            length_x: 绕强轴计算长度 l0x（m）
+            length_y: 绕弱轴计算长度 l0y（m）
+
+        Returns:
+            Dict[str, np.ndarray]: lambda_x、lambda_y、phi_x、phi_y、strength、stability_x、stability_y、
+                utilization（取各项最大值，超过容许长细比或失稳时为 inf，截面特性缺失时为NaN）
+        """
+        n = np.asarray(axial, dtype=float) * 1e3
+        mx = np.abs(np.asarray(moment_x, dtype=float)) * 1e6
+        my = np.abs(np.asarray(moment_y, dtype=float)) * 1e6
+        l0x = np.asarray(length_x, dtype=float) * 1e3
+        l0y = np.asarray(length_y, dtype=float) * 1e3
+        f = self.f
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            lambda_x = l0x / self._ix
+            lambda_y = l0y / self._iy
+            phi_x = stability_coefficient(lambda_x, self.fy, self.curve)
+            phi_y = stability_coefficient(lambda_y, self.fy, self.curve)
+
+            compression = np.maximum(n, 0.0)
+            bending_x = mx / (self._wx * f)
+            bending_y = my / (self._wy * f)
+            strength = np.abs(n) / (self._area * f) + bending_x + bending_y
+
+            # 欧拉临界力 N'E = π²EA / (1.1λ²)，弯矩按 1 / (1 - 0.8N/N'E) 放大
+            euler_x = np.pi ** 2 * ELASTIC_MODULUS * self._area / (1.1 * lambda_x ** 2)
+            euler_y = np.pi ** 2 * ELASTIC_MODULUS * self._area / (1.1 * lambda_y ** 2)
+            amplify_x = 1.0 - 0.8 * compression / euler_x
+            amplify_y = 1.0 - 0.8 * compression / euler_y
+
+            stability_x = (compression / (phi_x * self._area * f)
+                           + bending_x / amplify_x + bending_y / self.phi_b)
+            stability_y = (compression / (phi_y * self._area * f)
+                           + bending_x / self.phi_b + bending_y / amplify_y)
+            unstable = (amplify_x <= 0.0) | (amplify_y <= 0.0)
+            stability_x = np.where(compression > 0.0, np.where(unstable, np.inf, stability_x), 0.0)
+            stability_y = np.where(compression > 0.0, np.where(unstable, np.inf, stability_y), 0.0)
+
+            too_slender = (compression > 0.0) & (np.maximum(lambda_x, lambda_y) > self.slenderness_limit)
+            utilization = np.maximum(strength, np.maximum(stability_x, stability_y))
+            utilization = np.where(too_slender, np.inf, utilization)
+
+        return {
+            "lambda_x": lambda_x,
+            "lambda_y": lambda_y,
+            "phi_x": phi_x,
+            "phi_y": phi_y,
+            "strength": strength,
+            "stability_x": stability_x,
+            "stability_y": stability_y,
+            "utilization": utilization,
+        }
+
+    def lightest(self, axial, moment_x=0.0, moment_y=0.0, length_x=0.0, length_y=0.0,
+                 limit: Optional[int] = 20, max_ratio: float = 1.0) -> List[dict]:
+        """单个工况下满足要求的最轻截面
+
+        Args:
+            axial: 轴力 N（kN，受压为正）
+            moment_x: 绕强轴弯矩 Mx（kN·m）
+            moment_y: 绕弱轴弯矩 My（kN·m）
+            length_x: 绕强轴计算长度 l0x（m）
+            length_y: 绕弱轴计算长度 l0y（m）
+            limit: 返回数量上限，None表示不限
+            max_ratio: 容许的应力比
+
+        Returns:
+            List[dict]: 按理论重量从小到大排序的结果，每项包含 shape_type、model、weight、utilization、
+                lambda_x、lambda_y、phi_x、phi_y
+        """
+        result = self.evaluate(axial, moment_x, moment_y, length_x, length_y)
+        passing = np.flatnonzero(result["utilization"] <= max_ratio)
+        if limit is not None:
+            passing = passing[:limit]
+        return [{
+            "shape_type": self.shape_types[i],
+            "model": self.models[i],
+            "weight": float(self.weight[i]),
+            "utilization": float(result["utilization"][i]),
+            "lambda_x": float(result["lambda_x"][i]),
+            "lambda_y": float(result["lambda_y"][i]),
+            "phi_x": float(result["phi_x"][i]),
+            "phi_y": float(result["phi_y"][i]),
+        } for i in passing.tolist()]
+
+    def screen_cases(self, cases, max_ratio: float = 1.0, chunk: int = BATCH_CHUNK) -> Dict[str, np.ndarray]:
+        """批量筛选多个工况
+
+        Args:
+            cases: 工况数组，形状 (工况数, 5)，各列为 N、Mx、My、l0x、l0y（单位同 evaluate）
+            max_ratio: 容许的应力比
+            chunk: 每块计算的工况数
+
+        Returns:
+            Dict[str, np.ndarray]:
+                lightest: 每个工况满足要求的最轻截面序号（无满足的截面时为 -1）
+                utilization: 对应截面的应力比（无满足的截面时为NaN）
+                envelope: 每个截面在全部工况中的最大应力比
+                envelope_lightest: 满足全部工况的最轻截面序号（无时为 -1）
+        """
+        cases = np.atleast_2d(np.asarray(cases, dtype=float))
+        if cases.shape[1] != 5:
+            raise ValueError("工况数组应为 (工况数, 5)：N、Mx、My、l0x、l0y")
+
+        count = len(cases)
+        lightest = np.full(count, -1, dtype=np.intp)
+        utilization = np.full(count, np.nan)
+        envelope = np.zeros(len(self))
+
+        for start in range(0, count, chunk):
+            block = cases[start:start + chunk]
+            ratios = self.evaluate(*(block[:, [column]] for column in range(5)))["utilization"]
+            passing = ratios <= max_ratio
+            # 截面按重量排序，每个工况第一个满足要求的截面即最轻截面
+            first = np.argmax(passing, axis=1)
+            found = passing[np.arange(len(block)), first]
+            lightest[start:start + len(block)] = np.where(found, first, -1)
+            utilization[start:start + len(block)] = np.where(found, ratios[np.arange(len(block)), first], np.nan)
+            envelope = np.fmax(envelope, np.where(np.isnan(ratios), np.inf, ratios).max(axis=0))
+
+        passing_all = np.flatnonzero(envelope <= max_ratio)
+        return {
+            "lightest": lightest,
+            "utilization": utilization,
+            "envelope": envelope,
+            "envelope_lightest": int(passing_all[0]) if passing_all.size else -1,
+        }
+
+    def describe(self, index: int) -> dict:
+        """获取筛选器中某个截面的型号信息
+
+        Args:
+            index: 截面序号（screen_cases 返回的序号）
+
+        Returns:
+            dict: {shape_type, model, weight}
+        """
+        return {
+            "shape_type": self.shape_types[index],
+            "model": self.models[index],
+            "weight": float(self.weight[index]),
+        }
@@ -0,0 +1,488 @@
+"""型钢截面内存列式目录"""
+
+import threading
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from plugins.Steel_Shape_Table.connection import get_pool
+from plugins.Steel_Shape_Table.models import SectionRecord, SteelSection
+from plugins.Steel_Shape_Table.schema import TABLE_SOURCES
+from plugins.Steel_Shape_Table.search_index import SectionSearchIndex
+from plugins.Steel_Shape_Table.snapshot import database_fingerprint, read_snapshot, snapshot_path, write_snapshot
+
+
+# 模型字段名到数据库列名的别名（与 SectionDatabase 中的 VIEW_FIELD_ALIASES 一致）
+FIELD_ALIASES = {
+    "ix": "rx",
+    "iy": "ry",
+    "ix0": "rx0",
+    "iu": "ru",
+}
+
+# 型号中未包含、但参与搜索匹配的尺寸列（如 "200x200x8x12" 中的腹板、翼缘厚度）
+SEARCH_EXTRA_COLUMNS = ("web_thickness", "flange_thickness")
+
+# 个别表的专用别名
+TABLE_FIELD_ALIASES = {
+    "l_sections_2016": {"iy": "ry0", "iy0": "ry0", "ry": "ry0", "Wy": "Wy0"},
+    "i_sections_2016": {"fillet_radius": "round_radius"},
+    "c_sections_2016": {"fillet_radius": "round_radius"},
+}
+
+
+class SectionTable:
+    """单个数据库表的列式数据
+
+    型号保存为字符串数组，数值列保存为 float64 数组（空值为NaN）
+    """
+
+    def __init__(self, table_name: str, names: np.ndarray, categories: Optional[np.ndarray],
+                 columns: Dict[str, np.ndarray], source: dict):
+        """初始化列式数据
+
+        Args:
+            table_name: 数据库表名
+            names: 型号数组
+            categories: 类别数组（无类别列时为None）
+            columns: 数值列字典 {列名: 数组}
+            source: 数据来源配置
+        """
+        self.table_name = table_name
+        self.names = names
+        self.categories = categories
+        self.columns = columns
+        self.source = source
+
+        # 模型字段别名区分大小写（ix 为惯性半径，Ix 为惯性矩），其余列名忽略大小写
+        self._aliases = {**FIELD_ALIASES, **TABLE_FIELD_ALIASES.get(table_name.lower(), {})}
+        self._lookup = {name.lower(): name for name in columns}
+
+    def __len__(self):
+        """行数"""
+        return len(self.names)
+
+    def resolve_field(self, field: str) -> Optional[str]:
+        """将字段名（数据库列名或模型字段名）解析为实际列名
+
+        Args:
+            field: 字段名
+
+        Returns:
+            Optional[str]: 列名，不存在时返回None
+        """
+        if field in self.columns:
+            return field
+        field = self._aliases.get(field, field)
+        if field in self.columns:
+            return field
+        return self._lookup.get(field.lower())
+
+    def column(self, field: str) -> Optional[np.ndarray]:
+        """获取数值列
+
+        Args:
+            field: 字段名
+
+        Returns:
+            Optional[np.ndarray]: 数值数组，不存在时返回None
+        """
+        column = self.resolve_field(field)
+        return self.columns.get(column) if column else None
+
+    def shape_type_of(self, index: int) -> str:
+        """获取指定行的型钢类型"""
+        if "shape_type" in self.source:
+            return self.source["shape_type"]
+        return self.source["type_format"].format(self.categories[index])
+
+
+class CatalogResult:
+    """目录查询结果
+
+    只保存源表引用和行号数组，列数据按需切片
+    """
+
+    def __init__(self, table: Optional[SectionTable], indices: np.ndarray):
+        """初始化查询结果
+
+        Args:
+            table: 源表列式数据
+            indices: 行号数组
+        """
+        self.table = table
+        self.indices = indices
+
+    def __len__(self):
+        """结果行数"""
+        return len(self.indices)
+
+    @property
+    def names(self) -> np.ndarray:
+        """型号数组"""
+        if self.table is None:
+            return np.empty(0, dtype=str)
+        return self.table.names[self.indices]
+
+    def column(self, field: str) -> Optional[np.ndarray]:
+        """获取结果的数值列
+
+        Args:
+            field: 字段名（数据库列名或模型字段名，忽略大小写）
+
+        Returns:
+            Optional[np.ndarray]: 数值数组，字段不存在时返回None
+        """
+        if self.table is None:
+            return None
+        values = self.table.column(field)
+        return values[self.indices] if values is not None else None
+
+    def value(self, row: int, field: str):
+        """获取单个值
+
+        Args:
+            row: 结果中的行号
+            field: 字段名
+
+        Returns:
+            型号字段返回字符串，数值字段返回float，不存在或为空时返回None
+        """
+        if self.table is None:
+            return None
+        index = self.indices[row]
+        if self.table.resolve_field(field) is None and field.lower() in ("model", "section_name"):
+            return str(self.table.names[index])
+        values = self.table.column(field)
+        if values is None or np.isnan(values[index]):
+            return None
+        return float(values[index])
+
+    def record(self, row: int) -> SectionRecord:
+        """获取结果中一行的截面记录
+
+        Args:
+            row: 结果中的行号
+
+        Returns:
+            SectionRecord: 截面记录（引用源表，不复制数据）
+        """
+        return SectionRecord(self.table, self.indices[row])
+
+    def records(self) -> List[SectionRecord]:
+        """获取全部结果行的截面记录
+
+        Returns:
+            List[SectionRecord]: 截面记录列表
+        """
+        if self.table is None:
+            return []
+        return [SectionRecord(self.table, index) for index in self.indices.tolist()]
+
+    def to_dicts(self) -> List[dict]:
+        """转换为与 SteelSection.to_dict 相同键名的字典列表
+
+        Returns:
+            List[dict]: 型钢数据字典列表
+        """
+        if self.table is None:
+            return []
+
+        keys = [key for key in SteelSection.FIELDS if key not in SteelSection.TEXT_FIELDS]
+        fields = {key: self.table.column(key) for key in keys}
+        result = []
+        for index in self.indices:
+            item = {
+                "shape_type": self.table.shape_type_of(index),
+                "model": str(self.table.names[index]),
+                "category": str(self.table.categories[index]) if self.table.categories is not None else None,
+            }
+            for key, values in fields.items():
+                if values is None:
+                    item[key] = 0
+                else:
+                    value = values[index]
+                    item[key] = None if np.isnan(value) else float(value)
+            result.append(item)
+        return result
+
+
+class SectionCatalog:
+    """型钢截面内存列式目录
+
+    启动时一次性将所有截面表读入 NumPy 数组（整个目录不足千行），
+    类型切换、关键词搜索和属性过滤均通过向量化掩码在内存中完成
+    """
+
+    def __init__(self, db_path: str):
+        """初始化目录并加载数据
+
+        Args:
+            db_path: 数据库文件路径
+        """
+        self._db_path = db_path
+        self._snapshot_path = snapshot_path(db_path)
+        self._lock = threading.Lock()
+        self._tables = {}
+        self._shape_types = {}
+        self._search_index = None
+        self._version = ""
+        self.reload()
+
+    def reload(self):
+        """重新加载全部数据
+
+        数据库未变化时从二进制快照内存映射加载，否则从数据库读取并重新生成快照
+        """
+        pool = get_pool(self._db_path)
+        fingerprint = database_fingerprint(pool.db_path, pool.overlay_path)
+
+        tables = self._load_snapshot(fingerprint)
+        if tables is None:
+            tables = self._load_database(pool)
+            write_snapshot(self._snapshot_path, fingerprint, {
+                table.table_name: (table.names, table.categories, table.columns) for table in tables.values()})
+
+        shape_types = {}
+        for table in tables.values():
+            # 记录型钢类型到（表, 类别）的映射，保持数据库中的出现顺序
+            source = table.source
+            if "shape_type" in source:
+                shape_types[source["shape_type"]] = (table, None)
+            else:
+                for category in dict.fromkeys(table.categories.tolist()):
+                    shape_types[source["type_format"].format(category)] = (table, category)
+
+        with self._lock:
+            self._tables = tables
+            self._shape_types = shape_types
+            self._version = fingerprint
+            # 搜索索引在首次搜索时构建
+            self._search_index = None
+
+    def _load_snapshot(self, fingerprint: str) -> Optional[Dict[str, SectionTable]]:
+        """从二进制快照加载，快照不存在或已失效时返回None"""
+        data = read_snapshot(self._snapshot_path, fingerprint)
+        if data is None:
+            return None
+
+        sources = {source["table"]: source for source in TABLE_SOURCES}
+        tables = {}
+        for table_name, (names, categories, columns) in data.items():
+            source = sources.get(table_name)
+            if source is None:
+                return None
+            tables[table_name.lower()] = SectionTable(table_name, names, categories, columns, source)
+        return tables
+
+    def _load_database(self, pool) -> Dict[str, SectionTable]:
+        """从数据库读取所有截面表"""
+        tables = {}
+        with pool.connection() as conn:
+            existing = pool.list_tables(conn)
+            for source in TABLE_SOURCES:
+                if source["table"].lower() not in existing:
+                    continue
+                table = self._load_table(conn, pool.table_ref(source["table"]), source)
+                tables[table.table_name.lower()] = table
+        return tables
+
+    @property
+    def version(self) -> str:
+        """目录版本（内置库和用户覆盖库的指纹），数据变化后不同，用作派生缓存的键"""
+        return self._version
+
+    @property
+    def search_index(self) -> SectionSearchIndex:
+        """型号搜索索引（首次使用时构建）"""
+        with self._lock:
+            if self._search_index is None:
+                self._search_index = self._build_search_index(self._tables)
+            return self._search_index
+
+    @staticmethod
+    def _build_search_index(tables: Dict[str, SectionTable]) -> SectionSearchIndex:
+        """为所有表的型号构建搜索索引，键为 (表名小写, 行号)"""
+        entries = []
+        for key, table in tables.items():
+            extra_columns = [table.columns[name] for name in SEARCH_EXTRA_COLUMNS if name in table.columns]
+            for row, name in enumerate(table.names.tolist()):
+                extra_tokens = [f"{column[row]:g}" for column in extra_columns if not np.isnan(column[row])]
+                entries.append((name, (key, row), extra_tokens))
+        return SectionSearchIndex(entries)
+
+    def _load_table(self, conn, table_ref: str, source: dict) -> SectionTable:
+        """读取单个表为列式数据"""
+        cursor = conn.execute(f"SELECT * FROM {table_ref} ORDER BY id")
+        column_names = [description[0] for description in cursor.description]
+        rows = cursor.fetchall()
+
+        name_index = column_names.index(source["name_column"])
+        names = np.array([row[name_index] for row in rows], dtype=str)
+
+        categories = None
+        category_column = source.get("category_column")
+        if category_column:
+            category_index = column_names.index(category_column)
+            categories = np.array([row[category_index] for row in rows], dtype=str)
+
+        skip = {"id", source["name_column"], category_column}
+        columns = {}
+        for i, name in enumerate(column_names):
+            if name in skip:
+                continue
+            columns[name] = np.array([row[i] for row in rows], dtype=np.float64)
+
+        return SectionTable(source["table"], names, categories, columns, source)
+
+    def get_shape_types(self) -> List[str]:
+        """获取所有型钢类型
+
+        Returns:
+            List[str]: 型钢类型列表
+        """
+        return list(self._shape_types)
+
+    def get_table(self, shape_type: str) -> Optional[SectionTable]:
+        """获取型钢类型所在的源表"""
+        entry = self._shape_types.get(shape_type)
+        return entry[0] if entry else None
+
+    def search(self, text: str, limit: int = 20) -> List[dict]:
+        """在所有型钢类型中搜索型号
+
+        Args:
+            text: 搜索文本
+            limit: 返回数量上限
+
+        Returns:
+            List[dict]: 按相关度排序的结果，每项包含 shape_type、model、table、row、score
+        """
+        tables = self._tables
+        results = []
+        for (key, row), score in self.search_index.search(text, limit):
+            table = tables[key]
+            results.append({
+                "shape_type": table.shape_type_of(row),
+                "model": str(table.names[row]),
+                "table": table.table_name,
+                "row": row,
+                "score": score
+            })
+        return results
+
+    def query(self, shape_type: str, keyword: str = None, filters: dict = None) -> CatalogResult:
+        """查询型钢截面
+
+        Args:
+            shape_type: 型钢类型
+            keyword: 型号关键词（规范化后匹配，见 SectionSearchIndex）
+            filters: 属性过滤条件 {字段名: (最小值, 最大值)}，边界为None表示不限
+
+        Returns:
+            CatalogResult: 查询结果
+        """
+        entry = self._shape_types.get(shape_type)
+        if entry is None:
+            return CatalogResult(None, np.empty(0, dtype=np.intp))
+
+        table, category = entry
+        mask = np.ones(len(table), dtype=bool)
+
+        if category is not None:
+            mask &= table.categories == category
+
+        if keyword:
+            # 使用搜索索引匹配型号（支持 "200*200"、"L100x10" 等写法）
+            table_key = table.table_name.lower()
+            rows = [row for (key, row), _ in self.search_index.search(keyword) if key == table_key]
+            keyword_mask = np.zeros(len(table), dtype=bool)
+            keyword_mask[rows] = True
+            mask &= keyword_mask
+
+        for field, (minimum, maximum) in (filters or {}).items():
+            values = table.column(field)
+            if values is None:
+                return CatalogResult(table, np.empty(0, dtype=np.intp))
+            # NaN 与任何边界比较均为False，自动排除空值
+            if minimum is not None:
+                mask &= values >= minimum
+            if maximum is not None:
+                mask &= values <= maximum
+
+        return CatalogResult(table, np.flatnonzero(mask))
+
+    def find_lightest(self, constraints: dict, shape_types: List[str] = None, limit: int = 20) -> List[dict]:
+        """查找满足属性约束的最轻截面
+
+        每个型钢类型的约束通过向量化掩码求值，再按理论重量合并排序。
+        缺少某个约束字段的类型无法判断是否满足，直接跳过。
+
+        Args:
+            constraints: 属性约束 {字段名: (最小值, 最大值)}，边界为None表示不限
+            shape_types: 参与查找的型钢类型，为None时查找所有类型
+            limit: 返回数量上限，None表示不限
+
+        Returns:
+            List[dict]: 按理论重量从小到大排序的结果，每项包含 shape_type、model、
+                weight、table、row 以及 values（各约束字段的取值）
+        """
+        if shape_types is None:
+            shape_types = self.get_shape_types()
+
+        results = []
+        weights = []
+        for shape_type in shape_types:
+            result = self.query(shape_type, filters=constraints)
+            weight = result.column("weight")
+            if len(result) == 0 or weight is None:
+                continue
+            results.append(result)
+            weights.append(weight)
+
+        if not results:
+            return []
+
+        # 合并所有类型的重量后统一排序，重量为空的截面排在最后
+        all_weights = np.concatenate(weights)
+        owners = np.repeat(np.arange(len(results)), [len(result) for result in results])
+        positions = np.concatenate([np.arange(len(result)) for result in results])
+        order = np.argsort(all_weights, kind="stable")
+        if limit is not None:
+            order = order[:limit]
+
+        lightest = []
+        for i in order.tolist():
+            result = results[owners[i]]
+            position = int(positions[i])
+            row = int(result.indices[position])
+            lightest.append({
+                "shape_type": result.table.shape_type_of(row),
+                "model": str(result.table.names[row]),
+                "weight": result.value(position, "weight"),
+                "table": result.table.table_name,
+                "row": row,
+                "values": {field: result.value(position, field) for field in constraints}
+            })
+        return lightest
+
+
+_catalogs = {}
+_catalogs_lock = threading.Lock()
+
+
+def get_catalog(db_path: str) -> SectionCatalog:
+    """获取数据库对应的共享目录实例
+
+    Args:
+        db_path: 数据库文件路径
+
+    Returns:
+        SectionCatalog: 共享目录实例
+    """
+    with _catalogs_lock:
+        catalog = _catalogs.get(db_path)
+        if catalog is None:
+            catalog = SectionCatalog(db_path)
+            _catalogs[db_path] = catalog
+        return catalog
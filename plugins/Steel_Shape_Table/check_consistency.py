@@ -0,0 +1,116 @@
+"""型钢截面查询一致性检查
+
+比较 SectionDatabase（统一视图的SQL查询）和界面使用的 SectionCatalog（内存列式目录）
+对每种型钢类型返回的截面：型号和顺序一致，数值特性在容差内相等；
+并检查关键词查询和 limit 的结果与全量结果中按型号过滤、截取的结果一致。
+
+用法（在项目根目录执行）：
+    python -m plugins.Steel_Shape_Table.check_consistency
+    python -m plugins.Steel_Shape_Table.check_consistency --db path/to/sections.db
+
+存在不一致时退出码为 1。
+"""
+
+import argparse
+import math
+import os
+import sys
+from typing import List
+
+
+# 默认检查的内置截面库
+DEFAULT_DB = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "sections.db")
+
+# 关键词查询使用的关键词
+CHECK_KEYWORDS = ("200", "HW", "hn", "X10", "100")
+
+# 检查 limit 使用的返回数量
+CHECK_LIMIT = 5
+
+# 数值比较的相对容差
+REL_TOLERANCE = 1e-9
+
+
+def _same_value(left, right) -> bool:
+    """比较两个特性值（空值、NaN 和 0 视为相同，均表示没有数据）"""
+    left = 0.0 if left is None or (isinstance(left, float) and math.isnan(left)) else float(left)
+    right = 0.0 if right is None or (isinstance(right, float) and math.isnan(right)) else float(right)
+    return math.isclose(left, right, rel_tol=REL_TOLERANCE, abs_tol=1e-12)
+
+
+def check_shape_type(database, catalog, shape_type: str) -> List[str]:
+    """检查一种型钢类型的查询结果
+
+    Args:
+        database: SectionDatabase
+        catalog: SectionCatalog
+        shape_type: 型钢类型
+
+    Returns:
+        List[str]: 不一致的说明，一致时为空列表
+    """
+    from plugins.Steel_Shape_Table.models import SteelSection
+
+    problems = []
+    sections = database.get_sections(shape_type)
+    expected = catalog.query(shape_type).to_dicts()
+
+    models = [section.model for section in sections]
+    expected_models = [item["model"] for item in expected]
+    if models != expected_models:
+        problems.append(f"{shape_type}: 型号或顺序不一致（数据库 {len(models)} 个，目录 {len(expected_models)} 个）")
+        return problems
+
+    fields = [field for field in SteelSection.FIELDS if field not in SteelSection.TEXT_FIELDS]
+    for section, item in zip(sections, expected):
+        for field in fields:
+            if not _same_value(getattr(section, field), item[field]):
+                problems.append(f"{shape_type} {section.model}: {field} 数据库为 {getattr(section, field)}，"
+                                f"目录为 {item[field]}")
+
+    for keyword in CHECK_KEYWORDS:
+        matched = [model for model in models if keyword.lower() in model.lower()]
+        result = [section.model for section in database.get_sections(shape_type, keyword)]
+        if result != matched:
+            problems.append(f"{shape_type}: 关键词 {keyword!r} 的结果不一致（{len(result)} 个，应为 {len(matched)} 个）")
+
+    limited = [section.model for section in database.get_sections(shape_type, limit=CHECK_LIMIT)]
+    if limited != models[:CHECK_LIMIT]:
+        problems.append(f"{shape_type}: limit={CHECK_LIMIT} 的结果不是全量结果的前 {CHECK_LIMIT} 个")
+    return problems
+
+
+def main(argv=None) -> int:
+    """命令行入口
+
+    Returns:
+        int: 退出码（存在不一致时为 1）
+    """
+    parser = argparse.ArgumentParser(description="型钢截面查询一致性检查")
+    parser.add_argument("--db", default=DEFAULT_DB, help="型钢截面库路径")
+    args = parser.parse_args(argv)
+
+    from plugins.Steel_Shape_Table.catalog import get_catalog
+    from plugins.Steel_Shape_Table.database import SectionDatabase
+
+    database = SectionDatabase(args.db)
+    catalog = get_catalog(args.db)
+    shape_types = database.get_shape_types()
+
+    problems = []
+    for shape_type in shape_types:
+        problems.extend(check_shape_type(database, catalog, shape_type))
+    if shape_types != catalog.get_shape_types():
+        problems.append("型钢类型列表不一致")
+
+    if problems:
+        print(f"发现 {len(problems)} 处不一致：")
+        for problem in problems[:50]:
+            print(f"  {problem}")
+        return 1
+    print(f"已检查 {len(shape_types)} 种型钢类型，数据库查询与目录一致")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
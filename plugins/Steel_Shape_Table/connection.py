@@ -0,0 +1,293 @@
+"""型钢截面数据库连接池"""
+
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+
+from core.logger import Logger
+from plugins.Steel_Shape_Table.derived_properties import DERIVED_COLUMNS
+from plugins.Steel_Shape_Table.schema import (
+    WRITABLE_TABLES,
+    build_view_sql,
+    is_schema_current,
+    materialize_derived_columns,
+)
+
+
+# 用户覆盖库在连接中的名称
+OVERLAY_SCHEMA = "user"
+
+# 用户截面表结构（内置库中的通用 sections 表加上派生特性列，在覆盖库自身的连接中执行）
+OVERLAY_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS sections (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    shape_type TEXT NOT NULL,
+    model TEXT NOT NULL,
+    height REAL NOT NULL,
+    width REAL NOT NULL,
+    web_thickness REAL NOT NULL,
+    flange_thickness REAL NOT NULL,
+    area REAL NOT NULL,
+    weight REAL NOT NULL,
+    ix REAL NOT NULL,
+    iy REAL NOT NULL,
+    wx REAL NOT NULL,
+    wy REAL NOT NULL,
+    Wpx REAL,
+    Wpy REAL,
+    It REAL,
+    Iw REAL,
+    Avx REAL,
+    Avy REAL,
+    UNIQUE(shape_type, model)
+)
+"""
+
+# 用户截面表的属性索引（批量导入时先删除，导入完成后重建）
+OVERLAY_INDEXES = {
+    "idx_sections_weight": "weight",
+    "idx_sections_area": "area",
+    "idx_sections_ix": "ix",
+    "idx_sections_wx": "wx",
+    **{f"idx_sections_{column.lower()}": column for column in DERIVED_COLUMNS},
+}
+
+
+class SectionConnectionPool:
+    """型钢截面数据库连接池
+
+    内置截面库以只读、immutable URI 模式打开（不加文件锁、不检查修改），运行时从不写入内置库；
+    内置库结构版本过旧（需用 DataImporter 升级）时改为普通只读模式打开，
+    用户添加的截面写入单独的覆盖库，覆盖库附加（ATTACH）到同一连接上，
+    每个连接都有合并两者的临时统一视图 section_view。
+
+    连接在使用后放回池中复用，语句缓存和页缓存随连接保留；
+    连接默认 query_only，只有 write() 中临时允许写入。
+    """
+
+    # 每个连接缓存的预编译语句数
+    CACHED_STATEMENTS = 256
+    # 内存映射大小（字节）和页缓存大小（KB）
+    MMAP_SIZE = 64 * 1024 * 1024
+    CACHE_SIZE_KB = 8 * 1024
+    # 池中保留的空闲连接数上限
+    MAX_IDLE = 8
+
+    def __init__(self, db_path: str, overlay_path: str = None):
+        """初始化连接池
+
+        Args:
+            db_path: 内置截面库路径
+            overlay_path: 用户覆盖库路径，默认为内置库同目录下的 user_sections.db
+        """
+        self._logger = Logger()
+        self._db_path = os.path.abspath(db_path)
+        self._overlay_path = os.path.abspath(
+            overlay_path or os.path.join(os.path.dirname(self._db_path), "user_sections.db"))
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._idle = []
+        self._closed = False
+
+        self._immutable = self._check_schema()
+        self._init_overlay()
+
+    @property
+    def db_path(self) -> str:
+        """内置截面库路径"""
+        return self._db_path
+
+    @property
+    def overlay_path(self) -> str:
+        """用户覆盖库路径"""
+        return self._overlay_path
+
+    @staticmethod
+    def table_ref(table: str) -> str:
+        """获取表在连接中的完整名称（用户可写的表位于覆盖库）
+
+        Args:
+            table: 表名
+
+        Returns:
+            str: 带库名的表名，如 "main"."h_sections_2017"
+        """
+        schema = OVERLAY_SCHEMA if table.lower() in WRITABLE_TABLES else "main"
+        return f'"{schema}"."{table}"'
+
+    @staticmethod
+    def list_tables(conn) -> set:
+        """列出连接中可读的截面表（用户可写的表取自覆盖库）
+
+        Args:
+            conn: 连接池中的连接
+
+        Returns:
+            set: 小写表名集合
+        """
+        tables = {row[0].lower() for row in conn.execute(
+            "SELECT name FROM main.sqlite_master WHERE type = 'table'")}
+        overlay = {row[0].lower() for row in conn.execute(
+            f'SELECT name FROM "{OVERLAY_SCHEMA}".sqlite_master WHERE type = \'table\'')}
+        return (tables - set(WRITABLE_TABLES)) | (overlay & set(WRITABLE_TABLES))
+
+    @contextmanager
+    def connection(self):
+        """从池中取出一个只读连接，使用结束后放回
+
+        Yields:
+            sqlite3.Connection: 数据库连接（row_factory 为 sqlite3.Row）
+        """
+        conn = None
+        with self._lock:
+            if self._idle:
+                conn = self._idle.pop()
+        if conn is None:
+            conn = self._open()
+
+        try:
+            yield conn
+        finally:
+            with self._lock:
+                if not self._closed and len(self._idle) < self.MAX_IDLE:
+                    self._idle.append(conn)
+                    conn = None
+            if conn is not None:
+                conn.close()
+
+    @contextmanager
+    def write(self):
+        """获取可写入覆盖库的连接，退出时提交事务（异常时回滚）
+
+        Yields:
+            sqlite3.Connection: 数据库连接
+        """
+        with self._write_lock, self.connection() as conn:
+            conn.execute("PRAGMA query_only = 0")
+            try:
+                with conn:
+                    yield conn
+            finally:
+                conn.execute("PRAGMA query_only = 1")
+
+    @staticmethod
+    def drop_overlay_indexes(conn):
+        """删除用户截面表的属性索引（批量写入前调用）
+
+        Args:
+            conn: write() 返回的连接
+        """
+        for name in OVERLAY_INDEXES:
+            conn.execute(f'DROP INDEX IF EXISTS "{OVERLAY_SCHEMA}"."{name}"')
+
+    @staticmethod
+    def create_overlay_indexes(conn, schema: str = OVERLAY_SCHEMA):
+        """创建用户截面表的属性索引
+
+        Args:
+            conn: 数据库连接
+            schema: 用户截面表所在的库名
+        """
+        for name, column in OVERLAY_INDEXES.items():
+            conn.execute(f'CREATE INDEX IF NOT EXISTS "{schema}"."{name}" ON sections ({column})')
+
+    def close(self):
+        """关闭池中的空闲连接，之后归还的连接也会直接关闭"""
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+
+    def _open(self) -> sqlite3.Connection:
+        """打开新连接：只读内置库 + 附加覆盖库 + 临时统一视图"""
+        uri = Path(self._db_path).as_uri() + ("?mode=ro&immutable=1" if self._immutable else "?mode=ro")
+        conn = sqlite3.connect(uri, uri=True, check_same_thread=False,
+                               cached_statements=self.CACHED_STATEMENTS)
+        conn.row_factory = sqlite3.Row
+        conn.execute(f"PRAGMA mmap_size = {self.MMAP_SIZE}")
+        conn.execute(f"PRAGMA cache_size = -{self.CACHE_SIZE_KB}")
+        conn.execute("PRAGMA temp_store = MEMORY")
+        conn.execute(f'ATTACH DATABASE ? AS "{OVERLAY_SCHEMA}"', (self._overlay_path,))
+
+        # 临时视图优先于内置库中的同名视图，并包含覆盖库中的用户截面
+        view_sql = build_view_sql(conn, OVERLAY_SCHEMA)
+        if view_sql:
+            conn.execute(view_sql)
+        conn.execute("PRAGMA query_only = 1")
+        return conn
+
+    def _check_schema(self) -> bool:
+        """检查内置库是否为当前结构版本（只读，不做升级）
+
+        随程序发布的内置库已包含当前版本的索引和派生特性列；版本过旧的内置库仍可查询
+        （缺少的列为空、不使用新索引），需由 DataImporter 升级
+
+        Returns:
+            bool: 内置库为当前版本、可以按 immutable 模式打开时返回True
+        """
+        if not os.path.exists(self._db_path):
+            return False
+        try:
+            conn = sqlite3.connect(Path(self._db_path).as_uri() + "?mode=ro", uri=True)
+            try:
+                current = is_schema_current(conn)
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            self._logger.warning(f"无法读取型钢截面库的结构版本: {e}")
+            return False
+        if not current:
+            self._logger.warning("型钢截面库的结构版本过旧，请使用 DataImporter 重新生成索引和派生特性")
+        return current
+
+    def _init_overlay(self):
+        """创建用户覆盖库；首次创建时迁移内置库中已有的用户截面，旧版覆盖库补算派生特性列"""
+        is_new = not os.path.exists(self._overlay_path)
+        with sqlite3.connect(Path(self._overlay_path).as_uri(), uri=True) as conn:
+            conn.execute(OVERLAY_TABLE_SQL)
+            columns = {row[1].lower() for row in conn.execute("PRAGMA table_info(sections)")}
+            if not {column.lower() for column in DERIVED_COLUMNS} <= columns:
+                materialize_derived_columns(conn, tables=["sections"])
+            self.create_overlay_indexes(conn, "main")
+            if not is_new or not os.path.exists(self._db_path):
+                return
+
+            conn.execute("ATTACH DATABASE ? AS shipped",
+                         (Path(self._db_path).as_uri() + "?mode=ro",))
+            has_legacy = conn.execute(
+                "SELECT 1 FROM shipped.sqlite_master WHERE type = 'table' AND name = 'sections'").fetchone()
+            if has_legacy:
+                columns = ("shape_type, model, height, width, web_thickness, flange_thickness, "
+                           "area, weight, ix, iy, wx, wy")
+                conn.execute(
+                    f"INSERT OR IGNORE INTO main.sections ({columns}) "
+                    f"SELECT {columns} FROM shipped.sections ORDER BY id")
+                materialize_derived_columns(conn, tables=["sections"])
+
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(db_path: str, overlay_path: str = None) -> SectionConnectionPool:
+    """获取数据库对应的共享连接池
+
+    首次调用时创建连接池，overlay_path 仅在首次调用时生效
+
+    Args:
+        db_path: 内置截面库路径
+        overlay_path: 用户覆盖库路径
+
+    Returns:
+        SectionConnectionPool: 共享连接池
+    """
+    key = os.path.abspath(db_path)
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = SectionConnectionPool(db_path, overlay_path)
+            _pools[key] = pool
+        return pool
@@ -1,9 +1,324 @@
 """数据导入工具"""
 
 import os
+import csv
 import json
-from plugins.Steel_Shape_Table.database import SectionDatabase
-from plugins.Steel_Shape_Table.models import SteelSection
+import math
+import re
+import sqlite3
+from plugins.Steel_Shape_Table.database import SECTION_COLUMNS, SectionDatabase
+from plugins.Steel_Shape_Table.table_config import TABLE_COLUMN_CONFIGS
+
+
+# 型钢特性表字段名到通用sections表列名的映射（区分大小写：Ix 为惯性矩，ix 为惯性半径）
+# 通用sections表的 ix/iy 为惯性半径，wx/wy 为截面模量；表中没有惯性矩列，惯性矩只用于推算和校核惯性半径
+TABLE_FIELD_COLUMNS = {
+    "model": "model",
+    "section_name": "model",
+    "height": "height",
+    "width": "width",
+    "web_thickness": "web_thickness",
+    "flange_thickness": "flange_thickness",
+    "area": "area",
+    "weight": "weight",
+    "ix": "ix",
+    "iy": "iy",
+    "rx": "ix",
+    "ry": "iy",
+    "Wx": "wx",
+    "Wy": "wy",
+}
+
+# 其他可识别的表头（小写）
+HEADER_ALIASES = {
+    "类型": "shape_type",
+    "型钢类型": "shape_type",
+    "section_name": "model",
+    "rx": "ix",
+    "ry": "iy",
+}
+
+# 惯性矩表头（区分大小写）到对应惯性半径列的映射；转为小写后会与惯性半径列 ix/iy 混淆，不作为列导入
+INERTIA_HEADERS = {"Ix": "ix", "Iy": "iy"}
+
+# 惯性半径与 sqrt(惯性矩/面积) 的允许相对偏差
+RADIUS_TOLERANCE = 0.05
+
+# 数值列
+NUMERIC_COLUMNS = SECTION_COLUMNS[2:]
+
+# 流式读取JSON时每次读入的字符数
+JSON_CHUNK_SIZE = 1 << 16
+
+# {"sections": [...]} 格式中记录数组的起始位置
+SECTIONS_ARRAY_PATTERN = re.compile(r'"sections"\s*:\s*\[')
+
+
+def _build_header_map() -> dict:
+    """构建表头（小写的英文字段名或型钢特性表中文标题）到列名的映射"""
+    header_map = {column: column for column in SECTION_COLUMNS}
+    for columns in TABLE_COLUMN_CONFIGS.values():
+        for field, title, _ in columns:
+            column = TABLE_FIELD_COLUMNS.get(field)
+            # 中文标题去掉单位，如 "高度H(mm)" -> "高度h"
+            if column is not None:
+                header_map.setdefault(title.split("(")[0].lower(), column)
+    header_map.update(HEADER_ALIASES)
+    return header_map
+
+
+_HEADER_MAP = _build_header_map()
+
+# 惯性矩的中文标题（小写，去掉单位，如 "惯性矩ix"）到对应惯性半径列的映射
+_INERTIA_TITLE_MAP = {
+    title.split("(")[0].lower(): INERTIA_HEADERS[field]
+    for columns in TABLE_COLUMN_CONFIGS.values()
+    for field, title, _ in columns
+    if field in INERTIA_HEADERS
+}
+
+
+def normalize_header(name) -> str:
+    """将表头转换为通用sections表的列名
+
+    Args:
+        name: 表头文本
+
+    Returns:
+        str: 列名，无法识别时返回None
+    """
+    if name is None:
+        return None
+    key = str(name).strip().split("(")[0].split("（")[0]
+    if key in INERTIA_HEADERS:
+        return None
+    return _HEADER_MAP.get(key.lower())
+
+
+def inertia_column(name) -> str:
+    """获取惯性矩表头对应的惯性半径列名
+
+    Args:
+        name: 表头文本，如 "Ix" 或 "惯性矩Ix(cm⁴)"
+
+    Returns:
+        str: 惯性半径列名（ix 或 iy），不是惯性矩表头时返回None
+    """
+    if name is None:
+        return None
+    key = str(name).strip().split("(")[0].split("（")[0]
+    return INERTIA_HEADERS.get(key) or _INERTIA_TITLE_MAP.get(key.lower())
+
+
+def iter_json_records(json_path: str):
+    """流式读取JSON截面文件中的记录
+
+    支持 {"sections": [...]} 和顶层数组两种格式；按块读取并逐个解析数组元素，
+    不把整个文件读入内存。对象格式只读取 "sections" 键下的数组，其他键的数组忽略
+
+    Args:
+        json_path: JSON文件路径
+
+    Yields:
+        dict: 截面记录
+    """
+    decoder = json.JSONDecoder()
+    with open(json_path, "r", encoding="utf-8") as f:
+        buffer = f.read(JSON_CHUNK_SIZE)
+        while buffer and not buffer.lstrip("\ufeff \t\r\n"):
+            buffer += f.read(JSON_CHUNK_SIZE)
+
+        # 定位记录数组的起始位置：顶层数组为第一个 "["，否则为 "sections" 键的值
+        if buffer.lstrip("\ufeff \t\r\n").startswith("["):
+            start = buffer.find("[")
+        else:
+            match = SECTIONS_ARRAY_PATTERN.search(buffer)
+            while match is None:
+                chunk = f.read(JSON_CHUNK_SIZE)
+                if not chunk:
+                    return
+                buffer += chunk
+                match = SECTIONS_ARRAY_PATTERN.search(buffer)
+            start = match.end() - 1
+        position = start + 1
+
+        while True:
+            # 跳过空白和分隔符
+            while True:
+                while position < len(buffer) and buffer[position] in " \t\r\n,":
+                    position += 1
+                if position < len(buffer):
+                    break
+                chunk = f.read(JSON_CHUNK_SIZE)
+                if not chunk:
+                    return
+                buffer, position = chunk, 0
+            if buffer[position] == "]":
+                return
+
+            # 解析一条记录，数据不完整时继续读入
+            try:
+                record, end = decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                chunk = f.read(JSON_CHUNK_SIZE)
+                if not chunk:
+                    raise
+                buffer, position = buffer[position:] + chunk, 0
+                continue
+            yield record
+            position = end
+
+
+def iter_csv_records(csv_path: str):
+    """流式读取CSV截面文件中的记录（首行为表头，支持带BOM的UTF-8）
+
+    Args:
+        csv_path: CSV文件路径
+
+    Yields:
+        dict: {表头: 单元格文本}
+    """
+    with open(csv_path, "r", encoding="utf-8-sig", newline="") as f:
+        yield from csv.DictReader(f)
+
+
+def iter_xlsx_records(xlsx_path: str):
+    """流式读取Excel截面文件中的记录（每个工作表首行为表头）
+
+    以只读模式逐行读取，工作表名作为缺省的型钢类型
+
+    Args:
+        xlsx_path: Excel文件路径
+
+    Yields:
+        dict: {表头: 单元格值}
+    """
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(xlsx_path, read_only=True, data_only=True)
+    try:
+        for sheet in workbook.worksheets:
+            rows = sheet.iter_rows(values_only=True)
+            header = next(rows, None)
+            if not header:
+                continue
+            for values in rows:
+                if values is None or all(value is None for value in values):
+                    continue
+                record = dict(zip(header, values))
+                record.setdefault("shape_type", sheet.title)
+                yield record
+    finally:
+        workbook.close()
+
+
+# 文件扩展名到记录读取函数的映射
+RECORD_READERS = {
+    ".json": iter_json_records,
+    ".csv": iter_csv_records,
+    ".xlsx": iter_xlsx_records,
+    ".xlsm": iter_xlsx_records,
+}
+
+
+def _to_number(value) -> float:
+    """将单元格值转换为数值，空值为0"""
+    if value is None:
+        return 0.0
+    if isinstance(value, (int, float)):
+        return float(value)
+    text = str(value).strip().replace(",", "")
+    return float(text) if text else 0.0
+
+
+def _radius_of_gyration(radius: float, inertia: float, area: float, size: float) -> float:
+    """推算或校核惯性半径
+
+    Args:
+        radius: 记录中的惯性半径（cm），没有时为0
+        inertia: 记录中的惯性矩（cm⁴），没有时为0
+        area: 截面面积（cm²）
+        size: 截面高度和宽度的较大值（mm）
+
+    Returns:
+        float: 惯性半径（cm）
+
+    Raises:
+        ValueError: 惯性半径与惯性矩、面积不符，或无法换算
+    """
+    if inertia > 0 and area > 0:
+        expected = math.sqrt(inertia / area)
+        if radius == 0:
+            return expected
+        if abs(radius - expected) > RADIUS_TOLERANCE * expected:
+            raise ValueError(f"惯性半径 {radius} 与惯性矩和面积不符（应约为 {expected:.3g}）")
+        return radius
+
+    # 旧版JSON（如早期的 sections.json）在小写 ix/iy 下存放惯性矩：
+    # 惯性半径不可能超过截面尺寸，超过的按惯性矩换算
+    if size > 0 and radius * 10.0 > size:
+        if area <= 0:
+            raise ValueError(f"惯性半径 {radius} 超过截面尺寸且缺少面积，无法按惯性矩换算")
+        return math.sqrt(radius / area)
+    return radius
+
+
+# 校核惯性半径使用的列在 NUMERIC_COLUMNS 中的位置
+_RADIUS_INDEXES = {column: NUMERIC_COLUMNS.index(column) for column in INERTIA_HEADERS.values()}
+_AREA_INDEX = NUMERIC_COLUMNS.index("area")
+_SIZE_INDEXES = (NUMERIC_COLUMNS.index("height"), NUMERIC_COLUMNS.index("width"))
+
+
+def records_to_rows(records, shape_type: str = None, skipped: list = None):
+    """将截面记录转换为通用sections表的行
+
+    Args:
+        records: 截面记录（字典）的可迭代对象
+        shape_type: 记录中没有型钢类型时使用的类型
+        skipped: 不为None时追加无法导入的记录（缺少型号、数值无效或惯性半径不合理）
+
+    Yields:
+        tuple: 按 SECTION_COLUMNS 顺序排列的行
+    """
+    columns_cache = {}
+    for record in records:
+        keys = tuple(record)
+        cached = columns_cache.get(keys)
+        if cached is None:
+            columns = {}
+            inertia_keys = {}
+            for key in keys:
+                column = normalize_header(key)
+                # 同一列有多个表头时使用第一个（如 ix 与 rx 同时存在时取先出现的）
+                if column is not None and column not in columns:
+                    columns[column] = key
+                radius_column = inertia_column(key)
+                if radius_column is not None:
+                    inertia_keys.setdefault(radius_column, key)
+            cached = columns_cache[keys] = (columns, inertia_keys)
+        columns, inertia_keys = cached
+
+        model_key = columns.get("model")
+        model = record.get(model_key) if model_key else None
+        row_type = record.get(columns["shape_type"]) if "shape_type" in columns else None
+        row_type = row_type if row_type not in (None, "") else shape_type
+        if model in (None, "") or not row_type:
+            if skipped is not None:
+                skipped.append(record)
+            continue
+
+        try:
+            values = [_to_number(record.get(columns[column])) if column in columns else 0.0
+                      for column in NUMERIC_COLUMNS]
+            size = max(values[index] for index in _SIZE_INDEXES)
+            for column, index in _RADIUS_INDEXES.items():
+                inertia = _to_number(record.get(inertia_keys[column])) if column in inertia_keys else 0.0
+                values[index] = _radius_of_gyration(values[index], inertia, values[_AREA_INDEX], size)
+        except ValueError:
+            if skipped is not None:
+                skipped.append(record)
+            continue
+        yield (str(row_type).strip(), str(model).strip(), *values)
 
 
 class DataImporter:
@@ -15,6 +330,7 @@ class DataImporter:
         Args:
             db_path: 数据库文件路径
         """
+        self._db_path = db_path
         self._db = SectionDatabase(db_path)
     
     def import_from_json(self, json_path: str) -> int:
@@ -26,22 +342,37 @@ class DataImporter:
         Returns:
             int: 成功导入的记录数
         """
-        try:
-            # 读取JSON文件
-            with open(json_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            # 转换为SteelSection对象列表
-            sections = []
-            for section_dict in data.get('sections', []):
-                section = SteelSection.from_dict(section_dict)
-                sections.append(section)
+        return self.bulk_import(json_path)
+    
+    def bulk_import(self, file_path: str, shape_type: str = None, batch_size: int = 5000) -> int:
+        """流式批量导入型钢截面（JSON、CSV或Excel），已存在的型号（同类型同型号）会被更新
+        
+        记录边读取边写入，所有记录在一个事务中写入，派生特性按批计算后随记录写入，
+        索引和缓存只在最后重建一次
+        
+        Args:
+            file_path: 截面文件路径
+            shape_type: 文件中没有型钢类型列时使用的类型
+            batch_size: 每批写入的记录数
             
-            # 批量导入到数据库
-            return self._db.add_sections(sections)
-        except Exception as e:
-            print(f"从JSON导入失败: {e}")
+        Returns:
+            int: 成功导入的记录数
+        """
+        reader = RECORD_READERS.get(os.path.splitext(file_path)[1].lower())
+        if reader is None:
+            print(f"不支持的文件格式: {file_path}")
             return 0
+        
+        skipped = []
+        try:
+            count = self._db.bulk_upsert(records_to_rows(reader(file_path), shape_type, skipped), batch_size)
+        except (OSError, ValueError, sqlite3.Error) as e:
+            print(f"导入型钢截面失败: {e}")
+            return 0
+        
+        if skipped:
+            print(f"跳过 {len(skipped)} 条缺少类型、型号或数值无效的记录")
+        return count
     
     def export_to_json(self, json_path: str) -> bool:
         """将数据库数据导出到JSON文件
@@ -55,7 +386,7 @@ class DataImporter:
         return self._db.backup_to_json(json_path)
     
     def update_from_json(self, json_path: str) -> int:
-        """从JSON文件更新数据库数据（仅更新已存在的记录）
+        """从JSON文件更新数据库数据（已存在的记录更新，不存在的记录添加）
         
         Args:
             json_path: JSON文件路径
@@ -63,27 +394,7 @@ class DataImporter:
         Returns:
             int: 成功更新的记录数
         """
-        try:
-            # 读取JSON文件
-            with open(json_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            # 转换为SteelSection对象列表
-            sections = []
-            for section_dict in data.get('sections', []):
-                section = SteelSection.from_dict(section_dict)
-                sections.append(section)
-            
-            # 更新到数据库
-            updated_count = 0
-            for section in sections:
-                if self._db.add_section(section):
-                    updated_count += 1
-            
-            return updated_count
-        except Exception as e:
-            print(f"从JSON更新失败: {e}")
-            return 0
+        return self.bulk_import(json_path)
 
 
 def initialize_database():
@@ -104,6 +415,8 @@ def initialize_database():
     imported_count = importer.import_from_json(json_path)
     print(f"成功导入 {imported_count} 条记录到数据库")
     
+    # 内置库只读，派生特性由构建脚本写入（python -m plugins.Steel_Shape_Table.build_database），
+    # 导入的截面在写入时已计算派生特性
     return imported_count
 
 
@@ -1,16 +1,56 @@
 """数据库操作模块"""
 
-from re import I
 import sqlite3
 import json
 import os
-from tkinter import W
-from typing import List, Optional
+import threading
+from collections import OrderedDict
+from itertools import islice
+from typing import Iterable, List, Optional
+
+import numpy as np
+
+from core.cache import CacheStats
 from plugins.Steel_Shape_Table.models import SteelSection
+from plugins.Steel_Shape_Table.connection import get_pool
+from plugins.Steel_Shape_Table.derived_properties import (
+    DERIVED_COLUMNS,
+    TABLE_FAMILIES,
+    compute_derived_properties,
+    derived_rows,
+)
+from plugins.Steel_Shape_Table.schema import SECTION_VIEW, VIEW_COLUMNS
+
+
+# 用户截面表（通用sections表）可写入的列
+SECTION_COLUMNS = ("shape_type", "model", "height", "width", "web_thickness", "flange_thickness",
+                   "area", "weight", "ix", "iy", "wx", "wy")
+
+# 写入时计算的派生特性所需的尺寸列（SECTION_COLUMNS 中的位置）
+_DERIVED_INPUTS = {name: SECTION_COLUMNS.index(name)
+                   for name in ("height", "width", "web_thickness", "flange_thickness", "area")}
+
+# 模型字段名（惯性半径）到统一视图列名的映射
+VIEW_FIELD_ALIASES = {
+    "ix": "rx",
+    "iy": "ry",
+    "ix0": "rx0",
+    "iu": "ru",
+}
 
 
 class SectionDatabase:
-    """型钢截面数据库操作类"""
+    """型钢截面数据库操作类
+    
+    查询结果缓存分两层：每种型钢类型的完整结果，以及按 (类型, 关键词) 缓存的
+    搜索结果（LRU）。所有写入操作都会使缓存失效。
+    
+    所有读写都通过共享连接池进行（见 SectionConnectionPool）：内置库只读，
+    用户添加的截面写入覆盖库。
+    """
+    
+    # 关键词搜索结果缓存的最大条目数
+    SEARCH_CACHE_SIZE = 128
     
     def __init__(self, db_path: str):
         """初始化数据库连接
@@ -19,529 +59,351 @@ class SectionDatabase:
             db_path: 数据库文件路径
         """
         self._db_path = db_path
+        # 完整结果缓存：{型钢类型: 截面列表}，首次查询时填充
         self._cache = {}
+        # 搜索结果缓存：{(型钢类型, 关键词): 截面列表}，按最近使用排序
+        self._search_cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._cache_stats = CacheStats()
+        self._pool = None
         self._init_db()
 
-        # 初始化缓存
-        self._load_cache()
-
     def _init_db(self):
         """初始化数据库
         
-        只做必要的初始化工作，不创建表结构
+        不创建截面表，只获取共享连接池（首次获取时创建用户覆盖库）
         """
         # 确保数据库文件所在目录存在
         db_dir = os.path.dirname(self._db_path)
         if db_dir and not os.path.exists(db_dir):
             os.makedirs(db_dir)
         
-        # 测试数据库连接
-        try:
-            with sqlite3.connect(self._db_path) as conn:
-                # 简单执行一个查询来测试连接
-                conn.execute("SELECT 1")
-        except sqlite3.Error as e:
-            print(f"数据库连接测试失败: {e}")
+        self._pool = get_pool(self._db_path)
     
-    def _load_cache(self):
-        """加载缓存"""
-        # 获取所有型钢类型
-        shape_types = self.get_shape_types()
-        for shape_type in shape_types:
-            # 预加载每种类型的前100条数据到缓存
-            sections = self.get_sections(shape_type, limit=100)
-            self._cache[shape_type] = sections
-
-    def _get_sections_from_h_sections_table(self, category: str, keyword: str = None, limit: int = None) -> List[SteelSection]:
-        """从h_sections_2017表获取型钢截面数据
+    def get_sections(self, shape_type: str, keyword: str = None, limit: int = None) -> List[SteelSection]:
+        """获取指定类型的型钢截面列表
         
         Args:
-            category: 型钢类别 (HW/HM/HN/HP等)
+            shape_type: 型钢类型
             keyword: 搜索关键词
             limit: 限制返回数量
             
         Returns:
             List[SteelSection]: 型钢截面列表
         """
-        with sqlite3.connect(self._db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-            
-            # 构建查询语句
-            query = "SELECT * FROM h_sections_2017 WHERE category = ?"
-            params = [category]
-            
-            # 添加关键词搜索
-            if keyword:
-                query += " AND section_name LIKE ?"
-                params.append(f"%{keyword}%")
-            
-            # 添加限制
-            if limit:
-                query += " LIMIT ?"
-                params.append(limit)
-            
-            cursor.execute(query, params)
-            rows = cursor.fetchall()
-            
-            # 转换为SteelSection对象
-            sections = []
-            for row in rows:
-                section = SteelSection(
-                    shape_type="H型钢截面表（2017）",  # 固定为H型钢截面表（2017）
-                    category=row['category'],  # 类别作为category
-                    model=row['section_name'],  # section_name作为model
-                    height=row['height'],
-                    width=row['width'],
-                    web_thickness=row['web_thickness'],
-                    flange_thickness=row['flange_thickness'],
-                    fillet_radius=row['fillet_radius'],  # 使用数据库中的圆角半径
-                    area=row['area'],
-                    weight=row['weight'],
-                    surface_area=row['surface_area'],  # 使用数据库中的表面积
-                    Ix=row['Ix'],  # Ix对应数据库中的Ix列
-                    Iy=row['Iy'],  # Iy对应数据库中的Iy列
-                    ix=row['rx'],  # 惯性半径ix
-                    iy=row['ry'],  # 惯性半径iy
-                    Wx=row['Wx'],  # Wx对应数据库中的Wx列
-                    Wy=row['Wy']   # Wy对应数据库中的Wy列
-                )
-                sections.append(section)
-            
-            return sections
-            
-    def _get_sections_from_h_sections_2024_table(self, keyword: str = None, limit: int = None) -> List[SteelSection]:
-        """从h_sections_2024表获取型钢截面数据
+        keyword = keyword or None
+        
+        with self._cache_lock:
+            if keyword is None:
+                sections = self._cache.get(shape_type)
+            else:
+                sections = self._search_cache.get((shape_type, keyword))
+                if sections is not None:
+                    self._search_cache.move_to_end((shape_type, keyword))
+            
+            if sections is not None:
+                self._cache_stats.hits += 1
+            else:
+                self._cache_stats.misses += 1
+        
+        if sections is None:
+            # 缓存中只保存完整结果，limit 在返回时截取
+            sections = self._query_sections(shape_type, keyword)
+            
+            with self._cache_lock:
+                if keyword is None:
+                    self._cache[shape_type] = sections
+                else:
+                    self._search_cache[(shape_type, keyword)] = sections
+                    while len(self._search_cache) > self.SEARCH_CACHE_SIZE:
+                        self._search_cache.popitem(last=False)
+                        self._cache_stats.evictions += 1
+        
+        # 返回副本，调用方修改列表不会影响缓存
+        return list(sections[:limit] if limit else sections)
+    
+    def _query_sections(self, shape_type: str, keyword: str = None) -> List[SteelSection]:
+        """从统一视图查询指定类型的型钢截面（不使用缓存）
         
         Args:
+            shape_type: 型钢类型
             keyword: 搜索关键词
-            limit: 限制返回数量
             
         Returns:
             List[SteelSection]: 型钢截面列表
         """
-        with sqlite3.connect(self._db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-            
-            # 构建查询语句
-            query = "SELECT * FROM h_sections_2024"
-            params = []
-            
-            # 添加关键词搜索
-            if keyword:
-                query += " WHERE section_name LIKE ?"
-                params.append(f"%{keyword}%")
-            
-            # 添加限制
-            if limit:
-                query += " LIMIT ?"
-                params.append(limit)
-            
-            cursor.execute(query, params)
-            rows = cursor.fetchall()
-            
-            # 转换为SteelSection对象
-            sections = []
-            for row in rows:
-                section = SteelSection(
-                    shape_type="H型钢截面表（2024）",  # 统一使用"H型钢截面表（2024）"作为shape_type
-                    model=row['section_name'],  # section_name作为model
-                    height=row['height'],
-                    width=row['width'],
-                    web_thickness=row['web_thickness'],
-                    flange_thickness=row['flange_thickness'],
-                    fillet_radius=row['fillet_radius'],  # 使用数据库中的圆角半径
-                    area=row['area'],
-                    weight=row['weight'],
-                    surface_area=row['surface_area'],  # 使用数据库中的表面积
-                    Ix=row['Ix'],  # Ix对应数据库中的Ix列
-                    Iy=row['Iy'],  # Iy对应数据库中的Iy列
-                    ix=row['rx'],  # 惯性半径ix
-                    iy=row['ry'],  # 惯性半径iy
-                    Wx=row['Wx'],  # Wx对应数据库中的Wx列
-                    Wy=row['Wy']   # Wy对应数据库中的Wy列
-                )
-                sections.append(section)
-            
-            return sections
-            
-    def _get_sections_from_i_sections_2016_table(self, keyword: str = None, limit: int = None) -> List[SteelSection]:
-        """从i_sections_2016表获取型钢截面数据
+        query = f"SELECT * FROM {SECTION_VIEW} WHERE shape_type = ?"
+        params = [shape_type]
+        if keyword:
+            query += " AND model LIKE ?"
+            params.append(f"%{keyword}%")
+        query += " ORDER BY source_order, source_id"
+        
+        with self._pool.connection() as conn:
+            rows = conn.execute(query, params).fetchall()
+        return [self._section_from_view_row(row) for row in rows]
+    
+    def find_sections(self, filters: dict = None, shape_types: List[str] = None,
+                      order_by: str = "weight", limit: int = None) -> List[SteelSection]:
+        """跨型钢类型按属性过滤和排序（单条SQL，过滤和排序列均有索引）
         
         Args:
-            keyword: 搜索关键词
+            filters: 属性过滤条件 {统一列名: (最小值, 最大值)}，边界为None表示不限
+            shape_types: 型钢类型列表，为None时查询所有类型
+            order_by: 排序列（统一列名），默认按理论重量从小到大
             limit: 限制返回数量
             
         Returns:
             List[SteelSection]: 型钢截面列表
         """
-        with sqlite3.connect(self._db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-            
-            # 构建查询语句
-            query = "SELECT * FROM i_sections_2016"
-            params = []
-            
-            # 添加关键词搜索
-            if keyword:
-                query += " WHERE section_name LIKE ?"
-                params.append(f"%{keyword}%")
-            
-            # 添加限制
-            if limit:
-                query += " LIMIT ?"
-                params.append(limit)
-            
-            cursor.execute(query, params)
-            rows = cursor.fetchall()
-            
-            # 转换为SteelSection对象
-            sections = []
-            for row in rows:
-                section = SteelSection(
-                    shape_type="I型钢截面表（2016）",  # 统一使用"I型钢截面表（2016）"作为shape_type
-                    model=row['section_name'],  # section_name作为model
-                    height=row['height'],
-                    width=row['width'],
-                    web_thickness=row['web_thickness'],
-                    flange_thickness=row['flange_thickness'],
-                    inner_fillet_radius=row['inner_fillet_radius'],  # 内圆角半径
-                    round_radius=row['round_radius'],  # 使用数据库中的圆角半径
-                    area=row['area'],
-                    weight=row['weight'],
-                    surface_area=row['surface_area'],  # 使用数据库中的表面积
-                    Ix=row['Ix'],  # Ix对应数据库中的Ix列
-                    Iy=row['Iy'],  # Iy对应数据库中的Iy列
-                    ix=row['rx'],  # 惯性半径ix
-                    iy=row['ry'],  # 惯性半径iy
-                    Wx=row['Wx'],  # Wx对应数据库中的Wx列
-                    Wy=row['Wy']   # Wy对应数据库中的Wy列
-                )
-                sections.append(section)
-            
-            return sections
-            
-    def _get_sections_from_l_sections_2016_table(self, keyword: str = None, limit: int = None) -> List[SteelSection]:
-        """从L_sections_2016表获取型钢截面数据
+        conditions = []
+        params = []
+        for field, (minimum, maximum) in (filters or {}).items():
+            column = self._view_column(field)
+            if minimum is not None:
+                conditions.append(f"{column} >= ?")
+                params.append(minimum)
+            if maximum is not None:
+                conditions.append(f"{column} <= ?")
+                params.append(maximum)
+            if minimum is None and maximum is None:
+                conditions.append(f"{column} IS NOT NULL")
+        if shape_types is not None:
+            conditions.append(f"shape_type IN ({', '.join('?' * len(shape_types))})")
+            params.extend(shape_types)
+        
+        query = f"SELECT * FROM {SECTION_VIEW}"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        order_column = self._view_column(order_by)
+        query += f" ORDER BY {order_column} IS NULL, {order_column}, source_order, source_id"
+        if limit:
+            query += " LIMIT ?"
+            params.append(limit)
+        
+        with self._pool.connection() as conn:
+            rows = conn.execute(query, params).fetchall()
+        return [self._section_from_view_row(row) for row in rows]
+    
+    def get_section(self, model: str, shape_type: str = None) -> Optional[SteelSection]:
+        """按型号精确查找型钢截面（使用各表的型号索引）
         
         Args:
-            keyword: 搜索关键词
-            limit: 限制返回数量
+            model: 型号
+            shape_type: 型钢类型，为None时在所有类型中查找
             
         Returns:
-            List[SteelSection]: 型钢截面列表
+            Optional[SteelSection]: 型钢截面，不存在时返回None
         """
-        with sqlite3.connect(self._db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-            
-            # 构建查询语句
-            query = "SELECT * FROM L_sections_2016"
-            params = []
-            
-            # 添加关键词搜索
-            if keyword:
-                query += " WHERE section_name LIKE ?"
-                params.append(f"%{keyword}%")
-            
-            # 添加限制
-            if limit:
-                query += " LIMIT ?"
-                params.append(limit)
-            
-            cursor.execute(query, params)
-            rows = cursor.fetchall()
-            
-            # 转换为SteelSection对象
-            sections = []
-            for row in rows:
-                section = SteelSection(
-                    shape_type="等边角钢截面表（2016）",  # 统一使用"等边角钢截面表（2016）"作为shape_type
-                    model=row['section_name'],  # section_name作为model
-                    side_width=row['side_width'],  # 边宽
-                    edge_thickness=row['edge_thickness'],  # 边厚
-                    round_radius=row['round_radius'],  # 使用数据库中的圆角半径
-                    area=row['area'],
-                    weight=row['weight'],
-                    surface_area=row['surface_area'],  # 使用数据库中的表面积
-                    Ix=row['Ix'],  # Ix对应数据库中的Ix列
-                    Ix1=row['IX1'],  # IX1对应数据库中的IX1
-                    Ix0=row['IX0'],  # IX0对应数据库中的IX0列    
-                    Iy0=row['Iy0'],  # Iy0对应数据库中的Iy0列
-                    ix=row['rx'],  # 惯性半径ix
-                    ix0=row['rx0'],  # 惯性半径ix0
-                    iy=row['ry0'],  # 惯性半径iy0
-                    Wx=row['Wx'],  # wx对应数据库中的Wx列
-                    Wy=row['Wy0'],  # wy对应数据库中的Wy0列
-                    Wx0=row['WX0'],  # wx0对应数据库中的WX0列
-                    Wy0=row['Wy0'],  # wy0对应数据库中的Wy0列
-                    Z0=row['Z0']   # z0对应数据库中的Z0列
-                )
-                sections.append(section)
-            
-            return sections
-            
-    def _get_sections_from_non_l_sections_2016_table(self, keyword: str = None, limit: int = None) -> List[SteelSection]:
-        """从non_L_sections_2016表获取型钢截面数据
+        query = f"SELECT * FROM {SECTION_VIEW} WHERE model = ?"
+        params = [model]
+        if shape_type is not None:
+            query += " AND shape_type = ?"
+            params.append(shape_type)
+        query += " ORDER BY source_order, source_id LIMIT 1"
+        
+        with self._pool.connection() as conn:
+            row = conn.execute(query, params).fetchone()
+        return self._section_from_view_row(row) if row else None
+    
+    @staticmethod
+    def _view_column(field: str) -> str:
+        """将字段名解析为统一视图的列名
+        
+        Raises:
+            ValueError: 字段不是视图中的数据列
+        """
+        field = VIEW_FIELD_ALIASES.get(field, field)
+        if field not in VIEW_COLUMNS:
+            raise ValueError(f"未知的截面属性: {field}")
+        return field
+    
+    @staticmethod
+    def _section_from_view_row(row) -> SteelSection:
+        """从统一视图的一行创建型钢截面（惯性半径同时写入 ix/iy 等模型字段）"""
+        data = {column: row[column] for column in VIEW_COLUMNS}
+        for model_field, view_column in VIEW_FIELD_ALIASES.items():
+            data[model_field] = row[view_column]
+        return SteelSection(shape_type=row["shape_type"], category=row["category"], model=row["model"], **data)
+
+    def get_shape_types(self) -> List[str]:
+        """获取所有型钢类型
         
-        Args:
-            keyword: 搜索关键词
-            limit: 限制返回数量
-            
         Returns:
-            List[SteelSection]: 型钢截面列表
+            List[str]: 型钢类型列表，按源表和数据库中的出现顺序排列
         """
-        with sqlite3.connect(self._db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-            
-            # 构建查询语句
-            query = "SELECT * FROM non_L_sections_2016"
-            params = []
-            
-            # 添加关键词搜索
-            if keyword:
-                query += " WHERE section_name LIKE ?"
-                params.append(f"%{keyword}%")
-            
-            # 添加限制
-            if limit:
-                query += " LIMIT ?"
-                params.append(limit)
-            
-            cursor.execute(query, params)
-            rows = cursor.fetchall()
-            
-            # 转换为SteelSection对象
-            sections = []
-            for row in rows:
-                section = SteelSection(
-                    shape_type="不等边角钢截面表（2016）",  # 统一使用"不等边角钢截面表（2016）"作为shape_type
-                    model=row['section_name'],  # section_name作为model
-                    long_side_width=row['long_side_width'],  # 使用长边宽
-                    short_side_width=row['short_side_width'],  # 使用短边宽
-                    edge_thickness=row['edge_thickness'],  # 边厚
-                    round_radius=row['round_radius'],  # 使用数据库中的圆角半径
-                    area=row['area'],
-                    weight=row['weight'],
-                    surface_area=row['surface_area'],  # 使用数据库中的表面积
-                    Ix=row['Ix'],  # Ix对应数据库中的Ix列
-                    Ix1=row['Ix1'],  # Ix1对应数据库中的Ix1列
-                    Iy=row['Iy'],  # Iy对应数据库中的Iy列
-                    Iy1=row['Iy1'],  # Iy1对应数据库中的Iy1列
-                    Iu=row['Iu'],  # Iu对应数据库中的Iu列
-                    ix=row['rx'],  # 惯性半径ix
-                    iy=row['ry'],  # 惯性半径iy
-                    iu=row['ru'],  # 惯性半径ru
-                    Wx=row['Wx'],  # wx对应数据库中的Wx列
-                    Wy=row['Wy'],  # wy对应数据库中的Wy列
-                    Wu=row['Wu'],  # Wu对应数据库中的Wu列
-                    tan_theta=row['tan_theta'],  # 截面主轴夹角正切值
-                )
-                sections.append(section)
-            
-            return sections
-            
-    def _get_sections_from_c_sections_2016_table(self, keyword: str = None, limit: int = None) -> List[SteelSection]:
-        """从c_sections_2016表获取型钢截面数据
+        with self._pool.connection() as conn:
+            rows = conn.execute(
+                f"SELECT shape_type FROM {SECTION_VIEW} GROUP BY shape_type "
+                "ORDER BY MIN(source_order), MIN(source_id)").fetchall()
+        return [row[0] for row in rows]
+    
+    def clear_cache(self):
+        """清空缓存（所有写入操作后调用）"""
+        with self._cache_lock:
+            self._cache.clear()
+            self._search_cache.clear()
+    
+    def get_cache_stats(self) -> dict:
+        """获取查询缓存统计
+        
+        Returns:
+            dict: 包含 hits、misses、hit_rate、evictions、entries 字段
+        """
+        with self._cache_lock:
+            return {
+                "hits": self._cache_stats.hits,
+                "misses": self._cache_stats.misses,
+                "hit_rate": self._cache_stats.hit_rate,
+                "evictions": self._cache_stats.evictions,
+                "entries": len(self._cache) + len(self._search_cache)
+            }
+    
+    def add_section(self, section: SteelSection) -> bool:
+        """添加或更新型钢截面（写入用户覆盖库的通用sections表）
         
         Args:
-            keyword: 搜索关键词
-            limit: 限制返回数量
+            section: 型钢截面
             
         Returns:
-            List[SteelSection]: 型钢截面列表
+            bool: 是否添加成功
         """
-        with sqlite3.connect(self._db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-            
-            # 构建查询语句
-            query = "SELECT * FROM c_sections_2016"
-            params = []
-            
-            # 添加关键词搜索
-            if keyword:
-                query += " WHERE section_name LIKE ?"
-                params.append(f"%{keyword}%")
-            
-            # 添加限制
-            if limit:
-                query += " LIMIT ?"
-                params.append(limit)
-            
-            cursor.execute(query, params)
-            rows = cursor.fetchall()
-            
-            # 转换为SteelSection对象
-            sections = []
-            for row in rows:
-                section = SteelSection(
-                    shape_type="C型钢截面表（2016）",  # 统一使用"C型钢截面表（2016）"作为shape_type
-                    model=row['section_name'],  # section_name作为model
-                    height=row['height'],
-                    width=row['width'],
-                    web_thickness=row['web_thickness'],  # 使用腹板厚度
-                    flange_thickness=row['flange_thickness'],  # 使用翼缘厚度
-                    round_radius=row['round_radius'],  # 使用数据库中的圆角半径
-                    area=row['area'],
-                    weight=row['weight'],
-                    surface_area=row['surface_area'],  # 使用数据库中的表面积
-                    Ix=row['Ix'],  # Ix对应数据库中的Ix列
-                    Iy=row['Iy'],  # Iy对应数据库中的Iy列
-                    ix=row['rx'],  # 惯性半径rx
-                    iy=row['ry'],  # 惯性半径ry
-                    Wx=row['Wx'],  # wx对应数据库中的Wx列
-                    Wy=row['Wy']   # wy对应数据库中的Wy列
-                )
-                sections.append(section)
-            
-            return sections
+        return self.add_sections([section]) == 1
     
-    def get_sections(self, shape_type: str, keyword: str = None, limit: int = None) -> List[SteelSection]:
-        """获取指定类型的型钢截面列表
+    def add_sections(self, sections: List[SteelSection]) -> int:
+        """批量添加或更新型钢截面（写入用户覆盖库的通用sections表）
         
         Args:
-            shape_type: 型钢类型
-            keyword: 搜索关键词
-            limit: 限制返回数量
+            sections: 型钢截面列表
             
         Returns:
-            List[SteelSection]: 型钢截面列表
+            int: 成功写入的记录数
         """
-        # 如果是H型钢2017系列，从h_sections_2017表获取数据
-        # 检查是否为H型钢截面表（2017）格式，例如 "HW型钢截面表（2017）"
-        if shape_type.endswith("型钢截面表（2017）"):
-            
-            # 检查是否有缓存且没有关键词搜索
-            if not keyword and shape_type in self._cache:
-                return self._cache[shape_type]
-            
-            # 从shape_type中提取类别（如从"HW型钢截面表（2017）"中提取"HW"）
-            category = shape_type.split("型钢截面表（2017）")[0]
-            
-            # 从h_sections_2017表获取
-            sections = self._get_sections_from_h_sections_table(category, keyword, limit)
-            
-            # 更新缓存（如果没有关键词搜索）
-            if not keyword:
-                self._cache[shape_type] = sections
-                
-            return sections
-        # 如果是H型钢2024系列，从h_sections_2024表获取数据
-        elif shape_type == "H型钢截面表（2024）":
-            # 检查是否有缓存且没有关键词搜索
-            if not keyword and shape_type in self._cache:
-                return self._cache[shape_type]
-            
-            # 从h_sections_2024表获取
-            sections = self._get_sections_from_h_sections_2024_table(keyword, limit)
-            
-            # 更新缓存（如果没有关键词搜索）
-            if not keyword:
-                self._cache[shape_type] = sections
-                
-            return sections
-        # 如果是I型钢2016系列，从i_sections_2016表获取数据
-        elif shape_type == "I型钢截面表（2016）":
-            # 检查是否有缓存且没有关键词搜索
-            if not keyword and shape_type in self._cache:
-                return self._cache[shape_type]
-            
-            # 从i_sections_2016表获取
-            sections = self._get_sections_from_i_sections_2016_table(keyword, limit)
-            
-            # 更新缓存（如果没有关键词搜索）
-            if not keyword:
-                self._cache[shape_type] = sections
-                
-            return sections
-        # 如果是等边角钢2016系列，从L_sections_2016表获取数据
-        elif shape_type == "等边角钢截面表（2016）":
-            # 检查是否有缓存且没有关键词搜索
-            if not keyword and shape_type in self._cache:
-                return self._cache[shape_type]
-            
-            # 从L_sections_2016表获取
-            sections = self._get_sections_from_l_sections_2016_table(keyword, limit)
-            
-            # 更新缓存（如果没有关键词搜索）
-            if not keyword:
-                self._cache[shape_type] = sections
-                
-            return sections
-        # 如果是不等边角钢2016系列，从non_L_sections_2016表获取数据
-        elif shape_type == "不等边角钢截面表（2016）":
-            # 检查是否有缓存且没有关键词搜索
-            if not keyword and shape_type in self._cache:
-                return self._cache[shape_type]
-            
-            # 从non_L_sections_2016表获取
-            sections = self._get_sections_from_non_l_sections_2016_table(keyword, limit)
-            
-            # 更新缓存（如果没有关键词搜索）
-            if not keyword:
-                self._cache[shape_type] = sections
-                
-            return sections
-        # 如果是C型钢2016系列，从c_sections_2016表获取数据
-        elif shape_type == "C型钢截面表（2016）":
-            # 检查是否有缓存且没有关键词搜索
-            if not keyword and shape_type in self._cache:
-                return self._cache[shape_type]
+        rows = [
+            (section.shape_type, section.model, section.height or 0, section.width or 0,
+             section.web_thickness or 0, section.flange_thickness or 0, section.area or 0,
+             section.weight or 0, section.ix or 0, section.iy or 0, section.Wx or 0, section.Wy or 0)
+            for section in sections
+            if section.shape_type and section.model
+        ]
+        if not rows:
+            return 0
+        
+        try:
+            with self._pool.write() as conn:
+                conn.executemany(self._upsert_sql(), _with_derived_properties(rows))
+            return len(rows)
+        except sqlite3.Error as e:
+            print(f"写入型钢截面失败: {e}")
+            return 0
+        finally:
+            self.clear_cache()
+    
+    def bulk_upsert(self, rows: Iterable[tuple], batch_size: int = 5000) -> int:
+        """流式批量添加或更新型钢截面（写入用户覆盖库的通用sections表）
+        
+        所有记录在一个事务中按批 executemany 写入，每批的派生特性（塑性截面模量等）
+        随批向量化计算后一起写入；写入前删除属性索引，完成后重建索引并更新统计信息，
+        查询缓存只清空一次。任一批失败时整体回滚。
+        
+        Args:
+            rows: 按 SECTION_COLUMNS 顺序排列的记录元组，可以是生成器
+            batch_size: 每批写入的记录数
             
-            # 从c_sections_2016表获取
-            sections = self._get_sections_from_c_sections_2016_table(keyword, limit)
+        Returns:
+            int: 成功写入的记录数
             
-            # 更新缓存（如果没有关键词搜索）
-            if not keyword:
-                self._cache[shape_type] = sections
-                
-            return sections
-        
-        # 默认返回空列表，确保总是返回可迭代对象
-        return []
+        Raises:
+            sqlite3.Error: 写入失败
+        """
+        count = 0
+        try:
+            with self._pool.write() as conn:
+                self._pool.drop_overlay_indexes(conn)
+                sql = self._upsert_sql()
+                for batch in _batched(rows, batch_size):
+                    conn.executemany(sql, _with_derived_properties(batch))
+                    count += len(batch)
+                self._pool.create_overlay_indexes(conn)
+                conn.execute(f"ANALYZE {self._pool.table_ref('sections')}")
+            return count
+        finally:
+            self.clear_cache()
+    
+    def _upsert_sql(self) -> str:
+        """按 (shape_type, model) 插入或更新的SQL（更新时保留原记录的id和顺序）
 
-    def get_shape_types(self) -> List[str]:
-        """获取所有型钢类型
+        参数顺序为 SECTION_COLUMNS 加 DERIVED_COLUMNS（见 _with_derived_properties）
+        """
+        written = SECTION_COLUMNS + DERIVED_COLUMNS
+        columns = ", ".join(written)
+        placeholders = ", ".join("?" * len(written))
+        updates = ", ".join(f"{column} = excluded.{column}" for column in written[2:])
+        return (f"INSERT INTO {self._pool.table_ref('sections')} ({columns}) VALUES ({placeholders}) "
+                f"ON CONFLICT(shape_type, model) DO UPDATE SET {updates}")
+    
+    def backup_to_json(self, json_path: str) -> bool:
+        """将用户覆盖库的通用sections表备份到JSON文件
         
+        Args:
+            json_path: JSON文件路径
+            
         Returns:
-            List[str]: 型钢类型列表
+            bool: 是否备份成功
         """
-        with sqlite3.connect(self._db_path) as conn:
-            cursor = conn.cursor()
-            
-            # 从sections表获取类型
-            cursor.execute("SELECT DISTINCT shape_type FROM sections")
-            rows = cursor.fetchall()
-            types_from_sections = [row[0] for row in rows]
-            
-            # 从h_sections_2017表获取类型
-            cursor.execute("SELECT DISTINCT category FROM h_sections_2017")
-            rows = cursor.fetchall()
-            types_from_h_sections = [f"{row[0]}型钢截面表（2017）" for row in rows]
-            
-            # 添加H型钢截面表（2024）类型
-            types_from_h_sections_2024 = ["H型钢截面表（2024）"]
-            
-            # 添加I型钢截面表（2016）类型
-            types_from_i_sections_2016 = ["I型钢截面表（2016）"]
-            
-            # 添加等边角钢截面表（2016）类型
-            types_from_l_sections_2016 = ["等边角钢截面表（2016）"]
-            
-            # 添加不等边角钢截面表（2016）类型
-            types_from_non_l_sections_2016 = ["不等边角钢截面表（2016）"]
-            
-            # 添加C型钢截面表（2016）类型
-            types_from_c_sections_2016 = ["C型钢截面表（2016）"]
+        try:
+            with self._pool.connection() as conn:
+                rows = conn.execute(f"SELECT * FROM {self._pool.table_ref('sections')} ORDER BY id").fetchall()
+            
+            data = {"sections": [{key: row[key] for key in row.keys() if key != "id"} for row in rows]}
+            with open(json_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+            return True
+        except Exception as e:
+            print(f"备份到JSON失败: {e}")
+            return False
+    
+    def restore_from_json(self, json_path: str) -> int:
+        """从JSON文件恢复通用sections表
+        
+        Args:
+            json_path: JSON文件路径
             
-            # 合并七个列表
-            all_types = types_from_sections + types_from_h_sections + types_from_h_sections_2024 + types_from_i_sections_2016 + types_from_l_sections_2016 + types_from_non_l_sections_2016 + types_from_c_sections_2016
-            return all_types
+        Returns:
+            int: 成功恢复的记录数
+        """
+        try:
+            with open(json_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except Exception as e:
+            print(f"读取JSON失败: {e}")
+            return 0
+        
+        sections = [self._section_from_legacy_dict(item) for item in data.get("sections", [])]
+        return self.add_sections(sections)
     
-    def clear_cache(self):
-        """清空缓存"""
-        self._cache.clear()
\ No newline at end of file
+    @staticmethod
+    def _section_from_legacy_dict(data: dict) -> SteelSection:
+        """从通用sections表格式（小写 wx/wy 键）的字典创建型钢截面"""
+        data = dict(data)
+        data.setdefault("Wx", data.get("wx", 0))
+        data.setdefault("Wy", data.get("wy", 0))
+        return SteelSection.from_dict(data)
+
+
+def _with_derived_properties(rows: List[tuple]) -> List[tuple]:
+    """为一批按 SECTION_COLUMNS 排列的记录追加派生特性列（通用表按工字形截面计算）"""
+    values = np.array([[row[index] for index in _DERIVED_INPUTS.values()] for row in rows], dtype=float)
+    values = values.reshape(len(rows), len(_DERIVED_INPUTS))
+    derived = compute_derived_properties(TABLE_FAMILIES["sections"], dict(zip(_DERIVED_INPUTS, values.T)))
+    return [tuple(row) + properties for row, properties in zip(rows, derived_rows(derived))]
+
+
+def _batched(iterable, size: int):
+    """将可迭代对象按固定大小分批（最后一批可能较小）"""
+    iterator = iter(iterable)
+    while True:
+        batch = list(islice(iterator, size))
+        if not batch:
+            return
+        yield batch
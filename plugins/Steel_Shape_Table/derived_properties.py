@@ -0,0 +1,153 @@
+"""型钢派生截面特性
+
+塑性截面模量、扭转常数、翘曲常数和剪切面积不在原始截面表中，
+导入数据时按截面形式由尺寸批量计算（所有参数为数组，一次计算整个表），
+结果作为普通列写入数据库，可以像原有特性一样查询、过滤和排序。
+
+尺寸单位为 mm，结果单位与型钢特性表一致：塑性截面模量 cm³、扭转常数 cm⁴、
+翘曲常数 cm⁶、剪切面积 cm²。薄壁公式忽略倒角对扭转和翘曲的影响，用于初选。
+"""
+
+from typing import Dict, List
+
+import numpy as np
+
+
+# 派生特性列名
+DERIVED_COLUMNS = ("Wpx", "Wpy", "It", "Iw", "Avx", "Avy")
+
+# 各表的截面形式（通用sections表只有 H、B、t1、t2，按工字形计算）
+TABLE_FAMILIES = {
+    "sections": "i",
+    "h_sections_2017": "i",
+    "h_sections_2024": "i",
+    "i_sections_2016": "i",
+    "c_sections_2016": "channel",
+    "l_sections_2016": "equal_angle",
+    "non_l_sections_2016": "angle",
+}
+
+# 圆角（正方形减去四分之一圆）的面积系数和形心到角点的距离系数
+_FILLET_AREA = 1.0 - np.pi / 4.0
+_FILLET_CENTROID = (10.0 - 3.0 * np.pi) / (3.0 * (4.0 - np.pi))
+
+
+def _stacked_plastic_modulus(w1, d1, w2, d2):
+    """两个沿弯曲方向叠放的矩形（宽 w1 深 d1、宽 w2 深 d2）的塑性截面模量
+
+    塑性中和轴将面积平分，模量为两侧面积对中和轴的面积矩之和
+    """
+    half = (w1 * d1 + w2 * d2) / 2.0
+    in_first = w1 * d1 >= half
+    with np.errstate(divide="ignore", invalid="ignore"):
+        p = np.where(in_first, half / w1, d1 + (half - w1 * d1) / w2)
+    first = w1 * p ** 2 / 2.0 + w1 * (d1 - p) ** 2 / 2.0 + w2 * d2 * (d1 + d2 / 2.0 - p)
+    second = w1 * d1 * (p - d1 / 2.0) + w2 * (p - d1) ** 2 / 2.0 + w2 * (d1 + d2 - p) ** 2 / 2.0
+    return np.where(in_first, first, second)
+
+
+def _i_section(h, b, tw, tf, r, area):
+    """工字形、H形截面（双轴对称）"""
+    hw = h - 2.0 * tf
+    fillet = _FILLET_AREA * r ** 2
+    offset = _FILLET_CENTROID * r
+    return {
+        "Wpx": b * tf * (h - tf) + tw * hw ** 2 / 4.0 + 4.0 * fillet * (hw / 2.0 - offset),
+        "Wpy": tf * b ** 2 / 2.0 + hw * tw ** 2 / 4.0 + 4.0 * fillet * (tw / 2.0 + offset),
+        "It": (2.0 * b * tf ** 3 + (h - tf) * tw ** 3) / 3.0,
+        "Iw": tf * b ** 3 * (h - tf) ** 2 / 24.0,
+        "Avx": 2.0 * b * tf,
+        # 轧制工字形截面平行于腹板的剪切面积（含倒角），不小于腹板面积
+        "Avy": np.fmax(area - 2.0 * b * tf + (tw + 2.0 * r) * tf, hw * tw),
+    }
+
+
+def _channel(h, b, tw, tf, r, area):
+    """槽形截面（对x轴对称）"""
+    hw = h - 2.0 * tf
+    fillet = _FILLET_AREA * r ** 2
+    offset = _FILLET_CENTROID * r
+    # 翘曲常数按中线尺寸计算
+    bc = b - tw / 2.0
+    hc = h - tf
+    with np.errstate(divide="ignore", invalid="ignore"):
+        warping = tf * bc ** 3 * hc ** 2 / 12.0 * (3.0 * bc * tf + 2.0 * hc * tw) / (6.0 * bc * tf + hc * tw)
+    return {
+        "Wpx": b * tf * (h - tf) + tw * hw ** 2 / 4.0 + 2.0 * fillet * (hw / 2.0 - offset),
+        "Wpy": _stacked_plastic_modulus(h, tw, 2.0 * tf, b - tw),
+        "It": (2.0 * b * tf ** 3 + (h - tf) * tw ** 3) / 3.0,
+        "Iw": warping,
+        "Avx": 2.0 * b * tf,
+        "Avy": np.fmax(area - 2.0 * b * tf + (tw + r) * tf, hw * tw),
+    }
+
+
+def _angle(long_leg, short_leg, t):
+    """角钢（x轴垂直于长肢，绕几何轴计算）"""
+    return {
+        "Wpx": _stacked_plastic_modulus(short_leg, t, t, long_leg - t),
+        "Wpy": _stacked_plastic_modulus(long_leg, t, t, short_leg - t),
+        "It": (long_leg + short_leg - t) * t ** 3 / 3.0,
+        "Iw": t ** 3 * ((long_leg - t / 2.0) ** 3 + (short_leg - t / 2.0) ** 3) / 36.0,
+        "Avx": short_leg * t,
+        "Avy": long_leg * t,
+    }
+
+
+# 各派生特性从 mm 单位换算为表中单位的系数
+_UNIT_SCALES = {"Wpx": 1e-3, "Wpy": 1e-3, "It": 1e-4, "Iw": 1e-6, "Avx": 1e-2, "Avy": 1e-2}
+
+
+def compute_derived_properties(family: str, columns: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    """批量计算派生截面特性
+
+    Args:
+        family: 截面形式（"i"、"channel"、"equal_angle" 或 "angle"，见 TABLE_FAMILIES）
+        columns: 统一列名的尺寸数组，如 height、width、web_thickness、flange_thickness、
+            fillet_radius、side_width、long_side_width、short_side_width、edge_thickness、area；
+            缺少的列按空值处理
+
+    Returns:
+        Dict[str, np.ndarray]: {派生列名: 数组}，尺寸无效的截面为NaN
+    """
+    size = max((len(values) for values in columns.values() if values is not None), default=0)
+
+    def column(name: str) -> np.ndarray:
+        values = columns.get(name)
+        if values is None:
+            return np.full(size, np.nan)
+        return np.asarray(values, dtype=float)
+
+    if family in ("i", "channel"):
+        h, b = column("height"), column("width")
+        tw, tf = column("web_thickness"), column("flange_thickness")
+        r = np.nan_to_num(column("fillet_radius"))
+        area = column("area") * 1e2
+        builder = _i_section if family == "i" else _channel
+        values = builder(h, b, tw, tf, r, area)
+        valid = (h > 2.0 * tf) & (b > tw) & (tw > 0) & (tf > 0)
+    elif family in ("equal_angle", "angle"):
+        if family == "equal_angle":
+            long_leg = short_leg = column("side_width")
+        else:
+            long_leg, short_leg = column("long_side_width"), column("short_side_width")
+        t = column("edge_thickness")
+        values = _angle(long_leg, short_leg, t)
+        valid = (short_leg > t) & (long_leg >= short_leg) & (t > 0)
+    else:
+        raise ValueError(f"未知的截面形式: {family}")
+
+    return {name: np.where(valid, values[name] * _UNIT_SCALES[name], np.nan) for name in DERIVED_COLUMNS}
+
+
+def derived_rows(derived: Dict[str, np.ndarray]) -> List[tuple]:
+    """将派生特性数组转换为按 DERIVED_COLUMNS 顺序排列的记录元组
+
+    Args:
+        derived: compute_derived_properties 的结果
+
+    Returns:
+        List[tuple]: 每个截面一个元组，NaN 转为None（写入数据库为NULL）
+    """
+    matrix = np.column_stack([derived[column] for column in DERIVED_COLUMNS])
+    return [tuple(None if np.isnan(value) else value for value in row) for row in matrix.tolist()]
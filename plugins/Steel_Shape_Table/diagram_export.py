@@ -0,0 +1,215 @@
+"""型钢截面图批量导出"""
+
+import os
+import re
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from core.cache import DiskCache, get_cache
+from core.logger import Logger
+
+
+# 支持的导出格式（svg/png/pdf 需要 kaleido，html 不需要）
+EXPORT_FORMATS = ("svg", "png", "pdf", "html")
+
+# 图片导出引擎 kaleido 的最低版本（plotly 6.1 起只支持 kaleido 1.x，0.2.x 无法导出图片）
+KALEIDO_MIN_VERSION = (1, 0)
+
+# 图形描述缓存的命名空间和版本（修改图形生成逻辑后需递增版本）
+FIGURE_CACHE_NAMESPACE = "section_figures"
+FIGURE_SPEC_VERSION = 2
+
+# 每个子进程任务处理的截面数，减少进程间往返
+BATCH_SIZE = 16
+
+_INVALID_FILENAME_CHARS = re.compile(r'[\\/:*?"<>|\s]+')
+
+
+def build_shape_data(result) -> list:
+    """将目录查询结果转换为截面图使用的数据字典
+
+    Args:
+        result: 目录查询结果（CatalogResult）
+
+    Returns:
+        list: 每行一个截面数据字典（见 SectionRecord.shape_data）
+    """
+    return [record.shape_data() for record in result.records()]
+
+
+def image_engine_error(fmt: str):
+    """检查导出格式所需的图片引擎是否可用（不导入 plotly 和 kaleido）
+
+    Args:
+        fmt: 导出格式
+
+    Returns:
+        str: 引擎不可用时的错误说明，可用或不需要引擎（html）时返回None
+    """
+    if fmt == "html":
+        return None
+
+    from importlib import metadata
+
+    hint = "请执行 pip install -U \"kaleido>=1.0\"，并安装 Chrome 浏览器（可执行 plotly_get_chrome）"
+    try:
+        version = metadata.version("kaleido")
+    except metadata.PackageNotFoundError:
+        return f"导出 {fmt} 格式需要图片导出引擎 kaleido，{hint}；也可以选择 html 格式"
+    if tuple(int(part) for part in re.findall(r"\d+", version)[:2]) < KALEIDO_MIN_VERSION:
+        return f"kaleido {version} 版本过低，无法与当前 plotly 一起导出 {fmt} 格式，{hint}"
+    return None
+
+
+def figure_cache_key(shape_data: dict, style: dict) -> str:
+    """计算截面图形描述的缓存键
+
+    Args:
+        shape_data: 截面数据字典
+        style: 标注样式
+
+    Returns:
+        str: 缓存键
+    """
+    return DiskCache.make_key(section=shape_data, style=style, version=FIGURE_SPEC_VERSION)
+
+
+def _safe_filename(name: str) -> str:
+    """将型号或类型名转换为可用的文件名"""
+    return _INVALID_FILENAME_CHARS.sub("_", str(name)).strip("_") or "section"
+
+
+def _export_batch(items, fmt, style, cache_dir):
+    """在子进程中导出一批截面图
+
+    plotly 只在子进程中导入；图形描述按截面数据和样式缓存，命中时跳过图形构建
+
+    Args:
+        items: [(输出路径, 截面数据字典)] 列表
+        fmt: 导出格式
+        style: 标注样式
+        cache_dir: 磁盘缓存目录
+
+    Returns:
+        list: [(输出路径, 错误信息或None)] 列表
+    """
+    import plotly.graph_objects as go
+    from plugins.Steel_Shape_Table.ui.diagram_annotator import DiagramAnnotator
+
+    cache = get_cache(cache_dir)
+    annotator = DiagramAnnotator()
+    annotator.set_style(style)
+
+    results = []
+    for path, shape_data in items:
+        try:
+            spec = cache.get_or_compute(
+                FIGURE_CACHE_NAMESPACE, figure_cache_key(shape_data, style),
+                lambda: annotator.create_section_figure(shape_data).to_dict())
+            fig = go.Figure(spec)
+            if fmt == "html":
+                fig.write_html(path, include_plotlyjs="cdn")
+            else:
+                fig.write_image(path, format=fmt)
+        except Exception as e:
+            results.append((path, str(e)))
+        else:
+            results.append((path, None))
+    return results
+
+
+class SectionDiagramExporter:
+    """型钢截面图批量导出器
+
+    截面按批分发到进程池并行生成，主进程不导入 plotly；
+    每个截面的 Plotly 图形描述按截面数据和样式哈希缓存在磁盘缓存中，
+    重复导出时只需渲染
+    """
+
+    def __init__(self, style: dict = None, max_workers: int = None):
+        """初始化导出器
+
+        Args:
+            style: 标注样式，覆盖 DiagramAnnotator 的默认样式
+            max_workers: 最大进程数，默认为CPU核数
+        """
+        self._logger = Logger()
+        self._style = dict(style or {})
+        self._max_workers = max_workers
+
+    def export(self, sections, output_dir: str, fmt: str = "svg", context=None) -> dict:
+        """导出截面图
+
+        Args:
+            sections: 截面数据字典列表（见 build_shape_data），按 "类型" 分目录保存
+            output_dir: 输出目录
+            fmt: 导出格式，见 EXPORT_FORMATS
+            context: 任务上下文（TaskContext），用于报告进度和响应取消
+
+        Returns:
+            dict: {"exported": 成功导出的文件路径列表, "failed": [(文件路径, 错误信息)] 列表}
+
+        Raises:
+            ValueError: 不支持的导出格式
+            RuntimeError: 导出格式所需的图片引擎不可用
+        """
+        if fmt not in EXPORT_FORMATS:
+            raise ValueError(f"不支持的导出格式: {fmt}")
+        # 图片引擎缺失时在主进程中直接报错，不在每个子进程中逐个失败
+        error = image_engine_error(fmt)
+        if error is not None:
+            raise RuntimeError(error)
+
+        items = self._plan_files(sections, output_dir, fmt)
+        batches = [items[i:i + BATCH_SIZE] for i in range(0, len(items), BATCH_SIZE)]
+        cache_dir = str(get_cache().cache_dir)
+
+        exported, failed = [], []
+        if not batches:
+            return {"exported": exported, "failed": failed}
+
+        workers = min(self._max_workers or os.cpu_count() or 1, len(batches))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            pending = {executor.submit(_export_batch, batch, fmt, self._style, cache_dir) for batch in batches}
+            try:
+                while pending:
+                    done, pending = wait(pending, timeout=0.1, return_when=FIRST_COMPLETED)
+                    if context is not None:
+                        context.check_cancelled()
+                    for future in done:
+                        for path, error in future.result():
+                            if error is None:
+                                exported.append(path)
+                            else:
+                                failed.append((path, error))
+                    if done and context is not None:
+                        count = len(exported) + len(failed)
+                        context.report_progress(count * 100 // len(items), f"已导出 {count}/{len(items)}")
+            finally:
+                for future in pending:
+                    future.cancel()
+
+        if failed:
+            self._logger.warning(f"{len(failed)} 个截面图导出失败，首个错误: {failed[0][1]}")
+        return {"exported": exported, "failed": failed}
+
+    @staticmethod
+    def _plan_files(sections, output_dir: str, fmt: str) -> list:
+        """确定每个截面的输出路径并创建目录
+
+        Returns:
+            list: [(输出路径, 截面数据字典)] 列表
+        """
+        items = []
+        used = set()
+        for shape_data in sections:
+            directory = os.path.join(output_dir, _safe_filename(shape_data.get("类型", "")))
+            stem = _safe_filename(shape_data.get("型号", ""))
+            path = os.path.join(directory, f"{stem}.{fmt}")
+            index = 2
+            while path in used:
+                path = os.path.join(directory, f"{stem}_{index}.{fmt}")
+                index += 1
+            used.add(path)
+            os.makedirs(directory, exist_ok=True)
+            items.append((path, shape_data))
+        return items
@@ -0,0 +1,243 @@
+"""新旧标准 H 型钢等效截面映射（2017 → 2024）"""
+
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from plugins.Steel_Shape_Table.takeoff import SteelTakeoff
+
+
+# 旧标准和新标准 H 型钢所在的表
+LEGACY_TABLE = "h_sections_2017"
+CURRENT_TABLE = "h_sections_2024"
+
+# 等效准则：{准则: ((字段, 权重), ...)}，第一个字段为排序主键
+EQUIVALENCE_METRICS = {
+    "dimensions": (("height", 1.0), ("width", 1.0), ("web_thickness", 0.5), ("flange_thickness", 0.5)),
+    "stiffness": (("Ix", 1.0), ("Wx", 1.0)),
+}
+
+METRIC_TITLES = {
+    "dimensions": "尺寸等效",
+    "stiffness": "刚度等效",
+}
+
+# 每次查询的初始候选窗口（主键两侧各取的截面数）
+INITIAL_WINDOW = 8
+
+
+class SortedNeighborIndex:
+    """按主键排序的最近邻索引
+
+    特征取对数并乘以权重，欧氏距离近似为各属性相对偏差的加权平方和开方。
+    截面按第一个特征排序，查询时先在主键附近的小窗口内求得当前最近距离 d，
+    再检查主键落在 [q - d, q + d] 内的全部截面，结果是精确最近邻。
+    """
+
+    def __init__(self, features: np.ndarray, weights: np.ndarray):
+        """初始化索引
+
+        Args:
+            features: 特征矩阵（n × k，正数）
+            weights: 各特征的权重（k）
+        """
+        self._weights = np.asarray(weights, dtype=float)
+        points = np.log(np.asarray(features, dtype=float)) * self._weights
+        self._order = np.argsort(points[:, 0], kind="stable")
+        self._points = points[self._order]
+        self._keys = self._points[:, 0]
+
+    def __len__(self):
+        return len(self._order)
+
+    def transform(self, features: np.ndarray) -> np.ndarray:
+        """将原始特征转换为索引空间中的坐标"""
+        return np.log(np.asarray(features, dtype=float)) * self._weights
+
+    def nearest(self, features: np.ndarray):
+        """查找最近邻
+
+        Args:
+            features: 查询特征矩阵（m × k，正数）
+
+        Returns:
+            tuple: (索引构建时的行号数组, 距离数组)，长度均为 m
+        """
+        queries = self.transform(np.atleast_2d(features))
+        rows = np.empty(len(queries), dtype=np.intp)
+        distances = np.empty(len(queries))
+        count = len(self._keys)
+
+        for i, query in enumerate(queries):
+            center = int(np.searchsorted(self._keys, query[0]))
+            start, stop = max(center - INITIAL_WINDOW, 0), min(center + INITIAL_WINDOW, count)
+            best = np.sqrt(((self._points[start:stop] - query) ** 2).sum(axis=1)).min()
+
+            start = int(np.searchsorted(self._keys, query[0] - best, side="left"))
+            stop = int(np.searchsorted(self._keys, query[0] + best, side="right"))
+            candidate = np.sqrt(((self._points[start:stop] - query) ** 2).sum(axis=1))
+            position = start + int(np.argmin(candidate))
+            rows[i] = self._order[position]
+            distances[i] = candidate[position - start]
+        return rows, distances
+
+
+class SectionEquivalenceIndex:
+    """2017 版 H 型钢到 2024 版 H 型钢的等效截面索引
+
+    为每个等效准则在 2024 版截面上建立一个 SortedNeighborIndex，
+    构建时一次算出全部 2017 版截面的等效截面，之后的查询只是查表
+    """
+
+    def __init__(self, catalog):
+        """初始化并预先计算全部等效关系
+
+        Args:
+            catalog: 型钢截面目录（SectionCatalog）
+        """
+        self._catalog = catalog
+        self._target_types = self._types_of(catalog, CURRENT_TABLE)
+        self._source_types = self._types_of(catalog, LEGACY_TABLE)
+
+        self._targets = self._collect(self._target_types)
+        self._indexes = {}
+        for metric, fields in EQUIVALENCE_METRICS.items():
+            features = self._targets[[field for field, _ in fields]].to_numpy(dtype=float)
+            valid = np.flatnonzero((features > 0).all(axis=1))
+            index = SortedNeighborIndex(features[valid], [weight for _, weight in fields])
+            self._indexes[metric] = (index, valid)
+
+        sources = self._collect(self._source_types)
+        self._mapping = self._map_frame(sources)
+
+    @staticmethod
+    def _types_of(catalog, table_name: str) -> List[str]:
+        """获取属于指定表的型钢类型"""
+        return [shape_type for shape_type in catalog.get_shape_types()
+                if catalog.get_table(shape_type).table_name.lower() == table_name.lower()]
+
+    def _collect(self, shape_types: List[str]) -> pd.DataFrame:
+        """将若干型钢类型的截面合并为一个表（含等效准则用到的全部字段）"""
+        fields = ["height", "width", "web_thickness", "flange_thickness", "Ix", "Wx", "weight"]
+        frames = []
+        for shape_type in shape_types:
+            result = self._catalog.query(shape_type)
+            frame = pd.DataFrame({"shape_type": shape_type, "model": result.names.tolist()})
+            for field in fields:
+                values = result.column(field)
+                frame[field] = values if values is not None else np.nan
+            frames.append(frame)
+        if not frames:
+            return pd.DataFrame(columns=["shape_type", "model", *fields])
+        return pd.concat(frames, ignore_index=True)
+
+    def _map_frame(self, sections: pd.DataFrame) -> pd.DataFrame:
+        """为每个截面查找各准则下的等效截面
+
+        Args:
+            sections: 截面表（含 shape_type、model 和等效准则字段）
+
+        Returns:
+            pd.DataFrame: 每个截面一行，包含各准则的等效型号、类型、距离以及主要属性的相对偏差
+        """
+        mapping = sections[["shape_type", "model", "height", "width", "web_thickness",
+                            "flange_thickness", "Ix", "Wx", "weight"]].reset_index(drop=True)
+        for metric, fields in EQUIVALENCE_METRICS.items():
+            names = [field for field, _ in fields]
+            features = mapping[names].to_numpy(dtype=float)
+            valid = np.flatnonzero((features > 0).all(axis=1))
+
+            targets = np.full(len(mapping), -1, dtype=np.intp)
+            distances = np.full(len(mapping), np.nan)
+            index, target_rows = self._indexes[metric]
+            if len(valid) and len(index):
+                rows, found = index.nearest(features[valid])
+                targets[valid] = target_rows[rows]
+                distances[valid] = found
+
+            matched = targets >= 0
+            target = self._targets.iloc[np.where(matched, targets, 0)].reset_index(drop=True)
+            mapping[f"{metric}_model"] = target["model"].where(matched)
+            mapping[f"{metric}_shape_type"] = target["shape_type"].where(matched)
+            mapping[f"{metric}_dimensions"] = [
+                f"{h:g}x{b:g}x{t1:g}x{t2:g}" if ok else None
+                for ok, h, b, t1, t2 in zip(matched, target["height"], target["width"],
+                                            target["web_thickness"], target["flange_thickness"])]
+            mapping[f"{metric}_distance"] = distances
+            for field in ("Ix", "Wx", "weight"):
+                ratio = target[field].to_numpy(dtype=float) / mapping[field].to_numpy(dtype=float) - 1.0
+                mapping[f"{metric}_{field}_diff"] = np.where(matched, ratio, np.nan)
+        return mapping
+
+    @property
+    def mapping(self) -> pd.DataFrame:
+        """全部 2017 版 H 型钢的等效截面表"""
+        return self._mapping
+
+    def equivalents(self, shape_type: str, model: str) -> Optional[Dict[str, dict]]:
+        """查询截面的等效截面
+
+        Args:
+            shape_type: 型钢类型（2017 版 H 型钢）
+            model: 型号
+
+        Returns:
+            Optional[Dict[str, dict]]: {准则: {model, shape_type, dimensions, distance, Ix_diff, Wx_diff,
+                weight_diff}}，截面不是 2017 版 H 型钢时返回None
+        """
+        rows = self._mapping[(self._mapping["shape_type"] == shape_type) & (self._mapping["model"] == model)]
+        if rows.empty:
+            return None
+        row = rows.iloc[0]
+        return {
+            metric: {key: row[f"{metric}_{key}"] for key in ("model", "shape_type", "dimensions", "distance",
+                                                             "Ix_diff", "Wx_diff", "weight_diff")}
+            for metric in EQUIVALENCE_METRICS
+        }
+
+    def map_members(self, members: pd.DataFrame) -> pd.DataFrame:
+        """批量映射构件清单中的型号
+
+        清单中的 2017 版 H 型钢替换为各准则下的等效截面；其他型号（包括已是 2024 版的截面）
+        等效列为空。
+
+        Args:
+            members: 构件清单（见 SteelTakeoff.read_member_list）
+
+        Returns:
+            pd.DataFrame: 清单各行加上匹配的型号和各准则的等效截面列
+        """
+        resolved = SteelTakeoff(self._catalog).resolve(members)
+        resolved = resolved.drop(columns=["unit_weight", "unit_surface"])
+        equivalent_columns = [column for column in self._mapping.columns
+                              if column.split("_")[0] in EQUIVALENCE_METRICS]
+        return resolved.merge(self._mapping[["shape_type", "model", *equivalent_columns]],
+                              on=["shape_type", "model"], how="left")
+
+    @staticmethod
+    def write_excel(frame: pd.DataFrame, path: str):
+        """将等效截面表写入Excel文件（列标题为中文）
+
+        Args:
+            frame: mapping 或 map_members 的结果
+            path: Excel文件路径
+        """
+        titles = {
+            "designation": "清单型号", "shape_type": "型钢类型", "model": "型号",
+            "height": "高度H(mm)", "width": "宽度B(mm)", "web_thickness": "腹板厚度t1(mm)",
+            "flange_thickness": "翼缘厚度t2(mm)", "Ix": "惯性矩Ix(cm⁴)", "Wx": "截面模量Wx(cm³)",
+            "weight": "理论重量(kg/m)",
+        }
+        for metric, title in METRIC_TITLES.items():
+            titles.update({
+                f"{metric}_model": f"{title}型号",
+                f"{metric}_shape_type": f"{title}类型",
+                f"{metric}_dimensions": f"{title}尺寸",
+                f"{metric}_distance": f"{title}距离",
+                f"{metric}_Ix_diff": f"{title}Ix偏差",
+                f"{metric}_Wx_diff": f"{title}Wx偏差",
+                f"{metric}_weight_diff": f"{title}重量偏差",
+            })
+        with pd.ExcelWriter(path, engine="openpyxl") as writer:
+            frame.rename(columns=titles).to_excel(writer, index=False, sheet_name="等效截面")
@@ -1,8 +1,18 @@
 """型钢特性表业务逻辑"""
 
 import os
+
+import numpy as np
+
+from plugins.Steel_Shape_Table.capacity import CapacityScreen
+from plugins.Steel_Shape_Table.catalog import get_catalog
 from plugins.Steel_Shape_Table.database import SectionDatabase
-from plugins.Steel_Shape_Table.data.import_tools import initialize_database
+from plugins.Steel_Shape_Table.diagram_export import SectionDiagramExporter, build_shape_data
+from plugins.Steel_Shape_Table.equivalence import SectionEquivalenceIndex
+from plugins.Steel_Shape_Table.section_properties import compute_section_properties, expand_candidates
+from plugins.Steel_Shape_Table.takeoff import SteelTakeoff, run_takeoff
+from plugins.Steel_Shape_Table.ui.section_thumbnails import load_thumbnail_atlas
+from plugins.Steel_Shape_Table.data.import_tools import DataImporter, initialize_database
 
 
 class SteelShapeLogic:
@@ -19,8 +29,14 @@ class SteelShapeLogic:
         # 初始化数据库（如果数据库不存在或为空，则从JSON导入数据）
         self._init_database()
         
-        # 创建数据库连接
+        # 创建数据库连接（用于写入）
         self._db = SectionDatabase(self._db_path)
+        
+        # 内存列式目录，所有查询都由目录完成
+        self._catalog = get_catalog(self._db_path)
+        
+        # 新旧H型钢等效截面索引（首次使用时构建，目录重新加载后失效）
+        self._equivalence = None
     
     def _init_database(self):
         """初始化数据库"""
@@ -37,16 +53,9 @@ class SteelShapeLogic:
             keyword: 搜索关键词
             
         Returns:
-            list: 型钢列表，每个元素为字典，使用中文键名
+            list: 截面记录（SectionRecord）列表
         """
-        sections = self._db.get_sections(shape_type, keyword)
-        
-        # 转换为字典列表，使用数据库列名作为键
-        result = []
-        for section in sections:
-            section_dict = section.to_dict()
-            result.append(section_dict)
-        return result
+        return self._catalog.query(shape_type, keyword).records()
     
     def get_shape_types(self):
         """获取所有型钢类型
@@ -54,7 +63,7 @@ class SteelShapeLogic:
         Returns:
             list: 型钢类型列表
         """
-        return self._db.get_shape_types()
+        return self._catalog.get_shape_types()
     
     def search_shapes(self, shape_type, keyword):
         """根据关键词搜索型钢
@@ -64,10 +73,243 @@ class SteelShapeLogic:
             keyword: 搜索关键词
             
         Returns:
-            list: 匹配的型钢列表，每个元素为字典，使用中文键名
+            list: 匹配的截面记录（SectionRecord）列表
         """
         return self.get_steel_shapes(shape_type, keyword)
     
+    def search_all_shapes(self, text, limit=20):
+        """在所有型钢类型中搜索型号
+        
+        Args:
+            text: 搜索文本，如 "HW200"、"200*200"、"L100x10"
+            limit: 返回数量上限
+            
+        Returns:
+            list: 按相关度排序的结果，每项包含 shape_type、model、score 等字段
+        """
+        return self._catalog.search(text, limit)
+    
+    def query_shapes(self, shape_type, keyword=None, filters=None):
+        """查询型钢（列式结果，供表格直接使用）
+        
+        Args:
+            shape_type: 型钢类型
+            keyword: 搜索关键词
+            filters: 属性过滤条件 {字段名: (最小值, 最大值)}
+            
+        Returns:
+            CatalogResult: 查询结果
+        """
+        return self._catalog.query(shape_type, keyword, filters)
+
+    def search_shapes_in_type(self, shape_type, keyword, find_other_type=False):
+        """在指定类型中搜索型钢，没有匹配时可查找最匹配型号所在的其他类型
+
+        Args:
+            shape_type: 型钢类型
+            keyword: 搜索关键词
+            find_other_type: 当前类型没有匹配时是否在所有类型中查找
+
+        Returns:
+            tuple: (查询结果 CatalogResult, 最匹配型号所在的其他型钢类型或None)
+        """
+        result = self._catalog.query(shape_type, keyword)
+        if len(result) > 0 or not keyword or not find_other_type:
+            return result, None
+
+        matches = self._catalog.search(keyword, limit=1)
+        if matches and matches[0]["shape_type"] != shape_type:
+            return result, matches[0]["shape_type"]
+        return result, None
+
+    def find_lightest_shapes(self, constraints, shape_types=None, limit=20):
+        """查找满足属性约束的最轻型钢
+
+        Args:
+            constraints: 属性约束 {字段名: (最小值, 最大值)}，如 {"Wx": (500, None)}
+            shape_types: 参与查找的型钢类型列表，为None时查找所有类型
+            limit: 返回数量上限
+
+        Returns:
+            list: 按理论重量从小到大排序的结果，每项包含 shape_type、model、weight、values 等字段
+        """
+        return self._catalog.find_lightest(constraints, shape_types, limit)
+
+    def screen_member_capacity(self, load, shape_types=None, grade="Q235", curve="b", limit=20):
+        """按构件内力和计算长度筛选满足承载力要求的最轻型钢
+        
+        Args:
+            load: 工况 {"axial": N(kN，受压为正), "moment_x": Mx(kN·m), "moment_y": My(kN·m),
+                "length_x": l0x(m), "length_y": l0y(m)}
+            shape_types: 参与筛选的型钢类型列表，为None时筛选所有类型
+            grade: 钢材牌号
+            curve: 稳定系数的截面分类
+            limit: 返回数量上限
+            
+        Returns:
+            list: 按理论重量从小到大排序的结果，每项包含 shape_type、model、weight、utilization、
+                lambda_x、lambda_y、phi_x、phi_y
+        """
+        screen = CapacityScreen(self._catalog, shape_types, grade, curve)
+        return screen.lightest(limit=limit, **load)
+    
+    def screen_load_cases(self, cases, shape_types=None, grade="Q235", curve="b"):
+        """批量筛选多个工况，得到每个工况和全部工况包络的最轻截面
+        
+        Args:
+            cases: 工况数组 (工况数, 5)，各列为 N、Mx、My、l0x、l0y
+            shape_types: 参与筛选的型钢类型列表，为None时筛选所有类型
+            grade: 钢材牌号
+            curve: 稳定系数的截面分类
+            
+        Returns:
+            dict: {"cases": 每个工况的最轻截面（无满足的截面时为None）, "envelope": 满足全部工况的最轻截面或None}
+        """
+        screen = CapacityScreen(self._catalog, shape_types, grade, curve)
+        result = screen.screen_cases(cases)
+        lightest = [
+            None if index < 0 else {**screen.describe(index), "utilization": float(ratio)}
+            for index, ratio in zip(result["lightest"].tolist(), result["utilization"].tolist())
+        ]
+        envelope_index = result["envelope_lightest"]
+        envelope = None
+        if envelope_index >= 0:
+            envelope = {**screen.describe(envelope_index),
+                        "utilization": float(result["envelope"][envelope_index])}
+        return {"cases": lightest, "envelope": envelope}
+    
+    def compute_custom_sections(self, kind, height, width, web_thickness, flange_thickness=None,
+                                fillet_radius=(0.0,), limit=200):
+        """计算自定义截面（所有候选尺寸的组合）的截面特性
+        
+        Args:
+            kind: 截面类型（SECTION_KINDS 中的中文名称或类型代码）
+            height: 候选高度列表（mm）
+            width: 候选宽度列表（mm）
+            web_thickness: 候选腹板厚度列表（mm）
+            flange_thickness: 候选翼缘厚度列表（mm），为None时与腹板厚度相同
+            fillet_radius: 候选圆角半径列表（mm）
+            limit: 返回数量上限
+            
+        Returns:
+            dict: {"total": 组合总数, "valid": 尺寸合理的组合数,
+                   "rows": 按理论重量从小到大排序的截面列表，每项包含尺寸和截面特性}
+        """
+        candidates = expand_candidates(height, width, web_thickness, flange_thickness, fillet_radius)
+        properties = compute_section_properties(kind, **candidates)
+        
+        valid = np.flatnonzero(np.isfinite(properties["area"]))
+        order = valid[np.argsort(properties["weight"][valid], kind="stable")][:limit]
+        
+        columns = {**candidates, **properties}
+        rows = [{key: float(values[index]) for key, values in columns.items()} for index in order]
+        return {"total": len(candidates["height"]), "valid": len(valid), "rows": rows}
+    
+    def get_diagram_sections(self, shape_types=None):
+        """获取截面图使用的截面数据
+        
+        Args:
+            shape_types: 型钢类型列表，为None时获取所有类型
+            
+        Returns:
+            list: 截面数据字典列表，键名与截面形状图一致
+        """
+        sections = []
+        for shape_type in shape_types or self._catalog.get_shape_types():
+            sections.extend(build_shape_data(self._catalog.query(shape_type)))
+        return sections
+    
+    def get_thumbnail_atlas(self, shape_type):
+        """获取型钢类型的截面缩略图图集（可在后台任务中调用，按目录版本缓存在磁盘上）
+        
+        Args:
+            shape_type: 型钢类型
+            
+        Returns:
+            ThumbnailAtlas: 图集，缩略图按目录顺序排列
+        """
+        return load_thumbnail_atlas(self._catalog, shape_type)
+    
+    def export_section_diagrams(self, context, sections, output_dir, fmt="svg"):
+        """批量导出截面图（以 with_context=True 提交到后台任务）
+        
+        Args:
+            context: 任务上下文
+            sections: 截面数据字典列表，为None时导出所有型钢
+            output_dir: 输出目录
+            fmt: 导出格式（svg、png、pdf 或 html）
+            
+        Returns:
+            dict: {"exported": 成功导出的文件路径列表, "failed": [(文件路径, 错误信息)] 列表}
+        """
+        if sections is None:
+            sections = self.get_diagram_sections()
+        return SectionDiagramExporter().export(sections, output_dir, fmt, context)
+    
+    def compute_takeoff(self, member_path, output_path=None):
+        """按构件清单统计型钢重量和涂装面积，并生成Excel材料表
+        
+        Args:
+            member_path: 构件清单路径（CSV或Excel，包含型号、长度、数量列）
+            output_path: 材料表Excel路径，为None时不写文件
+            
+        Returns:
+            dict: {"total": 总计, "by_type": 按类型汇总的字典列表, "unmatched": 未匹配型号的字典列表}
+        """
+        result = run_takeoff(self._catalog, member_path, output_path)
+        return {
+            "total": result.total,
+            "by_type": result.by_type.to_dict("records"),
+            "unmatched": result.unmatched.to_dict("records"),
+        }
+    
+    def get_equivalence_index(self):
+        """获取2017版到2024版H型钢的等效截面索引
+        
+        Returns:
+            SectionEquivalenceIndex: 等效截面索引
+        """
+        if self._equivalence is None:
+            self._equivalence = SectionEquivalenceIndex(self._catalog)
+        return self._equivalence
+    
+    def find_equivalent_sections(self, shape_type, model):
+        """查询2017版H型钢在2024版中的等效截面
+        
+        Args:
+            shape_type: 型钢类型
+            model: 型号
+            
+        Returns:
+            dict: {准则: 等效截面信息}，不是2017版H型钢时返回None
+        """
+        return self.get_equivalence_index().equivalents(shape_type, model)
+    
+    def map_equivalent_sections(self, member_path, output_path):
+        """将构件清单中的2017版H型钢批量映射为2024版等效截面并写入Excel
+        
+        Args:
+            member_path: 构件清单路径（CSV或Excel，至少包含型号列），为None时输出全部2017版H型钢的对照表
+            output_path: 输出Excel路径
+            
+        Returns:
+            dict: {"total": 行数, "mapped": 已映射的行数, "unmatched": 未匹配目录的行数}
+        """
+        index = self.get_equivalence_index()
+        if member_path is None:
+            mapped = index.mapping
+            index.write_excel(mapped, output_path)
+            return {"total": len(mapped), "mapped": int(mapped["dimensions_model"].notna().sum()), "unmatched": 0}
+        
+        members = SteelTakeoff.read_member_list(member_path, required=("designation",))
+        mapped = index.map_members(members)
+        index.write_excel(mapped, output_path)
+        return {
+            "total": len(mapped),
+            "mapped": int(mapped["dimensions_model"].notna().sum()),
+            "unmatched": int(mapped["model"].isna().sum()),
+        }
+    
     def add_section(self, section_dict):
         """添加型钢截面数据
         
@@ -91,15 +333,39 @@ class SteelShapeLogic:
             "area": section_dict.get("截面面积"),
             "weight": section_dict.get("理论重量"),
             "surface_area": section_dict.get("表面积"),
-            "ix": section_dict.get("惯性矩Ix"),
-            "iy": section_dict.get("惯性矩Iy"),
-            "rx": section_dict.get("惯性半径rx"),
-            "ry": section_dict.get("惯性半径ry"),
-            "wx": section_dict.get("截面模量Wx"),
-            "wy": section_dict.get("截面模量Wy")
+            "Ix": section_dict.get("惯性矩Ix"),
+            "Iy": section_dict.get("惯性矩Iy"),
+            # 通用sections表只保存惯性半径（ix/iy），不保存惯性矩
+            "ix": section_dict.get("惯性半径ix") or section_dict.get("惯性半径rx"),
+            "iy": section_dict.get("惯性半径iy") or section_dict.get("惯性半径ry"),
+            "Wx": section_dict.get("截面模量Wx"),
+            "Wy": section_dict.get("截面模量Wy")
         }
         section = SteelSection.from_dict(english_dict)
-        return self._db.add_section(section)
+        success = self._db.add_section(section)
+        if success:
+            self._reload_catalog()
+        return success
+    
+    def import_sections(self, file_path, shape_type=None):
+        """从JSON、CSV或Excel文件批量导入型钢截面（已存在的型号会被更新）
+        
+        Args:
+            file_path: 截面文件路径
+            shape_type: 文件中没有型钢类型列时使用的类型
+            
+        Returns:
+            int: 成功导入的记录数
+        """
+        count = DataImporter(self._db_path).bulk_import(file_path, shape_type)
+        if count:
+            self._reload_catalog()
+        return count
+    
+    def _reload_catalog(self):
+        """重新加载目录，并使依赖目录的索引失效"""
+        self._catalog.reload()
+        self._equivalence = None
     
     def backup_database(self, json_path):
         """备份数据库到JSON文件
@@ -121,4 +387,6 @@ class SteelShapeLogic:
         Returns:
             int: 成功恢复的记录数
         """
-        return self._db.restore_from_json(json_path)
\ No newline at end of file
+        count = self._db.restore_from_json(json_path)
+        self._reload_catalog()
+        return count
\ No newline at end of file
@@ -4,11 +4,24 @@
 class SteelSection:
     """型钢截面模型"""
     
+    # 字段名（即 to_dict 的键名和顺序）
+    FIELDS = (
+        'shape_type', 'model', 'height', 'width', 'web_thickness', 'flange_thickness', 'fillet_radius',
+        'inner_fillet_radius', 'area', 'weight', 'surface_area', 'Ix', 'Iy', 'Ix1', 'Ix0', 'Iy0', 'Iy1', 'Iu',
+        'ix', 'iy', 'ix0', 'iu', 'rx', 'ry', 'rx0', 'ru', 'Wx', 'Wy', 'Wx0', 'Wy0', 'Wu', 'Z0', 'category',
+        'side_width', 'edge_thickness', 'round_radius', 'long_side_width', 'short_side_width', 'tan_theta',
+        'Wpx', 'Wpy', 'It', 'Iw', 'Avx', 'Avy',
+    )
+    # 文本字段（其余字段为数值）
+    TEXT_FIELDS = ('shape_type', 'model', 'category')
+    
+    __slots__ = FIELDS
+    
     def __init__(self, shape_type=None, model=None, height=0, width=0, web_thickness=0,
                  flange_thickness=0, fillet_radius=0, inner_fillet_radius=0, area=0, 
                  weight=0, surface_area=0, Ix=0, Iy=0, Ix1=0, Ix0=0, Iy0=0, Iy1=0, Iu=0, ix=0, iy=0, ix0=0, iu=0, rx=0, ry=0, rx0=0, ru=0, 
                  Wx=0, Wy=0, Wx0=0, Wy0=0, Wu=0, Z0=0, category=None, side_width=0, edge_thickness=0, round_radius=0, 
-                 long_side_width=0, short_side_width=0, tan_theta=0):
+                 long_side_width=0, short_side_width=0, tan_theta=0, Wpx=0, Wpy=0, It=0, Iw=0, Avx=0, Avy=0):
         """初始化型钢截面模型
         
         Args:
@@ -51,6 +64,12 @@ class SteelSection:
             long_side_width: 长边宽(mm)
             short_side_width: 短边宽(mm)
             tan_theta: 主惯性轴偏转角度的正切值
+            Wpx: 塑性截面模量Wpx(cm³)
+            Wpy: 塑性截面模量Wpy(cm³)
+            It: 扭转常数It(cm⁴)
+            Iw: 翘曲常数Iw(cm⁶)
+            Avx: 剪切面积Avx(cm²)
+            Avy: 剪切面积Avy(cm²)
         """
         self.shape_type = shape_type
         self.model = model
@@ -91,6 +110,12 @@ class SteelSection:
         self.long_side_width = long_side_width
         self.short_side_width = short_side_width
         self.tan_theta = tan_theta
+        self.Wpx = Wpx
+        self.Wpy = Wpy
+        self.It = It
+        self.Iw = Iw
+        self.Avx = Avx
+        self.Avy = Avy
     
     def to_dict(self):
         """转换为字典格式
@@ -98,47 +123,7 @@ class SteelSection:
         Returns:
             dict: 型钢截面数据字典
         """
-        return {
-            'shape_type': self.shape_type,
-            'model': self.model,
-            'height': self.height,
-            'width': self.width,
-            'web_thickness': self.web_thickness,
-            'flange_thickness': self.flange_thickness,
-            'fillet_radius': self.fillet_radius,
-            'inner_fillet_radius': self.inner_fillet_radius,
-            'area': self.area,
-            'weight': self.weight,
-            'surface_area': self.surface_area,
-            'Ix': self.Ix,
-            'Iy': self.Iy,
-            'Ix1': self.Ix1,
-            'Ix0': self.Ix0,
-            'Iy0': self.Iy0,
-            'Iy1': self.Iy1,
-            'Iu': self.Iu,
-            'ix': self.ix,
-            'iy': self.iy,
-            'ix0': self.ix0,
-            'iu': self.iu,
-            'rx': self.rx,
-            'ry': self.ry,
-            'rx0': self.rx0,
-            'ru': self.ru,
-            'Wx': self.Wx,
-            'Wy': self.Wy,
-            'Wx0': self.Wx0,
-            'Wy0': self.Wy0,
-            'Wu': self.Wu,
-            'Z0': self.Z0,
-            'category': self.category,
-            'side_width': self.side_width,
-            'edge_thickness': self.edge_thickness,
-            'round_radius': self.round_radius,
-            'long_side_width': self.long_side_width,
-            'short_side_width': self.short_side_width,
-            'tan_theta': self.tan_theta
-        }
+        return {name: getattr(self, name) for name in self.FIELDS}
     
     @classmethod
     def from_dict(cls, data_dict):
@@ -150,47 +135,7 @@ class SteelSection:
         Returns:
             SteelSection: 型钢截面模型实例
         """
-        return cls(
-            shape_type=data_dict.get('shape_type'),
-            model=data_dict.get('model'),
-            height=data_dict.get('height', 0),
-            width=data_dict.get('width', 0),
-            web_thickness=data_dict.get('web_thickness', 0),
-            flange_thickness=data_dict.get('flange_thickness', 0),
-            fillet_radius=data_dict.get('fillet_radius', 0),
-            inner_fillet_radius=data_dict.get('inner_fillet_radius', 0),
-            area=data_dict.get('area', 0),
-            weight=data_dict.get('weight', 0),
-            surface_area=data_dict.get('surface_area', 0),
-            Ix=data_dict.get('Ix', 0),
-            Iy=data_dict.get('Iy', 0),
-            Ix1=data_dict.get('Ix1', 0),
-            Ix0=data_dict.get('Ix0', 0),
-            Iy0=data_dict.get('Iy0', 0),
-            Iy1=data_dict.get('Iy1', 0),
-            Iu=data_dict.get('Iu', 0),
-            ix=data_dict.get('ix', 0),
-            iy=data_dict.get('iy', 0),
-            ix0=data_dict.get('ix0', 0),
-            iu=data_dict.get('iu', 0),
-            rx=data_dict.get('rx', 0),
-            ry=data_dict.get('ry', 0),
-            rx0=data_dict.get('rx0', 0),
-            ru=data_dict.get('ru', 0),
-            Wx=data_dict.get('Wx', 0),
-            Wy=data_dict.get('Wy', 0),
-            Wx0=data_dict.get('Wx0', 0),
-            Wy0=data_dict.get('Wy0', 0),
-            Wu=data_dict.get('Wu', 0),
-            Z0=data_dict.get('Z0', 0),
-            category=data_dict.get('category'),
-            side_width=data_dict.get('side_width', 0),
-            edge_thickness=data_dict.get('edge_thickness', 0),
-            round_radius=data_dict.get('round_radius', 0),
-            long_side_width=data_dict.get('long_side_width', 0),
-            short_side_width=data_dict.get('short_side_width', 0),
-            tan_theta=data_dict.get('tan_theta', 0)
-        )
+        return cls(**{name: data_dict.get(name, None if name in cls.TEXT_FIELDS else 0) for name in cls.FIELDS})
     
     def __str__(self):
         """字符串表示
@@ -198,4 +143,150 @@ class SteelSection:
         Returns:
             str: 型钢截面的字符串表示
         """
-        return f"{self.shape_type} {self.model}"
\ No newline at end of file
+        return f"{self.shape_type} {self.model}"
+
+
+# 截面形状图使用的截面类型（按数据库表名）
+DIAGRAM_TYPES_BY_TABLE = {
+    "h_sections_2017": "H型钢",
+    "h_sections_2024": "H型钢",
+    "i_sections_2016": "工字钢",
+    "c_sections_2016": "槽钢",
+    "l_sections_2016": "角钢",
+    "non_l_sections_2016": "角钢",
+}
+
+# 截面形状图的尺寸键到字段的映射（按顺序取第一个有值的字段，兼容H型钢、槽钢和角钢）
+DIAGRAM_FIELDS = {
+    "高度H": ("height", "long_side_width", "side_width"),
+    "宽度B": ("width", "short_side_width", "side_width"),
+    "腹板厚度t1": ("web_thickness",),
+    "翼缘厚度t2": ("flange_thickness",),
+    "厚度t": ("edge_thickness",),
+}
+
+
+class SectionRecord:
+    """目录中一个截面的轻量记录
+
+    只保存列式表的引用和行号，字段值在访问时从表的数组中读取，
+    不复制数据、不经过字典或文本转换。提供与截面数据字典相同的 get() 接口，
+    可直接交给截面形状图和尺寸标注使用。
+    """
+
+    __slots__ = ("_table", "_row")
+
+    def __init__(self, table, row: int):
+        """初始化截面记录
+
+        Args:
+            table: 列式表（SectionTable）
+            row: 表中的行号
+        """
+        self._table = table
+        self._row = int(row)
+
+    @property
+    def table(self):
+        """截面所在的列式表"""
+        return self._table
+
+    @property
+    def row(self) -> int:
+        """截面在表中的行号"""
+        return self._row
+
+    @property
+    def shape_type(self) -> str:
+        """型钢类型"""
+        return self._table.shape_type_of(self._row)
+
+    @property
+    def model(self) -> str:
+        """型号"""
+        return str(self._table.names[self._row])
+
+    @property
+    def category(self):
+        """型钢类别（无类别列时为None）"""
+        if self._table.categories is None:
+            return None
+        return str(self._table.categories[self._row])
+
+    @property
+    def diagram_type(self) -> str:
+        """截面形状图使用的截面类型（如 "H型钢"、"角钢"）"""
+        return DIAGRAM_TYPES_BY_TABLE.get(self._table.table_name.lower(), self.shape_type)
+
+    def value(self, field: str):
+        """读取数值字段
+
+        Args:
+            field: 字段名（数据库列名或模型字段名）
+
+        Returns:
+            Optional[float]: 字段值，字段不存在或为空时返回None
+        """
+        values = self._table.column(field)
+        if values is None:
+            return None
+        value = float(values[self._row])
+        return None if value != value else value
+
+    def __getattr__(self, name: str):
+        """以属性方式读取数值字段，如 record.Ix"""
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return self.value(name)
+
+    def get(self, key: str, default=None):
+        """按截面数据字典的键名读取值
+
+        Args:
+            key: "型号"、"类型"、截面形状图的尺寸键（如 "高度H"）或字段名
+            default: 无值时的默认值
+
+        Returns:
+            对应的值，无值时返回 default
+        """
+        if key == "型号":
+            return self.model
+        if key == "类型":
+            return self.diagram_type
+        for field in DIAGRAM_FIELDS.get(key, (key,)):
+            value = self.value(field)
+            if value:
+                return value
+        return default
+
+    def shape_data(self) -> dict:
+        """转换为截面数据字典（截面形状图的键名，仅包含有值的尺寸）
+
+        用于需要序列化的场合，如批量导出截面图时传给子进程
+
+        Returns:
+            dict: {"型号", "类型", 尺寸键: 数值}
+        """
+        shape_data = {"型号": self.model, "类型": self.diagram_type}
+        for key in DIAGRAM_FIELDS:
+            value = self.get(key)
+            if value is not None:
+                shape_data[key] = value
+        return shape_data
+
+    def to_dict(self) -> dict:
+        """转换为与 SteelSection.to_dict 相同键名的字典
+
+        Returns:
+            dict: 型钢截面数据字典（表中没有的字段为0，空值为None）
+        """
+        data = {}
+        for name in SteelSection.FIELDS:
+            if name in SteelSection.TEXT_FIELDS:
+                data[name] = getattr(self, name)
+            else:
+                data[name] = self.value(name) if self._table.column(name) is not None else 0
+        return data
+
+    def __repr__(self):
+        return f"SectionRecord({self.shape_type!r}, {self.model!r})"
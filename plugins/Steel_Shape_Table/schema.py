@@ -0,0 +1,280 @@
+"""型钢截面数据库统一视图和索引"""
+
+from typing import Dict, List
+
+import numpy as np
+
+from plugins.Steel_Shape_Table.derived_properties import (
+    DERIVED_COLUMNS,
+    TABLE_FAMILIES,
+    compute_derived_properties,
+    derived_rows,
+)
+
+
+# 截面数据来源表
+# table: 数据库表名；name_column: 型号列；
+# shape_type: 固定的型钢类型；category_column/type_format: 按类别列生成型钢类型
+TABLE_SOURCES = [
+    {"table": "sections", "name_column": "model", "category_column": "shape_type", "type_format": "{}"},
+    {"table": "h_sections_2017", "name_column": "section_name", "category_column": "category",
+     "type_format": "{}型钢截面表（2017）"},
+    {"table": "h_sections_2024", "name_column": "section_name", "shape_type": "H型钢截面表（2024）"},
+    {"table": "i_sections_2016", "name_column": "section_name", "shape_type": "I型钢截面表（2016）"},
+    {"table": "L_sections_2016", "name_column": "section_name", "shape_type": "等边角钢截面表（2016）"},
+    {"table": "non_L_sections_2016", "name_column": "section_name", "shape_type": "不等边角钢截面表（2016）"},
+    {"table": "c_sections_2016", "name_column": "section_name", "shape_type": "C型钢截面表（2016）"},
+]
+
+# 统一视图名称和数据库结构版本（保存在 PRAGMA user_version 中）
+SECTION_VIEW = "section_view"
+SCHEMA_VERSION = 2
+
+# 统一视图的数据列，单位与原表一致（尺寸mm，面积cm²，重量kg/m，惯性矩cm⁴，惯性半径cm，截面模量cm³）。
+# SQLite 列名不区分大小写，惯性半径统一使用 rx/ry/rx0/ru，避免与惯性矩 Ix/Iy/Ix0 冲突；
+# 最后几列为导入时计算的派生特性（见 derived_properties）
+VIEW_COLUMNS = [
+    "height", "width", "web_thickness", "flange_thickness", "fillet_radius", "inner_fillet_radius",
+    "round_radius", "side_width", "long_side_width", "short_side_width", "edge_thickness",
+    "area", "weight", "surface_area",
+    "Ix", "Iy", "Ix1", "Ix0", "Iy0", "Iy1", "Iu",
+    "rx", "ry", "rx0", "ru",
+    "Wx", "Wy", "Wx0", "Wy0", "Wu",
+    "Z0", "tan_theta",
+    *DERIVED_COLUMNS,
+]
+
+# 各表中与统一列名不一致的列（忽略大小写仍无法对应，或含义需要特殊处理）；
+# 值为None表示该表没有对应数据
+VIEW_COLUMN_ALIASES = {
+    # 等边角钢以 y0 轴（弱轴）作为 y 轴
+    "l_sections_2016": {"ry": "ry0", "Wy": "Wy0"},
+    "i_sections_2016": {"fillet_radius": "round_radius"},
+    "c_sections_2016": {"fillet_radius": "round_radius"},
+    # 通用表的小写 ix/iy 为惯性半径，不是惯性矩
+    "sections": {"rx": "ix", "ry": "iy", "Ix": None, "Iy": None},
+}
+
+# 在每个表上建立索引的常用属性列（统一列名）
+INDEXED_COLUMNS = ["weight", "area", "Ix", "Wx", "ry", *DERIVED_COLUMNS]
+
+# 用户可写的表（连接内置只读库时，这些表从附加的用户覆盖库读取）
+WRITABLE_TABLES = ("sections",)
+
+
+def _quote(name: str) -> str:
+    """为标识符加双引号"""
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _literal(text: str) -> str:
+    """生成SQL字符串字面量"""
+    return "'" + text.replace("'", "''") + "'"
+
+
+def _table_columns(conn, table: str, schema: str = "main") -> List[str]:
+    """获取表的列名"""
+    return [row[1] for row in conn.execute(f"PRAGMA {_quote(schema)}.table_info({_quote(table)})")]
+
+
+def _existing_tables(conn, schema: str = "main") -> Dict[str, str]:
+    """获取数据库中的表 {小写表名: 表名}"""
+    return {row[0].lower(): row[0] for row in conn.execute(
+        f"SELECT name FROM {_quote(schema)}.sqlite_master WHERE type = 'table'")}
+
+
+def _resolve_columns(table: str, table_columns: List[str]) -> Dict[str, str]:
+    """计算统一列名到表中实际列名的映射（不存在的列不包含在结果中）"""
+    aliases = VIEW_COLUMN_ALIASES.get(table.lower(), {})
+    lookup = {name.lower(): name for name in table_columns}
+    mapping = {}
+    for column in VIEW_COLUMNS:
+        source = aliases[column] if column in aliases else lookup.get(column.lower())
+        if source is not None:
+            mapping[column] = source
+    return mapping
+
+
+def _has_index(conn, table: str, columns: List[str]) -> bool:
+    """判断表上是否已有以指定列开头的索引（如唯一约束自动创建的索引）"""
+    for index in conn.execute(f"PRAGMA index_list({_quote(table)})").fetchall():
+        indexed = [row[2] for row in conn.execute(f"PRAGMA index_info({_quote(index[1])})")]
+        if [name.lower() for name in indexed[:len(columns)]] == [name.lower() for name in columns]:
+            return True
+    return False
+
+
+def _shape_type_expression(source: dict) -> str:
+    """生成型钢类型列的SQL表达式"""
+    if "shape_type" in source:
+        return _literal(source["shape_type"])
+    prefix, suffix = source["type_format"].split("{}")
+    parts = [_literal(prefix)] if prefix else []
+    parts.append(_quote(source["category_column"]))
+    if suffix:
+        parts.append(_literal(suffix))
+    return " || ".join(parts)
+
+
+def build_view_sql(conn, overlay_schema: str = None) -> str:
+    """根据数据库中已有的截面表生成统一视图的 CREATE VIEW 语句
+
+    视图列：source_table（源表名）、source_order（源表顺序）、source_id（源表id）、
+    shape_type、category、model，以及 VIEW_COLUMNS 中的数据列
+
+    Args:
+        conn: 数据库连接
+        overlay_schema: 附加的用户覆盖库名称。指定时生成只属于当前连接的临时视图，
+            WRITABLE_TABLES 中的表从覆盖库读取
+
+    Returns:
+        str: CREATE VIEW 语句，数据库中没有截面表时返回空字符串
+    """
+    existing = {"main": _existing_tables(conn)}
+    if overlay_schema:
+        existing[overlay_schema] = _existing_tables(conn, overlay_schema)
+
+    selects = []
+    for order, source in enumerate(TABLE_SOURCES):
+        schema = "main"
+        if overlay_schema and source["table"].lower() in WRITABLE_TABLES:
+            schema = overlay_schema
+        table = existing[schema].get(source["table"].lower())
+        if table is None:
+            continue
+        mapping = _resolve_columns(table, _table_columns(conn, table, schema))
+        # 通用表的类别列就是型钢类型，没有单独的类别
+        category = _quote(source["category_column"]) if source.get("type_format", "{}") != "{}" else "NULL"
+        fields = [
+            f"{_literal(source['table'])} AS source_table",
+            f"{order} AS source_order",
+            "id AS source_id",
+            f"{_shape_type_expression(source)} AS shape_type",
+            f"{category} AS category",
+            f"{_quote(source['name_column'])} AS model",
+        ]
+        fields += [f"{_quote(mapping[column]) if column in mapping else 'NULL'} AS {column}"
+                   for column in VIEW_COLUMNS]
+        # 临时视图可以引用其他库的表，需写明库名
+        table_ref = f"{_quote(schema)}.{_quote(table)}" if overlay_schema else _quote(table)
+        selects.append(f"SELECT {', '.join(fields)} FROM {table_ref}")
+
+    if not selects:
+        return ""
+    create = "CREATE TEMP VIEW" if overlay_schema else "CREATE VIEW"
+    return f"{create} {SECTION_VIEW} AS\n" + "\nUNION ALL\n".join(selects)
+
+
+def _index_statements(conn) -> List[str]:
+    """生成各截面表的索引语句（型号、类别+型号、常用属性），已有的等效索引不重复创建"""
+    existing = _existing_tables(conn)
+
+    statements = []
+    for source in TABLE_SOURCES:
+        table = existing.get(source["table"].lower())
+        if table is None:
+            continue
+        key = table.lower()
+        index_columns = {"model": [source["name_column"]]}
+        if source.get("category_column"):
+            index_columns["category"] = [source["category_column"], source["name_column"]]
+        for suffix, columns in index_columns.items():
+            if not _has_index(conn, table, columns):
+                statements.append(
+                    f"CREATE INDEX IF NOT EXISTS {_quote(f'idx_{key}_{suffix}')} "
+                    f"ON {_quote(table)} ({', '.join(_quote(name) for name in columns)})")
+
+        mapping = _resolve_columns(table, _table_columns(conn, table))
+        for column in INDEXED_COLUMNS:
+            if column in mapping:
+                statements.append(
+                    f"CREATE INDEX IF NOT EXISTS {_quote(f'idx_{key}_{column.lower()}')} "
+                    f"ON {_quote(table)} ({_quote(mapping[column])})")
+    return statements
+
+
+def materialize_derived_columns(conn, schema: str = "main", tables: List[str] = None) -> int:
+    """计算并写入截面表的派生特性列
+
+    缺少的派生列先用 ALTER TABLE 补上，再按截面形式对整个表批量计算，按id写回。
+    不提交事务，由调用方提交
+
+    Args:
+        conn: 可写的数据库连接
+        schema: 截面表所在的库名
+        tables: 要处理的表名，为None时处理 TABLE_SOURCES 中所有已有的表
+
+    Returns:
+        int: 写入的记录数
+    """
+    existing = _existing_tables(conn, schema)
+    names = tables if tables is not None else [source["table"] for source in TABLE_SOURCES]
+
+    count = 0
+    for name in names:
+        table = existing.get(name.lower())
+        family = TABLE_FAMILIES.get(name.lower())
+        if table is None or family is None:
+            continue
+        table_ref = f"{_quote(schema)}.{_quote(table)}"
+        present = {column.lower() for column in _table_columns(conn, table, schema)}
+        for column in DERIVED_COLUMNS:
+            if column.lower() not in present:
+                conn.execute(f"ALTER TABLE {table_ref} ADD COLUMN {_quote(column)} REAL")
+
+        mapping = _resolve_columns(table, _table_columns(conn, table, schema))
+        inputs = [column for column in mapping if column not in DERIVED_COLUMNS]
+        rows = conn.execute(
+            f"SELECT id, {', '.join(_quote(mapping[column]) for column in inputs)} FROM {table_ref}").fetchall()
+        if not rows:
+            continue
+        values = np.array([tuple(row)[1:] for row in rows], dtype=float).reshape(len(rows), len(inputs))
+        derived = compute_derived_properties(family, dict(zip(inputs, values.T)))
+
+        assignments = ", ".join(f"{_quote(column)} = ?" for column in DERIVED_COLUMNS)
+        conn.executemany(f"UPDATE {table_ref} SET {assignments} WHERE id = ?",
+                         [(*properties, row[0]) for properties, row in zip(derived_rows(derived), rows)])
+        count += len(rows)
+    return count
+
+
+def is_schema_current(conn) -> bool:
+    """判断数据库的统一视图和索引是否为当前版本
+
+    Args:
+        conn: 数据库连接
+
+    Returns:
+        bool: 结构版本不低于 SCHEMA_VERSION 且视图存在时返回True
+    """
+    version = conn.execute("PRAGMA main.user_version").fetchone()[0]
+    has_view = conn.execute(
+        "SELECT 1 FROM main.sqlite_master WHERE type = 'view' AND name = ?", (SECTION_VIEW,)).fetchone() is not None
+    return version >= SCHEMA_VERSION and has_view
+
+
+def ensure_schema(conn, force: bool = False):
+    """创建或更新统一视图、派生特性列和索引
+
+    数据库结构版本低于 SCHEMA_VERSION 或视图不存在时重新计算派生特性、重建视图并补建索引，
+    否则不做任何修改
+
+    Args:
+        conn: 数据库连接
+        force: 是否忽略版本强制重建（截面表结构变化后使用）
+    """
+    if is_schema_current(conn) and not force:
+        return
+
+    materialize_derived_columns(conn)
+    view_sql = build_view_sql(conn)
+    if not view_sql:
+        return
+
+    conn.execute(f"DROP VIEW IF EXISTS {SECTION_VIEW}")
+    conn.execute(view_sql)
+    for statement in _index_statements(conn):
+        conn.execute(statement)
+    conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+    conn.commit()
+
@@ -0,0 +1,206 @@
+"""型钢型号搜索索引"""
+
+import re
+import unicodedata
+from collections import defaultdict
+from functools import lru_cache
+from typing import Hashable, List, Sequence, Tuple
+
+
+# 型号中表示“乘”的分隔符统一为 X
+_SEPARATOR_PATTERN = re.compile(r"[×✕*＊·]")
+# 去除空白和连接符
+_STRIP_PATTERN = re.compile(r"[\s\-_/]+")
+# 与数字相邻的字母 O 视为数字 0（常见输入错误）
+_LETTER_O_PATTERN = re.compile(r"(?<=\d)O|O(?=\d)")
+# 字母段或数字段（数字可带小数）
+_TOKEN_PATTERN = re.compile(r"[A-Z一-鿿]+|\d+(?:\.\d+)?")
+
+# 匹配等级
+LEVEL_EXACT = 5
+LEVEL_PREFIX = 4
+LEVEL_SUBSTRING = 3
+LEVEL_TOKENS = 2
+LEVEL_FUZZY = 1
+
+# 模糊匹配的最低三元组相似度
+FUZZY_THRESHOLD = 0.4
+
+
+def normalize_designation(text: str) -> str:
+    """规范化型号字符串
+
+    全角转半角、转大写、乘号统一为 X、去除空白、与数字相邻的 O 视为 0，
+    例如 "hw 2OO×200" -> "HW200X200"
+
+    Args:
+        text: 型号或搜索文本
+
+    Returns:
+        str: 规范化后的字符串
+    """
+    text = unicodedata.normalize("NFKC", text or "").upper()
+    text = _SEPARATOR_PATTERN.sub("X", text)
+    text = _STRIP_PATTERN.sub("", text)
+    # 连续的 O（如 "4OO"）需多次替换
+    while True:
+        replaced = _LETTER_O_PATTERN.sub("0", text)
+        if replaced == text:
+            return text
+        text = replaced
+
+
+def tokenize_designation(normalized: str) -> Tuple[str, ...]:
+    """将规范化型号拆分为字母段和数字段（去掉分隔符 X）
+
+    例如 "L100X100X10" -> ("L", "100", "100", "10")
+
+    Args:
+        normalized: 规范化后的型号
+
+    Returns:
+        Tuple[str, ...]: 分段元组
+    """
+    return tuple(token for token in _TOKEN_PATTERN.findall(normalized) if token != "X")
+
+
+def _trigrams(text: str) -> set:
+    """计算字符三元组集合（两端补位，使短字符串也有三元组）"""
+    padded = f"^{text}$"
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def _is_token_subsequence(query: Sequence[str], tokens: Sequence[str]) -> bool:
+    """判断查询分段是否按顺序出现在型号分段中
+
+    字母段按前缀比较（"H" 可匹配 "HW"），数字段要求相等
+    """
+    position = 0
+    for token in query:
+        while position < len(tokens):
+            candidate = tokens[position]
+            position += 1
+            if token[0].isdigit():
+                if candidate == token:
+                    break
+            elif candidate.startswith(token):
+                break
+        else:
+            return False
+    return True
+
+
+class SectionSearchIndex:
+    """型号搜索索引
+
+    启动时对所有型号预先计算规范化字符串、分段和字符三元组倒排表。
+    查询先通过三元组倒排表筛选候选，再按匹配等级和相似度排序：
+    完全匹配 > 前缀匹配 > 子串匹配 > 分段顺序匹配 > 模糊匹配（容错拼写）。
+    """
+
+    def __init__(self, entries: Sequence[Tuple[str, Hashable, Sequence[str]]]):
+        """构建索引
+
+        Args:
+            entries: (型号, 键, 附加分段) 列表。键用于标识结果（如 (表名, 行号)）；
+                附加分段为型号中未包含的尺寸（如H型钢的腹板、翼缘厚度），
+                使 "200x200x8x12" 这类完整尺寸输入也能匹配
+        """
+        self._keys = []
+        self._normalized = []
+        self._tokens = []
+        self._gram_counts = []
+        self._postings = defaultdict(list)
+
+        for entry_id, (designation, key, extra_tokens) in enumerate(entries):
+            normalized = normalize_designation(designation)
+            grams = _trigrams(normalized)
+            self._keys.append(key)
+            self._normalized.append(normalized)
+            self._tokens.append(tokenize_designation(normalized) + tuple(extra_tokens))
+            self._gram_counts.append(len(grams))
+            for gram in grams:
+                self._postings[gram].append(entry_id)
+
+        # 索引构建后不再变化，按规范化查询缓存排序结果（输入时常重复查询同一前缀）
+        self._search_normalized = lru_cache(maxsize=256)(self._search_normalized)
+
+    def __len__(self):
+        """索引条目数"""
+        return len(self._keys)
+
+    def cache_info(self) -> dict:
+        """获取查询结果缓存的统计
+
+        Returns:
+            dict: 包含 hits、misses、hit_rate、entries 字段
+        """
+        info = self._search_normalized.cache_info()
+        total = info.hits + info.misses
+        return {"hits": info.hits, "misses": info.misses,
+                "hit_rate": info.hits / total if total else 0.0, "entries": info.currsize}
+
+    def search(self, text: str, limit: int = None, fuzzy: bool = True) -> List[Tuple[Hashable, float]]:
+        """搜索型号
+
+        Args:
+            text: 搜索文本，如 "HW200"、"200*200"、"L100x10"
+            limit: 返回数量上限，None表示不限
+            fuzzy: 没有精确匹配时是否返回模糊匹配结果
+
+        Returns:
+            List[Tuple[Hashable, float]]: (键, 得分) 列表，按得分从高到低排序；
+                得分的整数部分为匹配等级，小数部分为三元组相似度
+        """
+        query = normalize_designation(text)
+        if not query:
+            return []
+        scored = self._search_normalized(query, fuzzy)
+        if limit is not None:
+            scored = scored[:limit]
+        return [(self._keys[entry_id], score) for score, entry_id in scored]
+
+    def _search_normalized(self, query: str, fuzzy: bool) -> tuple:
+        """搜索规范化后的查询，返回按得分排序的 (得分, 条目号) 元组"""
+        query_tokens = tokenize_designation(query)
+        query_grams = _trigrams(query)
+
+        # 通过三元组倒排表统计每个条目与查询共有的三元组数；
+        # 含有查询子串的条目必然包含查询内部的三元组，因此不会漏掉
+        common = defaultdict(int)
+        for gram in query_grams:
+            for entry_id in self._postings.get(gram, ()):
+                common[entry_id] += 1
+
+        # 少于3个字符的查询没有内部三元组，逐条检查
+        if len(query) < 3:
+            for entry_id in range(len(self._keys)):
+                common.setdefault(entry_id, 0)
+
+        scored = []
+        fuzzy_scored = []
+        for entry_id, shared in common.items():
+            normalized = self._normalized[entry_id]
+            similarity = 2.0 * shared / (len(query_grams) + self._gram_counts[entry_id])
+
+            if normalized == query:
+                level = LEVEL_EXACT
+            elif normalized.startswith(query):
+                level = LEVEL_PREFIX
+            elif query in normalized:
+                level = LEVEL_SUBSTRING
+            elif query_tokens and _is_token_subsequence(query_tokens, self._tokens[entry_id]):
+                level = LEVEL_TOKENS
+            elif similarity >= FUZZY_THRESHOLD:
+                fuzzy_scored.append((LEVEL_FUZZY + similarity, entry_id))
+                continue
+            else:
+                continue
+            scored.append((level + similarity, entry_id))
+
+        if not scored and fuzzy:
+            scored = fuzzy_scored
+
+        # 得分相同按规范化型号排序，保证结果稳定
+        scored.sort(key=lambda item: (-item[0], self._normalized[item[1]]))
+        return tuple(scored)
@@ -0,0 +1,163 @@
+"""型钢截面目录二进制快照
+
+快照保存目录的全部列式数据，启动时以内存映射方式读取，数值列直接引用映射内存，
+无需查询数据库和逐行转换。数据库仍是可编辑的数据源，快照只是它的只读副本：
+文件头记录内置库和用户覆盖库的指纹，两者任一变化后快照失效，由目录重新生成。
+
+文件格式（小端）：
+    8 字节魔数 | 8 字节头部长度 | JSON 头部 | 按 8 字节对齐的数据块
+数值列为 float64 数组；型号和类别为字符串表（以 \\0 分隔的 UTF-8 文本块）。
+"""
+
+import json
+import os
+import struct
+import tempfile
+from typing import Dict, Optional
+
+import numpy as np
+
+from core.logger import Logger
+
+
+SNAPSHOT_MAGIC = b"FGSECT\x00\x01"
+SNAPSHOT_FORMAT = 1
+SNAPSHOT_FILENAME = "sections.snapshot"
+
+_HEADER_SIZE = struct.Struct("<8sQ")
+_ALIGNMENT = 8
+
+
+def snapshot_path(db_path: str) -> str:
+    """获取数据库对应的快照文件路径（与数据库位于同一目录）"""
+    return os.path.join(os.path.dirname(os.path.abspath(db_path)), SNAPSHOT_FILENAME)
+
+
+def database_fingerprint(*paths: str) -> str:
+    """计算数据库文件的指纹（文件大小和修改时间）
+
+    Args:
+        *paths: 数据库文件路径（内置库、用户覆盖库）
+
+    Returns:
+        str: 指纹字符串，文件不存在时对应部分为 "-"
+    """
+    parts = [f"format={SNAPSHOT_FORMAT}"]
+    for path in paths:
+        try:
+            stat = os.stat(path)
+            parts.append(f"{os.path.basename(path)}:{stat.st_size}:{stat.st_mtime_ns}")
+        except OSError:
+            parts.append("-")
+    return "|".join(parts)
+
+
+def _pad(offset: int) -> int:
+    """补齐到对齐边界所需的字节数"""
+    return -offset % _ALIGNMENT
+
+
+def _encode_strings(values) -> bytes:
+    """将字符串数组编码为以 \\0 分隔的文本块"""
+    return "".join(f"{value}\0" for value in values).encode("utf-8")
+
+
+def write_snapshot(path: str, fingerprint: str, tables: Dict[str, tuple]) -> bool:
+    """写入目录快照（写入临时文件后原子替换）
+
+    Args:
+        path: 快照文件路径
+        fingerprint: 数据库指纹
+        tables: {表名: (型号数组, 类别数组或None, {列名: float64数组})}，按加载顺序排列
+
+    Returns:
+        bool: 是否写入成功
+    """
+    blocks = []
+    offset = 0
+
+    def add_block(data: bytes) -> int:
+        nonlocal offset
+        start = offset
+        blocks.append(data)
+        blocks.append(b"\0" * _pad(len(data)))
+        offset += len(data) + _pad(len(data))
+        return start
+
+    header_tables = []
+    for table_name, (names, categories, columns) in tables.items():
+        entry = {"table": table_name, "rows": len(names), "columns": {}}
+        for key, values in (("names", names), ("categories", categories)):
+            if values is None:
+                continue
+            text = _encode_strings(values)
+            entry[key] = {"text": add_block(text), "text_size": len(text)}
+        for name, values in columns.items():
+            entry["columns"][name] = add_block(np.ascontiguousarray(values, dtype="<f8").tobytes())
+        header_tables.append(entry)
+
+    header = json.dumps({"format": SNAPSHOT_FORMAT, "fingerprint": fingerprint, "tables": header_tables},
+                        ensure_ascii=False).encode("utf-8")
+    header += b" " * _pad(_HEADER_SIZE.size + len(header))
+
+    try:
+        fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path) or ".", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(_HEADER_SIZE.pack(SNAPSHOT_MAGIC, len(header)))
+                f.write(header)
+                for block in blocks:
+                    f.write(block)
+            os.replace(temp_path, path)
+        except Exception:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+    except OSError as e:
+        Logger().warning(f"写入型钢目录快照失败: {e}")
+        return False
+    return True
+
+
+def read_snapshot(path: str, fingerprint: str) -> Optional[Dict[str, tuple]]:
+    """以内存映射方式读取目录快照
+
+    Args:
+        path: 快照文件路径
+        fingerprint: 当前数据库指纹，与快照中记录的不一致时视为失效
+
+    Returns:
+        Optional[Dict[str, tuple]]: 与 write_snapshot 参数相同结构的表数据（数值列为只读的映射数组），
+            快照不存在、已失效或损坏时返回None
+    """
+    if not os.path.exists(path):
+        return None
+
+    try:
+        buffer = np.memmap(path, dtype=np.uint8, mode="r")
+        magic, header_size = _HEADER_SIZE.unpack(buffer[:_HEADER_SIZE.size].tobytes())
+        if magic != SNAPSHOT_MAGIC:
+            return None
+        header = json.loads(buffer[_HEADER_SIZE.size:_HEADER_SIZE.size + header_size].tobytes())
+        if header.get("format") != SNAPSHOT_FORMAT or header.get("fingerprint") != fingerprint:
+            return None
+
+        base = _HEADER_SIZE.size + header_size
+
+        def read_strings(entry: dict, rows: int) -> np.ndarray:
+            text_start = base + entry["text"]
+            text = buffer[text_start:text_start + entry["text_size"]].tobytes().decode("utf-8")
+            return np.array(text.split("\0")[:rows], dtype=str)
+
+        tables = {}
+        for entry in header["tables"]:
+            rows = entry["rows"]
+            names = read_strings(entry["names"], rows)
+            categories = read_strings(entry["categories"], rows) if "categories" in entry else None
+            columns = {name: np.frombuffer(buffer, dtype="<f8", count=rows, offset=base + offset)
+                       for name, offset in entry["columns"].items()}
+            tables[entry["table"]] = (names, categories, columns)
+        return tables
+    except (OSError, ValueError, KeyError, struct.error) as e:
+        Logger().warning(f"型钢目录快照无效，将从数据库重新加载: {e}")
+        return None
@@ -20,6 +20,12 @@ TABLE_COLUMN_CONFIGS = {
         ('iy', '惯性半径iy(cm)', '.2f'),
         ('Wx', '截面模量Wx(cm³)', '.1f'),
         ('Wy', '截面模量Wy(cm³)', '.1f'),
+        ('Wpx', '塑性截面模量Wpx(cm³)', '.1f'),
+        ('Wpy', '塑性截面模量Wpy(cm³)', '.1f'),
+        ('It', '扭转常数It(cm⁴)', '.2f'),
+        ('Iw', '翘曲常数Iw(cm⁶)', '.0f'),
+        ('Avx', '剪切面积Avx(cm²)', '.2f'),
+        ('Avy', '剪切面积Avy(cm²)', '.2f'),
     ],
     # H型钢2024
     'h_sections_2024': [
@@ -38,6 +44,12 @@ TABLE_COLUMN_CONFIGS = {
         ('iy', '惯性半径iy(cm)', '.2f'),
         ('Wx', '截面模量Wx(cm³)', '.1f'),
         ('Wy', '截面模量Wy(cm³)', '.1f'),
+        ('Wpx', '塑性截面模量Wpx(cm³)', '.1f'),
+        ('Wpy', '塑性截面模量Wpy(cm³)', '.1f'),
+        ('It', '扭转常数It(cm⁴)', '.2f'),
+        ('Iw', '翘曲常数Iw(cm⁶)', '.0f'),
+        ('Avx', '剪切面积Avx(cm²)', '.2f'),
+        ('Avy', '剪切面积Avy(cm²)', '.2f'),
     ],
     # I型钢2016
     'i_sections_2016': [
@@ -57,6 +69,12 @@ TABLE_COLUMN_CONFIGS = {
         ('iy', '惯性半径iy(cm)', '.2f'),
         ('Wx', '截面模量Wx(cm³)', '.1f'),
         ('Wy', '截面模量Wy(cm³)', '.1f'),
+        ('Wpx', '塑性截面模量Wpx(cm³)', '.1f'),
+        ('Wpy', '塑性截面模量Wpy(cm³)', '.1f'),
+        ('It', '扭转常数It(cm⁴)', '.2f'),
+        ('Iw', '翘曲常数Iw(cm⁶)', '.0f'),
+        ('Avx', '剪切面积Avx(cm²)', '.2f'),
+        ('Avy', '剪切面积Avy(cm²)', '.2f'),
     ],
     # 等边角钢2016
     'l_sections_2016': [
@@ -78,6 +96,12 @@ TABLE_COLUMN_CONFIGS = {
         ('WX0', '截面模量WX0(cm³)', '.1f'),
         ('Wy0', '截面模量Wy0(cm³)', '.1f'),
         ('Z0', '重心距离Z0(cm)', '.2f'),
+        ('Wpx', '塑性截面模量Wpx(cm³)', '.1f'),
+        ('Wpy', '塑性截面模量Wpy(cm³)', '.1f'),
+        ('It', '扭转常数It(cm⁴)', '.2f'),
+        ('Iw', '翘曲常数Iw(cm⁶)', '.0f'),
+        ('Avx', '剪切面积Avx(cm²)', '.2f'),
+        ('Avy', '剪切面积Avy(cm²)', '.2f'),
     ],
     # 不等边角钢2016
     'non_l_sections_2016': [
@@ -102,6 +126,12 @@ TABLE_COLUMN_CONFIGS = {
         ('Iu', '惯性矩Iu(cm⁴)', '.1f'),
         ('ru', '惯性半径iu(cm)', '.2f'),
         ('Wu', '截面模量Wu(cm³)', '.1f'),
+        ('Wpx', '塑性截面模量Wpx(cm³)', '.1f'),
+        ('Wpy', '塑性截面模量Wpy(cm³)', '.1f'),
+        ('It', '扭转常数It(cm⁴)', '.2f'),
+        ('Iw', '翘曲常数Iw(cm⁶)', '.0f'),
+        ('Avx', '剪切面积Avx(cm²)', '.2f'),
+        ('Avy', '剪切面积Avy(cm²)', '.2f'),
     ],
     # C型钢2016
     'c_sections_2016': [
@@ -119,9 +149,53 @@ TABLE_COLUMN_CONFIGS = {
         ('iy', '惯性半径iy(cm)', '.2f'),
         ('Wx', '截面模量Wx(cm³)', '.1f'),
         ('Wy', '截面模量Wy(cm³)', '.1f'),
+        ('Wpx', '塑性截面模量Wpx(cm³)', '.1f'),
+        ('Wpy', '塑性截面模量Wpy(cm³)', '.1f'),
+        ('It', '扭转常数It(cm⁴)', '.2f'),
+        ('Iw', '翘曲常数Iw(cm⁶)', '.0f'),
+        ('Avx', '剪切面积Avx(cm²)', '.2f'),
+        ('Avy', '剪切面积Avy(cm²)', '.2f'),
     ],
 }
 
+# 最轻截面查找中可选的约束属性
+# 格式: (数据字段名, 中文标题)，字段名与列配置一致（ix/iy 为惯性半径）
+FINDER_PROPERTIES = [
+    ('Wx', '截面模量Wx(cm³)'),
+    ('Wy', '截面模量Wy(cm³)'),
+    ('Wpx', '塑性截面模量Wpx(cm³)'),
+    ('Wpy', '塑性截面模量Wpy(cm³)'),
+    ('Ix', '惯性矩Ix(cm⁴)'),
+    ('Iy', '惯性矩Iy(cm⁴)'),
+    ('ix', '惯性半径ix(cm)'),
+    ('iy', '惯性半径iy(cm)'),
+    ('area', '截面面积(cm²)'),
+    ('height', '高度H(mm)'),
+    ('width', '宽度B(mm)'),
+    ('web_thickness', '腹板厚度t1(mm)'),
+    ('flange_thickness', '翼缘厚度t2(mm)'),
+    ('It', '扭转常数It(cm⁴)'),
+    ('Avy', '剪切面积Avy(cm²)'),
+]
+
+# 自定义截面计算结果的列配置
+# 格式: (数据字段名, 中文标题, 格式)，字段名与 section_properties 的计算结果一致
+CUSTOM_SECTION_COLUMNS = [
+    ('height', '高度H(mm)', '.1f'),
+    ('width', '宽度B(mm)', '.1f'),
+    ('web_thickness', '腹板厚度t1(mm)', '.1f'),
+    ('flange_thickness', '翼缘厚度t2(mm)', '.1f'),
+    ('fillet_radius', '圆角半径r(mm)', '.1f'),
+    ('area', '截面面积(cm²)', '.2f'),
+    ('weight', '理论重量(kg/m)', '.2f'),
+    ('Ix', '惯性矩Ix(cm⁴)', '.1f'),
+    ('Iy', '惯性矩Iy(cm⁴)', '.1f'),
+    ('ix', '惯性半径ix(cm)', '.2f'),
+    ('iy', '惯性半径iy(cm)', '.2f'),
+    ('Wx', '截面模量Wx(cm³)', '.1f'),
+    ('Wy', '截面模量Wy(cm³)', '.1f'),
+]
+
 def get_table_config(shape_type):
     """根据型钢类型获取表格列配置
     
@@ -0,0 +1,306 @@
+"""型钢材料统计（按构件清单批量计算重量和涂装面积）"""
+
+import os
+import re
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from plugins.Steel_Shape_Table.search_index import normalize_designation
+
+
+# 构件清单表头（小写、去掉单位后）到标准列名的映射
+MEMBER_HEADER_ALIASES = {
+    "designation": ("型号", "规格", "截面", "截面规格", "designation", "section", "profile"),
+    "length": ("长度", "单长", "构件长度", "length"),
+    "count": ("数量", "件数", "根数", "count", "qty", "quantity"),
+    "shape_type": ("类型", "型钢类型", "shape_type", "type"),
+}
+
+# 清单型号中常见的截面符号写法
+DESIGNATION_PREFIXES = {
+    "∠": "L",
+}
+
+# 未匹配型号给出的建议数量
+SUGGESTION_COUNT = 3
+
+# 输出列标题
+DETAIL_COLUMNS = {
+    "designation": "清单型号",
+    "shape_type": "型钢类型",
+    "model": "匹配型号",
+    "length": "单长(m)",
+    "count": "数量",
+    "unit_weight": "理论重量(kg/m)",
+    "unit_surface": "表面积(m²/m)",
+    "total_length": "总长(m)",
+    "weight": "重量(kg)",
+    "surface": "涂装面积(m²)",
+}
+
+_UNIT_PATTERN = re.compile(r"[（(]([^）)]*)[）)]")
+# 等边截面的简写（如 "L100X10" 表示 "L100X100X10"）
+_EQUAL_LEG_PATTERN = re.compile(r"^([A-Z]+)(\d+(?:\.\d+)?)X\2X(.+)$")
+
+
+def _normalize_member_designation(text) -> str:
+    """规范化清单中的型号（统一截面符号写法）"""
+    normalized = normalize_designation(str(text))
+    for prefix, replacement in DESIGNATION_PREFIXES.items():
+        if normalized.startswith(prefix):
+            normalized = replacement + normalized[len(prefix):]
+    return normalized
+
+
+class TakeoffResult:
+    """材料统计结果"""
+
+    def __init__(self, detail: pd.DataFrame, by_section: pd.DataFrame, by_type: pd.DataFrame,
+                 unmatched: pd.DataFrame):
+        """初始化统计结果
+
+        Args:
+            detail: 明细（每个清单行一行，保留清单中的原有列）
+            by_section: 按规格汇总
+            by_type: 按型钢类型汇总
+            unmatched: 未匹配的型号及建议
+        """
+        self.detail = detail
+        self.by_section = by_section
+        self.by_type = by_type
+        self.unmatched = unmatched
+
+    @property
+    def total(self) -> dict:
+        """总计：数量、总长、重量和涂装面积"""
+        return {
+            "count": float(self.by_type["count"].sum()),
+            "total_length": float(self.by_type["total_length"].sum()),
+            "weight": float(self.by_type["weight"].sum()),
+            "surface": float(self.by_type["surface"].sum()),
+        }
+
+    def write_excel(self, path: str):
+        """将材料表写入Excel文件
+
+        工作表：材料明细、按规格汇总、按类型汇总（含总计行）、未匹配型号
+
+        Args:
+            path: Excel文件路径
+        """
+        by_type = self.by_type.copy()
+        total = {"shape_type": "总计", **self.total}
+        by_type = pd.concat([by_type, pd.DataFrame([total])], ignore_index=True)
+
+        with pd.ExcelWriter(path, engine="openpyxl") as writer:
+            self.detail.rename(columns=DETAIL_COLUMNS).to_excel(writer, index=False, sheet_name="材料明细")
+            self.by_section.rename(columns=DETAIL_COLUMNS).to_excel(writer, index=False, sheet_name="按规格汇总")
+            by_type.rename(columns=DETAIL_COLUMNS).to_excel(writer, index=False, sheet_name="按类型汇总")
+            self.unmatched.rename(columns={
+                "designation": "清单型号", "rows": "清单行数", "suggestions": "建议型号",
+            }).to_excel(writer, index=False, sheet_name="未匹配型号")
+
+
+class SteelTakeoff:
+    """型钢材料统计
+
+    将构件清单中的型号规范化后与目录做一次表连接，得到理论重量和表面积，
+    再按规格、类型汇总；未匹配的型号用目录搜索给出建议
+    """
+
+    def __init__(self, catalog):
+        """初始化材料统计
+
+        Args:
+            catalog: 型钢截面目录（SectionCatalog）
+        """
+        self._catalog = catalog
+        self._lookup = self._build_lookup(catalog)
+
+    @staticmethod
+    def _build_lookup(catalog) -> pd.DataFrame:
+        """构建目录查找表
+
+        每个截面的连接键：型号加腹板、翼缘厚度（区分同名型号，如 2024 版 H 型钢的
+        "H100X50X5X7"）、型号本身、等边截面的简写。同一键对应多个截面时按上述顺序优先，
+        其次按目录顺序取第一个
+        """
+        frames = []
+        order = 0
+        for shape_type in catalog.get_shape_types():
+            result = catalog.query(shape_type)
+            if len(result) == 0:
+                continue
+            models = result.names.tolist()
+            weight = result.column("weight")
+            surface = result.column("surface_area")
+            frame = pd.DataFrame({
+                "shape_type": shape_type,
+                "model": models,
+                "unit_weight": weight if weight is not None else np.nan,
+                "unit_surface": surface if surface is not None else np.nan,
+                "order": np.arange(order, order + len(models)),
+            })
+            order += len(models)
+
+            keys = [normalize_designation(model) for model in models]
+            frames.append(frame.assign(key=keys, priority=1))
+
+            short_keys = [_EQUAL_LEG_PATTERN.sub(r"\1\2X\3", key) for key in keys]
+            is_short = np.array([short != key for short, key in zip(short_keys, keys)], dtype=bool)
+            if is_short.any():
+                frames.append(frame[is_short].assign(key=np.array(short_keys)[is_short], priority=2))
+
+            t1, t2 = result.column("web_thickness"), result.column("flange_thickness")
+            if t1 is not None and t2 is not None:
+                full_keys = [f"{key}X{a:g}X{b:g}" for key, a, b in zip(keys, t1.tolist(), t2.tolist())]
+                frames.append(frame.assign(key=full_keys, priority=0))
+
+        if not frames:
+            return pd.DataFrame(columns=["shape_type", "model", "unit_weight", "unit_surface",
+                                         "order", "key", "priority"])
+        return pd.concat(frames, ignore_index=True).sort_values(["priority", "order"], kind="stable")
+
+    @staticmethod
+    def read_member_list(path: str, length_unit: str = None,
+                         required=("designation", "length")) -> pd.DataFrame:
+        """读取构件清单（CSV或Excel第一个工作表）
+
+        表头可为中文或英文：型号/规格、长度、数量（缺省为1）、类型（可选）；
+        长度单位取自参数或表头中的单位（如 "长度(mm)"），缺省为米
+
+        Args:
+            path: 清单文件路径
+            length_unit: 长度单位 "m" 或 "mm"，为None时从表头识别
+            required: 必须包含的标准列
+
+        Returns:
+            pd.DataFrame: 包含 designation、length（米）、count 列及原有其他列的清单
+
+        Raises:
+            ValueError: 缺少必需的列
+        """
+        extension = os.path.splitext(path)[1].lower()
+        if extension == ".csv":
+            frame = pd.read_csv(path, encoding="utf-8-sig")
+        else:
+            frame = pd.read_excel(path, engine="openpyxl")
+
+        renames = {}
+        units = {}
+        for header in frame.columns:
+            text = str(header).strip()
+            unit = _UNIT_PATTERN.search(text)
+            key = _UNIT_PATTERN.sub("", text).strip().lower()
+            for column, aliases in MEMBER_HEADER_ALIASES.items():
+                if key in aliases and column not in renames.values():
+                    renames[header] = column
+                    if unit:
+                        units[column] = unit.group(1).strip().lower()
+        frame = frame.rename(columns=renames)
+
+        missing = [MEMBER_HEADER_ALIASES[column][0] for column in required if column not in frame]
+        if missing:
+            raise ValueError(f"构件清单缺少列：{'、'.join(missing)}")
+
+        frame = frame[frame["designation"].notna()].copy()
+        if "length" not in frame:
+            frame["length"] = np.nan
+        frame["length"] = pd.to_numeric(frame["length"], errors="coerce")
+        if (length_unit or units.get("length", "m")) == "mm":
+            frame["length"] = frame["length"] / 1000.0
+        if "count" in frame:
+            frame["count"] = pd.to_numeric(frame["count"], errors="coerce").fillna(1)
+        else:
+            frame["count"] = 1.0
+        return frame.reset_index(drop=True)
+
+    def resolve(self, members: pd.DataFrame) -> pd.DataFrame:
+        """将清单型号与目录连接
+
+        Args:
+            members: 构件清单（见 read_member_list）
+
+        Returns:
+            pd.DataFrame: 清单各行（顺序不变）加上 shape_type、model、unit_weight、unit_surface 列，
+                未匹配的行 model 为空
+        """
+        members = members.copy()
+        members["key"] = [_normalize_member_designation(text) for text in members["designation"]]
+        members["_row"] = np.arange(len(members))
+        if "shape_type" not in members:
+            members["shape_type"] = None
+
+        lookup = self._lookup.drop(columns=["order", "priority"])
+        # 指定了类型的行在该类型内匹配，其余行在全部类型中匹配
+        typed = members["shape_type"].notna() & (members["shape_type"].astype(str).str.strip() != "")
+        matched_typed = members[typed].merge(
+            lookup.drop_duplicates(["shape_type", "key"]), on=["shape_type", "key"], how="left")
+        matched_untyped = members[~typed].drop(columns="shape_type").merge(
+            lookup.drop_duplicates("key"), on="key", how="left")
+        resolved = pd.concat([matched_typed, matched_untyped]).sort_values("_row")
+        return resolved.drop(columns=["key", "_row"]).reset_index(drop=True)
+
+    def compute(self, members: pd.DataFrame) -> TakeoffResult:
+        """计算材料表
+
+        Args:
+            members: 构件清单（见 read_member_list）
+
+        Returns:
+            TakeoffResult: 统计结果
+        """
+        detail = self.resolve(members)
+        detail["total_length"] = detail["length"] * detail["count"]
+        detail["weight"] = detail["total_length"] * detail["unit_weight"]
+        detail["surface"] = detail["total_length"] * detail["unit_surface"]
+
+        matched = detail[detail["model"].notna()]
+        sums = {"count": "sum", "total_length": "sum", "weight": "sum", "surface": "sum"}
+        by_section = (matched.groupby(["shape_type", "model"], sort=False)
+                      .agg({"unit_weight": "first", "unit_surface": "first", **sums}).reset_index())
+        by_type = matched.groupby("shape_type", sort=False).agg(sums).reset_index()
+
+        unmatched = detail[detail["model"].isna()]
+        unmatched = unmatched.groupby("designation", sort=False).size().reset_index(name="rows")
+        unmatched["suggestions"] = [self.suggest(text) for text in unmatched["designation"]]
+
+        leading = [column for column in DETAIL_COLUMNS if column in detail]
+        detail = detail[leading + [column for column in detail.columns if column not in leading]]
+        return TakeoffResult(detail, by_section, by_type, unmatched)
+
+    def suggest(self, designation, limit: int = SUGGESTION_COUNT) -> str:
+        """为未匹配的型号给出建议（目录模糊搜索）
+
+        Args:
+            designation: 清单中的型号
+            limit: 建议数量
+
+        Returns:
+            str: 建议型号，如 "HW200x200（HW型钢截面表（2017））；..."，无建议时为空字符串
+        """
+        text = _normalize_member_designation(designation)
+        matches = self._catalog.search(text, limit)
+        return "；".join(f"{item['model']}（{item['shape_type']}）" for item in matches)
+
+
+def run_takeoff(catalog, member_path: str, output_path: Optional[str] = None,
+                length_unit: str = None) -> TakeoffResult:
+    """读取构件清单、计算材料表并（可选）写入Excel
+
+    Args:
+        catalog: 型钢截面目录
+        member_path: 构件清单路径（CSV或Excel）
+        output_path: 材料表Excel路径，为None时不写文件
+        length_unit: 长度单位 "m" 或 "mm"，为None时从表头识别
+
+    Returns:
+        TakeoffResult: 统计结果
+    """
+    takeoff = SteelTakeoff(catalog)
+    result = takeoff.compute(takeoff.read_member_list(member_path, length_unit))
+    if output_path:
+        result.write_excel(output_path)
+    return result
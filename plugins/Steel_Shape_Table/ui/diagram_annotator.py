@@ -1,10 +1,61 @@
 """型钢截面标注计算引擎"""
 
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 import math
 
 
+def _new_figure():
+    """创建空白 Plotly 图形
+
+    plotly 导入较慢，只在真正生成图形时导入（批量导出时只在子进程中导入）
+    """
+    import plotly.graph_objects as go
+    return go.Figure()
+
+
+class DimensionAnnotation:
+    """一条尺寸标注的几何数据
+
+    start、end 为标注在截面上的锚点（绘图区域坐标，随缩放和平移变换），
+    offset 为尺寸线相对锚点的偏移（屏幕像素，不随缩放变化）
+    """
+
+    __slots__ = ("kind", "start", "end", "offset", "text")
+
+    def __init__(self, kind, start, end, offset, text):
+        """初始化尺寸标注
+
+        Args:
+            kind: 标注方向，"vertical"、"horizontal" 或 "diagonal"
+            start: 起点锚点（QPointF）
+            end: 终点锚点（QPointF）
+            offset: 尺寸线的屏幕偏移（QPointF）
+            text: 标注文字
+        """
+        self.kind = kind
+        self.start = start
+        self.end = end
+        self.offset = offset
+        self.text = text
+
+    @classmethod
+    def vertical(cls, x, y1, y2, offset, text):
+        """垂直尺寸标注，尺寸线向左（offset<0）或向右偏移 offset 像素"""
+        from PySide6.QtCore import QPointF
+        return cls("vertical", QPointF(x, y1), QPointF(x, y2), QPointF(offset, 0), text)
+
+    @classmethod
+    def horizontal(cls, x1, y, x2, offset, text):
+        """水平尺寸标注，尺寸线向上（offset<0）或向下偏移 offset 像素"""
+        from PySide6.QtCore import QPointF
+        return cls("horizontal", QPointF(x1, y), QPointF(x2, y), QPointF(0, offset), text)
+
+    @classmethod
+    def diagonal(cls, x1, y1, x2, y2, text):
+        """对角线尺寸标注（不偏移）"""
+        from PySide6.QtCore import QPointF
+        return cls("diagonal", QPointF(x1, y1), QPointF(x2, y2), QPointF(0, 0), text)
+
+
 class DiagramAnnotator:
     """型钢截面标注计算引擎"""
     
@@ -21,6 +72,22 @@ class DiagramAnnotator:
             "precision": 1  # 小数位数
         }
         
+    def get_style(self) -> dict:
+        """获取标注样式
+
+        Returns:
+            dict: 标注样式配置的副本
+        """
+        return dict(self._config)
+
+    def set_style(self, style):
+        """更新标注样式
+
+        Args:
+            style: 要覆盖的样式项，如 {"font_size": 14, "precision": 2}
+        """
+        self._config.update(style or {})
+
     def create_section_figure(self, shape_data):
         """创建型钢截面的Plotly图形
         
@@ -54,23 +121,65 @@ class DiagramAnnotator:
             draw_rect: 绘图区域
             scale_factor: 缩放因子
         """
+        self.paint_dimensions(painter, self.compute_dimensions(shape_data, draw_rect))
+        
+    def compute_dimensions(self, shape_data, draw_rect):
+        """计算尺寸标注的几何数据（锚点和文字），不进行绘制
+        
+        同一截面和绘图区域只需计算一次，缩放和平移时由 paint_dimensions 映射后绘制
+        
+        Args:
+            shape_data: 型钢数据字典
+            draw_rect: 未缩放、未平移的绘图区域
+            
+        Returns:
+            List[DimensionAnnotation]: 尺寸标注列表
+        """
         shape_type = shape_data.get("类型", "")
         
         if shape_type == "工字钢" or shape_type == "H型钢":
-            self._draw_i_dimensions(painter, shape_data, draw_rect, scale_factor)
+            return self._i_dimensions(shape_data, draw_rect)
         elif shape_type == "槽钢":
-            self._draw_channel_dimensions(painter, shape_data, draw_rect, scale_factor)
+            return self._channel_dimensions(shape_data, draw_rect)
         elif shape_type == "角钢":
-            self._draw_angle_dimensions(painter, shape_data, draw_rect, scale_factor)
+            return self._angle_dimensions(shape_data, draw_rect)
         elif shape_type == "圆钢":
-            self._draw_circle_dimensions(painter, shape_data, draw_rect, scale_factor)
+            return self._circle_dimensions(shape_data, draw_rect)
         elif shape_type == "方钢":
-            self._draw_square_dimensions(painter, shape_data, draw_rect, scale_factor)
+            return self._square_dimensions(shape_data, draw_rect)
         else:
-            self._draw_rectangle_dimensions(painter, shape_data, draw_rect, scale_factor)
+            return self._rectangle_dimensions(shape_data, draw_rect)
+            
+    def paint_dimensions(self, painter, dimensions, transform=None):
+        """绘制已计算的尺寸标注
+        
+        锚点经 transform 映射到屏幕坐标后再加上屏幕偏移，painter 不应用变换，
+        标注线宽和文字大小不随缩放变化
+        
+        Args:
+            painter: 未应用缩放变换的QPainter对象
+            dimensions: compute_dimensions 的结果
+            transform: 绘图区域到屏幕坐标的变换（QTransform），为None时不变换
+        """
+        for dimension in dimensions:
+            start, end = dimension.start, dimension.end
+            if transform is not None:
+                start, end = transform.map(start), transform.map(end)
+            start, end = start + dimension.offset, end + dimension.offset
+            
+            if dimension.kind == "vertical":
+                self._draw_vertical_dimension(painter, start.x(), start.y(), end.y(), dimension.text)
+            elif dimension.kind == "horizontal":
+                self._draw_horizontal_dimension(painter, start.x(), start.y(), end.x(), dimension.text)
+            else:
+                self._draw_diagonal_dimension(painter, start.x(), start.y(), end.x(), end.y(), dimension.text)
+            
+    def _format(self, name, value):
+        """标注文字，如 H=200.0"""
+        return f"{name}={value:.{self._config['precision']}f}"
             
-    def _draw_i_dimensions(self, painter, shape_data, draw_rect, scale_factor):
-        """绘制工字钢/H型钢尺寸标注"""
+    def _i_dimensions(self, shape_data, draw_rect):
+        """工字钢/H型钢尺寸标注"""
         h = shape_data.get("高度H", 100)
         b = shape_data.get("宽度B", 50)
         t1 = shape_data.get("腹板厚度t1", 5)
@@ -84,32 +193,23 @@ class DiagramAnnotator:
         center_x = draw_rect.center().x()
         center_y = draw_rect.center().y()
         
-        # 绘制高度标注
-        self._draw_vertical_dimension(painter, center_x - b * scale / 2 - 20, 
-                                    center_y - h * scale / 2, 
-                                    center_y + h * scale / 2, 
-                                    f"H={h:.{self._config['precision']}f}")
-        
-        # 绘制宽度标注
-        self._draw_horizontal_dimension(painter, center_x - b * scale / 2, 
-                                      center_y + h * scale / 2 + 20, 
-                                      center_x + b * scale / 2, 
-                                      f"B={b:.{self._config['precision']}f}")
-        
-        # 绘制腹板厚度标注
-        self._draw_horizontal_dimension(painter, center_x - t1 * scale / 2, 
-                                      center_y - 20, 
-                                      center_x + t1 * scale / 2, 
-                                      f"t₁={t1:.{self._config['precision']}f}")
-        
-        # 绘制翼缘厚度标注
-        self._draw_vertical_dimension(painter, center_x + b * scale / 2 + 20, 
-                                    center_y + h * scale / 2 - t2 * scale, 
-                                    center_y + h * scale / 2, 
-                                    f"t₂={t2:.{self._config['precision']}f}")
+        return [
+            # 高度标注
+            DimensionAnnotation.vertical(center_x - b * scale / 2, center_y - h * scale / 2,
+                                         center_y + h * scale / 2, -20, self._format("H", h)),
+            # 宽度标注
+            DimensionAnnotation.horizontal(center_x - b * scale / 2, center_y + h * scale / 2,
+                                           center_x + b * scale / 2, 20, self._format("B", b)),
+            # 腹板厚度标注
+            DimensionAnnotation.horizontal(center_x - t1 * scale / 2, center_y,
+                                           center_x + t1 * scale / 2, -20, self._format("t₁", t1)),
+            # 翼缘厚度标注
+            DimensionAnnotation.vertical(center_x + b * scale / 2, center_y + h * scale / 2 - t2 * scale,
+                                         center_y + h * scale / 2, 20, self._format("t₂", t2)),
+        ]
             
-    def _draw_channel_dimensions(self, painter, shape_data, draw_rect, scale_factor):
-        """绘制槽钢尺寸标注"""
+    def _channel_dimensions(self, shape_data, draw_rect):
+        """槽钢尺寸标注"""
         h = shape_data.get("高度H", 100)
         b = shape_data.get("宽度B", 50)
         t1 = shape_data.get("腹板厚度t1", 5)
@@ -123,32 +223,23 @@ class DiagramAnnotator:
         center_x = draw_rect.center().x()
         center_y = draw_rect.center().y()
         
-        # 绘制高度标注
-        self._draw_vertical_dimension(painter, center_x - 20, 
-                                    center_y - h * scale / 2, 
-                                    center_y + h * scale / 2, 
-                                    f"H={h:.{self._config['precision']}f}")
-        
-        # 绘制宽度标注
-        self._draw_horizontal_dimension(painter, center_x - t1 * scale / 2, 
-                                      center_y + h * scale / 2 + 20, 
-                                      center_x + (b - t1) * scale / 2, 
-                                      f"B={b:.{self._config['precision']}f}")
-        
-        # 绘制腹板厚度标注
-        self._draw_horizontal_dimension(painter, center_x - t1 * scale / 2, 
-                                      center_y - 20, 
-                                      center_x + t1 * scale / 2, 
-                                      f"t₁={t1:.{self._config['precision']}f}")
-        
-        # 绘制翼缘厚度标注
-        self._draw_vertical_dimension(painter, center_x + (b - t1) * scale / 2 + 20, 
-                                    center_y + h * scale / 2 - t2 * scale, 
-                                    center_y + h * scale / 2, 
-                                    f"t₂={t2:.{self._config['precision']}f}")
+        return [
+            # 高度标注
+            DimensionAnnotation.vertical(center_x, center_y - h * scale / 2,
+                                         center_y + h * scale / 2, -20, self._format("H", h)),
+            # 宽度标注
+            DimensionAnnotation.horizontal(center_x - t1 * scale / 2, center_y + h * scale / 2,
+                                           center_x + (b - t1) * scale / 2, 20, self._format("B", b)),
+            # 腹板厚度标注
+            DimensionAnnotation.horizontal(center_x - t1 * scale / 2, center_y,
+                                           center_x + t1 * scale / 2, -20, self._format("t₁", t1)),
+            # 翼缘厚度标注
+            DimensionAnnotation.vertical(center_x + (b - t1) * scale / 2, center_y + h * scale / 2 - t2 * scale,
+                                         center_y + h * scale / 2, 20, self._format("t₂", t2)),
+        ]
             
-    def _draw_angle_dimensions(self, painter, shape_data, draw_rect, scale_factor):
-        """绘制角钢尺寸标注"""
+    def _angle_dimensions(self, shape_data, draw_rect):
+        """角钢尺寸标注"""
         h = shape_data.get("高度H", 100)
         b = shape_data.get("宽度B", 100)
         t = shape_data.get("厚度t", 10)
@@ -161,27 +252,21 @@ class DiagramAnnotator:
         center_x = draw_rect.center().x()
         center_y = draw_rect.center().y()
         
-        # 绘制高度标注
-        self._draw_vertical_dimension(painter, center_x - b * scale / 2 - 20, 
-                                    center_y - h * scale / 2, 
-                                    center_y + h * scale / 2 - t * scale, 
-                                    f"H={h:.{self._config['precision']}f}")
-        
-        # 绘制宽度标注
-        self._draw_horizontal_dimension(painter, center_x - b * scale / 2, 
-                                      center_y + h * scale / 2 + 20, 
-                                      center_x + b * scale / 2 - t * scale, 
-                                      f"B={b:.{self._config['precision']}f}")
-        
-        # 绘制厚度标注
-        self._draw_diagonal_dimension(painter, center_x - b * scale / 2 + t * scale, 
-                                    center_y + h * scale / 2 - t * scale, 
-                                    center_x - b * scale / 2 + 2 * t * scale, 
-                                    center_y + h * scale / 2 - 2 * t * scale, 
-                                    f"t={t:.{self._config['precision']}f}")
+        return [
+            # 高度标注
+            DimensionAnnotation.vertical(center_x - b * scale / 2, center_y - h * scale / 2,
+                                         center_y + h * scale / 2 - t * scale, -20, self._format("H", h)),
+            # 宽度标注
+            DimensionAnnotation.horizontal(center_x - b * scale / 2, center_y + h * scale / 2,
+                                           center_x + b * scale / 2 - t * scale, 20, self._format("B", b)),
+            # 厚度标注
+            DimensionAnnotation.diagonal(center_x - b * scale / 2 + t * scale, center_y + h * scale / 2 - t * scale,
+                                         center_x - b * scale / 2 + 2 * t * scale,
+                                         center_y + h * scale / 2 - 2 * t * scale, self._format("t", t)),
+        ]
             
-    def _draw_circle_dimensions(self, painter, shape_data, draw_rect, scale_factor):
-        """绘制圆钢尺寸标注"""
+    def _circle_dimensions(self, shape_data, draw_rect):
+        """圆钢尺寸标注"""
         d = shape_data.get("直径D", 50)
         
         # 计算缩放比例
@@ -191,14 +276,12 @@ class DiagramAnnotator:
         center_x = draw_rect.center().x()
         center_y = draw_rect.center().y()
         
-        # 绘制直径标注
-        self._draw_horizontal_dimension(painter, center_x - d * scale / 2, 
-                                      center_y + d * scale / 2 + 20, 
-                                      center_x + d * scale / 2, 
-                                      f"D={d:.{self._config['precision']}f}")
+        # 直径标注
+        return [DimensionAnnotation.horizontal(center_x - d * scale / 2, center_y + d * scale / 2,
+                                               center_x + d * scale / 2, 20, self._format("D", d))]
             
-    def _draw_square_dimensions(self, painter, shape_data, draw_rect, scale_factor):
-        """绘制方钢尺寸标注"""
+    def _square_dimensions(self, shape_data, draw_rect):
+        """方钢尺寸标注"""
         a = shape_data.get("边长A", 50)
         
         # 计算缩放比例
@@ -208,14 +291,12 @@ class DiagramAnnotator:
         center_x = draw_rect.center().x()
         center_y = draw_rect.center().y()
         
-        # 绘制边长标注
-        self._draw_horizontal_dimension(painter, center_x - a * scale / 2, 
-                                      center_y + a * scale / 2 + 20, 
-                                      center_x + a * scale / 2, 
-                                      f"A={a:.{self._config['precision']}f}")
+        # 边长标注
+        return [DimensionAnnotation.horizontal(center_x - a * scale / 2, center_y + a * scale / 2,
+                                               center_x + a * scale / 2, 20, self._format("A", a))]
             
-    def _draw_rectangle_dimensions(self, painter, shape_data, draw_rect, scale_factor):
-        """绘制矩形尺寸标注"""
+    def _rectangle_dimensions(self, shape_data, draw_rect):
+        """矩形尺寸标注"""
         h = shape_data.get("高度H", 100)
         b = shape_data.get("宽度B", 50)
         
@@ -226,26 +307,30 @@ class DiagramAnnotator:
         center_x = draw_rect.center().x()
         center_y = draw_rect.center().y()
         
-        # 绘制高度标注
-        self._draw_vertical_dimension(painter, center_x - b * scale / 2 - 20, 
-                                    center_y - h * scale / 2, 
-                                    center_y + h * scale / 2, 
-                                    f"H={h:.{self._config['precision']}f}")
-        
-        # 绘制宽度标注
-        self._draw_horizontal_dimension(painter, center_x - b * scale / 2, 
-                                      center_y + h * scale / 2 + 20, 
-                                      center_x + b * scale / 2, 
-                                      f"B={b:.{self._config['precision']}f}")
+        return [
+            # 高度标注
+            DimensionAnnotation.vertical(center_x - b * scale / 2, center_y - h * scale / 2,
+                                         center_y + h * scale / 2, -20, self._format("H", h)),
+            # 宽度标注
+            DimensionAnnotation.horizontal(center_x - b * scale / 2, center_y + h * scale / 2,
+                                           center_x + b * scale / 2, 20, self._format("B", b)),
+        ]
+            
+    @staticmethod
+    def _dimension_pen():
+        """尺寸线画笔（cosmetic：线宽为设备像素）"""
+        from PySide6.QtGui import QPen, QColor
+        
+        pen = QPen(QColor(102, 102, 102), 1)
+        pen.setCosmetic(True)
+        return pen
             
     def _draw_vertical_dimension(self, painter, x, y1, y2, text):
         """绘制垂直尺寸标注"""
-        from PySide6.QtGui import QPen, QColor, QFont
-        from PySide6.QtCore import Qt
+        from PySide6.QtGui import QFont
         
         # 绘制尺寸线
-        pen = QPen(QColor(102, 102, 102), 1)
-        painter.setPen(pen)
+        painter.setPen(self._dimension_pen())
         painter.drawLine(x, y1, x, y2)
         
         # 绘制箭头
@@ -261,12 +346,10 @@ class DiagramAnnotator:
             
     def _draw_horizontal_dimension(self, painter, x1, y, x2, text):
         """绘制水平尺寸标注"""
-        from PySide6.QtGui import QPen, QColor, QFont
-        from PySide6.QtCore import Qt
+        from PySide6.QtGui import QFont
         
         # 绘制尺寸线
-        pen = QPen(QColor(102, 102, 102), 1)
-        painter.setPen(pen)
+        painter.setPen(self._dimension_pen())
         painter.drawLine(x1, y, x2, y)
         
         # 绘制箭头
@@ -282,12 +365,10 @@ class DiagramAnnotator:
             
     def _draw_diagonal_dimension(self, painter, x1, y1, x2, y2, text):
         """绘制对角线尺寸标注"""
-        from PySide6.QtGui import QPen, QColor, QFont
-        from PySide6.QtCore import Qt
+        from PySide6.QtGui import QFont
         
         # 绘制尺寸线
-        pen = QPen(QColor(102, 102, 102), 1)
-        painter.setPen(pen)
+        painter.setPen(self._dimension_pen())
         painter.drawLine(x1, y1, x2, y2)
         
         # 绘制箭头
@@ -300,7 +381,7 @@ class DiagramAnnotator:
         font = QFont("Arial", 10)
         painter.setFont(font)
         painter.drawText((x1 + x2) / 2, (y1 + y2) / 2 - 10, text)
-            
+
     def _create_i_figure(self, shape_data):
         """创建工字钢/H型钢图形"""
         h = shape_data.get("高度H", 100)
@@ -309,7 +390,7 @@ class DiagramAnnotator:
         t2 = shape_data.get("翼缘厚度t2", 8)
         
         # 创建图形
-        fig = go.Figure()
+        fig = _new_figure()
         
         # 计算中心点
         center_x = 0
@@ -567,7 +648,7 @@ class DiagramAnnotator:
         t2 = shape_data.get("翼缘厚度t2", 8)
         
         # 创建图形
-        fig = go.Figure()
+        fig = _new_figure()
         
         # 计算中心点
         center_x = 0
@@ -824,7 +905,7 @@ class DiagramAnnotator:
         t = shape_data.get("厚度t", 10)
         
         # 创建图形
-        fig = go.Figure()
+        fig = _new_figure()
         
         # 计算中心点
         center_x = 0
@@ -1008,7 +1089,7 @@ class DiagramAnnotator:
         d = shape_data.get("直径D", 50)
         
         # 创建图形
-        fig = go.Figure()
+        fig = _new_figure()
         
         # 计算中心点
         center_x = 0
@@ -1100,7 +1181,7 @@ class DiagramAnnotator:
         a = shape_data.get("边长A", 50)
         
         # 创建图形
-        fig = go.Figure()
+        fig = _new_figure()
         
         # 计算中心点
         center_x = 0
@@ -1193,7 +1274,7 @@ class DiagramAnnotator:
         b = shape_data.get("宽度B", 50)
         
         # 创建图形
-        fig = go.Figure()
+        fig = _new_figure()
         
         # 计算中心点
         center_x = 0
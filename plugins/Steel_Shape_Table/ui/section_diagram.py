@@ -2,13 +2,19 @@
 
 from PySide6.QtWidgets import QWidget
 from PySide6.QtCore import Qt, QPointF, QRectF
-from PySide6.QtGui import QPainter, QPen, QBrush, QColor, QFont, QPainterPath
+from PySide6.QtGui import QPainter, QPen, QBrush, QColor, QFont, QPainterPath, QPicture, QTransform
 
+from core.cache import CacheStats
 from plugins.Steel_Shape_Table.ui.diagram_annotator import DiagramAnnotator
 
 
 class SectionDiagram(QWidget):
-    """型钢截面形状绘图组件"""
+    """型钢截面形状绘图组件
+
+    截面形状只在切换截面或改变组件大小时录制一次到 QPicture，缩放和平移时只对缓存的
+    矢量图应用变换后回放（轮廓使用 cosmetic 画笔，线宽不随缩放变化）；
+    尺寸标注的锚点和文字同样只计算一次，绘制时只将锚点映射到屏幕坐标，文字和线宽保持不变
+    """
     
     def __init__(self, parent=None):
         """初始化绘图组件"""
@@ -18,6 +24,13 @@ class SectionDiagram(QWidget):
         self._offset = QPointF(0, 0)
         self._margin = 50  # 边距
         
+        # 缓存的截面形状（未缩放、未平移，不含尺寸标注），切换截面或改变大小时失效
+        self._picture = None
+        # 缓存的尺寸标注几何数据（锚点和文字），与 _picture 同时失效
+        self._dimensions = None
+        # 缓存图形的复用统计：回放已有图形为命中，重新录制为未命中
+        self._cache_stats = CacheStats()
+        
         # 创建标注引擎
         self._annotator = DiagramAnnotator()
         
@@ -32,9 +45,11 @@ class SectionDiagram(QWidget):
         """设置型钢数据
         
         Args:
-            shape_data: 型钢数据字典，包含截面参数
+            shape_data: 截面记录（SectionRecord）或型钢数据字典，通过 get() 读取截面参数
         """
         self._shape_data = shape_data
+        self._picture = None
+        self._dimensions = None
         self.update()  # 重绘
         
     def set_scale_factor(self, scale):
@@ -52,6 +67,20 @@ class SectionDiagram(QWidget):
         self._offset = QPointF(0, 0)
         self.update()
         
+    def get_cache_stats(self) -> dict:
+        """获取缓存图形的复用统计
+        
+        Returns:
+            dict: 包含 hits、misses、hit_rate 等字段
+        """
+        return self._cache_stats.to_dict()
+        
+    def resizeEvent(self, event):
+        """大小改变事件，截面图形按新的绘图区域重新录制"""
+        self._picture = None
+        self._dimensions = None
+        super().resizeEvent(event)
+        
     def paintEvent(self, event):
         """绘制事件"""
         painter = QPainter(self)
@@ -65,29 +94,50 @@ class SectionDiagram(QWidget):
             self._draw_no_data(painter)
             return
             
-        # 保存绘图状态
-        painter.save()
+        if self._picture is None:
+            self._cache_stats.misses += 1
+            self._picture = self._record_picture()
+            self._dimensions = self._annotator.compute_dimensions(self._shape_data, self._draw_rect())
+        else:
+            self._cache_stats.hits += 1
+            
+        # 以组件中心为基准缩放并平移后回放缓存的图形
+        center = QPointF(self.width() / 2, self.height() / 2)
+        transform = QTransform()
+        transform.translate(center.x() + self._offset.x(), center.y() + self._offset.y())
+        transform.scale(self._scale_factor, self._scale_factor)
+        transform.translate(-center.x(), -center.y())
+        painter.setTransform(transform)
+        painter.drawPicture(0, 0, self._picture)
+        
+        # 尺寸标注在屏幕坐标中绘制，锚点跟随变换后的截面，文字大小和线宽不随缩放变化
+        painter.resetTransform()
+        self._annotator.paint_dimensions(painter, self._dimensions, transform)
+        
+    def _draw_rect(self):
+        """未缩放、未平移时的绘图区域"""
+        return QRectF(
+            self._margin,
+            self._margin,
+            self.width() - 2 * self._margin,
+            self.height() - 2 * self._margin
+        )
         
-        # 应用缩放和平移
-        painter.translate(self._offset)
-        painter.scale(self._scale_factor, self._scale_factor)
+    def _record_picture(self):
+        """录制截面形状
         
-        # 获取绘图区域
-        draw_rect = QRectF(
-            self._margin / self._scale_factor,
-            self._margin / self._scale_factor,
-            (self.width() - 2 * self._margin) / self._scale_factor,
-            (self.height() - 2 * self._margin) / self._scale_factor
-        )
+        Returns:
+            QPicture: 未缩放、未平移的截面形状
+        """
+        picture = QPicture()
+        painter = QPainter(picture)
+        painter.setRenderHint(QPainter.Antialiasing)
         
         # 绘制截面形状
-        self._draw_section_shape(painter, draw_rect)
-        
-        # 绘制尺寸标注
-        self._draw_dimensions(painter, draw_rect)
+        self._draw_section_shape(painter, self._draw_rect())
         
-        # 恢复绘图状态
-        painter.restore()
+        painter.end()
+        return picture
         
     def _draw_no_data(self, painter):
         """绘制无数据提示"""
@@ -106,176 +156,7 @@ class SectionDiagram(QWidget):
             painter: QPainter对象
             draw_rect: 绘图区域
         """
-        shape_type = self._shape_data.get("类型", "")
-        
-        if shape_type == "工字钢" or shape_type == "H型钢":
-            self._draw_i_shape(painter, draw_rect)
-        elif shape_type == "槽钢":
-            self._draw_channel_shape(painter, draw_rect)
-        elif shape_type == "角钢":
-            self._draw_angle_shape(painter, draw_rect)
-        elif shape_type == "圆钢":
-            self._draw_circle_shape(painter, draw_rect)
-        elif shape_type == "方钢":
-            self._draw_square_shape(painter, draw_rect)
-        else:
-            # 默认绘制矩形
-            self._draw_rectangle_shape(painter, draw_rect)
-            
-    def _draw_i_shape(self, painter, draw_rect):
-        """绘制工字钢/H型钢截面"""
-        h = self._shape_data.get("高度H", 100)
-        b = self._shape_data.get("宽度B", 50)
-        t1 = self._shape_data.get("腹板厚度t1", 5)
-        t2 = self._shape_data.get("翼缘厚度t2", 8)
-        
-        # 计算缩放比例
-        max_size = max(h, b)
-        scale = min(draw_rect.width() / max_size, draw_rect.height() / max_size) * 0.8
-        
-        # 计算中心点
-        center_x = draw_rect.center().x()
-        center_y = draw_rect.center().y()
-        
-        # 绘制截面
-        path = QPainterPath()
-        
-        # 上翼缘
-        path.addRect(center_x - b * scale / 2, center_y - h * scale / 2, b * scale, t2 * scale)
-        
-        # 下翼缘
-        path.addRect(center_x - b * scale / 2, center_y + h * scale / 2 - t2 * scale, b * scale, t2 * scale)
-        
-        # 腹板
-        path.addRect(center_x - t1 * scale / 2, center_y - h * scale / 2 + t2 * scale, t1 * scale, h * scale - 2 * t2 * scale)
-        
-        # 填充颜色
-        painter.fillPath(path, QBrush(QColor(200, 200, 255, 180)))
-        
-        # 绘制轮廓
-        painter.setPen(QPen(QColor(0, 0, 0), 2))
-        painter.drawPath(path)
-        
-    def _draw_channel_shape(self, painter, draw_rect):
-        """绘制槽钢截面"""
-        h = self._shape_data.get("高度H", 100)
-        b = self._shape_data.get("宽度B", 50)
-        t1 = self._shape_data.get("腹板厚度t1", 5)
-        t2 = self._shape_data.get("翼缘厚度t2", 8)
-        
-        # 计算缩放比例
-        max_size = max(h, b)
-        scale = min(draw_rect.width() / max_size, draw_rect.height() / max_size) * 0.8
-        
-        # 计算中心点
-        center_x = draw_rect.center().x()
-        center_y = draw_rect.center().y()
-        
-        # 绘制截面
-        path = QPainterPath()
-        
-        # 腹板
-        path.addRect(center_x - t1 * scale / 2, center_y - h * scale / 2, t1 * scale, h * scale)
-        
-        # 上翼缘
-        path.addRect(center_x + t1 * scale / 2, center_y - h * scale / 2, (b - t1) * scale, t2 * scale)
-        
-        # 下翼缘
-        path.addRect(center_x + t1 * scale / 2, center_y + h * scale / 2 - t2 * scale, (b - t1) * scale, t2 * scale)
-        
-        # 填充颜色
-        painter.fillPath(path, QBrush(QColor(255, 200, 200, 180)))
-        
-        # 绘制轮廓
-        painter.setPen(QPen(QColor(0, 0, 0), 2))
-        painter.drawPath(path)
-        
-    def _draw_angle_shape(self, painter, draw_rect):
-        """绘制角钢截面"""
-        h = self._shape_data.get("高度H", 100)
-        b = self._shape_data.get("宽度B", 100)
-        t = self._shape_data.get("厚度t", 10)
-        
-        # 计算缩放比例
-        max_size = max(h, b)
-        scale = min(draw_rect.width() / max_size, draw_rect.height() / max_size) * 0.8
-        
-        # 计算中心点
-        center_x = draw_rect.center().x()
-        center_y = draw_rect.center().y()
-        
-        # 绘制截面
-        path = QPainterPath()
-        
-        # 外轮廓
-        path.moveTo(center_x - b * scale / 2, center_y - h * scale / 2)
-        path.lineTo(center_x + b * scale / 2, center_y - h * scale / 2)
-        path.lineTo(center_x + b * scale / 2, center_y - h * scale / 2 + t * scale)
-        path.lineTo(center_x - b * scale / 2 + t * scale, center_y - h * scale / 2 + t * scale)
-        path.lineTo(center_x - b * scale / 2 + t * scale, center_y + h * scale / 2 - t * scale)
-        path.lineTo(center_x - b * scale / 2, center_y + h * scale / 2 - t * scale)
-        path.lineTo(center_x - b * scale / 2, center_y - h * scale / 2)
-        
-        # 填充颜色
-        painter.fillPath(path, QBrush(QColor(200, 255, 200, 180)))
-        
-        # 绘制轮廓
-        painter.setPen(QPen(QColor(0, 0, 0), 2))
-        painter.drawPath(path)
-        
-    def _draw_circle_shape(self, painter, draw_rect):
-        """绘制圆钢截面"""
-        d = self._shape_data.get("直径D", 50)
-        
-        # 计算缩放比例
-        scale = min(draw_rect.width() / d, draw_rect.height() / d) * 0.8
-        
-        # 计算中心点
-        center_x = draw_rect.center().x()
-        center_y = draw_rect.center().y()
-        
-        # 绘制圆形
-        painter.setBrush(QBrush(QColor(255, 255, 200, 180)))
-        painter.setPen(QPen(QColor(0, 0, 0), 2))
-        painter.drawEllipse(center_x - d * scale / 2, center_y - d * scale / 2, d * scale, d * scale)
-        
-    def _draw_square_shape(self, painter, draw_rect):
-        """绘制方钢截面"""
-        a = self._shape_data.get("边长A", 50)
-        
-        # 计算缩放比例
-        scale = min(draw_rect.width() / a, draw_rect.height() / a) * 0.8
-        
-        # 计算中心点
-        center_x = draw_rect.center().x()
-        center_y = draw_rect.center().y()
-        
-        # 绘制方形
-        painter.setBrush(QBrush(QColor(200, 255, 255, 180)))
-        painter.setPen(QPen(QColor(0, 0, 0), 2))
-        painter.drawRect(center_x - a * scale / 2, center_y - a * scale / 2, a * scale, a * scale)
-        
-    def _draw_rectangle_shape(self, painter, draw_rect):
-        """绘制矩形截面（默认）"""
-        h = self._shape_data.get("高度H", 100)
-        b = self._shape_data.get("宽度B", 50)
-        
-        # 计算缩放比例
-        scale = min(draw_rect.width() / b, draw_rect.height() / h) * 0.8
-        
-        # 计算中心点
-        center_x = draw_rect.center().x()
-        center_y = draw_rect.center().y()
-        
-        # 绘制矩形
-        painter.setBrush(QBrush(QColor(240, 240, 240, 180)))
-        painter.setPen(QPen(QColor(0, 0, 0), 2))
-        painter.drawRect(center_x - b * scale / 2, center_y - h * scale / 2, b * scale, h * scale)
-        
-    def _draw_dimensions(self, painter, draw_rect):
-        """绘制尺寸标注"""
-        if self._shape_data and self._annotator:
-            self._annotator.draw_dimensions(painter, self._shape_data, draw_rect, self._scale_factor)
+        draw_section_shape(painter, self._shape_data, draw_rect)
         
     def wheelEvent(self, event):
         """鼠标滚轮事件，用于缩放"""
@@ -312,4 +193,195 @@ class SectionDiagram(QWidget):
     def mouseReleaseEvent(self, event):
         """鼠标释放事件"""
         if event.button() == Qt.LeftButton:
-            self._last_mouse_pos = None
\ No newline at end of file
+            self._last_mouse_pos = None
+
+
+def draw_section_shape(painter, shape_data, draw_rect, line_width=2):
+    """绘制截面形状（不含尺寸标注），截面图和缩略图共用
+
+    只通过传入的 painter 绘制，可以在工作线程中绘制到 QImage
+
+    Args:
+        painter: QPainter对象
+        shape_data: 截面记录（SectionRecord）或型钢数据字典，通过 get() 读取截面参数
+        draw_rect: 绘图区域
+        line_width: 轮廓线宽
+    """
+    shape_type = shape_data.get("类型", "")
+
+    if shape_type == "工字钢" or shape_type == "H型钢":
+        _draw_i_shape(painter, shape_data, draw_rect, line_width)
+    elif shape_type == "槽钢":
+        _draw_channel_shape(painter, shape_data, draw_rect, line_width)
+    elif shape_type == "角钢":
+        _draw_angle_shape(painter, shape_data, draw_rect, line_width)
+    elif shape_type == "圆钢":
+        _draw_circle_shape(painter, shape_data, draw_rect, line_width)
+    elif shape_type == "方钢":
+        _draw_square_shape(painter, shape_data, draw_rect, line_width)
+    else:
+        # 默认绘制矩形
+        _draw_rectangle_shape(painter, shape_data, draw_rect, line_width)
+
+
+def _outline_pen(line_width):
+    """截面轮廓画笔（cosmetic：线宽为设备像素，回放缓存图形时不随缩放变化）"""
+    pen = QPen(QColor(0, 0, 0), line_width)
+    pen.setCosmetic(True)
+    return pen
+
+
+def _draw_i_shape(painter, shape_data, draw_rect, line_width):
+    """绘制工字钢/H型钢截面"""
+    h = shape_data.get("高度H", 100)
+    b = shape_data.get("宽度B", 50)
+    t1 = shape_data.get("腹板厚度t1", 5)
+    t2 = shape_data.get("翼缘厚度t2", 8)
+
+    # 计算缩放比例
+    max_size = max(h, b)
+    scale = min(draw_rect.width() / max_size, draw_rect.height() / max_size) * 0.8
+
+    # 计算中心点
+    center_x = draw_rect.center().x()
+    center_y = draw_rect.center().y()
+
+    # 绘制截面
+    path = QPainterPath()
+
+    # 上翼缘
+    path.addRect(center_x - b * scale / 2, center_y - h * scale / 2, b * scale, t2 * scale)
+
+    # 下翼缘
+    path.addRect(center_x - b * scale / 2, center_y + h * scale / 2 - t2 * scale, b * scale, t2 * scale)
+
+    # 腹板
+    path.addRect(center_x - t1 * scale / 2, center_y - h * scale / 2 + t2 * scale, t1 * scale, h * scale - 2 * t2 * scale)
+
+    # 填充颜色
+    painter.fillPath(path, QBrush(QColor(200, 200, 255, 180)))
+
+    # 绘制轮廓
+    painter.setPen(_outline_pen(line_width))
+    painter.drawPath(path)
+
+
+def _draw_channel_shape(painter, shape_data, draw_rect, line_width):
+    """绘制槽钢截面"""
+    h = shape_data.get("高度H", 100)
+    b = shape_data.get("宽度B", 50)
+    t1 = shape_data.get("腹板厚度t1", 5)
+    t2 = shape_data.get("翼缘厚度t2", 8)
+
+    # 计算缩放比例
+    max_size = max(h, b)
+    scale = min(draw_rect.width() / max_size, draw_rect.height() / max_size) * 0.8
+
+    # 计算中心点
+    center_x = draw_rect.center().x()
+    center_y = draw_rect.center().y()
+
+    # 绘制截面
+    path = QPainterPath()
+
+    # 腹板
+    path.addRect(center_x - t1 * scale / 2, center_y - h * scale / 2, t1 * scale, h * scale)
+
+    # 上翼缘
+    path.addRect(center_x + t1 * scale / 2, center_y - h * scale / 2, (b - t1) * scale, t2 * scale)
+
+    # 下翼缘
+    path.addRect(center_x + t1 * scale / 2, center_y + h * scale / 2 - t2 * scale, (b - t1) * scale, t2 * scale)
+
+    # 填充颜色
+    painter.fillPath(path, QBrush(QColor(255, 200, 200, 180)))
+
+    # 绘制轮廓
+    painter.setPen(_outline_pen(line_width))
+    painter.drawPath(path)
+
+
+def _draw_angle_shape(painter, shape_data, draw_rect, line_width):
+    """绘制角钢截面"""
+    h = shape_data.get("高度H", 100)
+    b = shape_data.get("宽度B", 100)
+    t = shape_data.get("厚度t", 10)
+
+    # 计算缩放比例
+    max_size = max(h, b)
+    scale = min(draw_rect.width() / max_size, draw_rect.height() / max_size) * 0.8
+
+    # 计算中心点
+    center_x = draw_rect.center().x()
+    center_y = draw_rect.center().y()
+
+    # 绘制截面
+    path = QPainterPath()
+
+    # 外轮廓
+    path.moveTo(center_x - b * scale / 2, center_y - h * scale / 2)
+    path.lineTo(center_x + b * scale / 2, center_y - h * scale / 2)
+    path.lineTo(center_x + b * scale / 2, center_y - h * scale / 2 + t * scale)
+    path.lineTo(center_x - b * scale / 2 + t * scale, center_y - h * scale / 2 + t * scale)
+    path.lineTo(center_x - b * scale / 2 + t * scale, center_y + h * scale / 2 - t * scale)
+    path.lineTo(center_x - b * scale / 2, center_y + h * scale / 2 - t * scale)
+    path.lineTo(center_x - b * scale / 2, center_y - h * scale / 2)
+
+    # 填充颜色
+    painter.fillPath(path, QBrush(QColor(200, 255, 200, 180)))
+
+    # 绘制轮廓
+    painter.setPen(_outline_pen(line_width))
+    painter.drawPath(path)
+
+
+def _draw_circle_shape(painter, shape_data, draw_rect, line_width):
+    """绘制圆钢截面"""
+    d = shape_data.get("直径D", 50)
+
+    # 计算缩放比例
+    scale = min(draw_rect.width() / d, draw_rect.height() / d) * 0.8
+
+    # 计算中心点
+    center_x = draw_rect.center().x()
+    center_y = draw_rect.center().y()
+
+    # 绘制圆形
+    painter.setBrush(QBrush(QColor(255, 255, 200, 180)))
+    painter.setPen(_outline_pen(line_width))
+    painter.drawEllipse(center_x - d * scale / 2, center_y - d * scale / 2, d * scale, d * scale)
+
+
+def _draw_square_shape(painter, shape_data, draw_rect, line_width):
+    """绘制方钢截面"""
+    a = shape_data.get("边长A", 50)
+
+    # 计算缩放比例
+    scale = min(draw_rect.width() / a, draw_rect.height() / a) * 0.8
+
+    # 计算中心点
+    center_x = draw_rect.center().x()
+    center_y = draw_rect.center().y()
+
+    # 绘制方形
+    painter.setBrush(QBrush(QColor(200, 255, 255, 180)))
+    painter.setPen(_outline_pen(line_width))
+    painter.drawRect(center_x - a * scale / 2, center_y - a * scale / 2, a * scale, a * scale)
+
+
+def _draw_rectangle_shape(painter, shape_data, draw_rect, line_width):
+    """绘制矩形截面（默认）"""
+    h = shape_data.get("高度H", 100)
+    b = shape_data.get("宽度B", 50)
+
+    # 计算缩放比例
+    scale = min(draw_rect.width() / b, draw_rect.height() / h) * 0.8
+
+    # 计算中心点
+    center_x = draw_rect.center().x()
+    center_y = draw_rect.center().y()
+
+    # 绘制矩形
+    painter.setBrush(QBrush(QColor(240, 240, 240, 180)))
+    painter.setPen(_outline_pen(line_width))
+    painter.drawRect(center_x - b * scale / 2, center_y - h * scale / 2, b * scale, h * scale)
@@ -0,0 +1,175 @@
+"""型钢特性表数据模型"""
+
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, QSortFilterProxyModel, Qt
+
+from plugins.Steel_Shape_Table.table_config import get_table_config
+
+
+class SectionTableModel(QAbstractTableModel):
+    """型钢特性表数据模型
+
+    直接引用目录查询结果的列数组，单元格文本在 data() 中按需格式化，
+    切换型钢类型只需替换数组引用，不创建任何表格项
+    """
+
+    # 排序角色：返回原始数值，使排序按数值而不是文本进行
+    SortRole = Qt.ItemDataRole.UserRole
+
+    _ROLES = (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.TextAlignmentRole, SortRole)
+    _ALIGN_RIGHT = int(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+
+    def __init__(self, parent=None):
+        """初始化数据模型
+
+        Args:
+            parent: 父对象
+        """
+        super().__init__(parent)
+        self._shape_type = ""
+        self._result = None
+        self._column_config = []
+        self._names = []
+        # 每列的数值列表（型号列和缺失列为None）和格式字符串
+        self._values = []
+        self._formats = []
+
+    @property
+    def shape_type(self) -> str:
+        """当前型钢类型"""
+        return self._shape_type
+
+    @property
+    def result(self):
+        """当前目录查询结果"""
+        return self._result
+
+    def set_result(self, shape_type: str, result):
+        """设置显示的查询结果
+
+        Args:
+            shape_type: 型钢类型
+            result: 目录查询结果（CatalogResult）
+        """
+        self.beginResetModel()
+        self._shape_type = shape_type
+        self._result = result
+        self._column_config = get_table_config(shape_type)[0] or []
+        # 转换为Python列表：data() 调用频繁，逐个读取numpy标量较慢
+        self._names = result.names.tolist() if result is not None else []
+        self._values = []
+        self._formats = []
+        for field, _, fmt in self._column_config:
+            values = result.column(field) if fmt != 's' and result is not None else None
+            self._values.append(values.tolist() if values is not None else None)
+            self._formats.append("{:" + fmt + "}")
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        """行数"""
+        return 0 if parent.isValid() else len(self._names)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        """列数"""
+        return 0 if parent.isValid() else len(self._column_config)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        """单元格数据
+
+        Args:
+            index: 单元格索引
+            role: 数据角色
+
+        Returns:
+            显示文本、对齐方式或排序值
+        """
+        if role not in self._ROLES or not index.isValid():
+            return None
+
+        column = index.column()
+        values = self._values[column]
+
+        if values is None:
+            if self._column_config[column][2] == 's' and role != Qt.ItemDataRole.TextAlignmentRole:
+                return self._names[index.row()]
+            return None
+
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            return self._ALIGN_RIGHT
+
+        value = values[index.row()]
+        # 空值（NaN）不显示，排序值为None（由代理排在最后）
+        if value != value:
+            return None
+        if role == self.SortRole:
+            return value
+        return self._formats[column].format(value)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        """表头文本"""
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            if 0 <= section < len(self._column_config):
+                return self._column_config[section][1]
+            return None
+        return section + 1
+
+    def record(self, row: int):
+        """获取一行的截面记录（用于截面形状图）
+
+        Args:
+            row: 模型中的行号
+
+        Returns:
+            SectionRecord: 截面记录
+        """
+        return self._result.record(row)
+
+
+class SectionFilterProxyModel(QSortFilterProxyModel):
+    """型钢特性表排序过滤代理
+
+    按数值排序，空值无论升序还是降序都排在最后；过滤使用目录搜索得到的行掩码，
+    修改关键词时只需重新过滤，不重建源模型
+    """
+
+    def __init__(self, parent=None):
+        """初始化代理模型
+
+        Args:
+            parent: 父对象
+        """
+        super().__init__(parent)
+        self._row_mask = None
+        self.setSortRole(SectionTableModel.SortRole)
+
+    def set_row_mask(self, mask):
+        """设置行过滤掩码
+
+        Args:
+            mask: 与源模型行数相同的布尔数组，为None时显示所有行
+        """
+        self._row_mask = mask.tolist() if mask is not None else None
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row, source_parent) -> bool:
+        """判断源模型的行是否显示"""
+        mask = self._row_mask
+        return mask is None or source_row >= len(mask) or mask[source_row]
+
+    def lessThan(self, left, right) -> bool:
+        """比较两行的排序值（空值在升序时视为最大，降序时视为最小，始终排在最后）"""
+        left_value = left.data(self.sortRole())
+        right_value = right.data(self.sortRole())
+        if left_value is None or right_value is None:
+            if left_value is None and right_value is None:
+                return False
+            descending = self.sortOrder() == Qt.SortOrder.DescendingOrder
+            return (left_value is None) == descending
+        return left_value < right_value
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        """表头文本（行号按显示顺序连续编号）"""
+        if orientation == Qt.Orientation.Vertical and role == Qt.ItemDataRole.DisplayRole:
+            return section + 1
+        return super().headerData(section, orientation, role)
@@ -0,0 +1,266 @@
+"""型钢截面缩略图图集和缩略图浏览视图"""
+
+import zlib
+
+from PySide6.QtCore import QRect, QRectF, QSize, Qt, Signal
+from PySide6.QtGui import QColor, QImage, QPainter, QPen, QPixmap
+from PySide6.QtWidgets import QListView, QStyle, QStyledItemDelegate
+
+from core.cache import DiskCache, get_cache
+from plugins.Steel_Shape_Table.ui.section_diagram import draw_section_shape
+
+
+# 缩略图单元格边长和截面图形的边距（像素）
+THUMBNAIL_SIZE = 72
+THUMBNAIL_MARGIN = 4
+# 图集的最大宽度（像素），超出后换行
+ATLAS_MAX_WIDTH = 2048
+# 缩略图下方型号文字的高度（像素）
+LABEL_HEIGHT = 18
+
+# 图集的像素格式：16位色足够显示缩略图；缓存时直接压缩像素数据，读取比PNG解码和重新绘制都快
+ATLAS_FORMAT = QImage.Format.Format_RGB16
+# 缓存像素数据的 zlib 压缩级别
+ATLAS_COMPRESSION = 1
+
+# 图集缓存的命名空间和版本（修改缩略图绘制逻辑后需递增版本）
+THUMBNAIL_CACHE_NAMESPACE = "section_thumbnails"
+THUMBNAIL_SPEC_VERSION = 1
+
+
+class ThumbnailAtlas:
+    """截面缩略图图集
+
+    一种型钢类型的全部缩略图按目录顺序逐行排布在一张图像中，
+    视图绘制时只从同一张图像中截取对应的区域
+    """
+
+    def __init__(self, shape_type: str, image: QImage, cell_size: int, columns: int, count: int):
+        """初始化图集
+
+        Args:
+            shape_type: 型钢类型
+            image: 图集图像
+            cell_size: 单元格边长（像素）
+            columns: 每行的单元格数
+            count: 缩略图数量
+        """
+        self.shape_type = shape_type
+        self.image = image
+        self.cell_size = cell_size
+        self.columns = columns
+        self.count = count
+        self._pixmap = None
+
+    def __len__(self):
+        return self.count
+
+    def source_rect(self, row: int) -> QRect:
+        """获取目录中第 row 行截面的缩略图在图集中的区域"""
+        return QRect((row % self.columns) * self.cell_size, (row // self.columns) * self.cell_size,
+                     self.cell_size, self.cell_size)
+
+    def pixmap(self) -> QPixmap:
+        """图集的 QPixmap（只能在主线程中调用，首次调用时由图像转换）"""
+        if self._pixmap is None:
+            self._pixmap = QPixmap.fromImage(self.image)
+        return self._pixmap
+
+    def to_bytes(self) -> dict:
+        """转换为可缓存的数据（压缩的像素数据）"""
+        return {
+            "shape_type": self.shape_type, "cell_size": self.cell_size, "columns": self.columns,
+            "count": self.count, "width": self.image.width(), "height": self.image.height(),
+            "bytes_per_line": self.image.bytesPerLine(),
+            "pixels": zlib.compress(bytes(self.image.constBits()), ATLAS_COMPRESSION),
+        }
+
+    @classmethod
+    def from_bytes(cls, data: dict) -> "ThumbnailAtlas":
+        """从缓存的数据还原图集"""
+        pixels = zlib.decompress(data["pixels"])
+        # QImage 不持有外部缓冲区，复制一份
+        image = QImage(pixels, data["width"], data["height"], data["bytes_per_line"], ATLAS_FORMAT).copy()
+        return cls(data["shape_type"], image, data["cell_size"], data["columns"], data["count"])
+
+
+def render_thumbnail_atlas(shape_type: str, records, cell_size: int = THUMBNAIL_SIZE) -> ThumbnailAtlas:
+    """将截面绘制为缩略图图集
+
+    只使用 QImage 和 QPainter，可以在工作线程中执行
+
+    Args:
+        shape_type: 型钢类型
+        records: 截面记录列表（SectionRecord）
+        cell_size: 单元格边长（像素）
+
+    Returns:
+        ThumbnailAtlas: 图集
+    """
+    count = len(records)
+    columns = max(1, min(count, ATLAS_MAX_WIDTH // cell_size))
+    rows = max(1, -(-count // columns))
+    image = QImage(columns * cell_size, rows * cell_size, ATLAS_FORMAT)
+    image.fill(Qt.GlobalColor.white)
+
+    painter = QPainter(image)
+    painter.setRenderHint(QPainter.Antialiasing)
+    inner = cell_size - 2 * THUMBNAIL_MARGIN
+    for row, record in enumerate(records):
+        x, y = (row % columns) * cell_size, (row // columns) * cell_size
+        draw_section_shape(painter, record, QRectF(x + THUMBNAIL_MARGIN, y + THUMBNAIL_MARGIN, inner, inner), 1)
+    painter.end()
+    return ThumbnailAtlas(shape_type, image, cell_size, columns, count)
+
+
+def load_thumbnail_atlas(catalog, shape_type: str, cell_size: int = THUMBNAIL_SIZE) -> ThumbnailAtlas:
+    """获取型钢类型的缩略图图集，按目录版本缓存在磁盘上
+
+    目录数据变化后版本改变，缓存自动失效
+
+    Args:
+        catalog: 型钢截面目录（SectionCatalog）
+        shape_type: 型钢类型
+        cell_size: 单元格边长（像素）
+
+    Returns:
+        ThumbnailAtlas: 图集
+    """
+    cache = get_cache()
+    key = DiskCache.make_key(catalog=catalog.version, shape_type=shape_type, cell_size=cell_size,
+                             version=THUMBNAIL_SPEC_VERSION)
+    data = cache.get(THUMBNAIL_CACHE_NAMESPACE, key)
+    if data is not None:
+        return ThumbnailAtlas.from_bytes(data)
+
+    atlas = render_thumbnail_atlas(shape_type, catalog.query(shape_type).records(), cell_size)
+    cache.set(THUMBNAIL_CACHE_NAMESPACE, key, atlas.to_bytes())
+    return atlas
+
+
+class SectionThumbnailDelegate(QStyledItemDelegate):
+    """缩略图绘制代理：从图集中截取缩略图，下方显示型号
+
+    视图的模型为型钢特性表的排序过滤代理，缩略图按源模型行号（即目录顺序）定位；
+    图集尚未生成时只显示型号
+    """
+
+    def __init__(self, parent=None):
+        """初始化绘制代理
+
+        Args:
+            parent: 父对象
+        """
+        super().__init__(parent)
+        self._atlas = None
+
+    @property
+    def atlas(self):
+        """当前图集"""
+        return self._atlas
+
+    def set_atlas(self, atlas):
+        """设置图集
+
+        Args:
+            atlas: 缩略图图集，为None时清除
+        """
+        self._atlas = atlas
+
+    def sizeHint(self, option, index) -> QSize:
+        """单元格大小"""
+        size = self._atlas.cell_size if self._atlas is not None else THUMBNAIL_SIZE
+        return QSize(size, size + LABEL_HEIGHT)
+
+    def paint(self, painter, option, index):
+        """绘制缩略图和型号"""
+        rect = option.rect
+        if option.state & QStyle.StateFlag.State_Selected:
+            painter.fillRect(rect, option.palette.highlight())
+
+        size = rect.width()
+        image_rect = QRect(rect.left(), rect.top(), size, rect.height() - LABEL_HEIGHT)
+        row = index.model().mapToSource(index).row()
+        if self._atlas is not None and 0 <= row < len(self._atlas):
+            painter.drawPixmap(image_rect, self._atlas.pixmap(), self._atlas.source_rect(row))
+        else:
+            painter.setPen(QPen(QColor(200, 200, 200)))
+            painter.drawRect(image_rect.adjusted(THUMBNAIL_MARGIN, THUMBNAIL_MARGIN,
+                                                 -THUMBNAIL_MARGIN, -THUMBNAIL_MARGIN))
+
+        label_rect = QRect(rect.left(), image_rect.bottom(), size, LABEL_HEIGHT)
+        text = option.fontMetrics.elidedText(str(index.data()), Qt.TextElideMode.ElideRight, size - 2)
+        if option.state & QStyle.StateFlag.State_Selected:
+            painter.setPen(option.palette.highlightedText().color())
+        else:
+            painter.setPen(option.palette.text().color())
+        painter.drawText(label_rect, Qt.AlignmentFlag.AlignCenter, text)
+
+
+class SectionThumbnailView(QListView):
+    """截面缩略图浏览视图
+
+    图标模式的列表，与型钢特性表共用排序过滤代理（显示型号列），
+    排序和关键词过滤与表格一致；单元格大小固定，按批布局，滚动时只绘制可见的单元格
+    """
+
+    # 选中缩略图时发出，参数为代理模型中的行号
+    row_selected = Signal(int)
+
+    def __init__(self, parent=None):
+        """初始化视图
+
+        Args:
+            parent: 父对象
+        """
+        super().__init__(parent)
+        self._delegate = SectionThumbnailDelegate(self)
+        self.setItemDelegate(self._delegate)
+        self.setViewMode(QListView.ViewMode.IconMode)
+        self.setMovement(QListView.Movement.Static)
+        self.setResizeMode(QListView.ResizeMode.Adjust)
+        self.setLayoutMode(QListView.LayoutMode.Batched)
+        self.setUniformItemSizes(True)
+        self.setSpacing(4)
+        self.setVerticalScrollMode(QListView.ScrollMode.ScrollPerPixel)
+        self.setSelectionMode(QListView.SelectionMode.SingleSelection)
+        self.setEditTriggers(QListView.EditTrigger.NoEditTriggers)
+
+    @property
+    def atlas(self):
+        """当前显示的图集"""
+        return self._delegate.atlas
+
+    def setModel(self, model):
+        """设置模型（型钢特性表的排序过滤代理）并连接选择信号"""
+        super().setModel(model)
+        self.selectionModel().currentChanged.connect(self._on_current_changed)
+
+    def set_atlas(self, atlas):
+        """设置图集并重绘
+
+        Args:
+            atlas: 缩略图图集，为None时只显示型号
+        """
+        self._delegate.set_atlas(atlas)
+        self.scheduleDelayedItemsLayout()
+        self.viewport().update()
+
+    def select_row(self, row: int):
+        """选中代理模型中的一行（不发出 row_selected）
+
+        Args:
+            row: 代理模型中的行号
+        """
+        index = self.model().index(row, 0)
+        if index == self.currentIndex():
+            return
+        self.blockSignals(True)
+        self.setCurrentIndex(index)
+        self.blockSignals(False)
+        self.scrollTo(index)
+
+    def _on_current_changed(self, current, previous):
+        """当前缩略图变化"""
+        if current.isValid():
+            self.row_selected.emit(current.row())
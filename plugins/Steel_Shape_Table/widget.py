@@ -1,5 +1,8 @@
 """型钢特性表插件UI组件"""
 
+import os
+
+import numpy as np
 from PySide6.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -9,18 +12,30 @@ from PySide6.QtWidgets import (
     QLineEdit,
     QTableWidget,
     QTableWidgetItem,
+    QTableView,
     QHeaderView,
     QPushButton,
     QMessageBox,
     QScrollArea,
     QSplitter,
-    QGroupBox
+    QGroupBox,
+    QGridLayout,
+    QFileDialog,
+    QInputDialog,
+    QTabWidget
 )
-from PySide6.QtCore import Signal, Slot, Qt
+from PySide6.QtCore import Signal, Slot, Qt, QTimer
+from PySide6.QtGui import QDoubleValidator
 
+from core.tasks import TaskPriority, get_scheduler
+from plugins.Steel_Shape_Table.capacity import BUCKLING_CURVES, STEEL_GRADES
+from plugins.Steel_Shape_Table.diagram_export import EXPORT_FORMATS, image_engine_error
+from plugins.Steel_Shape_Table.section_properties import DIAGRAM_TYPES, SECTION_KINDS, parse_candidates
 from plugins.Steel_Shape_Table.logic import SteelShapeLogic
 from plugins.Steel_Shape_Table.ui.section_diagram import SectionDiagram
-from plugins.Steel_Shape_Table.table_config import get_table_config
+from plugins.Steel_Shape_Table.ui.section_table_model import SectionFilterProxyModel, SectionTableModel
+from plugins.Steel_Shape_Table.ui.section_thumbnails import SectionThumbnailView
+from plugins.Steel_Shape_Table.table_config import CUSTOM_SECTION_COLUMNS, FINDER_PROPERTIES
 
 
 class SteelShapeTableWidget(QWidget):
@@ -29,6 +44,29 @@ class SteelShapeTableWidget(QWidget):
     # 定义信号：标签标题变化
     title_changed = Signal(str)
     
+    # 输入搜索关键词后延迟查询的时间（毫秒），连续输入时只查询最后一次
+    SEARCH_DEBOUNCE_MS = 150
+    
+    # 最轻截面查找的约束条件行数和结果数量
+    FINDER_CONDITION_COUNT = 3
+    FINDER_RESULT_LIMIT = 20
+    
+    # 自定义截面计算显示的结果数量
+    CUSTOM_RESULT_LIMIT = 200
+    
+    # 承载力筛选显示的结果数量和结果列：(字段, 标题, 格式)
+    CAPACITY_RESULT_LIMIT = 20
+    CAPACITY_COLUMNS = [
+        ("shape_type", "型钢类型", "s"),
+        ("model", "型号", "s"),
+        ("weight", "理论重量(kg/m)", ".2f"),
+        ("utilization", "应力比", ".3f"),
+        ("lambda_x", "λx", ".1f"),
+        ("lambda_y", "λy", ".1f"),
+        ("phi_x", "φx", ".3f"),
+        ("phi_y", "φy", ".3f"),
+    ]
+    
     def __init__(self):
         """初始化UI组件"""
         super().__init__()
@@ -39,6 +77,38 @@ class SteelShapeTableWidget(QWidget):
         # 初始化当前型钢类型（先初始化，避免在_load_shapes中使用时报错）
         self._current_shape_type = ""
         
+        # 正在执行的查询任务及其型钢类型、关键词
+        self._search_handle = None
+        self._pending_shape_type = ""
+        self._pending_keyword = ""
+        
+        # 输入防抖定时器
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(self.SEARCH_DEBOUNCE_MS)
+        
+        # 正在绘制的缩略图图集任务
+        self._thumbnail_handle = None
+        
+        # 型钢特性表各型钢类型的列宽 {型钢类型: [列宽]}，每种类型只测量一次
+        self._column_widths = {}
+        
+        # 正在执行的最轻截面查找任务
+        self._finder_handle = None
+        
+        # 正在执行的承载力筛选任务
+        self._capacity_handle = None
+        
+        # 正在执行的截面图导出任务
+        self._export_handle = None
+        self._takeoff_handle = None
+        self._equivalence_handle = None
+        
+        # 正在执行的自定义截面计算任务及其截面类型
+        self._custom_handle = None
+        self._custom_kind = ""
+        self._custom_rows = []
+        
         # 初始化UI
         self._init_ui()
         
@@ -93,26 +163,42 @@ class SteelShapeTableWidget(QWidget):
         
         left_layout.addLayout(search_layout)
         
-        # 型钢特性表
-        self._table_widget = QTableWidget()
-        self._table_widget.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)  # 表格不可编辑
-        self._table_widget.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)  # 选中整行
-        self._table_widget.setSelectionMode(QTableWidget.SelectionMode.SingleSelection)  # 单选
+        # 型钢特性表：数据模型直接引用目录数组，代理负责排序和关键词过滤
+        self._table_model = SectionTableModel(self)
+        self._proxy_model = SectionFilterProxyModel(self)
+        self._proxy_model.setSourceModel(self._table_model)
+        
+        self._table_view = QTableView()
+        self._table_view.setModel(self._proxy_model)
+        self._table_view.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)  # 表格不可编辑
+        self._table_view.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)  # 选中整行
+        self._table_view.setSelectionMode(QTableView.SelectionMode.SingleSelection)  # 单选
+        
+        # 点击表头排序，初始保持数据库中的顺序
+        header = self._table_view.horizontalHeader()
+        header.setSortIndicator(-1, Qt.SortOrder.AscendingOrder)
+        self._table_view.setSortingEnabled(True)
         
-        # 设置表格标题
-        self._table_widget.setColumnCount(17)
-        self._table_widget.setHorizontalHeaderLabels([
-            "型号", "高度H(mm)", "宽度B(mm)", "腹板厚度t1(mm)", "翼缘厚度t2(mm)",
-            "圆角半径r(mm)", "内圆角半径r'(mm)", "截面面积(cm²)", "理论重量(kg/m)", 
-            "表面积(m²/m)", "惯性矩Ix(cm⁴)", "惯性矩Iy(cm⁴)", "惯性半径rx(cm)", 
-            "惯性半径ry(cm)", "截面模量Wx(cm³)", "截面模量Wy(cm³)"
-        ])
+        # 列宽可手动调整；每种型钢类型首次显示时按前若干行测量一次并缓存（见 _apply_column_widths），
+        # 不在每次模型重置时重新测量所有列
+        header.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+        header.setResizeContentsPrecision(50)
         
-        # 设置表头自适应
-        header = self._table_widget.horizontalHeader()
-        header.setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
+        # 缩略图浏览：与表格共用排序过滤代理，缩略图由后台任务绘制成一张图集
+        self._thumbnail_view = SectionThumbnailView()
+        self._thumbnail_view.setModel(self._proxy_model)
         
-        left_layout.addWidget(self._table_widget)
+        browse_tab = QTabWidget()
+        browse_tab.addTab(self._table_view, "表格")
+        browse_tab.addTab(self._thumbnail_view, "缩略图")
+        left_layout.addWidget(browse_tab, 1)
+        
+        # 最轻截面查找和自定义截面计算区域（分页显示，避免挤占型钢特性表）
+        tools_tab = QTabWidget()
+        tools_tab.addTab(self._create_finder_group(shape_types), "最轻截面查找")
+        tools_tab.addTab(self._create_custom_section_group(), "自定义截面")
+        tools_tab.addTab(self._create_capacity_group(shape_types), "承载力筛选")
+        left_layout.addWidget(tools_tab)
         
         # 右侧：截面形状绘图区域
         right_widget = QWidget()
@@ -148,6 +234,18 @@ class SteelShapeTableWidget(QWidget):
         control_layout.addWidget(zoom_out_btn)
         
         control_layout.addStretch()
+        
+        # 批量导出截面图
+        self._export_btn = QPushButton("导出截面图...")
+        control_layout.addWidget(self._export_btn)
+        
+        # 按构件清单统计材料
+        self._takeoff_btn = QPushButton("材料统计...")
+        control_layout.addWidget(self._takeoff_btn)
+        
+        # 新旧H型钢等效截面对照
+        self._equivalence_btn = QPushButton("新旧型钢对照...")
+        control_layout.addWidget(self._equivalence_btn)
         right_layout.addLayout(control_layout)
         
         # 添加提示信息
@@ -171,27 +269,252 @@ class SteelShapeTableWidget(QWidget):
         # 初始化表格数据
         self._load_shapes()
     
+    def _create_finder_group(self, shape_types):
+        """创建最轻截面查找区域
+
+        Args:
+            shape_types: 型钢类型列表
+
+        Returns:
+            QGroupBox: 查找区域
+        """
+        group = QGroupBox("最轻截面查找")
+        group_layout = QVBoxLayout(group)
+
+        # 约束条件：属性 ≥ 最小值，≤ 最大值（属性下拉框可直接输入其他字段名）
+        condition_layout = QGridLayout()
+        self._finder_conditions = []
+        for i in range(self.FINDER_CONDITION_COUNT):
+            property_combo = QComboBox()
+            property_combo.setEditable(True)
+            property_combo.addItem("（不限）", None)
+            for field, title in FINDER_PROPERTIES:
+                property_combo.addItem(title, field)
+
+            min_edit = QLineEdit()
+            min_edit.setPlaceholderText("最小值")
+            min_edit.setValidator(QDoubleValidator())
+            max_edit = QLineEdit()
+            max_edit.setPlaceholderText("最大值")
+            max_edit.setValidator(QDoubleValidator())
+
+            condition_layout.addWidget(property_combo, i, 0)
+            condition_layout.addWidget(QLabel("≥"), i, 1)
+            condition_layout.addWidget(min_edit, i, 2)
+            condition_layout.addWidget(QLabel("≤"), i, 3)
+            condition_layout.addWidget(max_edit, i, 4)
+            self._finder_conditions.append((property_combo, min_edit, max_edit))
+        condition_layout.setColumnStretch(0, 2)
+        condition_layout.setColumnStretch(2, 1)
+        condition_layout.setColumnStretch(4, 1)
+        group_layout.addLayout(condition_layout)
+
+        # 查找范围和按钮
+        scope_layout = QHBoxLayout()
+        scope_layout.addWidget(QLabel("查找范围："))
+        self._finder_scope_combo = QComboBox()
+        self._finder_scope_combo.addItem("全部类型")
+        self._finder_scope_combo.addItems(shape_types)
+        scope_layout.addWidget(self._finder_scope_combo)
+        self._finder_btn = QPushButton("查找最轻截面")
+        scope_layout.addWidget(self._finder_btn)
+        self._finder_status_label = QLabel()
+        self._finder_status_label.setStyleSheet("color: #666;")
+        scope_layout.addWidget(self._finder_status_label)
+        scope_layout.addStretch()
+        group_layout.addLayout(scope_layout)
+
+        # 查找结果（双击跳转到对应型号）
+        self._finder_table = QTableWidget()
+        self._finder_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self._finder_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        self._finder_table.setSelectionMode(QTableWidget.SelectionMode.SingleSelection)
+        self._finder_table.setColumnCount(4)
+        self._finder_table.setHorizontalHeaderLabels(["型钢类型", "型号", "理论重量(kg/m)", "约束属性"])
+        self._finder_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+        self._finder_table.horizontalHeader().setStretchLastSection(True)
+        self._finder_table.setMaximumHeight(180)
+        group_layout.addWidget(self._finder_table)
+
+        return group
+
+    def _create_custom_section_group(self):
+        """创建自定义截面计算区域
+
+        Returns:
+            QGroupBox: 计算区域
+        """
+        group = QGroupBox("自定义截面")
+        group_layout = QVBoxLayout(group)
+
+        # 截面类型和候选尺寸（逗号分隔多个值，或 起始:终止:步长）
+        input_layout = QGridLayout()
+        input_layout.addWidget(QLabel("截面类型："), 0, 0)
+        self._custom_kind_combo = QComboBox()
+        self._custom_kind_combo.addItems(list(SECTION_KINDS))
+        input_layout.addWidget(self._custom_kind_combo, 0, 1)
+
+        self._custom_edits = {}
+        dimensions = [
+            ("height", "H(mm)", "300"),
+            ("width", "B(mm)", "200"),
+            ("web_thickness", "t1(mm)", "8"),
+            ("flange_thickness", "t2(mm)", "12"),
+            ("fillet_radius", "r(mm)", "0"),
+        ]
+        for i, (field, title, default) in enumerate(dimensions):
+            row, column = 1 + i // 3, (i % 3) * 2
+            edit = QLineEdit(default)
+            edit.setPlaceholderText("如 200,250 或 200:400:50")
+            input_layout.addWidget(QLabel(title), row, column)
+            input_layout.addWidget(edit, row, column + 1)
+            self._custom_edits[field] = edit
+
+        self._custom_btn = QPushButton("计算")
+        input_layout.addWidget(self._custom_btn, 2, 4)
+        self._custom_status_label = QLabel()
+        self._custom_status_label.setStyleSheet("color: #666;")
+        input_layout.addWidget(self._custom_status_label, 2, 5)
+        group_layout.addLayout(input_layout)
+
+        # 计算结果（按理论重量排序，选中后显示截面形状）
+        self._custom_table = QTableWidget()
+        self._custom_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self._custom_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        self._custom_table.setSelectionMode(QTableWidget.SelectionMode.SingleSelection)
+        self._custom_table.setColumnCount(len(CUSTOM_SECTION_COLUMNS))
+        self._custom_table.setHorizontalHeaderLabels([title for _, title, _ in CUSTOM_SECTION_COLUMNS])
+        self._custom_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+        self._custom_table.setMaximumHeight(180)
+        group_layout.addWidget(self._custom_table)
+
+        return group
+
+    def _create_capacity_group(self, shape_types):
+        """创建构件承载力筛选区域
+
+        Args:
+            shape_types: 型钢类型列表
+
+        Returns:
+            QGroupBox: 筛选区域
+        """
+        group = QGroupBox("承载力筛选")
+        group_layout = QVBoxLayout(group)
+
+        # 构件内力和计算长度
+        input_layout = QGridLayout()
+        self._capacity_edits = {}
+        loads = [
+            ("axial", "N(kN，压为正)", "500"),
+            ("moment_x", "Mx(kN·m)", "50"),
+            ("moment_y", "My(kN·m)", "0"),
+            ("length_x", "l0x(m)", "6"),
+            ("length_y", "l0y(m)", "3"),
+        ]
+        for i, (field, title, default) in enumerate(loads):
+            row, column = i // 3, (i % 3) * 2
+            edit = QLineEdit(default)
+            edit.setValidator(QDoubleValidator())
+            input_layout.addWidget(QLabel(title), row, column)
+            input_layout.addWidget(edit, row, column + 1)
+            self._capacity_edits[field] = edit
+
+        # 钢材牌号、稳定系数截面分类和筛选范围
+        self._capacity_grade_combo = QComboBox()
+        self._capacity_grade_combo.addItems(list(STEEL_GRADES))
+        self._capacity_curve_combo = QComboBox()
+        self._capacity_curve_combo.addItems([f"{curve}类" for curve in BUCKLING_CURVES])
+        self._capacity_curve_combo.setCurrentIndex(list(BUCKLING_CURVES).index("b"))
+        input_layout.addWidget(QLabel("钢材："), 2, 0)
+        input_layout.addWidget(self._capacity_grade_combo, 2, 1)
+        input_layout.addWidget(QLabel("截面分类："), 2, 2)
+        input_layout.addWidget(self._capacity_curve_combo, 2, 3)
+        group_layout.addLayout(input_layout)
+
+        scope_layout = QHBoxLayout()
+        scope_layout.addWidget(QLabel("筛选范围："))
+        self._capacity_scope_combo = QComboBox()
+        self._capacity_scope_combo.addItem("全部类型")
+        self._capacity_scope_combo.addItems(shape_types)
+        scope_layout.addWidget(self._capacity_scope_combo)
+        self._capacity_btn = QPushButton("筛选")
+        scope_layout.addWidget(self._capacity_btn)
+        self._capacity_status_label = QLabel()
+        self._capacity_status_label.setStyleSheet("color: #666;")
+        scope_layout.addWidget(self._capacity_status_label)
+        scope_layout.addStretch()
+        group_layout.addLayout(scope_layout)
+
+        # 筛选结果（按理论重量排序，双击跳转到对应型号）
+        self._capacity_table = QTableWidget()
+        self._capacity_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self._capacity_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        self._capacity_table.setSelectionMode(QTableWidget.SelectionMode.SingleSelection)
+        self._capacity_table.setColumnCount(len(self.CAPACITY_COLUMNS))
+        self._capacity_table.setHorizontalHeaderLabels([title for _, title, _ in self.CAPACITY_COLUMNS])
+        self._capacity_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+        self._capacity_table.setMaximumHeight(180)
+        group_layout.addWidget(self._capacity_table)
+
+        return group
+
     def _connect_signals(self):
         """连接信号和槽"""
         # 连接类型选择变化信号
-        self._type_combo.currentTextChanged.connect(self._load_shapes)
+        self._type_combo.currentTextChanged.connect(lambda: self._load_shapes())
         
         # 连接搜索按钮点击信号
-        self._search_btn.clicked.connect(self._load_shapes)
+        self._search_btn.clicked.connect(self._submit_search)
         
         # 连接搜索框回车键信号
-        self._search_edit.returnPressed.connect(self._load_shapes)
+        self._search_edit.returnPressed.connect(self._submit_search)
+        
+        # 输入时防抖后自动搜索
+        self._search_edit.textChanged.connect(self._search_timer.start)
+        self._search_timer.timeout.connect(self._load_shapes)
         
         # 连接表格选择变化信号
-        self._table_widget.itemSelectionChanged.connect(self._on_table_selection_changed)
+        self._table_view.selectionModel().selectionChanged.connect(self._on_table_selection_changed)
+        
+        # 选中缩略图时选中表格中的同一行
+        self._thumbnail_view.row_selected.connect(self._table_view.selectRow)
+        
+        # 连接最轻截面查找信号
+        self._finder_btn.clicked.connect(self._find_lightest)
+        self._finder_table.cellDoubleClicked.connect(self._on_finder_result_activated)
+        
+        # 连接承载力筛选信号
+        self._capacity_btn.clicked.connect(self._screen_capacity)
+        self._capacity_table.cellDoubleClicked.connect(self._on_capacity_result_activated)
+        
+        # 连接自定义截面计算信号
+        self._custom_btn.clicked.connect(self._compute_custom_sections)
+        self._custom_table.itemSelectionChanged.connect(self._on_custom_selection_changed)
+        
+        # 连接截面图导出信号
+        self._export_btn.clicked.connect(self._export_diagrams)
+        
+        # 连接材料统计信号
+        self._takeoff_btn.clicked.connect(self._compute_takeoff)
+        self._equivalence_btn.clicked.connect(self._map_equivalent_sections)
         
         # 发出初始标题信号（延迟发出，确保界面已完全初始化）
-        from PySide6.QtCore import QTimer
         QTimer.singleShot(0, self._emit_initial_title)
     
     @Slot()
-    def _load_shapes(self):
-        """加载型钢数据到表格"""
+    def _submit_search(self):
+        """立即搜索（回车或点击搜索按钮），当前类型没有匹配时切换到匹配的类型"""
+        self._load_shapes(find_other_type=True)
+    
+    @Slot()
+    def _load_shapes(self, find_other_type=False):
+        """加载型钢数据到表格
+        
+        Args:
+            find_other_type: 当前类型没有匹配时是否切换到最匹配型号所在的类型
+        """
+        self._search_timer.stop()
         shape_type = self._type_combo.currentText()
         keyword = self._search_edit.text().strip()
         
@@ -201,115 +524,598 @@ class SteelShapeTableWidget(QWidget):
             # 发出标题变化信号
             self.title_changed.emit(f"{shape_type}型钢特性表")
         
-        # 获取型钢数据
-        shapes = self._logic.search_shapes(shape_type, keyword)
+        # 取消尚未完成的上一次查询，只显示最新一次的结果
+        if self._search_handle is not None:
+            self._search_handle.cancel()
+        
+        # 在后台任务中查询型钢数据，完成后填充表格
+        self._search_handle = get_scheduler().submit(
+            self._logic.search_shapes_in_type, args=(shape_type, keyword, find_other_type),
+            name="查询型钢数据", priority=TaskPriority.HIGH)
+        # 连接绑定方法而不是捕获 self 的 lambda，组件销毁后迟到的结果不会再调用槽函数
+        self._search_handle.succeeded.connect(self._on_shapes_loaded)
+        self._search_handle.failed.connect(self._on_shapes_load_failed)
+        self._pending_shape_type = shape_type
+        self._pending_keyword = keyword
+    
+    @Slot(object)
+    def _on_shapes_loaded(self, payload):
+        """查询完成，填充表格
         
-        # 清空表格
-        self._table_widget.setRowCount(0)
+        Args:
+            payload: (目录查询结果, 最匹配型号所在的其他型钢类型或None)
+        """
+        # 取消前已完成、结果仍在队列中的旧查询直接丢弃
+        if not self._is_current_result(self._search_handle):
+            return
+        self._search_handle = None
         
-        # 获取当前表类型的列配置
-        column_config, table_name = get_table_config(shape_type)
+        result, other_shape_type = payload
+        self._show_result(self._pending_shape_type, self._pending_keyword, result)
         
-        if column_config:
-            # 设置表格列数
-            self._table_widget.setColumnCount(len(column_config))
-            
-            # 设置表格标题
-            headers = [title for _, title, _ in column_config]
-            self._table_widget.setHorizontalHeaderLabels(headers)
-            
-            # 记录当前表类型（用于选择变化时提取数据）
-            self._current_table_name = table_name
+        # 当前类型中没有匹配的型号时，切换到最匹配型号所在的类型
+        if other_shape_type:
+            self._type_combo.setCurrentText(other_shape_type)
+    
+    @Slot(str)
+    def _on_shapes_load_failed(self, error):
+        """查询失败"""
+        if not self._is_current_result(self._search_handle):
+            return
+        self._search_handle = None
+        QMessageBox.warning(self, "错误", f"加载型钢数据失败：{error}")
+    
+    @staticmethod
+    def _is_current_result(handle) -> bool:
+        """判断收到的结果是否来自当前记录的任务
+        
+        任务先更新状态再发出结果信号，当前记录的任务尚未结束时，收到的是已被取代的旧任务的结果
+        
+        Args:
+            handle: 当前记录的任务句柄
             
-            # 添加数据到表格
-            for i, shape in enumerate(shapes):
-                self._table_widget.insertRow(i)
-                
-                # 填充数据
-                for col, (db_col, title, fmt) in enumerate(column_config):
-                    # 忽略大小写查找字段
-                    found_key = None
-                    for key in shape.keys():
-                        if key.lower() == db_col.lower():
-                            found_key = key
-                            break
-                    if found_key and shape[found_key] is not None:
-                        value = shape[found_key]
-                        if fmt == 's':
-                            item = QTableWidgetItem(str(value))
-                        else:
-                            # 使用 format 方法格式化数字
-                            format_str = "{:" + fmt + "}"
-                            formatted_value = format_str.format(value)
-                            item = QTableWidgetItem(formatted_value)
-                            item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-                        self._table_widget.setItem(i, col, item)
+        Returns:
+            bool: 结果来自该任务时返回True
+        """
+        return handle is not None and handle.is_done()
+    
+    def _show_result(self, shape_type, keyword, result):
+        """显示查询结果
+        
+        型钢类型变化时替换模型数据；关键词只改变代理的行掩码，不重建模型
+        
+        Args:
+            shape_type: 型钢类型
+            keyword: 搜索关键词
+            result: 目录查询结果
+        """
+        if shape_type != self._table_model.shape_type:
+            full_result = result if not keyword else self._logic.query_shapes(shape_type)
+            self._table_model.set_result(shape_type, full_result)
+            self._apply_column_widths(shape_type)
+            self._load_thumbnails(shape_type)
+        
+        if keyword and self._table_model.result is not None:
+            self._proxy_model.set_row_mask(np.isin(self._table_model.result.indices, result.indices))
         else:
-            # 默认配置（向后兼容）
-            self._table_widget.setColumnCount(16)
-            self._table_widget.setHorizontalHeaderLabels([
-                "型号", "高度H(mm)", "宽度B(mm)", "腹板厚度t1(mm)", "翼缘厚度t2(mm)",
-                "圆角半径r(mm)", "内圆角半径r'(mm)", "截面面积(cm²)", "理论重量(kg/m)", 
-                "表面积(m²/m)", "惯性矩Ix(cm⁴)", "惯性矩Iy(cm⁴)", "惯性半径rx(cm)", 
-                "惯性半径ry(cm)", "截面模量Wx(cm³)", "截面模量Wy(cm³)"
-            ])
-            
-            for i, shape in enumerate(shapes):
-                self._table_widget.insertRow(i)
-                self._table_widget.setItem(i, 0, QTableWidgetItem(shape["型号"]))
-                
-                for col, key in enumerate(["高度H", "宽度B", "腹板厚度t1", "翼缘厚度t2", "圆角半径r", "内圆角半径r'", "截面面积", "理论重量", "表面积", "惯性矩Ix", "惯性矩Iy", "惯性半径rx", "惯性半径ry", "截面模量Wx", "截面模量Wy"], 1):
-                    if key in shape:
-                        item = QTableWidgetItem(f"{shape[key]:.2f}")
-                        item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-                        self._table_widget.setItem(i, col, item)
-            
-            self._current_table_name = None
+            self._proxy_model.set_row_mask(None)
+    
+    def _apply_column_widths(self, shape_type):
+        """设置型钢特性表的列宽
+        
+        型钢类型首次显示时按内容测量一次（只按前若干行估算）并缓存，之后直接使用缓存的列宽
+        
+        Args:
+            shape_type: 型钢类型
+        """
+        header = self._table_view.horizontalHeader()
+        widths = self._column_widths.get(shape_type)
+        if widths is None or len(widths) != header.count():
+            self._table_view.resizeColumnsToContents()
+            self._column_widths[shape_type] = [header.sectionSize(column) for column in range(header.count())]
+            return
+        for column, width in enumerate(widths):
+            header.resizeSection(column, width)
     
     @Slot()
     def _on_table_selection_changed(self):
         """处理表格选择变化"""
         # 获取当前选中的行
-        selected_items = self._table_widget.selectedItems()
-        if not selected_items:
+        selected_rows = self._table_view.selectionModel().selectedRows()
+        if not selected_rows:
             return
         
-        # 获取选中行的数据
-        row = selected_items[0].row()
-        shape_data = {}
-        
-        # 从表格中提取数据
-        shape_data["型号"] = self._table_widget.item(row, 0).text()
+        # 截面记录直接引用目录数组，不经过字典和文本转换
+        row = self._proxy_model.mapToSource(selected_rows[0]).row()
         
-        # 获取型钢类型
-        shape_data["类型"] = self._type_combo.currentText()
+        # 更新截面形状图
+        self._section_diagram.set_shape_data(self._table_model.record(row))
+        self._thumbnail_view.select_row(selected_rows[0].row())
+    
+    def _load_thumbnails(self, shape_type):
+        """在后台任务中获取型钢类型的缩略图图集
         
-        # 获取当前表类型的列配置
-        column_config, table_name = get_table_config(self._type_combo.currentText())
+        Args:
+            shape_type: 型钢类型
+        """
+        if self._thumbnail_handle is not None:
+            self._thumbnail_handle.cancel()
+        if self._thumbnail_view.atlas is not None and self._thumbnail_view.atlas.shape_type != shape_type:
+            self._thumbnail_view.set_atlas(None)
         
-        if column_config:
-            # 根据列配置提取数据
-            for col, (db_col, title, fmt) in enumerate(column_config):
-                item = self._table_widget.item(row, col)
-                if item and item.text():
-                    try:
-                        shape_data[title] = float(item.text())
-                    except ValueError:
-                        pass
-        else:
-            # 默认配置（向后兼容）
-            headers = ["高度H", "宽度B", "腹板厚度t1", "翼缘厚度t2", "圆角半径r", "内圆角半径r'", "截面面积", "理论重量", "表面积", "惯性矩Ix", "惯性矩Iy", "惯性半径rx", "惯性半径ry", "截面模量Wx", "截面模量Wy"]
-            for i, header in enumerate(headers, 1):
-                item = self._table_widget.item(row, i)
-                if item and item.text():
-                    try:
-                        shape_data[header] = float(item.text())
-                    except ValueError:
-                        pass
+        # 优先级低于查询，不影响切换类型和搜索的响应
+        self._thumbnail_handle = get_scheduler().submit(
+            self._logic.get_thumbnail_atlas, args=(shape_type,),
+            name="绘制截面缩略图", priority=TaskPriority.NORMAL)
+        self._thumbnail_handle.succeeded.connect(self._on_thumbnails_loaded)
+        self._thumbnail_handle.failed.connect(self._on_thumbnails_load_failed)
+    
+    @Slot(object)
+    def _on_thumbnails_loaded(self, atlas):
+        """图集绘制完成，显示缩略图
         
-        # 更新截面形状图
-        self._section_diagram.set_shape_data(shape_data)
+        Args:
+            atlas: 缩略图图集
+        """
+        if not self._is_current_result(self._thumbnail_handle):
+            return
+        self._thumbnail_handle = None
+        if atlas.shape_type == self._table_model.shape_type:
+            self._thumbnail_view.set_atlas(atlas)
     
+    @Slot(str)
+    def _on_thumbnails_load_failed(self, error):
+        """图集绘制失败，缩略图视图只显示型号"""
+        if not self._is_current_result(self._thumbnail_handle):
+            return
+        self._thumbnail_handle = None
+    
+    def _get_finder_constraints(self):
+        """从约束条件行读取属性约束
+
+        Returns:
+            dict: 属性约束 {字段名: (最小值, 最大值)}
+        """
+        constraints = {}
+        for property_combo, min_edit, max_edit in self._finder_conditions:
+            # 选中预置属性时使用其字段名，手动输入时将输入文本作为字段名
+            text = property_combo.currentText().strip()
+            index = property_combo.currentIndex()
+            if index >= 0 and text == property_combo.itemText(index):
+                field = property_combo.itemData(index)
+            else:
+                field = text
+            if not field:
+                continue
+
+            bounds = []
+            for edit in (min_edit, max_edit):
+                try:
+                    bounds.append(float(edit.text()) if edit.text().strip() else None)
+                except ValueError:
+                    bounds.append(None)
+            if bounds[0] is None and bounds[1] is None:
+                continue
+            constraints[field] = tuple(bounds)
+        return constraints
+
+    @Slot()
+    def _find_lightest(self):
+        """查找满足约束条件的最轻截面"""
+        constraints = self._get_finder_constraints()
+        if not constraints:
+            QMessageBox.information(self, "提示", "请至少输入一个约束条件")
+            return
+
+        scope = self._finder_scope_combo.currentIndex()
+        shape_types = None if scope <= 0 else [self._finder_scope_combo.currentText()]
+
+        if self._finder_handle is not None:
+            self._finder_handle.cancel()
+
+        self._finder_status_label.setText("正在查找...")
+        self._finder_handle = get_scheduler().submit(
+            self._logic.find_lightest_shapes, args=(constraints, shape_types, self.FINDER_RESULT_LIMIT),
+            name="查找最轻截面", priority=TaskPriority.HIGH)
+        self._finder_handle.succeeded.connect(self._on_lightest_found)
+        self._finder_handle.failed.connect(self._on_find_lightest_failed)
+        self._finder_handle.cancelled.connect(self._on_find_lightest_cancelled)
+
+    @Slot(object)
+    def _on_lightest_found(self, results):
+        """查找完成，填充结果表格
+
+        Args:
+            results: 按理论重量排序的结果列表
+        """
+        if not self._is_current_result(self._finder_handle):
+            return
+        self._finder_handle = None
+        self._finder_table.setRowCount(len(results))
+        align = Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+        for row, item in enumerate(results):
+            self._finder_table.setItem(row, 0, QTableWidgetItem(item["shape_type"]))
+            self._finder_table.setItem(row, 1, QTableWidgetItem(item["model"]))
+            weight = item["weight"]
+            weight_item = QTableWidgetItem("" if weight is None else f"{weight:.2f}")
+            weight_item.setTextAlignment(align)
+            self._finder_table.setItem(row, 2, weight_item)
+            values = ", ".join(
+                f"{field}={value:g}" for field, value in item["values"].items() if value is not None)
+            self._finder_table.setItem(row, 3, QTableWidgetItem(values))
+        self._finder_table.resizeColumnsToContents()
+
+        if results:
+            self._finder_status_label.setText(f"最轻：{results[0]['model']}（共显示 {len(results)} 个）")
+        else:
+            self._finder_status_label.setText("未找到满足条件的截面")
+
+    @Slot(str)
+    def _on_find_lightest_failed(self, error):
+        """查找失败"""
+        if not self._is_current_result(self._finder_handle):
+            return
+        self._finder_handle = None
+        self._finder_status_label.setText("")
+        QMessageBox.warning(self, "错误", f"查找最轻截面失败：{error}")
+
+    @Slot()
+    def _on_find_lightest_cancelled(self):
+        """查找被取消（被新的查找取代时不处理）"""
+        if not self._is_current_result(self._finder_handle):
+            return
+        self._finder_handle = None
+        self._finder_status_label.setText("")
+
+    @Slot(int, int)
+    def _on_finder_result_activated(self, row, column):
+        """双击查找结果，在型钢特性表中显示该型号"""
+        self._show_result_row(self._finder_table, row)
+
+    def _show_result_row(self, table, row):
+        """在型钢特性表中显示结果表格某行的型号（第0列为型钢类型，第1列为型号）"""
+        type_item = table.item(row, 0)
+        model_item = table.item(row, 1)
+        if type_item is None or model_item is None:
+            return
+
+        self._search_edit.setText(model_item.text())
+        if self._type_combo.currentText() == type_item.text():
+            self._load_shapes()
+        else:
+            # 切换类型会触发重新加载
+            self._type_combo.setCurrentText(type_item.text())
+
+    @Slot()
+    def _screen_capacity(self):
+        """按构件内力和计算长度筛选最轻截面"""
+        try:
+            load = {field: float(edit.text() or 0) for field, edit in self._capacity_edits.items()}
+        except ValueError:
+            QMessageBox.warning(self, "提示", "请输入有效的内力和计算长度")
+            return
+
+        scope = self._capacity_scope_combo.currentIndex()
+        shape_types = None if scope <= 0 else [self._capacity_scope_combo.currentText()]
+        grade = self._capacity_grade_combo.currentText()
+        curve = list(BUCKLING_CURVES)[self._capacity_curve_combo.currentIndex()]
+
+        if self._capacity_handle is not None:
+            self._capacity_handle.cancel()
+
+        self._capacity_status_label.setText("正在筛选...")
+        self._capacity_handle = get_scheduler().submit(
+            self._logic.screen_member_capacity, args=(load, shape_types, grade, curve, self.CAPACITY_RESULT_LIMIT),
+            name="承载力筛选", priority=TaskPriority.HIGH)
+        self._capacity_handle.succeeded.connect(self._on_capacity_screened)
+        self._capacity_handle.failed.connect(self._on_screen_capacity_failed)
+        self._capacity_handle.cancelled.connect(self._on_screen_capacity_cancelled)
+
+    @Slot(object)
+    def _on_capacity_screened(self, results):
+        """筛选完成，填充结果表格
+
+        Args:
+            results: 按理论重量排序的满足要求的截面列表
+        """
+        if not self._is_current_result(self._capacity_handle):
+            return
+        self._capacity_handle = None
+        self._capacity_table.setRowCount(len(results))
+        align = Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+        for row, item in enumerate(results):
+            for column, (field, _, fmt) in enumerate(self.CAPACITY_COLUMNS):
+                value = item[field]
+                cell = QTableWidgetItem(value if fmt == "s" else format(value, fmt))
+                if fmt != "s":
+                    cell.setTextAlignment(align)
+                self._capacity_table.setItem(row, column, cell)
+        self._capacity_table.resizeColumnsToContents()
+
+        if results:
+            best = results[0]
+            self._capacity_status_label.setText(f"最轻：{best['model']}（应力比 {best['utilization']:.3f}）")
+        else:
+            self._capacity_status_label.setText("没有满足要求的截面")
+
+    @Slot(str)
+    def _on_screen_capacity_failed(self, error):
+        """筛选失败"""
+        if not self._is_current_result(self._capacity_handle):
+            return
+        self._capacity_handle = None
+        self._capacity_status_label.setText("")
+        QMessageBox.warning(self, "错误", f"承载力筛选失败：{error}")
+
+    @Slot()
+    def _on_screen_capacity_cancelled(self):
+        """筛选被取消（被新的筛选取代时不处理）"""
+        if not self._is_current_result(self._capacity_handle):
+            return
+        self._capacity_handle = None
+        self._capacity_status_label.setText("")
+
+    @Slot(int, int)
+    def _on_capacity_result_activated(self, row, column):
+        """双击筛选结果，在型钢特性表中显示该型号"""
+        self._show_result_row(self._capacity_table, row)
+
+    @Slot()
+    def _compute_custom_sections(self):
+        """计算自定义截面所有候选尺寸组合的截面特性"""
+        try:
+            dimensions = {field: parse_candidates(edit.text()) for field, edit in self._custom_edits.items()}
+        except ValueError as e:
+            QMessageBox.warning(self, "提示", f"尺寸输入有误：{e}")
+            return
+        if not all(dimensions[field] for field in ("height", "width", "web_thickness")):
+            QMessageBox.information(self, "提示", "请输入高度、宽度和腹板厚度")
+            return
+        dimensions["flange_thickness"] = dimensions["flange_thickness"] or None
+        dimensions["fillet_radius"] = dimensions["fillet_radius"] or [0.0]
+
+        if self._custom_handle is not None:
+            self._custom_handle.cancel()
+
+        self._custom_kind = self._custom_kind_combo.currentText()
+        self._custom_status_label.setText("正在计算...")
+        self._custom_handle = get_scheduler().submit(
+            self._logic.compute_custom_sections, args=(self._custom_kind,),
+            kwargs=dict(dimensions, limit=self.CUSTOM_RESULT_LIMIT),
+            name="计算自定义截面", priority=TaskPriority.HIGH)
+        self._custom_handle.succeeded.connect(self._on_custom_sections_computed)
+        self._custom_handle.failed.connect(self._on_compute_custom_sections_failed)
+        self._custom_handle.cancelled.connect(self._on_compute_custom_sections_cancelled)
+
+    @Slot(object)
+    def _on_custom_sections_computed(self, result):
+        """自定义截面计算完成，填充结果表格
+
+        Args:
+            result: 计算结果，见 SteelShapeLogic.compute_custom_sections
+        """
+        if not self._is_current_result(self._custom_handle):
+            return
+        self._custom_handle = None
+        rows = result["rows"]
+        self._custom_rows = rows
+        self._custom_table.setRowCount(len(rows))
+        align = Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+        for row, values in enumerate(rows):
+            for column, (field, _, fmt) in enumerate(CUSTOM_SECTION_COLUMNS):
+                item = QTableWidgetItem(f"{values[field]:{fmt}}")
+                item.setTextAlignment(align)
+                self._custom_table.setItem(row, column, item)
+        self._custom_table.resizeColumnsToContents()
+
+        status = f"共 {result['total']} 个组合，{result['valid']} 个有效"
+        if result["valid"] > len(rows):
+            status += f"，显示最轻的 {len(rows)} 个"
+        self._custom_status_label.setText(status)
+
+    @Slot(str)
+    def _on_compute_custom_sections_failed(self, error):
+        """自定义截面计算失败"""
+        if not self._is_current_result(self._custom_handle):
+            return
+        self._custom_handle = None
+        self._custom_status_label.setText("")
+        QMessageBox.warning(self, "错误", f"计算自定义截面失败：{error}")
+
+    @Slot()
+    def _on_compute_custom_sections_cancelled(self):
+        """自定义截面计算被取消（被新的计算取代时不处理）"""
+        if not self._is_current_result(self._custom_handle):
+            return
+        self._custom_handle = None
+        self._custom_status_label.setText("")
+
+    @Slot()
+    def _on_custom_selection_changed(self):
+        """选中自定义截面，更新截面形状图"""
+        row = self._custom_table.currentRow()
+        if row < 0 or row >= len(self._custom_rows):
+            return
+
+        values = self._custom_rows[row]
+        kind = SECTION_KINDS[self._custom_kind]
+        self._section_diagram.set_shape_data({
+            "型号": f"{self._custom_kind} {values['height']:g}x{values['width']:g}"
+                    f"x{values['web_thickness']:g}x{values['flange_thickness']:g}",
+            "类型": DIAGRAM_TYPES[kind],
+            "高度H": values["height"],
+            "宽度B": values["width"],
+            "腹板厚度t1": values["web_thickness"],
+            "翼缘厚度t2": values["flange_thickness"],
+            "厚度t": values["web_thickness"],
+        })
+
+    @Slot()
+    def _export_diagrams(self):
+        """批量导出截面图：选中的截面、当前类型或全部型钢"""
+        if self._export_handle is not None:
+            QMessageBox.information(self, "提示", "截面图正在导出，请稍候")
+            return
+
+        selected_rows = self._table_view.selectionModel().selectedRows()
+        scopes = ["当前类型", "全部型钢"]
+        if selected_rows:
+            scopes.insert(0, f"选中的截面（{len(selected_rows)} 个）")
+        scope, ok = QInputDialog.getItem(self, "导出截面图", "导出范围：", scopes, 0, False)
+        if not ok:
+            return
+        fmt, ok = QInputDialog.getItem(self, "导出截面图", "导出格式：", list(EXPORT_FORMATS), 0, False)
+        if not ok:
+            return
+        error = image_engine_error(fmt)
+        if error is not None:
+            QMessageBox.warning(self, "导出截面图", error)
+            return
+        output_dir = QFileDialog.getExistingDirectory(self, "选择导出目录")
+        if not output_dir:
+            return
+
+        if scope == "全部型钢":
+            sections = None
+        elif scope == "当前类型":
+            sections = [self._table_model.record(row).shape_data() for row in range(self._table_model.rowCount())]
+        else:
+            sections = [self._table_model.record(self._proxy_model.mapToSource(index).row()).shape_data()
+                        for index in selected_rows]
+
+        self._export_btn.setEnabled(False)
+        self._export_handle = get_scheduler().submit(
+            self._logic.export_section_diagrams, args=(sections, output_dir, fmt),
+            name="导出截面图", with_context=True)
+        self._export_handle.succeeded.connect(self._on_diagrams_exported)
+        self._export_handle.failed.connect(self._on_export_diagrams_failed)
+        self._export_handle.cancelled.connect(self._on_export_diagrams_finished)
+
+    @Slot(object)
+    def _on_diagrams_exported(self, result):
+        """截面图导出完成"""
+        self._on_export_diagrams_finished()
+        exported, failed = result["exported"], result["failed"]
+        if failed:
+            QMessageBox.warning(self, "导出截面图",
+                                f"已导出 {len(exported)} 个截面图，{len(failed)} 个失败：\n{failed[0][1]}")
+        else:
+            QMessageBox.information(self, "导出截面图", f"已导出 {len(exported)} 个截面图")
+
+    @Slot(str)
+    def _on_export_diagrams_failed(self, error):
+        """截面图导出失败"""
+        self._on_export_diagrams_finished()
+        QMessageBox.warning(self, "错误", f"导出截面图失败：{error}")
+
+    @Slot()
+    def _on_export_diagrams_finished(self):
+        """导出任务结束，恢复导出按钮"""
+        self._export_handle = None
+        self._export_btn.setEnabled(True)
+
+    @Slot()
+    def _compute_takeoff(self):
+        """选择构件清单和输出文件，在后台生成材料表"""
+        if self._takeoff_handle is not None:
+            QMessageBox.information(self, "提示", "材料表正在生成，请稍候")
+            return
+
+        member_path, _ = QFileDialog.getOpenFileName(
+            self, "选择构件清单", "", "构件清单 (*.csv *.xlsx *.xlsm);;所有文件 (*)")
+        if not member_path:
+            return
+        output_path, _ = QFileDialog.getSaveFileName(
+            self, "保存材料表", os.path.splitext(member_path)[0] + "_材料表.xlsx", "Excel 文件 (*.xlsx)")
+        if not output_path:
+            return
+
+        self._takeoff_btn.setEnabled(False)
+        self._takeoff_handle = get_scheduler().submit(
+            self._logic.compute_takeoff, args=(member_path, output_path), name="材料统计")
+        self._takeoff_handle.succeeded.connect(self._on_takeoff_computed)
+        self._takeoff_handle.failed.connect(self._on_takeoff_failed)
+        self._takeoff_handle.cancelled.connect(self._on_takeoff_finished)
+
+    @Slot(object)
+    def _on_takeoff_computed(self, result):
+        """材料表生成完成，显示汇总"""
+        self._on_takeoff_finished()
+        total = result["total"]
+        lines = [f"{item['shape_type']}：{item['weight'] / 1000:.3f} t，{item['surface']:.2f} m²"
+                 for item in result["by_type"]]
+        lines.append(f"合计：{total['weight'] / 1000:.3f} t，涂装面积 {total['surface']:.2f} m²")
+        unmatched = result["unmatched"]
+        if unmatched:
+            lines.append(f"\n{len(unmatched)} 个型号未匹配（详见“未匹配型号”工作表）：")
+            lines.extend(f"{item['designation']} → {item['suggestions'] or '无建议'}" for item in unmatched[:5])
+            QMessageBox.warning(self, "材料统计", "\n".join(lines))
+        else:
+            QMessageBox.information(self, "材料统计", "\n".join(lines))
+
+    @Slot(str)
+    def _on_takeoff_failed(self, error):
+        """材料表生成失败"""
+        self._on_takeoff_finished()
+        QMessageBox.warning(self, "错误", f"材料统计失败：{error}")
+
+    @Slot()
+    def _on_takeoff_finished(self):
+        """材料统计任务结束，恢复按钮"""
+        self._takeoff_handle = None
+        self._takeoff_btn.setEnabled(True)
+
+    @Slot()
+    def _map_equivalent_sections(self):
+        """生成2017版到2024版H型钢的等效截面对照表（全部截面或构件清单）"""
+        if self._equivalence_handle is not None:
+            QMessageBox.information(self, "提示", "对照表正在生成，请稍候")
+            return
+
+        scopes = ["全部2017版H型钢", "构件清单"]
+        scope, ok = QInputDialog.getItem(self, "新旧型钢对照", "对照范围：", scopes, 0, False)
+        if not ok:
+            return
+        member_path = None
+        default_path = "H型钢新旧对照.xlsx"
+        if scope == "构件清单":
+            member_path, _ = QFileDialog.getOpenFileName(
+                self, "选择构件清单", "", "构件清单 (*.csv *.xlsx *.xlsm);;所有文件 (*)")
+            if not member_path:
+                return
+            default_path = os.path.splitext(member_path)[0] + "_新旧对照.xlsx"
+        output_path, _ = QFileDialog.getSaveFileName(self, "保存对照表", default_path, "Excel 文件 (*.xlsx)")
+        if not output_path:
+            return
+
+        self._equivalence_btn.setEnabled(False)
+        self._equivalence_handle = get_scheduler().submit(
+            self._logic.map_equivalent_sections, args=(member_path, output_path), name="新旧型钢对照")
+        self._equivalence_handle.succeeded.connect(self._on_equivalent_sections_mapped)
+        self._equivalence_handle.failed.connect(self._on_map_equivalent_sections_failed)
+        self._equivalence_handle.cancelled.connect(self._on_map_equivalent_sections_finished)
+
+    @Slot(object)
+    def _on_equivalent_sections_mapped(self, result):
+        """对照表生成完成"""
+        self._on_map_equivalent_sections_finished()
+        message = f"共 {result['total']} 行，{result['mapped']} 行已映射为2024版H型钢"
+        if result["unmatched"]:
+            message += f"，{result['unmatched']} 行型号未在目录中找到"
+        QMessageBox.information(self, "新旧型钢对照", message)
+
+    @Slot(str)
+    def _on_map_equivalent_sections_failed(self, error):
+        """对照表生成失败"""
+        self._on_map_equivalent_sections_finished()
+        QMessageBox.warning(self, "错误", f"生成新旧型钢对照表失败：{error}")
+
+    @Slot()
+    def _on_map_equivalent_sections_finished(self):
+        """对照任务结束，恢复按钮"""
+        self._equivalence_handle = None
+        self._equivalence_btn.setEnabled(True)
+
     def _emit_initial_title(self):
         """发出初始标题信号"""
         initial_shape_type = self._type_combo.currentText()
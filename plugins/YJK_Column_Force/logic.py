@@ -4,6 +4,8 @@ import os
 import pandas as pd
 from PySide6.QtWidgets import QFileDialog
 
+from core.cache import get_cache
+
 
 class YJKColumnForceLogic:
     """YJK柱脚内力处理工具业务逻辑"""
@@ -22,29 +24,14 @@ class YJKColumnForceLogic:
             dict: 处理结果，包含success、original_rows、removed_rows、final_rows、save_path、format、error等字段
         """
         try:
-            # 尝试读取工作表
-            df = self._read_excel_file(file_path)
-            
-            # 处理数据
-            processed_data = self._process_data(df, mode="pressure")
-            
-            # 导出数据
-            result = self._export_data(
-                processed_data["df"], 
-                file_path, 
-                "压力",
-                processed_data["original_rows"],
-                processed_data["removed_rows"],
-                processed_data["final_rows"]
-            )
-            
-            return result
-        
+            processed_data = self.prepare_data(file_path, mode="pressure")
         except Exception as e:
             return {
                 "success": False,
                 "error": str(e)
             }
+        
+        return self.export_prepared_data(processed_data, file_path, "压力")
     
     def process_tension(self, file_path: str):
         """处理拉力数据
@@ -56,29 +43,14 @@ class YJKColumnForceLogic:
             dict: 处理结果，包含success、original_rows、removed_rows、final_rows、save_path、format、error等字段
         """
         try:
-            # 尝试读取工作表
-            df = self._read_excel_file(file_path)
-            
-            # 处理数据
-            processed_data = self._process_data(df, mode="tension")
-            
-            # 导出数据
-            result = self._export_data(
-                processed_data["df"], 
-                file_path, 
-                "拉力",
-                processed_data["original_rows"],
-                processed_data["removed_rows"],
-                processed_data["final_rows"]
-            )
-            
-            return result
-        
+            processed_data = self.prepare_data(file_path, mode="tension")
         except Exception as e:
             return {
                 "success": False,
                 "error": str(e)
             }
+        
+        return self.export_prepared_data(processed_data, file_path, "拉力")
     
     def process_all(self, file_path: str):
         """处理全部柱底内力
@@ -90,24 +62,51 @@ class YJKColumnForceLogic:
             dict: 处理结果，包含success、original_rows、removed_rows、final_rows、save_path、format、error等字段
         """
         try:
-            # 尝试读取工作表
-            df = self._read_excel_file(file_path)
+            processed_data = self.prepare_data(file_path, mode="all")
+        except Exception as e:
+            return {
+                "success": False,
+                "error": str(e)
+            }
+        
+        return self.export_prepared_data(processed_data, file_path, "全部柱底内力")
+    
+    def prepare_data(self, file_path: str, mode: str = "all"):
+        """读取并处理数据（不涉及界面，可在后台任务中执行）
+        
+        Args:
+            file_path: Excel文件路径
+            mode: 处理模式，可选值：pressure（压力）、tension（拉力）、all（全部）
             
-            # 处理数据
-            processed_data = self._process_data(df, mode="all")
+        Returns:
+            dict: 处理后的数据，包含df、original_rows、removed_rows、final_rows
+        """
+        # 尝试读取工作表
+        df = self._read_excel_file(file_path)
+        
+        # 处理数据
+        return self._process_data(df, mode=mode)
+    
+    def export_prepared_data(self, processed_data: dict, file_path: str, data_type: str):
+        """导出已处理的数据（弹出对话框，需在GUI线程中调用）
+        
+        Args:
+            processed_data: prepare_data 返回的处理结果
+            file_path: 原始Excel文件路径
+            data_type: 数据类型（压力、拉力、全部柱底内力）
             
-            # 导出数据
-            result = self._export_data(
+        Returns:
+            dict: 处理结果，包含success、original_rows、removed_rows、final_rows、save_path、format、error等字段
+        """
+        try:
+            return self._export_data(
                 processed_data["df"], 
                 file_path, 
-                "全部柱底内力",
+                data_type,
                 processed_data["original_rows"],
                 processed_data["removed_rows"],
                 processed_data["final_rows"]
             )
-            
-            return result
-        
         except Exception as e:
             return {
                 "success": False,
@@ -117,6 +116,21 @@ class YJKColumnForceLogic:
     def _read_excel_file(self, file_path: str):
         """读取Excel文件
         
+        解析结果按文件内容缓存，同一文件重复处理（压力/拉力/全部）时只解析一次
+        
+        Args:
+            file_path: Excel文件路径
+            
+        Returns:
+            pd.DataFrame: 读取的数据
+        """
+        cache = get_cache()
+        key = cache.make_key(file_path, sheet="基本组合内力")
+        return cache.get_or_compute("yjk_sheets", key, lambda: self._parse_excel_file(file_path))
+    
+    def _parse_excel_file(self, file_path: str):
+        """解析Excel文件中的“基本组合内力”工作表
+        
         Args:
             file_path: Excel文件路径
             
@@ -408,73 +422,114 @@ class YJKColumnForceLogic:
             dict: 处理结果，包含success、original_rows、removed_rows、final_rows、save_path、format、error等字段
         """
         try:
-            # 尝试读取工作表
-            df = self._read_excel_file(file_path)
-            
-            # 检查数据格式，确保保留原有列数和第一行
-            if df.shape[0] < 1:
-                raise ValueError("文件中没有数据")
-            
-            # 检查列数是否足够（至少14列，对应A-N）
-            if df.shape[1] < 14:
-                raise ValueError(f"工作表列数不足（需要至少14列），当前列数: {df.shape[1]}")
-            
-            # 分离数据部分（从第二行开始）
-            data_rows = df.iloc[1:].copy()  # 数据部分从第二行开始
-            
-            # 记录原始数据行数
-            original_data_rows = len(data_rows)
-            
-            # 转换B~L列为数值（对应数字索引1~11，即第2列到第12列）
-            data_rows.iloc[:, 1:12] = data_rows.iloc[:, 1:12].apply(pd.to_numeric, errors='coerce')
-            
-            # 删除F列（索引5）值为1的行
-            data_rows = data_rows[data_rows.iloc[:, 5] != 1]
-            removed_f1_rows = original_data_rows - len(data_rows)
-            
-            # 按K列（索引10）倒序排序
-            data_rows = data_rows.sort_values(by=data_rows.columns[10], ascending=False)
-            
-            # 根据导出类型过滤数据
-            if export_type == "pressure":
-                # 仅保留K列<0的行（压力）
-                data_rows = data_rows[data_rows.iloc[:, 10] < 0]
-                filtered_rows = len(data_rows)
-                export_suffix = "压力"
-            elif export_type == "tension":
-                # 仅保留K列>0的行（拉力）
-                data_rows = data_rows[data_rows.iloc[:, 10] > 0]
-                filtered_rows = len(data_rows)
-                export_suffix = "拉力"
-            else:
-                # 全部内力
-                filtered_rows = len(data_rows)
-                export_suffix = "全部内力"
-            
-            if filtered_rows == 0:
-                raise ValueError(f"没有找到符合条件的数据")
-            
-            # 构建探索者格式数据
-            # 探索者表头
-            explorer_header = ["序号", "描述", "轴力Nz", "剪力Vx", "剪力Vy", "弯矩Mx", "弯矩My", "是否抗震"]
-            
-            # 构建数据行
-            explorer_data = [explorer_header]
-            for idx, (_, row) in enumerate(data_rows.iterrows(), 1):
-                explorer_row = [
-                    idx,  # 序号
-                    f"组合工况{idx}",  # 描述
-                    row.iloc[10],  # 轴力Nz (原K列)
-                    row.iloc[9],   # 剪力Vx (原J列)
-                    row.iloc[8],   # 剪力Vy (原I列)
-                    row.iloc[7],   # 弯矩Mx (原H列)
-                    row.iloc[6],   # 弯矩My (原G列)
-                    "否"           # 是否抗震
-                ]
-                explorer_data.append(explorer_row)
-            
-            # 转换为DataFrame
-            explorer_df = pd.DataFrame(explorer_data)
+            explorer_data = self.prepare_explorer_data(file_path, export_type)
+        except Exception as e:
+            return {
+                "success": False,
+                "error": str(e)
+            }
+        
+        return self.export_explorer_prepared(explorer_data, file_path)
+    
+    def prepare_explorer_data(self, file_path: str, export_type: str):
+        """读取数据并转换为探索者格式（不涉及界面，可在后台任务中执行）
+        
+        Args:
+            file_path: Excel文件路径
+            export_type: 导出类型，可选值：pressure（压力）、tension（拉力）、all（全部）
+            
+        Returns:
+            dict: 探索者数据，包含df、original_rows、removed_rows、final_rows、export_suffix
+        """
+        # 尝试读取工作表
+        df = self._read_excel_file(file_path)
+        
+        # 检查数据格式，确保保留原有列数和第一行
+        if df.shape[0] < 1:
+            raise ValueError("文件中没有数据")
+        
+        # 检查列数是否足够（至少14列，对应A-N）
+        if df.shape[1] < 14:
+            raise ValueError(f"工作表列数不足（需要至少14列），当前列数: {df.shape[1]}")
+        
+        # 分离数据部分（从第二行开始）
+        data_rows = df.iloc[1:].copy()  # 数据部分从第二行开始
+        
+        # 记录原始数据行数
+        original_data_rows = len(data_rows)
+        
+        # 转换B~L列为数值（对应数字索引1~11，即第2列到第12列）
+        data_rows.iloc[:, 1:12] = data_rows.iloc[:, 1:12].apply(pd.to_numeric, errors='coerce')
+        
+        # 删除F列（索引5）值为1的行
+        data_rows = data_rows[data_rows.iloc[:, 5] != 1]
+        removed_f1_rows = original_data_rows - len(data_rows)
+        
+        # 按K列（索引10）倒序排序
+        data_rows = data_rows.sort_values(by=data_rows.columns[10], ascending=False)
+        
+        # 根据导出类型过滤数据
+        if export_type == "pressure":
+            # 仅保留K列<0的行（压力）
+            data_rows = data_rows[data_rows.iloc[:, 10] < 0]
+            filtered_rows = len(data_rows)
+            export_suffix = "压力"
+        elif export_type == "tension":
+            # 仅保留K列>0的行（拉力）
+            data_rows = data_rows[data_rows.iloc[:, 10] > 0]
+            filtered_rows = len(data_rows)
+            export_suffix = "拉力"
+        else:
+            # 全部内力
+            filtered_rows = len(data_rows)
+            export_suffix = "全部内力"
+        
+        if filtered_rows == 0:
+            raise ValueError(f"没有找到符合条件的数据")
+        
+        # 构建探索者格式数据
+        # 探索者表头
+        explorer_header = ["序号", "描述", "轴力Nz", "剪力Vx", "剪力Vy", "弯矩Mx", "弯矩My", "是否抗震"]
+        
+        # 构建数据行
+        explorer_data = [explorer_header]
+        for idx, (_, row) in enumerate(data_rows.iterrows(), 1):
+            explorer_row = [
+                idx,  # 序号
+                f"组合工况{idx}",  # 描述
+                row.iloc[10],  # 轴力Nz (原K列)
+                row.iloc[9],   # 剪力Vx (原J列)
+                row.iloc[8],   # 剪力Vy (原I列)
+                row.iloc[7],   # 弯矩Mx (原H列)
+                row.iloc[6],   # 弯矩My (原G列)
+                "否"           # 是否抗震
+            ]
+            explorer_data.append(explorer_row)
+        
+        # 转换为DataFrame
+        explorer_df = pd.DataFrame(explorer_data)
+        
+        return {
+            "df": explorer_df,
+            "original_rows": original_data_rows,
+            "removed_rows": removed_f1_rows,
+            "final_rows": filtered_rows,
+            "export_suffix": export_suffix
+        }
+    
+    def export_explorer_prepared(self, explorer_data: dict, file_path: str):
+        """导出探索者数据（弹出对话框，需在GUI线程中调用）
+        
+        Args:
+            explorer_data: prepare_explorer_data 返回的探索者数据
+            file_path: 原始Excel文件路径
+            
+        Returns:
+            dict: 处理结果，包含success、original_rows、removed_rows、final_rows、save_path、format、error等字段
+        """
+        try:
+            explorer_df = explorer_data["df"]
+            export_suffix = explorer_data["export_suffix"]
             
             # 弹出格式选择对话框
             from PySide6.QtWidgets import QDialog, QVBoxLayout, QLabel, QRadioButton, QButtonGroup, QPushButton, QFileDialog
@@ -561,9 +616,9 @@ class YJKColumnForceLogic:
             
             return {
                 "success": True,
-                "original_rows": original_data_rows,
-                "removed_rows": removed_f1_rows,
-                "final_rows": filtered_rows,
+                "original_rows": explorer_data["original_rows"],
+                "removed_rows": explorer_data["removed_rows"],
+                "final_rows": explorer_data["final_rows"],
                 "save_path": save_path,
                 "format": export_format
             }
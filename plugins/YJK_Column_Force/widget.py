@@ -10,6 +10,7 @@ from PySide6.QtWidgets import (
 from PySide6.QtCore import Qt, Slot
 from PySide6.QtGui import QFont, QTextCursor
 
+from core.tasks import TaskPriority, get_scheduler
 from plugins.YJK_Column_Force.logic import YJKColumnForceLogic
 
 
@@ -26,6 +27,9 @@ class YJKColumnForceWidget(QWidget):
         # 模式标志：当前是否显示原版界面
         self._current_mode = "original"  # "original" 或 "explorer"
         
+        # 正在后台处理的导出任务参数
+        self._export_job = None
+        
         # 初始化UI
         self._init_ui()
         
@@ -388,115 +392,67 @@ class YJKColumnForceWidget(QWidget):
 
     def process_pressure(self):
         """处理压力数据"""
-        if not self.file_path:
-            self.log_message("⚠ 请先选择Excel文件", "error")
-            QMessageBox.warning(self, "错误", "请先选择Excel文件")
-            return
-
-        try:
-            self.log_message("开始处理压力数据...", "info")
-            self.export_pressure_btn.setEnabled(False)
-            
-            # 执行处理
-            result = self._logic.process_pressure(self.file_path)
-            
-            if result["success"]:
-                # 显示成功信息
-                success_msg = f"""
-                <b>处理完成！</b><br><br>
-                <b>原始数据行数:</b> {result['original_rows']}<br>
-                <b>删除F列=1的行数:</b> {result['removed_rows']}<br>
-                <b>最终压力数据行数:</b> {result['final_rows']}<br>
-                <b>保存路径:</b> {result['save_path']}<br><br>
-                <i>文件格式: {result['format'].upper()}</i>
-                """
-                
-                msg_box = QMessageBox(self)
-                msg_box.setWindowTitle("处理成功")
-                msg_box.setTextFormat(Qt.RichText)
-                msg_box.setText(success_msg)
-                msg_box.setIcon(QMessageBox.Information)
-                msg_box.setStandardButtons(QMessageBox.Ok)
-                msg_box.exec_()
-                
-                self.log_message(f"✓ 压力数据已保存到: {result['save_path']}", "success")
-                
-                # 打开文件所在文件夹
-                try:
-                    os.startfile(os.path.dirname(result['save_path']))
-                except Exception as e:
-                    self.log_message(f"⚠ 打开文件夹失败: {str(e)}", "warning")
-            else:
-                raise ValueError(result["error"])
-
-        except Exception as e:
-            self.log_message(f"✗ 错误: {str(e)}", "error")
-            QMessageBox.critical(self, "处理错误", str(e))
-        finally:
-            self.export_pressure_btn.setEnabled(True)
+        self._start_export("original", "pressure", "压力", "最终压力数据行数")
 
     def process_tension(self):
         """处理拉力数据"""
-        if not self.file_path:
-            self.log_message("⚠ 请先选择Excel文件", "error")
-            QMessageBox.warning(self, "错误", "请先选择Excel文件")
-            return
-
-        try:
-            self.log_message("开始处理拉力数据...", "info")
-            self.export_tension_btn.setEnabled(False)
-            
-            # 执行处理
-            result = self._logic.process_tension(self.file_path)
-            
-            if result["success"]:
-                # 显示成功信息
-                success_msg = f"""
-                <b>处理完成！</b><br><br>
-                <b>原始数据行数:</b> {result['original_rows']}<br>
-                <b>删除F列=1的行数:</b> {result['removed_rows']}<br>
-                <b>最终拉力数据行数:</b> {result['final_rows']}<br>
-                <b>保存路径:</b> {result['save_path']}<br><br>
-                <i>文件格式: {result['format'].upper()}</i>
-                """
-                
-                msg_box = QMessageBox(self)
-                msg_box.setWindowTitle("处理成功")
-                msg_box.setTextFormat(Qt.RichText)
-                msg_box.setText(success_msg)
-                msg_box.setIcon(QMessageBox.Information)
-                msg_box.setStandardButtons(QMessageBox.Ok)
-                msg_box.exec_()
-                
-                self.log_message(f"✓ 拉力数据已保存到: {result['save_path']}", "success")
-                
-                # 打开文件所在文件夹
-                try:
-                    os.startfile(os.path.dirname(result['save_path']))
-                except Exception as e:
-                    self.log_message(f"⚠ 打开文件夹失败: {str(e)}", "warning")
-            else:
-                raise ValueError(result["error"])
-
-        except Exception as e:
-            self.log_message(f"✗ 错误: {str(e)}", "error")
-            QMessageBox.critical(self, "处理错误", str(e))
-        finally:
-            self.export_tension_btn.setEnabled(True)
+        self._start_export("original", "tension", "拉力", "最终拉力数据行数")
 
     def process_all(self):
         """处理全部柱底内力"""
+        self._start_export("original", "all", "全部柱底内力", "最终数据行数")
+    
+    def _start_export(self, kind, mode, data_type, final_label):
+        """在后台读取和处理数据，完成后在GUI线程中弹出导出对话框
+        
+        Args:
+            kind: 导出类别，original（原版）或 explorer（探索者）
+            mode: 处理模式，可选值：pressure、tension、all
+            data_type: 数据类型名称，用于日志和文件名
+            final_label: 成功信息中最终行数的标签
+        """
         if not self.file_path:
             self.log_message("⚠ 请先选择Excel文件", "error")
             QMessageBox.warning(self, "错误", "请先选择Excel文件")
             return
-
+        
+        self.log_message(f"开始处理{data_type}数据...", "info")
+        
+        # 禁用所有按钮，同一时间只处理一个导出任务
+        self.export_pressure_btn.setEnabled(False)
+        self.export_tension_btn.setEnabled(False)
+        self.export_all_btn.setEnabled(False)
+        
+        self._export_job = {
+            "kind": kind,
+            "file_path": self.file_path,
+            "data_type": data_type,
+            "final_label": final_label
+        }
+        
+        if kind == "explorer":
+            prepare = self._logic.prepare_explorer_data
+        else:
+            prepare = self._logic.prepare_data
+        
+        # 读取和处理Excel在后台任务中执行，避免界面卡顿
+        handle = get_scheduler().submit(
+            prepare, args=(self.file_path, mode), name=f"处理{data_type}数据", priority=TaskPriority.HIGH)
+        handle.succeeded.connect(self._on_export_prepared)
+        handle.failed.connect(self._on_export_failed)
+        handle.cancelled.connect(self._on_export_cancelled)
+    
+    @Slot(object)
+    def _on_export_prepared(self, prepared):
+        """数据处理完成，弹出导出对话框并保存文件"""
+        job = self._export_job
+        self._export_job = None
+        
         try:
-            self.log_message("开始处理全部柱底内力数据...", "info")
-            self.export_all_btn.setEnabled(False)
-            
-            # 执行处理
-            result = self._logic.process_all(self.file_path)
+            if job["kind"] == "explorer":
+                result = self._logic.export_explorer_prepared(prepared, job["file_path"])
+            else:
+                result = self._logic.export_prepared_data(prepared, job["file_path"], job["data_type"])
             
             if result["success"]:
                 # 显示成功信息
@@ -504,7 +460,7 @@ class YJKColumnForceWidget(QWidget):
                 <b>处理完成！</b><br><br>
                 <b>原始数据行数:</b> {result['original_rows']}<br>
                 <b>删除F列=1的行数:</b> {result['removed_rows']}<br>
-                <b>最终数据行数:</b> {result['final_rows']}<br>
+                <b>{job['final_label']}:</b> {result['final_rows']}<br>
                 <b>保存路径:</b> {result['save_path']}<br><br>
                 <i>文件格式: {result['format'].upper()}</i>
                 """
@@ -517,7 +473,7 @@ class YJKColumnForceWidget(QWidget):
                 msg_box.setStandardButtons(QMessageBox.Ok)
                 msg_box.exec_()
                 
-                self.log_message(f"✓ 全部柱底内力数据已保存到: {result['save_path']}", "success")
+                self.log_message(f"✓ {job['data_type']}数据已保存到: {result['save_path']}", "success")
                 
                 # 打开文件所在文件夹
                 try:
@@ -531,7 +487,28 @@ class YJKColumnForceWidget(QWidget):
             self.log_message(f"✗ 错误: {str(e)}", "error")
             QMessageBox.critical(self, "处理错误", str(e))
         finally:
-            self.export_all_btn.setEnabled(True)
+            self._set_export_buttons_enabled(True)
+    
+    @Slot(str)
+    def _on_export_failed(self, error):
+        """数据处理失败"""
+        self._export_job = None
+        self.log_message(f"✗ 错误: {error}", "error")
+        QMessageBox.critical(self, "处理错误", error)
+        self._set_export_buttons_enabled(True)
+    
+    @Slot()
+    def _on_export_cancelled(self):
+        """数据处理被取消"""
+        self._export_job = None
+        self.log_message("⚠ 处理已取消", "warning")
+        self._set_export_buttons_enabled(True)
+    
+    def _set_export_buttons_enabled(self, enabled):
+        """设置导出按钮的可用状态"""
+        self.export_pressure_btn.setEnabled(enabled)
+        self.export_tension_btn.setEnabled(enabled)
+        self.export_all_btn.setEnabled(enabled)
     
     def _on_original_mode_clicked(self):
         """切换到原版模式"""
@@ -599,62 +576,8 @@ class YJKColumnForceWidget(QWidget):
     
     def export_explorer_data(self, export_type):
         """导出探索者数据"""
-        if not self.file_path:
-            self.log_message("⚠ 请先选择Excel文件", "error")
-            QMessageBox.warning(self, "错误", "请先选择Excel文件")
-            return
-        
-        try:
-            self.log_message(f"开始处理探索者{export_type}数据...", "info")
-            
-            # 禁用所有按钮
-            self.export_pressure_btn.setEnabled(False)
-            self.export_tension_btn.setEnabled(False)
-            self.export_all_btn.setEnabled(False)
-            
-            # 读取Excel文件
-            self.log_message("尝试读取Excel文件...", "info")
-            
-            # 调用逻辑层处理
-            result = self._logic.export_explorer_data(self.file_path, export_type)
-            
-            if result["success"]:
-                # 显示成功信息
-                success_msg = f"""
-                <b>处理完成！</b><br><br>
-                <b>原始数据行数:</b> {result['original_rows']}<br>
-                <b>删除F列=1的行数:</b> {result['removed_rows']}<br>
-                <b>最终数据行数:</b> {result['final_rows']}<br>
-                <b>保存路径:</b> {result['save_path']}<br><br>
-                <i>文件格式: {result['format'].upper()}</i>
-                """
-                
-                msg_box = QMessageBox(self)
-                msg_box.setWindowTitle("处理成功")
-                msg_box.setTextFormat(Qt.RichText)
-                msg_box.setText(success_msg)
-                msg_box.setIcon(QMessageBox.Information)
-                msg_box.setStandardButtons(QMessageBox.Ok)
-                msg_box.exec_()
-                
-                self.log_message(f"✓ 探索者{export_type}数据已保存到: {result['save_path']}", "success")
-                
-                # 打开文件所在文件夹
-                try:
-                    os.startfile(os.path.dirname(result['save_path']))
-                except Exception as e:
-                    self.log_message(f"⚠ 打开文件夹失败: {str(e)}", "warning")
-            else:
-                raise ValueError(result["error"])
-
-        except Exception as e:
-            self.log_message(f"✗ 错误: {str(e)}", "error")
-            QMessageBox.critical(self, "处理错误", str(e))
-        finally:
-            # 启用所有按钮
-            self.export_pressure_btn.setEnabled(True)
-            self.export_tension_btn.setEnabled(True)
-            self.export_all_btn.setEnabled(True)
+        names = {"pressure": "压力", "tension": "拉力", "all": "全部内力"}
+        self._start_export("explorer", export_type, f"探索者{names.get(export_type, export_type)}", "最终数据行数")
 
     def reset(self):
         """重置插件UI到初始状态"""
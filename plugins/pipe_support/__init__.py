@@ -10,7 +10,6 @@ class PipeSupportPlugin(BasePlugin):
     def __init__(self):
         """初始化插件"""
         super().__init__()
-        self._widget = None
     
     def get_name(self) -> str:
         """获取插件名称"""
@@ -21,10 +20,11 @@ class PipeSupportPlugin(BasePlugin):
         return "提供管墩计算功能"
     
     def get_widget(self):
-        """获取插件UI组件"""
-        if self._widget is None:
-            self._widget = PipeSupportWidget()
-        return self._widget
+        """获取插件UI组件
+        
+        每个标签页使用独立的组件实例，组件由标签页管理器负责释放
+        """
+        return PipeSupportWidget()
     
     def on_load(self):
         """插件加载时调用"""
@@ -32,6 +32,4 @@ class PipeSupportPlugin(BasePlugin):
     
     def on_unload(self):
         """插件卸载时调用"""
-        if self._widget:
-            self._widget.deleteLater()
-            self._widget = None
\ No newline at end of file
+        pass
\ No newline at end of file
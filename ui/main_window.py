@@ -11,6 +11,8 @@ from PySide6.QtWidgets import (
     QToolBar,
     QStatusBar,
     QLabel,
+    QProgressBar,
+    QToolButton,
     QTreeWidget,
     QTreeWidgetItem
 )
@@ -19,7 +21,9 @@ from PySide6.QtCore import Qt
 
 from core.logger import Logger
 from core.plugin_manager import PluginManager
+from core.tasks import get_scheduler
 from ui.dialogs.about_dialog import AboutDialog
+from ui.tab_manager import TabLifecycleManager
 
 
 class MainWindow(QMainWindow):
@@ -32,6 +36,7 @@ class MainWindow(QMainWindow):
         self._logger = Logger()
         self._app_instance = None  # 应用实例引用
         self._plugin_manager = None  # 插件管理器引用
+        self._session_store = None  # 会话存储，用于退出时保存和启动时恢复标签页
         # 插件映射：存储插件名称到工厂函数的映射，工厂函数返回插件UI组件的新实例
         self._plugin_factories = {}
         # 已注册的插件列表
@@ -109,6 +114,9 @@ class MainWindow(QMainWindow):
         tab_bar.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         tab_bar.customContextMenuRequested.connect(self._on_tab_bar_context_menu)
         
+        # 标签页生命周期管理：负责插件组件的创建、释放和休眠
+        self._tab_manager = TabLifecycleManager(self._workspace, self._create_plugin_widget)
+        
         # 添加默认的欢迎页面
         self._add_welcome_tab()
         
@@ -242,6 +250,28 @@ class MainWindow(QMainWindow):
         status_label = QLabel("就绪")
         status_bar.addWidget(status_label)
         
+        # 左侧：后台任务指示器（空闲时隐藏）
+        self._task_label = QLabel()
+        status_bar.addWidget(self._task_label)
+        
+        self._task_progress = QProgressBar()
+        self._task_progress.setFixedWidth(120)
+        self._task_progress.setMaximumHeight(14)
+        self._task_progress.setTextVisible(False)
+        status_bar.addWidget(self._task_progress)
+        
+        self._task_cancel_button = QToolButton()
+        self._task_cancel_button.setText("✕")
+        self._task_cancel_button.setToolTip("取消所有后台任务")
+        self._task_cancel_button.setAutoRaise(True)
+        status_bar.addWidget(self._task_cancel_button)
+        
+        scheduler = get_scheduler()
+        scheduler.active_count_changed.connect(self._update_task_indicator)
+        scheduler.task_progress.connect(lambda _: self._update_task_indicator())
+        self._task_cancel_button.clicked.connect(scheduler.cancel_all)
+        self._update_task_indicator()
+        
         # 中间：拉伸空间
         status_bar.addPermanentWidget(QWidget(), 1)
         
@@ -256,6 +286,40 @@ class MainWindow(QMainWindow):
         version_label = QLabel(" | 版本 v1.0.0")
         status_bar.addPermanentWidget(version_label)
     
+    def _update_task_indicator(self, *_):
+        """根据调度器中未结束的任务更新状态栏任务指示器"""
+        tasks = get_scheduler().active_tasks()
+        visible = bool(tasks)
+        self._task_label.setVisible(visible)
+        self._task_progress.setVisible(visible)
+        self._task_cancel_button.setVisible(visible)
+        if not visible:
+            return
+        
+        # 显示最早提交的任务，多个任务时附带数量
+        task = tasks[0]
+        text = task.name
+        if task.progress_message:
+            text = f"{text}: {task.progress_message}"
+        if len(tasks) > 1:
+            text = f"{text}（共 {len(tasks)} 个任务）"
+        self._task_label.setText(text)
+        
+        if task.progress_value > 0:
+            self._task_progress.setRange(0, 100)
+            self._task_progress.setValue(task.progress_value)
+        else:
+            # 未报告进度时显示忙碌状态
+            self._task_progress.setRange(0, 0)
+    
+    def set_max_live_tabs(self, max_live_tabs: int):
+        """设置同时保持活动的插件标签页数量上限
+        
+        Args:
+            max_live_tabs: 活动标签页数量上限，超出时休眠最久未使用的标签页
+        """
+        self._tab_manager.set_max_live_tabs(max_live_tabs)
+    
     def set_plugin_manager(self, plugin_manager: PluginManager):
         """设置插件管理器引用
         
@@ -264,6 +328,62 @@ class MainWindow(QMainWindow):
         """
         self._plugin_manager = plugin_manager
     
+    def set_session_store(self, session_store):
+        """设置会话存储
+        
+        Args:
+            session_store: SessionStore实例，为None时不保存会话
+        """
+        self._session_store = session_store
+    
+    def save_session(self):
+        """保存当前打开的插件标签页到会话文件"""
+        if self._session_store is None:
+            return
+        
+        tabs = []
+        current_index = 0
+        for index in range(self._workspace.count()):
+            plugin_name = self._tab_manager.get_plugin_name(index)
+            if plugin_name is None:
+                continue
+            if index == self._workspace.currentIndex():
+                current_index = len(tabs)
+            tabs.append({
+                "plugin": plugin_name,
+                "title": self._workspace.tabText(index),
+                "state": self._tab_manager.get_tab_state(index)
+            })
+        
+        self._session_store.save(tabs, current_index)
+    
+    def restore_session(self):
+        """从会话文件恢复标签页
+        
+        仅创建轻量占位标签页，插件组件在标签页首次激活时才创建
+        """
+        if self._session_store is None:
+            return
+        
+        tabs, current_index = self._session_store.load()
+        tabs = [tab for tab in tabs if tab["plugin"] in self._plugin_factories]
+        if not tabs:
+            return
+        
+        self._close_welcome_tab()
+        first_index = self._workspace.count()
+        for tab in tabs:
+            self._tab_manager.add_placeholder_tab(tab["plugin"], tab["title"], tab["state"])
+        
+        # 只有当前标签页会立即创建插件组件
+        current_index = min(max(current_index, 0), len(tabs) - 1)
+        index = first_index + current_index
+        self._workspace.setCurrentIndex(index)
+        # 添加占位标签页时不处理 currentChanged，索引未变化（如恢复第一个标签页）时不会触发恢复，需显式恢复
+        if self._tab_manager.is_hibernated(index):
+            self._tab_manager.restore_tab(index)
+        self._logger.info(f"Restored session with {len(tabs)} tabs")
+    
     def register_plugin(self, plugin_name: str):
         """注册插件到主窗口
         
@@ -308,12 +428,12 @@ class MainWindow(QMainWindow):
         Args:
             index: 标签页索引
         """
-        self._workspace.removeTab(index)
+        self._tab_manager.release_tab(index)
     
     def clear_plugin_tabs(self):
         """清除所有插件标签页"""
-        # 清除所有标签页
-        self._workspace.clear()
+        # 清除所有标签页并释放组件
+        self._tab_manager.release_all()
         # 添加欢迎页面
         self._add_welcome_tab()
     
@@ -371,17 +491,10 @@ class MainWindow(QMainWindow):
         
         # 检查是否是插件节点
         if item_text in self._plugin_factories:
-            # 每次点击都新建一个插件实例
-            widget_factory = self._plugin_factories[item_text]
-            new_widget = widget_factory()
-            if new_widget is None:
+            # 每次点击都新建一个插件实例，添加到工作区并切换到该标签页
+            if self._tab_manager.open_tab(item_text) < 0:
                 return
             
-            # 添加到工作区
-            self._workspace.addTab(new_widget, item_text)
-            # 切换到新添加的标签页
-            self._workspace.setCurrentIndex(self._workspace.count() - 1)
-            
             # 关闭欢迎标签页
             self._close_welcome_tab()
     
@@ -448,6 +561,14 @@ class MainWindow(QMainWindow):
         reload_action.triggered.connect(lambda: self._on_reload_tab(index))
         menu.addAction(reload_action)
         
+        # 休眠选项：释放组件，切换回该标签页时自动恢复
+        hibernate_action = QAction("💤 休眠", self)
+        hibernate_action.setEnabled(
+            index != self._workspace.currentIndex() and self._tab_manager.can_hibernate(index)
+        )
+        hibernate_action.triggered.connect(lambda: self._tab_manager.hibernate_tab(index))
+        menu.addAction(hibernate_action)
+        
         # 添加分隔线
         menu.addSeparator()
         
@@ -465,14 +586,12 @@ class MainWindow(QMainWindow):
         Args:
             index: 当前标签页索引
         """
-        # 获取当前标签页的文本
-        tab_text = self._workspace.tabText(index)
+        # 获取当前标签页对应的插件名称
+        plugin_name = self._tab_manager.get_plugin_name(index)
         # 检查是否是插件标签页
-        if tab_text in self._plugin_factories:
-            # 使用插件工厂函数创建一个新的标签页实例
-            widget_factory = self._plugin_factories[tab_text]
-            new_widget = widget_factory()
-            self._workspace.addTab(new_widget, tab_text)
+        if plugin_name in self._plugin_factories:
+            # 创建一个新的标签页实例
+            self._tab_manager.open_tab(plugin_name)
     
     def _on_reload_tab(self, index):
         """处理重新加载标签页操作
@@ -480,11 +599,11 @@ class MainWindow(QMainWindow):
         Args:
             index: 当前标签页索引
         """
-        # 获取当前标签页的文本
-        tab_text = self._workspace.tabText(index)
+        # 获取当前标签页对应的插件名称
+        plugin_name = self._tab_manager.get_plugin_name(index)
         # 检查是否是插件标签页
-        if tab_text in self._plugin_factories:
-            # 获取当前标签页的widget
+        if plugin_name in self._plugin_factories:
+            # 获取当前标签页的widget（休眠的标签页没有reset方法，将直接重建）
             current_widget = self._workspace.widget(index)
             
             # 优先尝试调用reset()方法
@@ -496,20 +615,8 @@ class MainWindow(QMainWindow):
                     # 重置失败，继续创建新实例
                     print(f"Failed to reset widget: {e}")
             
-            # 如果没有reset方法或者重置失败，创建新实例
-            widget_factory = self._plugin_factories[tab_text]
-            new_widget = widget_factory()
-            
-            # 保存当前索引
-            current_index = self._workspace.currentIndex()
-            
-            # 替换当前标签页
-            self._workspace.removeTab(index)
-            new_index = self._workspace.insertTab(index, new_widget, tab_text)
-            
-            # 如果当前标签页是被选中的，切换到新添加的标签页
-            if index == current_index:
-                self._workspace.setCurrentIndex(new_index)
+            # 如果没有reset方法或者重置失败，创建新实例替换当前标签页（旧组件随之释放）
+            self._tab_manager.replace_tab(index)
     
     def _on_close_tab(self, index):
         """处理关闭标签页操作
@@ -520,8 +627,8 @@ class MainWindow(QMainWindow):
         # 不允许关闭欢迎页面
         if self._workspace.tabText(index) == "欢迎":
             return
-        # 关闭当前标签页
-        self._workspace.removeTab(index)
+        # 关闭当前标签页并释放组件
+        self._tab_manager.release_tab(index)
         
         # 检查是否所有标签页都已关闭，如果是，添加欢迎页面
         if self._workspace.count() == 0:
@@ -533,7 +640,7 @@ class MainWindow(QMainWindow):
         for i in range(self._workspace.count()):
             if self._workspace.tabText(i) == "欢迎":
                 # 移除欢迎标签页
-                self._workspace.removeTab(i)
+                self._tab_manager.release_tab(i)
                 break
     
     def _update_tab_title(self, widget, title):
@@ -645,12 +752,17 @@ class MainWindow(QMainWindow):
             return
         
         # 检查当前标签页是否是插件标签页
-        if current_tab_text in self._plugin_factories:
-            # 使用插件工厂函数创建一个新的标签页实例
-            widget_factory = self._plugin_factories[current_tab_text]
-            new_widget = widget_factory()
-            # 添加新标签页
-            self._workspace.addTab(new_widget, current_tab_text)
-            # 切换到新添加的标签页
-            self._workspace.setCurrentIndex(self._workspace.count() - 1)
+        plugin_name = self._tab_manager.get_plugin_name(current_index)
+        if plugin_name in self._plugin_factories:
+            # 创建一个新的标签页实例并切换到该标签页
+            self._tab_manager.open_tab(plugin_name)
+    
+    def closeEvent(self, event):
+        """窗口关闭事件，保存会话并清理休眠标签页的临时文件"""
+        try:
+            self.save_session()
+        except Exception as e:
+            self._logger.error(f"保存会话失败: {e}")
+        self._tab_manager.cleanup()
+        super().closeEvent(event)
 
@@ -0,0 +1,499 @@
+"""标签页生命周期管理"""
+
+import itertools
+import os
+import tempfile
+
+from PySide6.QtWidgets import QLabel, QTabWidget
+from PySide6.QtCore import QObject, Qt
+
+from core.logger import Logger
+from core.utils import get_process_memory, format_file_size
+
+
+class _TabRecord:
+    """单个插件标签页的状态记录"""
+
+    def __init__(self, plugin_name: str, widget):
+        """初始化标签页记录
+
+        Args:
+            plugin_name: 插件名称
+            widget: 标签页当前显示的组件（插件组件或休眠占位组件）
+        """
+        self.plugin_name = plugin_name
+        self.widget = widget
+        self.hibernated = False
+        self.memory = 0  # 字节：活动时为创建组件时的内存增量，休眠时为序列化状态大小
+        self.state = None  # 休眠时保存在内存中的状态
+        self.state_path = None  # 休眠状态过大时使用的临时文件
+        self.last_active = 0
+
+    def clear_state(self):
+        """清除休眠状态（包括临时文件）"""
+        if self.state_path and os.path.exists(self.state_path):
+            try:
+                os.remove(self.state_path)
+            except OSError:
+                pass
+        self.state = None
+        self.state_path = None
+
+
+class TabLifecycleManager(QObject):
+    """标签页生命周期管理器
+
+    负责插件标签页的创建、关闭和休眠：
+    - 关闭标签页时真正销毁插件组件；
+    - 活动标签页超过上限时，将最久未使用的标签页序列化后销毁组件，
+      仅保留轻量占位组件；切换回该标签页时重建组件并恢复状态；
+      组件提供 hibernate_state()/restore_state() 时优先使用（保留计算结果，且没有
+      保存/加载文件的提示等副作用），否则使用 save()/open()；
+    - 组件的 has_active_tasks() 返回True（有后台任务正在执行）时不休眠；
+    - 记录每个标签页的内存占用。
+    """
+
+    # 序列化状态不超过该大小时保存在内存中，否则保存到临时文件
+    INLINE_STATE_LIMIT = 256 * 1024
+
+    def __init__(self, tab_widget: QTabWidget, widget_factory, max_live_tabs: int = 8):
+        """初始化标签页生命周期管理器
+
+        Args:
+            tab_widget: 工作区标签页组件
+            widget_factory: 组件工厂函数，接收插件名称，返回插件UI组件
+            max_live_tabs: 同时保持活动（未休眠）的插件标签页数量上限
+        """
+        super().__init__(tab_widget)
+
+        self._logger = Logger()
+        self._tab_widget = tab_widget
+        self._widget_factory = widget_factory
+        self._max_live_tabs = max_live_tabs
+        self._records = {}  # 标签页组件 -> _TabRecord
+        self._activation_counter = itertools.count(1)
+        self._switching = False  # 替换标签页组件期间忽略 currentChanged
+
+        self._tab_widget.currentChanged.connect(self._on_current_changed)
+
+    def set_max_live_tabs(self, max_live_tabs: int):
+        """设置活动标签页数量上限
+
+        Args:
+            max_live_tabs: 活动标签页数量上限，小于1表示不限制
+        """
+        self._max_live_tabs = max_live_tabs
+        self._enforce_live_limit()
+
+    def open_tab(self, plugin_name: str, title: str = None) -> int:
+        """新建插件标签页并切换到该标签页
+
+        Args:
+            plugin_name: 插件名称
+            title: 标签页标题，默认为插件名称
+
+        Returns:
+            int: 新标签页索引，创建失败时返回-1
+        """
+        record = _TabRecord(plugin_name, None)
+        widget = self._create_widget(record)
+        if widget is None:
+            return -1
+
+        record.widget = widget
+        self._records[widget] = record
+        index = self._tab_widget.addTab(widget, title or plugin_name)
+        self._update_tab_tooltip(index)
+        self._tab_widget.setCurrentIndex(index)
+        return index
+
+    def add_placeholder_tab(self, plugin_name: str, title: str, state: bytes = None) -> int:
+        """添加一个处于休眠状态的标签页，首次激活时才创建插件组件
+
+        Args:
+            plugin_name: 插件名称
+            title: 标签页标题
+            state: 插件 save() 生成的状态数据，为None时以初始状态创建
+
+        Returns:
+            int: 新标签页索引
+        """
+        placeholder = self._create_placeholder()
+        record = _TabRecord(plugin_name, placeholder)
+        record.hibernated = True
+        record.state = state
+        record.memory = len(state) if state else 0
+        self._records[placeholder] = record
+
+        self._switching = True
+        try:
+            index = self._tab_widget.addTab(placeholder, title)
+        finally:
+            self._switching = False
+        self._update_tab_tooltip(index)
+        return index
+
+    def replace_tab(self, index: int):
+        """用新建的插件组件替换指定标签页（丢弃原有状态）
+
+        Args:
+            index: 标签页索引
+
+        Returns:
+            QWidget: 新的插件组件，失败时返回None
+        """
+        old_widget = self._tab_widget.widget(index)
+        record = self._records.get(old_widget)
+        if record is None:
+            return None
+
+        widget = self._create_widget(record)
+        if widget is None:
+            return None
+
+        record.clear_state()
+        record.hibernated = False
+        self._swap_widget(index, old_widget, widget)
+        return widget
+
+    def release_tab(self, index: int):
+        """关闭标签页并释放其组件
+
+        Args:
+            index: 标签页索引
+        """
+        widget = self._tab_widget.widget(index)
+        if widget is None:
+            return
+
+        self._tab_widget.removeTab(index)
+        record = self._records.pop(widget, None)
+        if record is not None:
+            record.clear_state()
+        widget.deleteLater()
+
+    def release_all(self):
+        """关闭所有标签页并释放其组件"""
+        self._switching = True
+        try:
+            for index in reversed(range(self._tab_widget.count())):
+                self.release_tab(index)
+        finally:
+            self._switching = False
+
+    def is_managed(self, index: int) -> bool:
+        """检查标签页是否为受管理的插件标签页"""
+        return self._tab_widget.widget(index) in self._records
+
+    def is_hibernated(self, index: int) -> bool:
+        """检查标签页是否处于休眠状态"""
+        record = self._records.get(self._tab_widget.widget(index))
+        return record is not None and record.hibernated
+
+    def get_plugin_name(self, index: int):
+        """获取标签页对应的插件名称
+
+        Returns:
+            str: 插件名称，非插件标签页返回None
+        """
+        record = self._records.get(self._tab_widget.widget(index))
+        return record.plugin_name if record else None
+
+    def can_hibernate(self, index: int) -> bool:
+        """检查标签页是否可以休眠（组件支持状态保存，且没有正在执行的后台任务）"""
+        record = self._records.get(self._tab_widget.widget(index))
+        return (record is not None and not record.hibernated and self._supports_state(record.widget)
+                and not self._has_active_tasks(record.widget))
+
+    def get_tab_state(self, index: int):
+        """获取标签页的序列化状态
+
+        活动标签页序列化当前状态，休眠标签页直接返回已保存的状态
+
+        Args:
+            index: 标签页索引
+
+        Returns:
+            bytes: 状态数据，不支持状态保存时返回None
+        """
+        record = self._records.get(self._tab_widget.widget(index))
+        if record is None:
+            return None
+
+        if record.hibernated:
+            if record.state_path:
+                with open(record.state_path, "rb") as f:
+                    return f.read()
+            return record.state
+
+        if not self._supports_state(record.widget):
+            return None
+        return self._save_state(record.widget)
+
+    def get_memory_usage(self) -> list:
+        """获取各插件标签页的内存占用
+
+        Returns:
+            list: 每个元素为字典，包含 index、title、plugin、hibernated、memory（字节）
+        """
+        usage = []
+        for index in range(self._tab_widget.count()):
+            record = self._records.get(self._tab_widget.widget(index))
+            if record is None:
+                continue
+            usage.append({
+                "index": index,
+                "title": self._tab_widget.tabText(index),
+                "plugin": record.plugin_name,
+                "hibernated": record.hibernated,
+                "memory": record.memory
+            })
+        return usage
+
+    def hibernate_tab(self, index: int) -> bool:
+        """休眠标签页：序列化状态后销毁插件组件
+
+        Args:
+            index: 标签页索引
+
+        Returns:
+            bool: 是否休眠成功
+        """
+        if index == self._tab_widget.currentIndex() or not self.can_hibernate(index):
+            return False
+
+        widget = self._tab_widget.widget(index)
+        record = self._records[widget]
+
+        state = self._save_state(widget)
+        if state is None:
+            return False
+
+        if len(state) <= self.INLINE_STATE_LIMIT:
+            record.state = state
+        else:
+            fd, record.state_path = tempfile.mkstemp(suffix=".fg", prefix="fugo_tab_")
+            with os.fdopen(fd, "wb") as f:
+                f.write(state)
+
+        record.hibernated = True
+        record.memory = len(state)
+        self._swap_widget(index, widget, self._create_placeholder())
+        self._logger.debug(f"Hibernated tab: {self._tab_widget.tabText(index)}")
+        return True
+
+    def restore_tab(self, index: int):
+        """恢复休眠的标签页：重建插件组件并载入休眠时保存的状态
+
+        状态载入失败时销毁新建的组件，标签页保持休眠并保留状态，再次切换到该标签页时重试
+
+        Args:
+            index: 标签页索引
+
+        Returns:
+            QWidget: 重建的插件组件，失败时返回None
+        """
+        placeholder = self._tab_widget.widget(index)
+        record = self._records.get(placeholder)
+        if record is None or not record.hibernated:
+            return None
+
+        state_memory = record.memory
+        widget = self._create_widget(record)
+        if widget is None:
+            return None
+
+        if (record.state is not None or record.state_path) and not self._load_state(widget, record):
+            record.memory = state_memory
+            widget.deleteLater()
+            self._logger.error(f"恢复标签页失败，已保留休眠状态: {self._tab_widget.tabText(index)}")
+            return None
+
+        record.clear_state()
+        record.hibernated = False
+        self._swap_widget(index, placeholder, widget)
+        self._logger.debug(f"Restored tab: {self._tab_widget.tabText(index)}")
+        return widget
+
+    def cleanup(self):
+        """清理所有休眠状态的临时文件"""
+        for record in self._records.values():
+            if record.state_path:
+                record.clear_state()
+
+    def _on_current_changed(self, index: int):
+        """处理当前标签页变化：恢复休眠标签页并执行活动数量限制
+
+        Args:
+            index: 当前标签页索引
+        """
+        if self._switching or index < 0:
+            return
+
+        record = self._records.get(self._tab_widget.widget(index))
+        if record is None:
+            return
+
+        if record.hibernated:
+            self.restore_tab(index)
+
+        record.last_active = next(self._activation_counter)
+        self._enforce_live_limit()
+
+    def _enforce_live_limit(self):
+        """休眠最久未使用的标签页，使活动标签页数量不超过上限"""
+        if self._max_live_tabs < 1:
+            return
+
+        current = self._tab_widget.currentWidget()
+        candidates = [
+            record for record in self._records.values()
+            if not record.hibernated and record.widget is not current
+            and self._supports_state(record.widget) and not self._has_active_tasks(record.widget)
+        ]
+        live_count = sum(1 for record in self._records.values() if not record.hibernated)
+
+        candidates.sort(key=lambda record: record.last_active)
+        for record in candidates:
+            if live_count <= self._max_live_tabs:
+                break
+            index = self._tab_widget.indexOf(record.widget)
+            if index >= 0 and self.hibernate_tab(index):
+                live_count -= 1
+
+    def _create_widget(self, record: _TabRecord):
+        """通过工厂函数创建插件组件并记录内存增量
+
+        Args:
+            record: 标签页记录
+
+        Returns:
+            QWidget: 插件组件，失败时返回None
+        """
+        memory_before = get_process_memory()
+        widget = self._widget_factory(record.plugin_name)
+        if widget is None:
+            return None
+
+        record.memory = max(get_process_memory() - memory_before, 0)
+        return widget
+
+    def _swap_widget(self, index: int, old_widget, new_widget):
+        """在原位置替换标签页组件并销毁旧组件
+
+        Args:
+            index: 标签页索引
+            old_widget: 旧组件
+            new_widget: 新组件
+        """
+        record = self._records.pop(old_widget)
+        record.widget = new_widget
+        self._records[new_widget] = record
+
+        title = self._tab_widget.tabText(index)
+        was_current = self._tab_widget.currentIndex() == index
+
+        self._switching = True
+        try:
+            self._tab_widget.removeTab(index)
+            self._tab_widget.insertTab(index, new_widget, title)
+            if was_current:
+                self._tab_widget.setCurrentIndex(index)
+        finally:
+            self._switching = False
+
+        old_widget.deleteLater()
+        self._update_tab_tooltip(index)
+
+    def _save_state(self, widget):
+        """将组件状态序列化为字节数据（优先使用 hibernate_state()，否则调用 save()）
+
+        Args:
+            widget: 插件组件
+
+        Returns:
+            bytes: 状态数据，失败时返回None
+        """
+        if callable(getattr(widget, "hibernate_state", None)):
+            try:
+                return widget.hibernate_state()
+            except Exception as e:
+                self._logger.error(f"序列化标签页状态失败: {e}")
+                return None
+
+        fd, path = tempfile.mkstemp(suffix=".fg", prefix="fugo_tab_")
+        os.close(fd)
+        try:
+            widget.save(path)
+            with open(path, "rb") as f:
+                return f.read()
+        except Exception as e:
+            self._logger.error(f"序列化标签页状态失败: {e}")
+            return None
+        finally:
+            os.remove(path)
+
+    def _load_state(self, widget, record: _TabRecord):
+        """载入休眠时保存的状态（优先使用 restore_state()，否则调用 open()）
+
+        Args:
+            widget: 新建的插件组件
+            record: 标签页记录
+
+        Returns:
+            bool: 是否载入成功（方法抛出异常或返回False时为失败）
+        """
+        path = record.state_path
+        temp_path = None
+        try:
+            if callable(getattr(widget, "restore_state", None)):
+                if path is not None:
+                    with open(path, "rb") as f:
+                        result = widget.restore_state(f.read())
+                else:
+                    result = widget.restore_state(record.state)
+                return result is not False
+            if path is None:
+                fd, temp_path = tempfile.mkstemp(suffix=".fg", prefix="fugo_tab_")
+                with os.fdopen(fd, "wb") as f:
+                    f.write(record.state)
+                path = temp_path
+            return widget.open(path) is not False
+        except Exception as e:
+            self._logger.error(f"恢复标签页状态失败: {e}")
+            return False
+        finally:
+            if temp_path:
+                os.remove(temp_path)
+
+    def _update_tab_tooltip(self, index: int):
+        """更新标签页提示信息（插件名称和内存占用）"""
+        record = self._records.get(self._tab_widget.widget(index))
+        if record is None:
+            return
+
+        status = "已休眠" if record.hibernated else "活动"
+        self._tab_widget.setTabToolTip(
+            index,
+            f"插件: {record.plugin_name}\n状态: {status}\n内存: {format_file_size(record.memory)}"
+        )
+
+    @staticmethod
+    def _supports_state(widget) -> bool:
+        """检查组件是否提供 hibernate_state() 和 restore_state()，或 save() 和 open() 方法"""
+        return any(callable(getattr(widget, save, None)) and callable(getattr(widget, load, None))
+                   for save, load in (("hibernate_state", "restore_state"), ("save", "open")))
+
+    @staticmethod
+    def _has_active_tasks(widget) -> bool:
+        """检查组件是否有正在执行的后台任务（任务完成前销毁组件会使结果信号发送到已删除的对象）"""
+        has_active_tasks = getattr(widget, "has_active_tasks", None)
+        return callable(has_active_tasks) and bool(has_active_tasks())
+
+    @staticmethod
+    def _create_placeholder():
+        """创建休眠标签页的轻量占位组件"""
+        placeholder = QLabel("💤 标签页已休眠，切换到此标签页时将自动恢复")
+        placeholder.setObjectName("hibernatedTab")
+        placeholder.setAlignment(Qt.AlignCenter)
+        return placeholder